@@ -0,0 +1,608 @@
+#!/usr/bin/env python
+"""引擎端到端基准：本地 asyncio HTTP 替身 + 真实 AsyncRuntimeEngine，测槽位扩展上限。
+
+替身服务跑在独立子进程里，提供录制（或合成）的问卷星页面并接收提交，可注入延迟
+与错误率；本进程内的引擎、slot 调度和问卷星 HTTP 运行时都是真实实现，只是 httpx
+的传输层被重定向到替身。每个并发档位输出吞吐、单次作答延迟分位、单次 CPU 与峰值
+RSS，整体写成 JSON，便于跨提交对比回归。
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import ctypes
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, cast
+from unittest.mock import patch
+
+_resource: Any
+try:
+    import resource as _resource
+except ImportError:  # Windows 没有 resource 模块
+    _resource = None
+
+_psutil: Any
+try:
+    import psutil as _psutil
+except ImportError:  # psutil 是可选依赖，缺失时按平台自行读取
+    _psutil = None
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+import httpx  # noqa: E402
+
+import software.network.http.async_client as async_http_client  # noqa: E402
+import software.network.http.client as sync_http_client  # noqa: E402
+import wjx.provider.http_runtime as wjx_http_runtime  # noqa: E402
+from software.core.config.schema import RuntimeConfig  # noqa: E402
+from software.core.engine.async_engine import AsyncEngineClient  # noqa: E402
+from software.core.questions.config import build_default_question_entries  # noqa: E402
+from software.core.task import ExecutionState  # noqa: E402
+from software.providers.contracts import build_survey_definition  # noqa: E402
+from software.providers.hooks import reset_hook_cache  # noqa: E402
+from software.ui.controller.run_controller_parts.runtime_preparation import prepare_execution_artifacts  # noqa: E402
+from wjx.provider.parser import _parse_wjx_html  # noqa: E402
+
+BENCH_SURVEY_URL = "https://www.wjx.cn/vm/benchE2E.aspx"
+DEFAULT_SLOT_LEVELS = "1,4,16,64,256"
+_STAND_IN_HOST = "127.0.0.1"
+_SUBMIT_SUCCESS_TEXT = "10〒https://www.wjx.cn/wjx/join/complete.aspx"
+
+
+def build_recorded_survey_html(question_count: int) -> str:
+    """合成一份单选/多选/填空轮换的问卷星页面，结构与解析器单测夹具一致。"""
+    blocks: List[str] = []
+    for index in range(max(1, question_count)):
+        number = index + 1
+        kind = index % 3
+        if kind == 0:
+            options = "".join(f'<div><span class="label">选项{option}</span></div>' for option in range(1, 6))
+            blocks.append(
+                f'<div topic="{number}" id="div{number}" type="3">'
+                f'<div class="topichtml">{number}. 单选题{number}</div>'
+                f'<div class="ui-controlgroup">{options}</div></div>'
+            )
+        elif kind == 1:
+            options = "".join(f'<div><span class="label">功能{option}</span></div>' for option in range(1, 5))
+            blocks.append(
+                f'<div topic="{number}" id="div{number}" type="4">'
+                f'<div class="topichtml">{number}. 多选题{number}</div>'
+                f'<div class="ui-controlgroup">{options}</div></div>'
+            )
+        else:
+            blocks.append(
+                f'<div topic="{number}" id="div{number}" type="1">'
+                f'<div class="topichtml">{number}. 填空题{number}</div>'
+                f'<div class="ui-input-text"><input type="text" id="q{number}" name="q{number}" /></div></div>'
+            )
+    return (
+        "<html><head><title>端到端基准问卷</title></head><body>"
+        '<div id="divQuestion"><fieldset>'
+        + "".join(blocks)
+        + "</fieldset></div></body></html>"
+    )
+
+
+# ---------------------------------------------------------------- 替身服务（子进程）
+
+
+async def _handle_connection(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    *,
+    page_body: bytes,
+    latency_seconds: float,
+    jitter_seconds: float,
+    error_rate: float,
+    rng: random.Random,
+    counters: Dict[str, int],
+) -> None:
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                return
+            method, _, rest = request_line.decode("latin-1").partition(" ")
+            path = rest.split(" ", 1)[0]
+            content_length = 0
+            keep_alive = True
+            while True:
+                header_line = await reader.readline()
+                if header_line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = header_line.decode("latin-1").partition(":")
+                lowered = name.strip().lower()
+                if lowered == "content-length":
+                    content_length = int(value.strip() or 0)
+                elif lowered == "connection" and value.strip().lower() == "close":
+                    keep_alive = False
+            if content_length:
+                await reader.readexactly(content_length)
+
+            delay = latency_seconds + (rng.uniform(-jitter_seconds, jitter_seconds) if jitter_seconds > 0 else 0.0)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if error_rate > 0 and rng.random() < error_rate:
+                status, body = "503 Service Unavailable", b"stand-in injected error"
+                counters["errors"] += 1
+            elif method == "GET" and "/vm/" in path:
+                status, body = "200 OK", page_body
+                counters["pages"] += 1
+            elif method == "POST" and path.startswith("/joinnew/processjq.ashx"):
+                status, body = "200 OK", _SUBMIT_SUCCESS_TEXT.encode("utf-8")
+                counters["submits"] += 1
+            else:
+                status, body = "404 Not Found", b"not found"
+                counters["unknown"] += 1
+            writer.write(
+                (
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: text/html; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                ).encode("latin-1")
+                + body
+            )
+            await writer.drain()
+            if not keep_alive:
+                return
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return
+    finally:
+        writer.close()
+
+
+def _stand_in_server_main(
+    port_queue: Any,
+    stop_event: Any,
+    page_html: str,
+    latency_ms: float,
+    jitter_ms: float,
+    error_rate: float,
+    seed: int,
+) -> None:
+    async def _serve() -> None:
+        counters = {"pages": 0, "submits": 0, "errors": 0, "unknown": 0}
+        rng = random.Random(seed)
+        page_body = page_html.encode("utf-8")
+
+        async def _on_connect(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await _handle_connection(
+                reader,
+                writer,
+                page_body=page_body,
+                latency_seconds=max(0.0, latency_ms) / 1000.0,
+                jitter_seconds=max(0.0, jitter_ms) / 1000.0,
+                error_rate=max(0.0, min(1.0, error_rate)),
+                rng=rng,
+                counters=counters,
+            )
+
+        server = await asyncio.start_server(_on_connect, _STAND_IN_HOST, 0, backlog=1024)
+        port_queue.put(server.sockets[0].getsockname()[1])
+        async with server:
+            while not stop_event.is_set():
+                await asyncio.sleep(0.1)
+        port_queue.put(counters)
+
+    asyncio.run(_serve())
+
+
+class StandInServer:
+    """在子进程里运行替身服务，避免其 CPU/内存计入被测进程。"""
+
+    def __init__(self, *, page_html: str, latency_ms: float, jitter_ms: float, error_rate: float, seed: int) -> None:
+        context = multiprocessing.get_context("spawn")
+        self._queue = context.Queue()
+        self._stop = context.Event()
+        self._process = context.Process(
+            target=_stand_in_server_main,
+            args=(self._queue, self._stop, page_html, latency_ms, jitter_ms, error_rate, seed),
+            daemon=True,
+        )
+        self.port = 0
+
+    def __enter__(self) -> "StandInServer":
+        self._process.start()
+        self.port = int(self._queue.get(timeout=30))
+        return self
+
+    def stop(self) -> Dict[str, int]:
+        self._stop.set()
+        try:
+            counters = dict(self._queue.get(timeout=10))
+        except Exception:
+            counters = {}
+        self._process.join(timeout=10)
+        return counters
+
+    def __exit__(self, *_exc: Any) -> None:
+        if self._process.is_alive():
+            self._stop.set()
+            self._process.join(timeout=5)
+        if self._process.is_alive():
+            self._process.terminate()
+
+
+# ---------------------------------------------------------------- 传输层重定向
+
+
+def _redirect(request: httpx.Request, port: int) -> None:
+    request.url = request.url.copy_with(scheme="http", host=_STAND_IN_HOST, port=port)
+
+
+class _AsyncRedirectTransport(httpx.AsyncBaseTransport):
+    def __init__(self, port: int) -> None:
+        self._port = port
+        # 沿用生产客户端的连接池上限，基准才能反映真实的连接复用瓶颈
+        self._inner = httpx.AsyncHTTPTransport(limits=sync_http_client._CLIENT_LIMITS)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        _redirect(request, self._port)
+        return await self._inner.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class _SyncRedirectTransport(httpx.BaseTransport):
+    def __init__(self, port: int) -> None:
+        self._port = port
+        self._inner = httpx.HTTPTransport(limits=sync_http_client._CLIENT_LIMITS)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        _redirect(request, self._port)
+        return self._inner.handle_request(request)
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+def _patch_http_clients(port: int) -> List[Any]:
+    def _create_async(_self: Any, *, proxy: Any, verify: Any, follow_redirects: bool, trust_env: bool) -> httpx.AsyncClient:
+        del proxy, verify, trust_env
+        return httpx.AsyncClient(timeout=None, follow_redirects=follow_redirects, transport=_AsyncRedirectTransport(port))
+
+    def _create_sync(_self: Any, *, proxy: Any, verify: Any, follow_redirects: bool, trust_env: bool) -> httpx.Client:
+        del proxy, verify, trust_env
+        return httpx.Client(timeout=None, follow_redirects=follow_redirects, transport=_SyncRedirectTransport(port))
+
+    return [
+        patch.object(async_http_client._AsyncClientManager, "_create_client", _create_async),
+        patch.object(sync_http_client._SyncClientManager, "_create_client", _create_sync),
+    ]
+
+
+# ---------------------------------------------------------------- 度量
+
+
+class AttemptRecorder:
+    """包住问卷星 HTTP 运行时，记录每次作答（取页 + 生成 + 提交）的耗时与结果。"""
+
+    def __init__(self) -> None:
+        self._original = wjx_http_runtime.brush_wjx_http
+        self._lock = threading.Lock()
+        self.durations: List[float] = []
+        self.failures = 0
+        self.cancelled = 0
+
+    def reset(self) -> None:
+        with self._lock:
+            self.durations = []
+            self.failures = 0
+            self.cancelled = 0
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> bool:
+        started = time.perf_counter()
+        try:
+            ok = bool(await self._original(*args, **kwargs))
+        except asyncio.CancelledError:
+            # 达到目标份数后被收尾取消的作答不计入延迟分布
+            with self._lock:
+                self.cancelled += 1
+            raise
+        except Exception:
+            self._record(time.perf_counter() - started, ok=False)
+            raise
+        self._record(time.perf_counter() - started, ok=ok)
+        return ok
+
+    def _record(self, elapsed: float, *, ok: bool) -> None:
+        with self._lock:
+            self.durations.append(elapsed)
+            if not ok:
+                self.failures += 1
+
+
+class _ProcessMemoryCounters(ctypes.Structure):
+    _fields_ = [
+        ("cb", ctypes.c_ulong),
+        ("PageFaultCount", ctypes.c_ulong),
+        ("PeakWorkingSetSize", ctypes.c_size_t),
+        ("WorkingSetSize", ctypes.c_size_t),
+        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+        ("PagefileUsage", ctypes.c_size_t),
+        ("PeakPagefileUsage", ctypes.c_size_t),
+    ]
+
+
+def _windows_rss_bytes() -> int:
+    windll = cast(Any, ctypes).windll
+    counters = _ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    process = windll.kernel32.GetCurrentProcess()
+    if not windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+        return 0
+    return int(counters.WorkingSetSize)
+
+
+def _current_rss_bytes() -> int:
+    """当前进程常驻内存；优先 psutil，缺失时 Windows 走 GetProcessMemoryInfo，Linux 读 /proc。"""
+    if _psutil is not None:
+        return int(_psutil.Process().memory_info().rss)
+    if sys.platform == "win32":
+        try:
+            return _windows_rss_bytes()
+        except (OSError, AttributeError):
+            return 0
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as handle:
+            resident_pages = int(handle.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if _resource is None:
+        return 0
+    # macOS 没有 /proc，只能拿到进程至今的峰值；采样器本来就只取峰值
+    peak = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
+    # Linux 单位为 KB，macOS 为字节
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+class PeakRssSampler:
+    def __init__(self, interval_seconds: float = 0.02) -> None:
+        self._interval = interval_seconds
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="PeakRssSampler")
+        self.peak_bytes = _current_rss_bytes()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.peak_bytes = max(self.peak_bytes, _current_rss_bytes())
+
+    def __enter__(self) -> "PeakRssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self._stop.set()
+        self._thread.join(timeout=1)
+        self.peak_bytes = max(self.peak_bytes, _current_rss_bytes())
+
+
+def _percentiles_ms(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    if len(samples) == 1:
+        value = samples[0] * 1000
+        return {"p50": value, "p95": value, "p99": value, "max": value}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50": round(cuts[49] * 1000, 3),
+        "p95": round(cuts[94] * 1000, 3),
+        "p99": round(cuts[98] * 1000, 3),
+        "max": round(max(samples) * 1000, 3),
+    }
+
+
+# ---------------------------------------------------------------- 运行
+
+
+def build_runtime_config(page_html: str) -> RuntimeConfig:
+    info, title = _parse_wjx_html(page_html)
+    definition = build_survey_definition("wjx", title, info)
+    questions_info = [question for question in definition.questions if not question.is_description]
+    config = RuntimeConfig(
+        url=BENCH_SURVEY_URL,
+        survey_title=definition.title or "",
+        survey_provider=definition.provider,
+        target=1,
+        threads=1,
+        submit_interval=(0, 0),
+        answer_duration=(0, 0),
+        random_ip_enabled=False,
+        random_ua_enabled=False,
+        fail_stop_enabled=False,
+        reliability_mode_enabled=True,
+        reverse_fill_enabled=False,
+    )
+    config.questions_info = list(questions_info)
+    config.question_entries = list(build_default_question_entries(questions_info, survey_url=BENCH_SURVEY_URL))
+    return config
+
+
+def run_level(
+    runtime_config: RuntimeConfig,
+    *,
+    slots: int,
+    attempts: int,
+    recorder: AttemptRecorder,
+    timeout_seconds: float,
+) -> Dict[str, Any]:
+    prepared = prepare_execution_artifacts(runtime_config, fallback_survey_title=runtime_config.survey_title)
+    execution_config = prepared.execution_config_template
+    execution_config.target_num = attempts
+    execution_config.num_threads = slots
+    execution_config.submit_interval_range_seconds = (0, 0)
+    execution_config.answer_duration_range_seconds = (0, 0)
+    execution_config.random_proxy_ip_enabled = False
+    execution_config.random_user_agent_enabled = False
+    execution_config.stop_on_fail_enabled = False
+    state = ExecutionState(config=execution_config)
+    state.initialize_reverse_fill_runtime()
+
+    recorder.reset()
+    client = AsyncEngineClient()
+    timed_out = False
+    with PeakRssSampler() as rss:
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        try:
+            future = client.start_run(execution_config, state, runtime_bridge=None)
+            try:
+                future.result(timeout=max(1.0, timeout_seconds))
+            except TimeoutError:
+                timed_out = True
+                client.stop_run()
+        finally:
+            client.shutdown(timeout=15.0)
+        elapsed = time.perf_counter() - started
+        cpu_seconds = time.process_time() - cpu_started
+
+    durations = list(recorder.durations)
+    attempt_count = len(durations)
+    return {
+        "slots": slots,
+        "target": attempts,
+        "attempts": attempt_count,
+        "successes": int(state.cur_num or 0),
+        "failures": int(recorder.failures),
+        "cancelled": int(recorder.cancelled),
+        "timed_out": timed_out,
+        "elapsed_seconds": round(elapsed, 4),
+        "attempts_per_second": round(attempt_count / elapsed, 3) if elapsed > 0 else 0.0,
+        "latency_ms": _percentiles_ms(durations),
+        "cpu_ms_per_attempt": round(cpu_seconds * 1000 / attempt_count, 3) if attempt_count else 0.0,
+        "peak_rss_mb": round(rss.peak_bytes / (1024 * 1024), 2),
+    }
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=False,
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+
+def _parse_slot_levels(raw: str) -> List[int]:
+    levels = sorted({max(1, int(item)) for item in str(raw or "").split(",") if item.strip()})
+    return levels or [1]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slots", default=DEFAULT_SLOT_LEVELS, help="逗号分隔的并发档位，如 1,4,16,64,256")
+    parser.add_argument("--attempts-per-slot", type=int, default=4)
+    parser.add_argument("--min-attempts", type=int, default=32)
+    parser.add_argument("--questions", type=int, default=20, help="未指定 --page 时合成问卷的题数")
+    parser.add_argument("--page", type=Path, default=None, help="录制的问卷星页面 HTML")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="替身返回 503 的概率")
+    parser.add_argument("--seed", type=int, default=2026)
+    parser.add_argument("--timeout", type=float, default=600.0, help="单个档位的超时秒数")
+    parser.add_argument("--output", type=Path, default=None, help="结果 JSON 路径；不传则输出到 stdout")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, str(args.log_level).upper(), logging.WARNING))
+    page_html = args.page.read_text(encoding="utf-8") if args.page else build_recorded_survey_html(args.questions)
+    runtime_config = build_runtime_config(page_html)
+    if not runtime_config.questions_info:
+        print("[FAIL] 问卷页面未解析出任何题目")
+        return 1
+
+    recorder = AttemptRecorder()
+    runs: List[Dict[str, Any]] = []
+    server_counters: Dict[str, int] = {}
+    with StandInServer(
+        page_html=page_html,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    ) as server:
+        patches = _patch_http_clients(server.port)
+        patches.append(patch.object(wjx_http_runtime, "brush_wjx_http", recorder))
+        for item in patches:
+            item.start()
+        reset_hook_cache()
+        try:
+            for slots in _parse_slot_levels(args.slots):
+                attempts = max(int(args.min_attempts), slots * max(1, int(args.attempts_per_slot)))
+                result = run_level(
+                    runtime_config,
+                    slots=slots,
+                    attempts=attempts,
+                    recorder=recorder,
+                    timeout_seconds=args.timeout,
+                )
+                runs.append(result)
+                latency = result["latency_ms"]
+                print(
+                    f"slots={slots:<4} attempts={result['attempts']:<5} "
+                    f"rate={result['attempts_per_second']:9.2f}/s "
+                    f"p50={latency['p50']:8.2f}ms p95={latency['p95']:8.2f}ms p99={latency['p99']:8.2f}ms "
+                    f"cpu={result['cpu_ms_per_attempt']:7.2f}ms rss={result['peak_rss_mb']:8.2f}MB"
+                    + (" [TIMEOUT]" if result["timed_out"] else ""),
+                    file=sys.stderr,
+                )
+        finally:
+            for item in reversed(patches):
+                item.stop()
+            reset_hook_cache()
+            server_counters = server.stop()
+
+    report = {
+        "benchmark": "engine_e2e",
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "params": {
+            "questions": len(runtime_config.questions_info),
+            "page": str(args.page or ""),
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "error_rate": args.error_rate,
+            "attempts_per_slot": args.attempts_per_slot,
+            "min_attempts": args.min_attempts,
+            "seed": args.seed,
+        },
+        "server": server_counters,
+        "runs": runs,
+    }
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    return 1 if any(run["timed_out"] for run in runs) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+"""冷启动基准：反复拉起 SurveyController.py 到首帧绘制，统计各阶段耗时和导入开销，超出预算时返回非零。
+
+每次运行都用独立的临时 HOME / 配置目录，避免上一次留下的设置和缓存影响测量；
+子进程带 ``-X importtime``，顺带汇总累计耗时最高的导入。
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+ENTRY_FILE = ROOT_DIR / "SurveyController.py"
+CHILD_RESULT_PREFIX = "__WJX_CHECK__"
+ENV_STARTUP_BUDGET_MS = "SURVEYCONTROLLER_STARTUP_BUDGET_MS"
+DEFAULT_STARTUP_BUDGET_MS = 6000.0
+RUN_TIMEOUT_SECONDS = 60
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[int, int, str]]:
+    """解析 ``-X importtime`` 输出，返回 (自身微秒, 累计微秒, 模块名)。"""
+    rows: List[Tuple[int, int, str]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue
+        rows.append((self_us, cumulative_us, parts[2].strip()))
+    return rows
+
+
+def _make_run_env(profile_path: Path, home_dir: Path) -> Dict[str, str]:
+    env = os.environ.copy()
+    current_python_path = env.get("PYTHONPATH", "")
+    env["PYTHONPATH"] = str(ROOT_DIR) if not current_python_path else os.pathsep.join([str(ROOT_DIR), current_python_path])
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    for key in ("HOME", "USERPROFILE", "APPDATA", "LOCALAPPDATA"):
+        env[key] = str(home_dir)
+    for key, name in (("XDG_CONFIG_HOME", "config"), ("XDG_DATA_HOME", "data"), ("XDG_CACHE_HOME", "cache")):
+        env[key] = str(home_dir / name)
+    env["SURVEYCONTROLLER_STARTUP_PROFILE"] = str(profile_path)
+    env["SURVEYCONTROLLER_STARTUP_PROFILE_EXIT"] = "1"
+    return env
+
+
+def run_cold_start() -> Dict[str, Any]:
+    """拉起一次完整启动，返回剖析报告外加进程外测得的首帧时间和导入统计。"""
+    with tempfile.TemporaryDirectory(prefix="surveycontroller-startup-") as temp_dir:
+        temp_root = Path(temp_dir)
+        profile_path = temp_root / "startup_profile.json"
+        home_dir = temp_root / "home"
+        home_dir.mkdir()
+        spawned_at = time.time()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", str(ENTRY_FILE)],
+            cwd=str(ROOT_DIR),
+            capture_output=True,
+            text=True,
+            env=_make_run_env(profile_path, home_dir),
+            timeout=RUN_TIMEOUT_SECONDS,
+        )
+        if not profile_path.exists():
+            tail = "\n".join(line for line in result.stderr.splitlines() if not line.startswith("import time:"))[-2000:]
+            raise RuntimeError(f"启动未写出剖析报告（退出码 {result.returncode}）：{tail}")
+        report = json.loads(profile_path.read_text(encoding="utf-8"))
+    first_paint_epoch = report.get("first_paint_epoch")
+    report["spawn_to_first_paint_ms"] = (
+        round((float(first_paint_epoch) - spawned_at) * 1000.0, 3) if first_paint_epoch else None
+    )
+    imports = _parse_importtime(result.stderr)
+    report["import_self_ms"] = round(sum(row[0] for row in imports) / 1000.0, 3)
+    report["top_imports"] = [
+        {"module": name, "cumulative_ms": round(cumulative / 1000.0, 3)}
+        for _self_us, cumulative, name in sorted(imports, key=lambda row: -row[1])[:15]
+    ]
+    return report
+
+
+def summarize(reports: List[Dict[str, Any]], budget_ms: float) -> Dict[str, Any]:
+    first_paints = [float(report["spawn_to_first_paint_ms"]) for report in reports if report.get("spawn_to_first_paint_ms")]
+    median_ms: Optional[float] = round(statistics.median(first_paints), 3) if first_paints else None
+    deferred = sorted({name for report in reports for name in report.get("deferred_loaded_before_paint") or []})
+    problems: List[str] = []
+    if median_ms is None:
+        problems.append("没有测到首帧时间")
+    elif median_ms > budget_ms:
+        problems.append(f"冷启动到首帧中位数 {median_ms:.0f}ms 超出预算 {budget_ms:.0f}ms")
+    if deferred:
+        problems.append(f"首帧前加载了应按需导入的模块：{', '.join(deferred)}")
+    return {
+        "kind": "startup_budget",
+        "ok": not problems,
+        "budget_ms": budget_ms,
+        "median_first_paint_ms": median_ms,
+        "runs_ms": first_paints,
+        "deferred_loaded_before_paint": deferred,
+        "message": "；".join(problems),
+    }
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"spawn->first paint={report.get('spawn_to_first_paint_ms')}ms "
+        f"in-process first paint={report.get('first_paint_ms')}ms "
+        f"import self total={report.get('import_self_ms')}ms modules={report.get('modules_total')}"
+    )
+    for phase in report.get("phases") or []:
+        packages = ", ".join(phase.get("top_packages") or [])
+        print(
+            f"  {phase['name']:<20} {phase['duration_ms']:9.1f}ms "
+            f"+{phase['imported_modules']:>4} modules {packages}"
+        )
+    print("  top imports (cumulative, including post-paint prewarm):")
+    for item in report.get("top_imports") or []:
+        print(f"    {item['cumulative_ms']:9.1f}ms  {item['module']}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.environ.get(ENV_STARTUP_BUDGET_MS, DEFAULT_STARTUP_BUDGET_MS)),
+    )
+    parser.add_argument("--quiet", action="store_true", help="只输出汇总结果")
+    args = parser.parse_args()
+
+    reports: List[Dict[str, Any]] = []
+    for index in range(max(1, int(args.runs))):
+        try:
+            report = run_cold_start()
+        except (RuntimeError, subprocess.TimeoutExpired) as exc:
+            summary = {"kind": "startup_budget", "ok": False, "message": f"第 {index + 1} 次冷启动失败：{exc}"}
+            print(CHILD_RESULT_PREFIX + json.dumps(summary, ensure_ascii=False))
+            return 1
+        reports.append(report)
+        if not args.quiet:
+            print(f"[run {index + 1}]")
+            _print_report(report)
+
+    summary = summarize(reports, float(args.budget_ms))
+    print(
+        f"median spawn->first paint={summary['median_first_paint_ms']}ms "
+        f"budget={summary['budget_ms']:.0f}ms runs={summary['runs_ms']}"
+    )
+    print(CHILD_RESULT_PREFIX + json.dumps(summary, ensure_ascii=False))
+    return 0 if summary["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""问卷星 HTML 解析基准：用单测夹具拼出大问卷，对比题干文本提取的新旧实现。"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+from unittest.mock import patch
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from wjx.provider import html_parser_rules  # noqa: E402
+from wjx.provider.html_parser import parse_survey_questions_from_html  # noqa: E402
+from wjx.provider.html_parser_common import _normalize_html_text  # noqa: E402
+
+FIXTURE_GLOB = "CI/unit_tests/providers/test_wjx_html_parser*.py"
+_TRIPLE_QUOTED_RE = re.compile(r'"""(.*?)"""', re.S)
+_LEGACY_EXCLUDED_SELECTORS = (
+    ".ui-controlgroup",
+    "ul",
+    "ol",
+    "table",
+    "textarea",
+    "select",
+    ".slider",
+    ".rangeslider",
+    ".range-slider",
+    ".errorMessage",
+)
+
+
+def _legacy_collect_text_outside_option_blocks(question_div) -> str:
+    """旧实现：序列化题目节点后重新建树，再删除选项子树取文本。"""
+    cloned_soup = BeautifulSoup(str(question_div), "html.parser")
+    for selector in _LEGACY_EXCLUDED_SELECTORS:
+        for element in cloned_soup.select(selector):
+            element.decompose()
+    return _normalize_html_text(cloned_soup.get_text(" ", strip=True))
+
+
+def load_fixture_question_divs() -> List[str]:
+    """从解析器单测里抽出所有带 topic 的题目节点 HTML。"""
+    question_divs: List[str] = []
+    for path in sorted(ROOT_DIR.glob(FIXTURE_GLOB)):
+        source = path.read_text(encoding="utf-8")
+        for match in _TRIPLE_QUOTED_RE.finditer(source):
+            html = match.group(1)
+            if "topic=" not in html:
+                continue
+            soup = BeautifulSoup(html, "html.parser")
+            for question_div in soup.find_all("div", attrs={"topic": True}):
+                question_divs.append(str(question_div))
+    return question_divs
+
+
+def build_large_survey_html(question_divs: List[str], question_count: int) -> str:
+    blocks: List[str] = []
+    for index in range(question_count):
+        template = question_divs[index % len(question_divs)]
+        number = index + 1
+        block = re.sub(r'\btopic="\d+"', f'topic="{number}"', template, count=1)
+        block = re.sub(r'\bid="div\d+"', f'id="div{number}"', block, count=1)
+        blocks.append(block)
+    return (
+        "<html><head><title>基准问卷</title></head><body>"
+        "<div id=\"divQuestion\"><fieldset>"
+        + "".join(blocks)
+        + "</fieldset></div></body></html>"
+    )
+
+
+def _time_call(func: Callable[[], object], repeat: int) -> List[float]:
+    samples: List[float] = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def _format_samples(label: str, samples: List[float]) -> str:
+    return (
+        f"{label:<28} median={statistics.median(samples) * 1000:8.2f}ms "
+        f"min={min(samples) * 1000:8.2f}ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--questions", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    question_divs = load_fixture_question_divs()
+    if not question_divs:
+        print("[FAIL] 未在解析器单测中找到题目夹具")
+        return 1
+    html = build_large_survey_html(question_divs, max(1, int(args.questions)))
+    soup = BeautifulSoup(html, "html.parser")
+    nodes = soup.find_all("div", attrs={"topic": True})
+
+    mismatches = [
+        node.get("topic")
+        for node in nodes
+        if _legacy_collect_text_outside_option_blocks(node)
+        != _normalize_html_text(html_parser_rules._collect_text_outside_option_blocks(node))
+    ]
+    if mismatches:
+        print(f"[FAIL] 新旧题干文本不一致：topic={mismatches[:10]}")
+        return 1
+
+    legacy_text = _time_call(
+        lambda: [_legacy_collect_text_outside_option_blocks(node) for node in nodes],
+        args.repeat,
+    )
+    current_text = _time_call(
+        lambda: [html_parser_rules._collect_text_outside_option_blocks(node) for node in nodes],
+        args.repeat,
+    )
+    with patch.object(
+        html_parser_rules,
+        "_collect_text_outside_option_blocks",
+        _legacy_collect_text_outside_option_blocks,
+    ):
+        legacy_parse = _time_call(lambda: parse_survey_questions_from_html(html), args.repeat)
+    current_parse = _time_call(lambda: parse_survey_questions_from_html(html), args.repeat)
+
+    print(f"fixtures={len(question_divs)} questions={len(nodes)} html_bytes={len(html.encode('utf-8'))}")
+    print(_format_samples("limit text (legacy reparse)", legacy_text))
+    print(_format_samples("limit text (tree walk)", current_text))
+    print(_format_samples("full parse (legacy reparse)", legacy_parse))
+    print(_format_samples("full parse (tree walk)", current_parse))
+    speedup = statistics.median(legacy_parse) / max(statistics.median(current_parse), 1e-9)
+    print(f"full parse speedup: {speedup:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -28,6 +28,8 @@ RUFF_SELECT = "F"
 CHILD_RESULT_PREFIX = "__WJX_CHECK__"
 IMPORT_TIMEOUT_SECONDS = 12
 WINDOW_SMOKE_TIMEOUT_SECONDS = 25
+STARTUP_BUDGET_TIMEOUT_SECONDS = 240
+STARTUP_BENCH_FILE = ROOT_DIR / "CI" / "benchmarks" / "startup_bench.py"
 UNIT_TEST_TIMEOUT_SECONDS = int(os.environ.get("SURVEY_CONTROLLER_UNIT_TEST_TIMEOUT_SECONDS", "120"))
 DEFAULT_UNIT_TEST_COVERAGE_FAIL_UNDER = "62"
 PYRIGHT_TIMEOUT_SECONDS = int(os.environ.get("SURVEY_CONTROLLER_PYRIGHT_TIMEOUT_SECONDS", "90"))
@@ -554,6 +556,35 @@ def run_window_smoke_check() -> dict | None:
     }
 
 
+def run_startup_budget_check() -> dict | None:
+    """冷启动到首帧超出预算，或首帧前加载了应按需导入的重依赖时报错。"""
+    env = make_child_env()
+    try:
+        result = subprocess.run(
+            [sys.executable, str(STARTUP_BENCH_FILE), "--quiet"],
+            cwd=str(ROOT_DIR),
+            capture_output=True,
+            text=True,
+            env=env,
+            timeout=STARTUP_BUDGET_TIMEOUT_SECONDS,
+        )
+    except subprocess.TimeoutExpired:
+        return {
+            "phase": "startup",
+            "message": f"Startup benchmark timed out (>{STARTUP_BUDGET_TIMEOUT_SECONDS}s).",
+        }
+
+    payload = extract_child_payload(result.stdout, result.stderr) or {}
+    if payload.get("kind") == "startup_budget" and payload.get("ok") is True:
+        return None
+
+    fallback_message = summarize_child_output(result.stdout, result.stderr)
+    return {
+        "phase": "startup",
+        "message": payload.get("message") or fallback_message or "Startup budget check failed.",
+    }
+
+
 def extract_coverage_summary(stdout: str) -> str | None:
     lines = stdout.splitlines()
     start_index: int | None = None
@@ -660,6 +691,11 @@ def print_issues(title: str, issues: Iterable[dict]) -> None:
                     print(f"   {line}")
             continue
 
+        if phase == "startup":
+            print(f"{index}. Cold start budget")
+            print(f"   {item['message']}")
+            continue
+
         if phase == "unit":
             print(f"{index}. Unit tests")
             print(f"   {item['message']}")
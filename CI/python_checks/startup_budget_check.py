@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+"""冷启动预算检查。"""
+
+from __future__ import annotations
+
+from CI.python_checks.common import (
+    configure_console_encoding,
+    ensure_target_dirs,
+    print_issues,
+    print_scan_targets,
+    run_startup_budget_check,
+)
+
+
+def main() -> int:
+    configure_console_encoding()
+    target_dirs = ensure_target_dirs()
+
+    print_scan_targets(target_dirs)
+    issue = run_startup_budget_check()
+    print(f"[INFO] Startup budget failures: {1 if issue else 0}")
+    if issue is None:
+        print("[PASS] Startup budget check passed.")
+        return 0
+
+    print("[FAIL] Startup budget check failed:")
+    print_issues("[Startup budget failures]", [issue])
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -24,6 +24,7 @@ from CI.python_checks.common import (
     run_module_import_checks,
     run_pyright_check,
     run_ruff_check,
+    run_startup_budget_check,
     run_type_ignore_check,
     run_unit_tests,
     run_window_smoke_check,
@@ -37,7 +38,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--full",
         action="store_true",
-        help="Enable module import and main window smoke checks. The default is quick mode.",
+        help="Enable module import, main window smoke, and startup budget checks. The default is quick mode.",
     )
     pyright_group = parser.add_mutually_exclusive_group()
     pyright_group.add_argument(
@@ -80,9 +81,11 @@ def main() -> int:
     if quick_mode:
         print("[INFO] Module import checks: skipped (use --full to enable)")
         print("[INFO] Main window smoke check: skipped (use --full to enable)")
+        print("[INFO] Startup budget check: skipped (use --full to enable)")
     else:
         print(f"[INFO] Module import checks: {len(modules)}")
         print("[INFO] Main window smoke check: enabled")
+        print("[INFO] Startup budget check: enabled")
 
     compile_issues = run_compile_checks(compile_targets)
     ruff_issues, ruff_error = run_ruff_check(target_dirs)
@@ -91,6 +94,7 @@ def main() -> int:
     unit_test_issue, coverage_summary = run_unit_tests()
     import_issues = run_module_import_checks(modules) if args.full else []
     window_issue = run_window_smoke_check() if args.full else None
+    startup_issue = run_startup_budget_check() if args.full else None
 
     if ruff_error:
         print(f"[ERROR] {ruff_error}")
@@ -107,6 +111,7 @@ def main() -> int:
         + (1 if unit_test_issue else 0)
         + len(import_issues)
         + (1 if window_issue else 0)
+        + (1 if startup_issue else 0)
     )
     elapsed = time.perf_counter() - start_time
 
@@ -121,6 +126,7 @@ def main() -> int:
         print(coverage_summary)
     print(f"[INFO] Module import failures: {len(import_issues)}")
     print(f"[INFO] Main window smoke failures: {1 if window_issue else 0}")
+    print(f"[INFO] Startup budget failures: {1 if startup_issue else 0}")
     print(f"[INFO] Elapsed time: {elapsed:.2f}s")
 
     if total_issues == 0:
@@ -128,7 +134,10 @@ def main() -> int:
             print("[PASS] Quick checks passed: compile, Ruff, Pyright, and unit tests all succeeded.")
             print("[INFO] For import and main window smoke checks, run: python CI/python_ci.py --full")
         else:
-            print("[PASS] Full checks passed: compile, Ruff, Pyright, unit tests, module import, and main window smoke checks all succeeded.")
+            print(
+                "[PASS] Full checks passed: compile, Ruff, Pyright, unit tests, module import, "
+                "main window smoke, and startup budget checks all succeeded."
+            )
         return 0
 
     print(f"[FAIL] Found {total_issues} issue(s):")
@@ -142,6 +151,8 @@ def main() -> int:
     print_issues("[Module import failures]", import_issues)
     if window_issue:
         print_issues("[Main window smoke failures]", [window_issue])
+    if startup_issue:
+        print_issues("[Startup budget failures]", [startup_issue])
 
     return 1
 
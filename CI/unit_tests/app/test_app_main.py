@@ -44,6 +44,7 @@ def test_main_returns_exit_code_and_avoids_hard_exit(monkeypatch) -> None:
         "ensure_user_data_directories",
         lambda: events.append("dirs"),
     )
+    monkeypatch.setattr(main_module, "_install_survey_definition_cache", lambda: events.append("survey_cache"))
     monkeypatch.setattr(main_module, "_enable_fault_handler", lambda: events.append("fault_on"))
     monkeypatch.setattr(main_module, "setup_logging", lambda: events.append("logging_on"))
     monkeypatch.setattr(main_module, "qInstallMessageHandler", lambda _handler: events.append("qt_msg"))
@@ -52,11 +53,22 @@ def test_main_returns_exit_code_and_avoids_hard_exit(monkeypatch) -> None:
         "install_qfluentwidgets_animation_guards",
         lambda: events.append("guards"),
     )
+    monkeypatch.setattr(
+        main_module.http_client,
+        "defer_prewarm",
+        lambda: events.append("defer_prewarm"),
+    )
     monkeypatch.setattr(
         main_module.http_client,
         "prewarm",
         lambda: events.append("prewarm"),
     )
+    monkeypatch.setattr(main_module, "start_startup_profile", lambda: events.append("profile_on"))
+    monkeypatch.setattr(
+        main_module,
+        "watch_first_paint",
+        lambda window, callback: (events.append("watch_paint"), callback()),
+    )
     monkeypatch.setattr(main_module, "_disable_fault_handler", lambda: events.append("fault_off"))
     monkeypatch.setattr(
         main_module.os,
@@ -84,13 +96,17 @@ def test_main_returns_exit_code_and_avoids_hard_exit(monkeypatch) -> None:
     assert fake_app.exec_calls == 1
     assert fake_window.shown == 1
     assert events == [
+        "profile_on",
         "velopack",
         "metadata",
         "dirs",
+        "survey_cache",
         "fault_on",
         "logging_on",
         "qt_msg",
         "guards",
+        "defer_prewarm",
+        "watch_paint",
         "prewarm",
         "logging_off",
         "fault_off",
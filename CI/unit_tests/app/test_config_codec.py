@@ -44,6 +44,11 @@ class ConfigCodecTests:
         assert payload["answer_datetime_window"] == ("2026-02-10 09:00:00", "2026-02-10 10:00:00")
         assert restored.answer_datetime_window == ("2026-02-10 09:00:00", "2026-02-10 10:00:00")
 
+    def test_runtime_config_roundtrip_keeps_ai_answer_pool_size(self) -> None:
+        restored = deserialize_runtime_config(serialize_runtime_config(RuntimeConfig(ai_answer_pool_size=5)))
+        assert restored.ai_answer_pool_size == 5
+        assert normalize_runtime_config_payload({"ai_answer_pool_size": "-3"}).ai_answer_pool_size == 0
+
     def test_runtime_config_roundtrip_keeps_questions_info_provider_metadata(self) -> None:
         config = RuntimeConfig(survey_provider='qq', questions_info=[SurveyQuestionMeta(num=3, title='联系方式', type_code='1', provider='qq', provider_question_id='question-3', provider_page_id='page-2', provider_type='text', option_texts=['姓名', '电话'], required=True, logic_parse_status='unknown', question_media=[{'kind': 'image', 'scope': 'title', 'index': None, 'source_url': 'https://example.com/q3.png', 'label': '题干图'}])])
         payload = serialize_runtime_config(config)
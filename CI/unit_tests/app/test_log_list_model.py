@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from PySide6.QtCore import Qt
+
+from software.logging.log_utils import LogBufferEntry
+from software.ui.widgets.log_list_view import LogListModel
+
+
+def _entry(seq: int, category: str = "INFO", text: str = "") -> LogBufferEntry:
+    return LogBufferEntry(text=text or f"日志-{seq}", category=category, seq=seq)
+
+
+class LogListModelTests:
+    def test_append_entries_trims_oldest_entries_and_reports_removed_rows(self) -> None:
+        model = LogListModel(capacity=3)
+        model.reset_entries([_entry(1), _entry(2)])
+
+        removed = model.append_entries([_entry(3, "ERROR", "错误\nTraceback\n  detail"), _entry(4), _entry(5)])
+
+        assert removed == 2
+        assert model.last_seq == 5
+        assert [model.data(model.index(row)) for row in range(model.rowCount())] == [
+            "错误",
+            "Traceback",
+            "  detail",
+            "日志-4",
+            "日志-5",
+        ]
+
+    def test_category_filter_keeps_applying_to_appended_rows(self) -> None:
+        model = LogListModel(capacity=10)
+        model.reset_entries([_entry(1), _entry(2, "ERROR"), _entry(3, "WARNING")])
+
+        model.set_category_filter(["ERROR"])
+        model.append_entries([_entry(4), _entry(5, "ERROR")])
+
+        assert [model.data(model.index(row)) for row in range(model.rowCount())] == ["日志-2", "日志-5"]
+        model.set_category_filter(None)
+        assert model.rowCount() == 5
+
+    def test_load_plain_text_colors_traceback_continuation_as_error(self) -> None:
+        model = LogListModel()
+        model.set_colors({"ERROR": "#ff0000", "DEFAULT": "#888888"})
+
+        model.load_plain_text("2024-01-01 00:00:00 [ERROR] 失败\n  File x\n普通行")
+
+        colors = [model.data(model.index(row), Qt.ItemDataRole.ForegroundRole).name() for row in range(model.rowCount())]
+        assert colors == ["#ff0000", "#ff0000", "#888888"]
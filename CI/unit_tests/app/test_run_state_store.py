@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from types import MappingProxyType
+
+import pytest
+
+from software.core.questions.schema import QuestionEntry
+from software.ui.controller.run_state_store import RunStateStore, snapshot_paths_changed
+
+
+def _entry(probabilities: list[float], question_num: int) -> QuestionEntry:
+    return QuestionEntry(
+        question_type="single",
+        probabilities=list(probabilities),
+        option_count=len(probabilities),
+        question_num=question_num,
+    )
+
+
+class RunStateStoreTests:
+    def test_runtime_patch_shares_unchanged_subtrees_and_reports_paths(self) -> None:
+        events: list[tuple[dict, object]] = []
+        store = RunStateStore(on_runtime_snapshot_changed=lambda snapshot, paths: events.append((snapshot, paths)))
+        before = store.get_runtime_snapshot()
+
+        store.apply_runtime_patch({"progress": {"current": 3}, "status_text": "运行中"})
+
+        after = store.get_runtime_snapshot()
+        assert after["progress"]["current"] == 3
+        assert after["progress"] is not before["progress"]
+        assert after["threads"] is before["threads"]
+        assert after["settings"] is before["settings"]
+        assert len(events) == 1
+        assert events[0][1] == frozenset({("progress", "current"), ("status_text",)})
+
+    def test_noop_patch_does_not_emit(self) -> None:
+        events: list[object] = []
+        store = RunStateStore(on_runtime_snapshot_changed=lambda _snapshot, paths: events.append(paths))
+        store.apply_runtime_patch({"threads": {"rows": [{"thread_name": "Slot-1"}]}})
+
+        store.apply_runtime_patch({"threads": {"rows": [{"thread_name": "Slot-1"}]}, "running": False})
+
+        assert len(events) == 1
+
+    def test_thread_rows_patch_keeps_identity_of_unchanged_rows(self) -> None:
+        store = RunStateStore()
+        store.apply_runtime_patch({"threads": {"rows": [{"thread_name": "Slot-1", "success": 1}, {"thread_name": "Slot-2", "success": 0}]}})
+        first, second = store.get_runtime_snapshot()["threads"]["rows"]
+
+        store.apply_runtime_patch({"threads": {"rows": [{"thread_name": "Slot-1", "success": 1}, {"thread_name": "Slot-2", "success": 2}]}})
+
+        rows = store.get_runtime_snapshot()["threads"]["rows"]
+        assert rows[0] is first
+        assert rows[1] is not second
+        assert rows[1]["success"] == 2
+
+    def test_snapshot_is_read_only(self) -> None:
+        store = RunStateStore()
+        store.apply_runtime_patch({"threads": {"rows": [{"thread_name": "Slot-1"}]}})
+        snapshot = store.get_runtime_snapshot()
+
+        assert isinstance(snapshot["progress"], MappingProxyType)
+        assert isinstance(snapshot["threads"]["rows"], tuple)
+        with pytest.raises(TypeError):
+            snapshot["progress"]["current"] = 9  # type: ignore[index]
+        # 顶层是浅拷贝，调用方改动不会回写到仓库
+        snapshot["running"] = True
+        assert store.get_runtime_snapshot()["running"] is False
+
+    def test_replace_question_entries_keeps_unchanged_entries(self) -> None:
+        events: list[object] = []
+        store = RunStateStore(on_survey_snapshot_changed=lambda _snapshot, paths: events.append(paths))
+        store.replace_question_entries([_entry([1, 1], 1), _entry([2, 1], 2)])
+        first, second = store.get_survey_snapshot()["question_entries"]
+
+        store.replace_question_entries([_entry([1, 1], 1), _entry([5, 1], 2)])
+
+        entries = store.get_survey_snapshot()["question_entries"]
+        assert entries[0] is first
+        assert entries[1] is not second
+        assert entries[1].probabilities == [5, 1]
+        assert events[-1] == frozenset({("question_entries",)})
+
+    def test_hydrate_emits_full_refresh(self) -> None:
+        from software.core.config.schema import RuntimeConfig
+
+        events: list[object] = []
+        store = RunStateStore(on_survey_snapshot_changed=lambda _snapshot, paths: events.append(paths))
+
+        store.hydrate_from_config(RuntimeConfig(url="https://v.wjx.cn/vm/abc.aspx"))
+
+        assert events == [None]
+
+
+class SnapshotPathsChangedTests:
+    def test_matches_prefix_parent_and_child_paths(self) -> None:
+        paths = frozenset({("progress", "current")})
+
+        assert snapshot_paths_changed(paths, "progress")
+        assert snapshot_paths_changed(paths, ("progress", "current", "extra"))
+        assert not snapshot_paths_changed(paths, ("progress", "target"))
+        assert not snapshot_paths_changed(paths, "threads", "random_ip")
+
+    def test_none_means_full_refresh(self) -> None:
+        assert snapshot_paths_changed(None, "anything")
+        assert not snapshot_paths_changed(frozenset(), "anything")
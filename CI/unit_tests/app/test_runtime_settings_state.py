@@ -156,6 +156,24 @@ def test_run_controller_writes_runtime_state_to_config(qapp) -> None:
     assert cfg.answer_datetime_window == ("2026-02-10 09:00:00", "2026-02-10 10:00:00")
 
 
+def test_run_controller_save_current_config_copies_snapshot_entries(qapp, monkeypatch) -> None:
+    import software.ui.controller.run_controller as run_controller_module
+    from software.core.questions.schema import QuestionEntry
+
+    monkeypatch.setattr(run_controller_module, "save_config", lambda cfg, path=None: str(path or ""))
+    controller = RunController()
+    controller.replace_question_entries(
+        [QuestionEntry(question_type="single", probabilities=[1.0, 1.0], option_count=2, question_num=1)]
+    )
+
+    controller.save_current_config("demo.json")
+
+    snapshot_entry = controller.get_survey_snapshot()["question_entries"][0]
+    assert controller.config.question_entries[0] is not snapshot_entry
+    controller.config.question_entries[0].probabilities[0] = 9.0
+    assert snapshot_entry.probabilities == [1.0, 1.0]
+
+
 def test_runtime_settings_state_writes_to_config() -> None:
     state = RuntimeSettingsState()
     state.update(
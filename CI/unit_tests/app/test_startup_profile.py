@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import logging
+import sys
+
+from PySide6.QtWidgets import QWidget
+
+import software.app.startup_profile as startup_profile
+from software.app.startup_profile import (
+    ENV_STARTUP_PROFILE,
+    ENV_STARTUP_PROFILE_EXIT,
+    StartupProfiler,
+    finish_startup_profile,
+    mark_startup_first_paint,
+    mark_startup_phase,
+    start_startup_profile,
+    watch_first_paint,
+)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 10.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StartupProfilerTests:
+    def test_phases_record_duration_and_newly_imported_modules(self, monkeypatch, tmp_path) -> None:
+        clock = _FakeClock()
+        profiler = StartupProfiler(str(tmp_path / "profile.json"), clock=clock)
+
+        clock.now += 0.25
+        monkeypatch.setitem(sys.modules, "fake_startup_pkg", object())
+        monkeypatch.setitem(sys.modules, "fake_startup_pkg.child", object())
+        bootstrap = profiler.mark("bootstrap")
+        clock.now += 0.5
+        window = profiler.mark("create_window")
+
+        assert bootstrap.duration_ms == 250.0
+        assert bootstrap.imported_modules == 2
+        assert bootstrap.top_packages == ["fake_startup_pkg(2)"]
+        assert window.started_ms == 250.0
+        assert window.duration_ms == 500.0
+        assert window.imported_modules == 0
+
+    def test_first_paint_reports_deferred_modules_already_loaded(self, monkeypatch, tmp_path) -> None:
+        clock = _FakeClock()
+        output_path = tmp_path / "nested" / "profile.json"
+        profiler = StartupProfiler(str(output_path), clock=clock)
+        monkeypatch.setattr(startup_profile, "DEFERRED_STARTUP_MODULES", ("fake_heavy_dep", "fake_missing_dep"))
+        monkeypatch.setitem(sys.modules, "fake_heavy_dep", object())
+
+        clock.now += 1.5
+        profiler.mark_first_paint()
+        clock.now += 1.0
+        profiler.mark_first_paint()
+        profiler.write_report()
+
+        report = json.loads(output_path.read_text(encoding="utf-8"))
+        assert report["first_paint_ms"] == 1500.0
+        assert report["first_paint_epoch"] is not None
+        assert report["deferred_loaded_before_paint"] == ["fake_heavy_dep"]
+        assert [phase["name"] for phase in report["phases"]] == ["first_paint"]
+
+
+class StartupProfileEnvironmentTests:
+    def test_profile_is_disabled_without_environment_variable(self) -> None:
+        assert start_startup_profile({}) is None
+        assert start_startup_profile({ENV_STARTUP_PROFILE: "0"}) is None
+
+        mark_startup_phase("bootstrap")
+        mark_startup_first_paint()
+        assert finish_startup_profile() is None
+
+    def test_enabled_profile_writes_report_on_finish(self, tmp_path) -> None:
+        output_path = tmp_path / "startup.json"
+        profiler = start_startup_profile({ENV_STARTUP_PROFILE: str(output_path), ENV_STARTUP_PROFILE_EXIT: "0"})
+
+        assert profiler is not None
+        assert profiler.exit_after_first_paint is False
+        mark_startup_phase("bootstrap")
+        mark_startup_first_paint()
+
+        assert finish_startup_profile() == str(output_path)
+        report = json.loads(output_path.read_text(encoding="utf-8"))
+        assert [phase["name"] for phase in report["phases"]] == ["bootstrap", "first_paint"]
+        assert startup_profile.get_startup_profiler() is None
+
+    def test_write_failure_is_logged_instead_of_raised(self, caplog, tmp_path) -> None:
+        output_path = tmp_path / "occupied"
+        output_path.mkdir()
+        start_startup_profile({ENV_STARTUP_PROFILE: str(output_path)})
+
+        with caplog.at_level(logging.WARNING):
+            assert finish_startup_profile() is None
+
+        assert any("finish_startup_profile" in record.getMessage() for record in caplog.records)
+        assert startup_profile.get_startup_profiler() is None
+
+    def test_flag_value_writes_into_logs_directory(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setattr("software.app.user_paths.get_user_logs_directory", lambda: str(tmp_path))
+
+        profiler = start_startup_profile({ENV_STARTUP_PROFILE: "1"})
+
+        assert profiler is not None
+        assert profiler.output_path == str(tmp_path / startup_profile.STARTUP_PROFILE_FILENAME)
+        assert finish_startup_profile() == profiler.output_path
+
+
+class FirstPaintWatcherTests:
+    def test_callback_fires_once_after_first_paint(self, qtbot) -> None:
+        calls: list[str] = []
+        widget = QWidget()
+        qtbot.addWidget(widget)
+        watch_first_paint(widget, lambda: calls.append("painted"))
+
+        widget.show()
+        qtbot.waitUntil(lambda: calls == ["painted"], timeout=2000)
+        widget.update()
+        qtbot.wait(20)
+
+        assert calls == ["painted"]
+
+    def test_fallback_timer_fires_when_window_never_paints(self, qtbot) -> None:
+        calls: list[str] = []
+        widget = QWidget()
+        qtbot.addWidget(widget)
+        startup_profile.FirstPaintWatcher(widget, lambda: calls.append("fallback"), fallback_ms=10)
+
+        qtbot.waitUntil(lambda: calls == ["fallback"], timeout=2000)
@@ -40,6 +40,7 @@ class _FakeController(QObject):
         self.parse_calls: list[str] = []
         self.stop_calls = 0
         self.resume_calls = 0
+        self.ai_reload_calls = 0
 
     def get_runtime_ui_state(self):
         return dict(self.state)
@@ -82,6 +83,10 @@ class _FakeController(QObject):
     def resume_run(self) -> None:
         self.resume_calls += 1
 
+    def reload_ai_settings(self) -> bool:
+        self.ai_reload_calls += 1
+        return True
+
     def refresh_random_ip_counter(self, **_kwargs) -> None:
         return None
 
@@ -151,6 +156,24 @@ def test_runtime_page_builds_and_syncs_config_without_network(monkeypatch, qtbot
     assert cfg.ai_system_prompt
 
 
+def test_runtime_page_reloads_running_ai_settings_once_after_saves(monkeypatch, qtbot) -> None:
+    _patch_page_dependencies(monkeypatch)
+    controller = _FakeController()
+    page = RuntimePage(controller)
+    qtbot.addWidget(page)
+    section = page.ai_section
+
+    section.ai_apikey_edit.setText("key-1")
+    section._on_ai_apikey_changed()
+    section.ai_baseurl_edit.setText("https://example.com/v1")
+    section._on_ai_baseurl_changed()
+
+    assert controller.ai_reload_calls == 0
+    qtbot.waitUntil(lambda: controller.ai_reload_calls == 1, timeout=2000)
+    qtbot.wait(section._AI_RELOAD_DEBOUNCE_MS + 100)
+    assert controller.ai_reload_calls == 1
+
+
 def test_strategy_page_builds_rules_and_dimension_sections(monkeypatch, qtbot) -> None:
     _patch_page_dependencies(monkeypatch)
     page = QuestionStrategyPage()
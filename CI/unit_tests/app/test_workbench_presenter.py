@@ -197,6 +197,7 @@ def _presenter_with_fakes() -> WorkbenchPresenter:
     dynamic.host = _FakeHost()
     dynamic._last_running_state = None
     dynamic._last_pause_state = None
+    dynamic._snapshot_item_copies = {}
     presenter.state = WorkbenchState()
     dynamic.runtime_page = _FakeRuntimePage()
     dynamic.dashboard = _FakeDashboard()
@@ -272,6 +273,36 @@ def test_workbench_presenter_survey_parsed_updates_state_and_context() -> None:
     assert reverse_fill_page.contexts[-1]["question_entries"] == [entry]
 
 
+def test_workbench_presenter_copies_only_changed_snapshot_items() -> None:
+    presenter = _presenter_with_fakes()
+    first_entry, second_entry = _question_entry(1), _question_entry(2)
+    first_meta, second_meta = _question_meta(1), _question_meta(2)
+    snapshot = {
+        "phase": "ready",
+        "survey_title": "Parsed",
+        "questions_info": (first_meta, second_meta),
+        "question_entries": (first_entry, second_entry),
+    }
+
+    presenter.on_survey_snapshot_changed(snapshot, frozenset({("question_entries",)}))
+    first_copies = presenter.state.get_entries()
+    changed_entry = _question_entry(2)
+    changed_entry.question_title = "Q2 改"
+    presenter.on_survey_snapshot_changed(
+        {**snapshot, "question_entries": (first_entry, changed_entry)},
+        frozenset({("question_entries",)}),
+    )
+    second_copies = presenter.state.get_entries()
+
+    # 页面拿到的是副本，不会改到共享快照；未变化的题目复用上次的副本
+    assert first_copies[0] is not first_entry
+    assert first_copies[0] == first_entry
+    assert second_copies[0] is first_copies[0]
+    assert second_copies[1] is not first_copies[1]
+    assert second_copies[1] is not changed_entry
+    assert second_copies[1].question_title == "Q2 改"
+
+
 def test_workbench_presenter_syncs_urls_without_looping() -> None:
     presenter = _presenter_with_fakes()
     dashboard = cast(_FakeDashboard, presenter.dashboard)
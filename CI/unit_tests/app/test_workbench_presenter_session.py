@@ -43,6 +43,7 @@ def _presenter() -> WorkbenchPresenter:
     p = WorkbenchPresenter.__new__(WorkbenchPresenter)
     p.controller = controller
     p.host = SimpleNamespace(toasts=[], _toast=lambda text, level="info": p.host.toasts.append((text, level)))
+    p._snapshot_item_copies = {}
     p.state = WorkbenchState()
     p.runtime_page = SimpleNamespace(apply_config=MagicMock())
     p.strategy_page = SimpleNamespace(
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 
 from software.core.ai import runtime as ai_runtime
+from software.core.ai.answer_pool import _split_batch_answers, use_ai_answer_pool
 
 
 class AiRuntimeTests:
@@ -26,3 +27,101 @@ class AiRuntimeTests:
             assert "临时故障" in str(exc)
 
         assert len(calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_agenerate_ai_answer_serves_pooled_answers_with_one_batch_call(self, monkeypatch) -> None:
+        calls: list[tuple[str, str, int | None, object]] = []
+        snapshot = object()
+
+        async def _generate(prompt, *, question_type, blank_count=None, runtime_settings=None):
+            calls.append((prompt, question_type, blank_count, runtime_settings))
+            await ai_runtime.asyncio.sleep(0)
+            return "答案一||答案二||答案一||答案三"
+
+        monkeypatch.setattr(ai_runtime, "agenerate_answer", _generate)
+        pool = ai_runtime.build_ai_answer_pool(3, snapshot)
+        try:
+            with use_ai_answer_pool(pool):
+                answers = await ai_runtime.asyncio.gather(
+                    ai_runtime.agenerate_ai_answer("1. 你的建议？", question_type="fill_blank"),
+                    ai_runtime.agenerate_ai_answer("1. 你的建议？", question_type="fill_blank"),
+                )
+                answers.append(await ai_runtime.agenerate_ai_answer("1. 你的建议？", question_type="fill_blank"))
+        finally:
+            await pool.close()
+
+        assert sorted(answers) == ["答案一", "答案三", "答案二"]
+        assert calls[0][1:] == ("multi_fill_blank", 3, snapshot)
+        stats = pool.snapshot_stats()
+        assert stats.misses == 2
+        assert stats.hits == 1
+        assert stats.answers_generated >= 3
+
+    def test_split_batch_answers_strips_preamble_and_numbering_and_caps_count(self) -> None:
+        raw = "以下是 3 个回答：\n1. 多开晚班\n2、增加座位\n（3）延长 1.5 小时\n4. 多余的回答"
+        assert _split_batch_answers(raw, 3) == ["多开晚班", "增加座位", "延长 1.5 小时"]
+        assert _split_batch_answers("好的，回答如下：\n- 甲||- 乙||乙", 3) == ["甲", "乙"]
+
+    @pytest.mark.asyncio
+    async def test_batch_prompt_asks_for_separated_answers_without_numbering(self, monkeypatch) -> None:
+        prompts: list[str] = []
+
+        async def _generate(prompt, *, question_type, blank_count=None, runtime_settings=None):
+            prompts.append(prompt)
+            return "甲||乙"
+
+        monkeypatch.setattr(ai_runtime, "agenerate_answer", _generate)
+        await ai_runtime._agenerate_answer_batch("你的建议？", 2)
+
+        assert "||" in prompts[0]
+        assert "不要编号" in prompts[0]
+
+    @pytest.mark.asyncio
+    async def test_agenerate_ai_answer_falls_back_when_pool_batch_fails(self, monkeypatch) -> None:
+        async def _generate(prompt, *, question_type, blank_count=None, runtime_settings=None):
+            if question_type == "multi_fill_blank":
+                raise RuntimeError("批量失败")
+            return "单次答案"
+
+        monkeypatch.setattr(ai_runtime, "agenerate_answer", _generate)
+        pool = ai_runtime.build_ai_answer_pool(4)
+        try:
+            with use_ai_answer_pool(pool):
+                answer = await ai_runtime.agenerate_ai_answer("题目", question_type="fill_blank")
+        finally:
+            await pool.close()
+
+        assert answer == "单次答案"
+        assert pool.snapshot_stats().failed_batches == 1
+
+    @pytest.mark.asyncio
+    async def test_rebind_ai_answer_pool_discards_answers_from_previous_settings(self, monkeypatch) -> None:
+        old_settings = object()
+        new_settings = object()
+        old_started = ai_runtime.asyncio.Event()
+        release_old = ai_runtime.asyncio.Event()
+        calls: list[object] = []
+
+        async def _generate(prompt, *, question_type, blank_count=None, runtime_settings=None):
+            calls.append(runtime_settings)
+            if runtime_settings is old_settings:
+                old_started.set()
+                await release_old.wait()
+                return "旧一||旧二||旧三||旧四"
+            return "新一||新二||新三||新四"
+
+        monkeypatch.setattr(ai_runtime, "agenerate_answer", _generate)
+        pool = ai_runtime.build_ai_answer_pool(4, old_settings)
+        assert pool is not None
+        try:
+            waiting = ai_runtime.asyncio.create_task(pool.take("你的建议？"))
+            await old_started.wait()
+            ai_runtime.rebind_ai_answer_pool(pool, new_settings)
+            release_old.set()
+            # 旧配置的在途补货作废，等待中的调用回退单次生成
+            assert await waiting is None
+            assert await pool.take("你的建议？") == "新一"
+        finally:
+            await pool.close()
+
+        assert calls == [old_settings, new_settings]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from software.core.persona import context
 
 
@@ -46,6 +48,32 @@ class PersonaContextTests:
 
         assert result == [3.0, 2.0, 3.0]
 
+    def test_apply_persona_boost_caches_mask_and_logs_matches_once(self, patch_attrs) -> None:
+        persona = _Persona({"city": ["北京", "北京市"], "age": ["18"]})
+        patch_attrs((context, "get_current_persona", lambda: persona))
+        logged: list[str] = []
+        patch_attrs((context.logging, "info", lambda message, *args: logged.append(message % args)))
+        calls = {"count": 0}
+        original_keyword_map = persona.to_keyword_map
+
+        def _counting_keyword_map() -> dict[str, list[str]]:
+            calls["count"] += 1
+            return original_keyword_map()
+
+        patch_attrs((persona, "to_keyword_map", _counting_keyword_map))
+        context.reset_context()
+        texts = ["北京市", "18岁", "上海"]
+
+        first = context.apply_persona_boost(texts, [1.0, 1.0, 1.0])
+        second = context.apply_persona_boost(texts, [2.0, 2.0, 2.0])
+
+        assert first == [3.0, 3.0, 1.0]
+        assert second == [6.0, 6.0, 2.0]
+        assert calls["count"] == 1
+        assert len(logged) == 1
+        assert "2 个选项" in logged[0]
+        assert "北京市" in logged[0]
+
     def test_build_ai_context_prompt_includes_persona_and_recent_answers(self, patch_attrs) -> None:
         context.reset_context()
         patch_attrs((context, "get_current_persona", lambda: _Persona(description="25岁，北京用户")))
@@ -66,3 +94,39 @@ class PersonaContextTests:
         patch_attrs((context, "get_current_persona", lambda: None))
 
         assert context.build_ai_context_prompt() == ""
+
+    def test_concurrent_slot_coroutines_keep_isolated_answer_contexts(self) -> None:
+        from software.core.persona import generator
+        from software.core.questions import consistency
+        from software.core.task.answer_context import use_answer_context
+
+        async def _slot(name: str, selected: int, started: asyncio.Event, peers_started: asyncio.Event) -> tuple:
+            with use_answer_context():
+                generator.set_current_persona(_Persona(description=name))
+                context.reset_context()
+                consistency.reset_consistency_context([])
+                context.record_answer(1, "single", selected_indices=[selected])
+                started.set()
+                await peers_started.wait()
+                return (
+                    generator.get_current_persona().to_description(),
+                    context.get_answered()[1].selected_indices,
+                )
+
+        async def _run() -> list:
+            events = [asyncio.Event() for _ in range(2)]
+            both_started = asyncio.Event()
+
+            async def _gate() -> None:
+                await asyncio.gather(*(event.wait() for event in events))
+                both_started.set()
+
+            gate = asyncio.create_task(_gate())
+            results = await asyncio.gather(
+                _slot("slot-1", 0, events[0], both_started),
+                _slot("slot-2", 1, events[1], both_started),
+            )
+            await gate
+            return results
+
+        assert asyncio.run(_run()) == [("slot-1", [0]), ("slot-2", [1])]
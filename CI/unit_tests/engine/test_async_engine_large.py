@@ -85,7 +85,7 @@ class _DoneFuture:
 
 
 def _build_engine() -> AsyncRuntimeEngine:
-    return AsyncRuntimeEngine(status_bus=SimpleNamespace(emit=lambda _event: None))
+    return AsyncRuntimeEngine(status_bus=SimpleNamespace(emit=lambda _event: None, flush=lambda: 0))
 
 
 class AsyncRuntimeEngineLargeTests:
@@ -191,7 +191,7 @@ class AsyncRuntimeEngineLargeTests:
         config = ExecutionConfig(num_threads=2, target_num=5, survey_provider="wjx")
         state = ExecutionState(config=config)
         bus_events: list[dict[str, object]] = []
-        engine._status_bus = SimpleNamespace(emit=lambda event: bus_events.append(event))
+        engine._status_bus = SimpleNamespace(emit=lambda event: bus_events.append(event), flush=lambda: 0)
         created_runners: list[SimpleNamespace] = []
         created_schedulers: list[SimpleNamespace] = []
 
@@ -236,6 +236,38 @@ class AsyncRuntimeEngineLargeTests:
         assert engine._pause_event is None
         assert engine._state is None
 
+    @pytest.mark.asyncio
+    async def test_run_builds_ai_answer_pool_with_configured_size(self, monkeypatch) -> None:
+        engine = _build_engine()
+        config = ExecutionConfig(num_threads=1, target_num=1, survey_provider="wjx", ai_answer_pool_size=4)
+        state = ExecutionState(config=config)
+        engine._status_bus = SimpleNamespace(emit=lambda _event: None, flush=lambda: 0)
+        pool_sizes: list[int] = []
+
+        class _FakeRunner:
+            def __init__(self, **_kwargs) -> None:
+                pass
+
+            async def run(self) -> None:
+                raise RuntimeError("stop after start")
+
+        class _FakeScheduler:
+            def __init__(self, *, concurrency: int) -> None:
+                self.concurrency = concurrency
+
+            async def close(self) -> None:
+                return None
+
+        monkeypatch.setattr(async_engine, "AsyncScheduler", _FakeScheduler)
+        monkeypatch.setattr(async_engine, "AsyncRunContext", lambda **kwargs: SimpleNamespace(**kwargs))
+        monkeypatch.setattr(async_engine, "AsyncSlotRunner", _FakeRunner)
+        monkeypatch.setattr(async_engine, "build_ai_answer_pool", lambda size, _settings: pool_sizes.append(size))
+
+        with pytest.raises(RuntimeError, match="stop after start"):
+            await engine._run(config=config, state=state, runtime_bridge=None)
+
+        assert pool_sizes == [4]
+
     @pytest.mark.asyncio
     async def test_run_starts_async_proxy_prefetch_without_blocking_slots(self, monkeypatch) -> None:
         engine = _build_engine()
@@ -400,6 +432,27 @@ class AsyncRuntimeEngineLargeTests:
         assert engine._thread is None
         assert thread.join_calls == [2.5]
 
+    def test_reload_ai_settings_swaps_snapshot_and_rebinds_answer_pool(self, monkeypatch) -> None:
+        import software.integrations.ai.runtime_settings as runtime_settings
+
+        engine = _build_engine()
+        snapshot = SimpleNamespace(model="changed-model")
+        monkeypatch.setattr(runtime_settings, "build_ai_runtime_settings", lambda: snapshot)
+        assert engine.reload_ai_settings() is False
+
+        config = ExecutionConfig(survey_provider="wjx", ai_runtime_settings=SimpleNamespace(model="old-model"))
+        loop = _FakeLoop()
+        rebound: list[object] = []
+        pool = SimpleNamespace(rebind=rebound.append)
+        engine._loop = loop
+        engine._state = ExecutionState(config=config)
+        engine._ai_answer_pool = pool
+
+        assert engine.reload_ai_settings() is True
+        assert config.ai_runtime_settings is snapshot
+        assert loop.threadsafe_calls == [(async_engine.rebind_ai_answer_pool, (pool, snapshot))]
+        assert len(rebound) == 1
+
     def test_async_engine_client_forwards_all_calls(self) -> None:
         calls: list[tuple[str, object]] = []
         future = concurrent.futures.Future()
@@ -410,6 +463,7 @@ class AsyncRuntimeEngineLargeTests:
             stop_run=lambda: calls.append(("stop_run", None)),
             pause_run=lambda reason="": calls.append(("pause_run", reason)),
             resume_run=lambda: calls.append(("resume_run", None)),
+            reload_ai_settings=lambda: calls.append(("reload_ai_settings", None)) or True,
             parse_survey=lambda url: calls.append(("parse_survey", url)) or future,
             submit_ui_task=lambda task_name, coro_factory: calls.append(("submit_ui_task", task_name)) or future,
             shutdown=lambda timeout=5.0: calls.append(("shutdown", timeout)),
@@ -423,6 +477,7 @@ class AsyncRuntimeEngineLargeTests:
         client.stop_run()
         client.pause_run("pause")
         client.resume_run()
+        assert client.reload_ai_settings() is True
         assert client.parse_survey("https://example.com") is future
         assert client.submit_ui_task("task", lambda: asyncio.sleep(0)) is future
         client.shutdown(timeout=1.2)
@@ -432,6 +487,7 @@ class AsyncRuntimeEngineLargeTests:
             "stop_run",
             "pause_run",
             "resume_run",
+            "reload_ai_settings",
             "parse_survey",
             "submit_ui_task",
             "shutdown",
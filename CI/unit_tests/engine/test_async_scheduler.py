@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 
-from software.core.engine.async_scheduler import AsyncScheduler
+from software.core.engine.async_scheduler import AsyncScheduler, LowestTokenFirstPolicy
 
 
 async def test_scheduler_enforces_bounded_tokens() -> None:
@@ -67,3 +67,77 @@ async def test_scheduler_release_before_wait_does_not_lose_wakeup() -> None:
         assert reacquired == token
     finally:
         await scheduler.close()
+
+
+async def test_scheduler_release_wakes_exactly_one_waiter() -> None:
+    scheduler = AsyncScheduler(concurrency=1)
+    try:
+        token = await scheduler.acquire()
+        assert token is not None
+        waiters = [asyncio.create_task(scheduler.acquire()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        assert scheduler.snapshot_metrics().waiting_acquirers == 5
+
+        await scheduler.release(token, requeue=True)
+        await asyncio.sleep(0.01)
+
+        assert [task.done() for task in waiters] == [True, False, False, False, False]
+        assert waiters[0].result() == token
+        assert scheduler.snapshot_metrics().waiting_acquirers == 4
+    finally:
+        await scheduler.close()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+
+async def test_scheduler_delayed_tokens_wake_in_ready_order_without_polling() -> None:
+    scheduler = AsyncScheduler(concurrency=2)
+    try:
+        first = await scheduler.acquire()
+        second = await scheduler.acquire()
+        await scheduler.release(first or 0, requeue=True, delay_seconds=0.2)
+        await scheduler.release(second or 0, requeue=True, delay_seconds=0.02)
+        metrics = scheduler.snapshot_metrics()
+        assert metrics.delayed_size == 2
+        assert metrics.ready_depth == 0
+
+        assert await asyncio.wait_for(scheduler.acquire(), timeout=1.0) == second
+        assert scheduler.snapshot_metrics().delayed_size == 1
+        assert await asyncio.wait_for(scheduler.acquire(), timeout=1.0) == first
+        metrics = scheduler.snapshot_metrics()
+        assert metrics.delayed_size == 0
+        assert metrics.acquired_total == 4
+        assert metrics.waited_total == 2
+        assert metrics.wait_seconds_max > 0
+    finally:
+        await scheduler.close()
+
+
+async def test_scheduler_cancelled_waiter_returns_handed_token() -> None:
+    scheduler = AsyncScheduler(concurrency=1)
+    try:
+        token = await scheduler.acquire()
+        assert token is not None
+        cancelled = asyncio.create_task(scheduler.acquire())
+        survivor = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0.01)
+
+        await scheduler.release(token, requeue=True)
+        cancelled.cancel()
+        await asyncio.gather(cancelled, return_exceptions=True)
+
+        assert await asyncio.wait_for(survivor, timeout=1.0) == token
+    finally:
+        await scheduler.close()
+
+
+async def test_scheduler_lowest_token_first_policy_prefers_small_ids() -> None:
+    scheduler = AsyncScheduler(concurrency=3, policy=LowestTokenFirstPolicy())
+    try:
+        tokens = [await scheduler.acquire() for _ in range(3)]
+        assert tokens == [0, 1, 2]
+        await scheduler.release(2, requeue=True)
+        await scheduler.release(0, requeue=True)
+        assert await scheduler.acquire() == 0
+        assert await scheduler.acquire() == 2
+    finally:
+        await scheduler.close()
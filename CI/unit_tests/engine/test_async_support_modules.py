@@ -7,51 +7,71 @@ from types import SimpleNamespace
 import pytest
 
 from software.core.engine.async_events import AsyncRunContext, ThreadEventProxy
-from software.core.engine.async_status_bus import AsyncStatusBus
+from software.core.engine.async_status_bus import AsyncStatusBus, AsyncStatusBusStats
 
 
 class AsyncStatusBusTests:
-    def test_emit_dispatches_callback_with_sequence(self, patch_attrs) -> None:
+    def test_emit_dispatches_callback_with_sequence(self) -> None:
         delivered: list[str] = []
         bus = AsyncStatusBus(
             dispatcher=lambda callback: callback(),
-            throttle_seconds=0.0,
+            flush_interval_seconds=0.0,
         )
-        patch_attrs((__import__("software.core.engine.async_status_bus", fromlist=["time"]).time, "monotonic", lambda: 10.0))
+        event = {"slot_id": "slot-1", "callback": lambda: delivered.append("ok")}
 
-        bus.emit({"slot_id": "slot-1", "callback": lambda: delivered.append("ok")})
+        bus.emit(event)
 
         assert delivered == ["ok"]
+        assert event["sequence"] == 1
 
-    def test_emit_throttles_high_frequency_events(self, patch_attrs) -> None:
-        module = __import__("software.core.engine.async_status_bus", fromlist=["time"])
-        timestamps = iter([1.0, 1.01])
+    def test_emit_coalesces_high_frequency_events_to_latest_per_slot(self) -> None:
         dispatched: list[str] = []
-        patch_attrs((module.time, "monotonic", lambda: next(timestamps)))
         bus = AsyncStatusBus(
             dispatcher=lambda callback: (dispatched.append("dispatch"), callback()),
-            throttle_seconds=0.1,
+            flush_interval_seconds=60.0,
         )
 
         bus.emit({"slot_id": "slot-1", "type": "progress", "callback": lambda: dispatched.append("first")})
         bus.emit({"slot_id": "slot-1", "type": "progress", "callback": lambda: dispatched.append("second")})
+        bus.emit({"slot_id": "slot-2", "type": "progress", "callback": lambda: dispatched.append("other")})
+        assert dispatched == []
 
-        assert dispatched == ["dispatch", "first"]
+        assert bus.flush() == 2
+        assert dispatched == ["dispatch", "second", "other"]
+        assert bus.snapshot_stats() == AsyncStatusBusStats(emitted=3, coalesced=1, dispatched=2, batches=1)
 
-    def test_emit_does_not_throttle_non_high_frequency_events(self, patch_attrs) -> None:
-        module = __import__("software.core.engine.async_status_bus", fromlist=["time"])
-        timestamps = iter([2.0, 2.01])
+    def test_emit_keeps_every_non_high_frequency_event_in_order(self) -> None:
         dispatched: list[str] = []
-        patch_attrs((module.time, "monotonic", lambda: next(timestamps)))
         bus = AsyncStatusBus(
             dispatcher=lambda callback: (dispatched.append("dispatch"), callback()),
-            throttle_seconds=0.1,
+            flush_interval_seconds=60.0,
         )
 
+        bus.emit({"slot_id": "slot-1", "type": "status", "callback": lambda: dispatched.append("status-1")})
         bus.emit({"slot_id": "slot-1", "type": "result", "callback": lambda: dispatched.append("first")})
         bus.emit({"slot_id": "slot-1", "type": "result", "callback": lambda: dispatched.append("second")})
+        bus.emit({"slot_id": "slot-1", "type": "status", "callback": lambda: dispatched.append("status-2")})
+        bus.flush()
 
-        assert dispatched == ["dispatch", "first", "dispatch", "second"]
+        assert dispatched == ["dispatch", "first", "second", "status-2"]
+
+    @pytest.mark.asyncio
+    async def test_emit_flushes_once_per_frame_on_running_loop(self) -> None:
+        batches: list[int] = []
+        delivered: list[str] = []
+
+        def _dispatch(callback) -> None:
+            batches.append(1)
+            callback()
+
+        bus = AsyncStatusBus(dispatcher=_dispatch, flush_interval_seconds=0.01)
+        for idx in range(20):
+            bus.emit({"slot_id": f"slot-{idx % 4}", "type": "status", "callback": lambda idx=idx: delivered.append(str(idx))})
+        await asyncio.sleep(0.05)
+
+        assert batches == [1]
+        assert delivered == ["16", "17", "18", "19"]
+        assert bus.flush() == 0
 
 
 class AsyncRunContextTests:
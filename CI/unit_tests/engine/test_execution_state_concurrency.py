@@ -191,3 +191,113 @@ class ExecutionStateConcurrencyTests:
         assert rows[1]['step_current'] == 3
         assert rows[1]['step_total'] == 3
         assert rows[1]['step_percent'] == 100
+
+    def test_snapshot_thread_progress_delta_returns_only_changed_slots(self) -> None:
+        state = ExecutionState()
+        state.ensure_worker_threads(3, prefix='Slot')
+        first = state.snapshot_thread_progress_delta(0)
+        assert first.full
+        assert [row['thread_name'] for row in first.rows] == ['Slot-1', 'Slot-2', 'Slot-3']
+        assert first.rows[0]['thread_display_name'] == '会话 1'
+
+        state.increment_thread_success('Slot-2')
+        delta = state.snapshot_thread_progress_delta(first.last_seq)
+        assert not delta.full
+        assert [row['thread_name'] for row in delta.rows] == ['Slot-2']
+        assert delta.rows[0]['success_count'] == 1
+        assert delta.order == ('Slot-1', 'Slot-2', 'Slot-3')
+        assert state.snapshot_thread_progress_delta(delta.last_seq).rows == []
+        # 序号超前（换了一次运行）时退回全量
+        assert state.snapshot_thread_progress_delta(delta.last_seq + 100).full
+
+    def test_thread_progress_row_cache_reuses_unchanged_rows(self) -> None:
+        from software.core.task.progress_state import ThreadProgressRowCache
+
+        state = ExecutionState()
+        state.ensure_worker_threads(2, prefix='Slot')
+        cache = ThreadProgressRowCache()
+        before = cache.refresh(state)
+        state.update_thread_step('Slot-2', 2, 5, status_text='填写问卷', running=True)
+        after = cache.refresh(state)
+        assert after[0] is before[0]
+        assert after[1] is not before[1]
+        assert after[1]['step_current'] == 2
+        assert after == state.snapshot_thread_progress()
+        assert state.get_thread_progress('Slot-2').step_total == 5
+
+    def test_distribution_counters_compile_commit_and_read_without_copy(self) -> None:
+        from software.core.task import ExecutionConfig
+        from software.providers.contracts import SurveyQuestionMeta
+
+        config = ExecutionConfig(
+            question_config_index_map={1: ('single', 0), 2: ('matrix', 0), 3: ('text', 0)},
+            questions_metadata={
+                1: SurveyQuestionMeta(num=1, title='Q1', type_code='3', options=3),
+                2: SurveyQuestionMeta(num=2, title='Q2', type_code='6', options=4, rows=2),
+            },
+        )
+        state = ExecutionState(config=config)
+        assert state.compile_distribution_counters() == 3
+        state.record_distribution_choice(1, 2, 3, thread_name='Slot-1')
+        state.record_distribution_choice(2, 0, 4, row_index=1, thread_name='Slot-1')
+        state.append_pending_distribution_choice('q:1', 0, 3, thread_name='Slot-2')
+        assert state.read_distribution_counts(1) == (0, state.distribution_counters.read(0)[1])
+        assert state.commit_pending_distribution('Slot-1') == 2
+        total, counts = state.read_distribution_counts(1)
+        assert total == 1
+        assert list(counts) == [0, 0, 1]
+        assert state.read_distribution_counts(1)[1] is counts
+        assert state.commit_pending_distribution('Slot-2') == 1
+        assert state.snapshot_distribution_stats('q:1', 3) == (2, [1, 0, 1])
+        assert state.distribution_runtime_stats['matrix:2:1'] == {'total': 1, 'counts': [1, 0, 0, 0]}
+        assert state.read_distribution_counts(9) == (0, ())
+
+    def test_distribution_counters_commit_concurrently_without_losing_counts(self) -> None:
+        state = ExecutionState()
+        barrier = threading.Barrier(4)
+
+        def _worker(idx: int) -> None:
+            name = f'Slot-{idx}'
+            barrier.wait()
+            for _ in range(200):
+                state.reset_pending_distribution(name)
+                state.record_distribution_choice(5, idx % 2, 2, thread_name=name)
+                state.commit_pending_distribution(name)
+        threads = [threading.Thread(target=_worker, args=(idx,)) for idx in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5.0)
+        assert state.snapshot_distribution_stats('q:5', 2) == (800, [400, 400])
+
+    def test_runtime_channels_only_wake_subscribed_waiters(self) -> None:
+        from software.core.task.runtime_channels import RUNTIME_CHANNEL_PROGRESS, RUNTIME_CHANNEL_PROXY
+
+        state = ExecutionState()
+        proxy_seq = state._runtime_change_sequence(RUNTIME_CHANNEL_PROXY)
+        all_seq = state._runtime_change_sequence()
+
+        state.update_thread_status('Slot-1', '填写问卷', running=True)
+
+        assert state._runtime_change_sequence(RUNTIME_CHANNEL_PROXY) == proxy_seq
+        assert state._runtime_change_sequence(RUNTIME_CHANNEL_PROGRESS) > 0
+        assert state._runtime_change_sequence() == all_seq + 1
+
+        state.mark_terminal_stop('user_stopped')
+        # 终止属于全局事件，广播到每个通道
+        assert state._runtime_change_sequence(RUNTIME_CHANNEL_PROXY) == proxy_seq + 1
+
+    def test_progress_updates_do_not_wait_for_other_subsystem_locks(self) -> None:
+        state = ExecutionState()
+        done = threading.Event()
+
+        def _worker() -> None:
+            state.update_thread_step('Slot-1', 1, 2, running=True)
+            state.record_distribution_choice(1, 0, 2, thread_name='Slot-1')
+            done.set()
+        with state.proxy_lock, state.reverse_fill_lock, state.lock:
+            worker = threading.Thread(target=_worker)
+            worker.start()
+            assert done.wait(timeout=1.0)
+        worker.join(timeout=1.0)
+        assert state.snapshot_thread_progress()[0]['step_current'] == 1
@@ -0,0 +1,83 @@
+from __future__ import annotations
+import random
+import threading
+from software.core.engine.provider_common import ensure_joint_psychometric_answer_plan
+from software.core.questions import strict_ratio
+from software.core.task import ExecutionConfig, ExecutionState, create_run_random_context, use_random_stream
+from software.core.task.random_context import active_random_stream, run_random
+
+def _build_scale_config(seed: int | None) -> ExecutionConfig:
+    question_config_index_map = {num: ('scale', num - 1) for num in range(1, 7)}
+    return ExecutionConfig(
+        target_num=40,
+        random_seed=seed,
+        question_config_index_map=question_config_index_map,
+        question_dimension_map={num: 'A' if num <= 3 else 'B' for num in question_config_index_map},
+        question_psycho_bias_map={num: 'custom' for num in question_config_index_map},
+        questions_metadata={num: {'options': 5} for num in question_config_index_map},
+        scale_prob=[[1, 2, 3, 4, 5] for _ in question_config_index_map],
+    )
+
+class RunRandomContextTests:
+
+    def test_create_context_treats_missing_seed_as_global_random(self) -> None:
+        assert create_run_random_context(None) is None
+        assert create_run_random_context('') is None
+        assert create_run_random_context('42').seed == 42
+
+    def test_substreams_are_stable_and_independent(self) -> None:
+        context = create_run_random_context(7)
+        first = [context.sample_stream(3).random() for _ in range(2)]
+        assert first[0] == first[1]
+        assert context.sample_stream(3).random() != context.sample_stream(4).random()
+        assert context.sample_stream(3).random() != context.sample_stream(3, attempt=1).random()
+        assert context.slot_stream('Slot-1').random() != context.plan_stream().random()
+
+    def test_proxy_uses_bound_stream_and_falls_back_to_global(self) -> None:
+        random.seed(11)
+        expected_global = random.random()
+        random.seed(11)
+        stream = random.Random(5)
+        expected_stream = random.Random(5).random()
+        with use_random_stream(stream):
+            assert active_random_stream() is stream
+            assert run_random.random() == expected_stream
+        assert active_random_stream() is None
+        assert run_random.random() == expected_global
+
+    def test_bound_stream_does_not_leak_to_other_threads(self) -> None:
+        seen: list[object] = []
+        with use_random_stream(random.Random(1)):
+            worker = threading.Thread(target=lambda: seen.append(active_random_stream()))
+            worker.start()
+            worker.join()
+        assert seen == [None]
+
+    def test_weighted_sample_is_reproducible_under_same_stream(self) -> None:
+        context = create_run_random_context(99)
+        results = []
+        for _ in range(2):
+            with use_random_stream(context.sample_stream(0)):
+                results.append(strict_ratio.weighted_sample_without_replacement(list(range(8)), [1.0] * 8, 4))
+        assert results[0] == results[1]
+
+    def test_state_hands_out_new_attempt_stream_per_draw(self) -> None:
+        state = ExecutionState(config=ExecutionConfig(random_seed=3))
+        context = create_run_random_context(3)
+        first = state.next_attempt_random_stream('Slot-1', sample_index=2)
+        retry = state.next_attempt_random_stream('Slot-2', sample_index=2)
+        slot = state.next_attempt_random_stream('Slot-1')
+        assert first.random() == context.sample_stream(2, 0).random()
+        assert retry.random() == context.sample_stream(2, 1).random()
+        assert slot.random() == context.slot_stream('Slot-1', 0).random()
+        assert ExecutionState(config=ExecutionConfig()).next_attempt_random_stream('Slot-1') is None
+
+    def test_seeded_joint_plan_is_identical_regardless_of_global_state(self) -> None:
+        random.seed(1)
+        first = ensure_joint_psychometric_answer_plan(_build_scale_config(2026))
+        random.seed(2)
+        second = ensure_joint_psychometric_answer_plan(_build_scale_config(2026))
+        third = ensure_joint_psychometric_answer_plan(_build_scale_config(2027))
+        assert first is not None and second is not None and third is not None
+        assert first.answers_by_sample == second.answers_by_sample
+        assert first.answers_by_sample != third.answers_by_sample
@@ -119,6 +119,16 @@ class RunStopPolicyTests:
         assert state.get_terminal_stop_snapshot()[0] == 'target_reached'
         gui.handle_random_ip_submission.assert_called_once_with(stop_signal)
 
+    def test_record_success_wakes_proxy_channel_waiters(self) -> None:
+        from software.core.task.runtime_channels import RUNTIME_CHANNEL_PROXY
+        config = ExecutionConfig(target_num=3)
+        state = ExecutionState(config=config)
+        policy = RunStopPolicy(config, state)
+        sequence_before = state._runtime_change_sequence(RUNTIME_CHANNEL_PROXY)
+        policy.record_success(threading.Event(), thread_name='Worker-1')
+        assert state.cur_num == 1
+        assert state._runtime_change_sequence(RUNTIME_CHANNEL_PROXY) > sequence_before
+
     def test_record_success_commits_reverse_fill_row(self, make_gui_mock) -> None:
         state = self._build_reverse_fill_state()
         config = state.config
@@ -191,3 +191,10 @@ class RuntimePreparationTests:
             artifacts = prepare_execution_artifacts(config)
         assert artifacts.execution_config_template.target_num == 9
         assert artifacts.execution_config_template.num_threads == 3
+
+    def test_prepare_execution_artifacts_copies_ai_answer_pool_size(self) -> None:
+        config = self._build_config()
+        config.ai_answer_pool_size = 6
+        with patch('software.ui.controller.run_controller_parts.runtime_preparation.build_enabled_reverse_fill_spec', return_value=None), patch('software.ui.controller.run_controller_parts.runtime_preparation.configure_probabilities', return_value=None):
+            artifacts = prepare_execution_artifacts(config)
+        assert artifacts.execution_config_template.ai_answer_pool_size == 6
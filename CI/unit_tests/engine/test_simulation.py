@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+
+import pytest
+
+from software.app.config import DEFAULT_FILL_TEXT
+from software.core.engine.simulation import simulate_answer_sheets
+from software.core.questions.utils import OPTION_FILL_AI_TOKEN
+from software.core.task import ExecutionConfig
+from software.providers.contracts import SurveyQuestionMeta
+
+
+def _build_config(**overrides) -> ExecutionConfig:
+    question_config_index_map = {num: ("scale", num - 1) for num in range(1, 7)}
+    question_config_index_map[7] = ("single", 0)
+    metadata = {
+        num: SurveyQuestionMeta(num=num, title=f"题{num}", type_code="5", options=5, option_texts=list("12345"))
+        for num in range(1, 7)
+    }
+    metadata[7] = SurveyQuestionMeta(num=7, title="性别", type_code="3", options=2, option_texts=["男", "女"])
+    values = dict(
+        target_num=5,
+        random_seed=2026,
+        question_config_index_map=question_config_index_map,
+        question_dimension_map={num: "A" if num <= 3 else "B" for num in range(1, 7)},
+        question_psycho_bias_map={num: "custom" for num in range(1, 7)},
+        questions_metadata=metadata,
+        scale_prob=[[1, 2, 3, 4, 5] for _ in range(6)],
+        single_prob=[[30, 70]],
+    )
+    values.update(overrides)
+    return ExecutionConfig(**values)
+
+
+class SimulationTests:
+    @pytest.mark.asyncio
+    async def test_simulation_streams_jsonl_and_reports_ratios_alpha_and_throughput(self) -> None:
+        config = _build_config()
+        output = io.StringIO()
+
+        report = await simulate_answer_sheets(config, sample_count=60, output=output)
+
+        lines = output.getvalue().splitlines()
+        assert len(lines) == report.generated == 60
+        first = json.loads(lines[0])
+        assert first["sample"] == 1
+        assert sorted(first["answers"], key=int) == [str(num) for num in range(1, 8)]
+        assert report.failed == 0
+        assert report.samples_per_second > 0
+        assert set(report.dimension_alpha) == {"A", "B"}
+        assert all(alpha > 0.5 for alpha in report.dimension_alpha.values())
+        scale_stat = next(stat for stat in report.question_stats if stat.stat_key == "q:1")
+        assert scale_stat.total == 60
+        assert scale_stat.target_ratios == pytest.approx([1 / 15, 2 / 15, 3 / 15, 4 / 15, 5 / 15])
+        assert scale_stat.max_abs_gap < 0.05
+        # 模拟使用独立配置副本，不污染正式运行的目标份数与联合计划缓存
+        assert config.target_num == 5
+        assert config.joint_psychometric_answer_plan is None
+
+    @pytest.mark.asyncio
+    async def test_simulation_writes_csv_without_calling_ai(self, monkeypatch) -> None:
+        from wjx.provider import answering_builders
+
+        async def _fail(*_args, **_kwargs):
+            raise AssertionError("模拟模式不应调用 AI")
+
+        monkeypatch.setattr(answering_builders, "agenerate_ai_answer", _fail)
+        config = _build_config(text_ai_flags=[True])
+        output = io.StringIO()
+
+        report = await simulate_answer_sheets(config, sample_count=3, output=output, output_format="csv")
+
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        assert rows[0] == ["sample", "joint_sample", *[f"Q{num}" for num in range(1, 8)]]
+        assert [row[0] for row in rows[1:]] == ["1", "2", "3"]
+        assert all(row[8] in {"1", "2"} for row in rows[1:])
+        assert report.generated == 3
+        assert config.text_ai_flags == [True]
+
+    @pytest.mark.asyncio
+    async def test_simulation_replaces_ai_option_fill_without_calling_ai(self, monkeypatch) -> None:
+        from software.core.ai import runtime as ai_runtime
+        from software.core.questions import text_values
+        from tencent.provider import answering_builders as qq_answering_builders
+        from wjx.provider import answering_builders as wjx_answering_builders
+
+        ai_calls: list[str] = []
+
+        async def _record(prompt, *_args, **_kwargs):
+            ai_calls.append(str(prompt))
+            return "AI"
+
+        for module in (ai_runtime, text_values, wjx_answering_builders, qq_answering_builders):
+            monkeypatch.setattr(module, "agenerate_ai_answer", _record)
+        fill_texts = [[OPTION_FILL_AI_TOKEN, None]]
+        config = _build_config(single_prob=[[100, 0]], single_option_fill_texts=fill_texts, ai_answer_pool_size=4)
+        output = io.StringIO()
+
+        report = await simulate_answer_sheets(config, sample_count=3, output=output)
+
+        assert ai_calls == []
+        assert report.generated == 3
+        assert report.failed == 0
+        fills = [json.loads(line)["answers"]["7"]["fills"] for line in output.getvalue().splitlines()]
+        assert fills == [{"0": DEFAULT_FILL_TEXT}] * 3
+        assert config.single_option_fill_texts == [[OPTION_FILL_AI_TOKEN, None]]
+
+    @pytest.mark.asyncio
+    async def test_simulation_rejects_unknown_output_format(self) -> None:
+        with pytest.raises(ValueError):
+            await simulate_answer_sheets(_build_config(), sample_count=1, output_format="xlsx")
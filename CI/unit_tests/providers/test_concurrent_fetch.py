@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from software.providers.concurrent_fetch import fetch_all, race_by_priority
+
+
+class FetchAllTests:
+    async def test_requests_run_concurrently_and_keep_order(self) -> None:
+        started: list[str] = []
+        release = asyncio.Event()
+
+        async def request(name: str) -> str:
+            started.append(name)
+            await release.wait()
+            return name
+
+        task = asyncio.ensure_future(fetch_all(request("meta"), request("questions")))
+        await asyncio.sleep(0.01)
+        assert started == ["meta", "questions"]
+        release.set()
+
+        assert await task == ("meta", "questions")
+
+    async def test_failure_cancels_remaining_requests(self) -> None:
+        cancelled: list[str] = []
+
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("slow")
+                raise
+
+        async def broken() -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await fetch_all(slow(), broken())
+        assert cancelled == ["slow"]
+
+
+class RaceByPriorityTests:
+    async def test_waits_for_higher_priority_candidate_then_cancels_rest(self) -> None:
+        cancelled: list[str] = []
+
+        async def candidate(name: str, delay: float) -> str:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+            return name
+
+        key, result = await race_by_priority(
+            [
+                ("zhs", lambda: candidate("zhs", 0.02)),
+                ("zht", lambda: candidate("zht", 0.0)),
+                ("en", lambda: candidate("en", 10)),
+            ]
+        )
+
+        assert (key, result) == ("zhs", "zhs")
+        assert cancelled == ["en"]
+
+    async def test_falls_back_to_next_candidate_and_raises_last_error(self) -> None:
+        async def fail(message: str) -> str:
+            raise RuntimeError(message)
+
+        async def succeed() -> str:
+            return "ok"
+
+        assert await race_by_priority([("a", lambda: fail("a")), ("b", succeed)]) == ("b", "ok")
+        with pytest.raises(RuntimeError, match="^b$"):
+            await race_by_priority([("a", lambda: fail("a")), ("b", lambda: fail("b"))])
+
+    async def test_abort_error_stops_race_immediately(self) -> None:
+        cancelled: list[str] = []
+
+        async def slow() -> str:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("slow")
+                raise
+            return "slow"
+
+        async def login_required() -> str:
+            raise RuntimeError("需要登录")
+
+        with pytest.raises(RuntimeError, match="需要登录"):
+            await race_by_priority(
+                [("a", slow), ("b", login_required)],
+                abort_on=lambda exc: "登录" in str(exc),
+            )
+        assert cancelled == ["slow"]
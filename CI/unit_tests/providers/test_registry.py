@@ -8,7 +8,7 @@ from software.core.task import ExecutionConfig, ExecutionState
 from software.providers import registry
 from software.providers.common import SURVEY_PROVIDER_CREDAMO, SURVEY_PROVIDER_QQ, SURVEY_PROVIDER_WJX
 from software.providers.contracts import SurveyDefinition
-from software.providers.hooks import build_fill_http_hook, build_parse_hook
+from software.providers.hooks import build_fill_http_hook, build_parse_hook, load_hook, reset_hook_cache
 
 
 async def test_parse_survey_routes_detected_provider_directly() -> None:
@@ -209,3 +209,15 @@ async def test_parse_hook_rejects_sync_parser_result() -> None:
             assert "解析 hook 必须返回 awaitable" in str(exc)
         else:
             raise AssertionError("同步解析 hook 不应再被接受")
+
+
+def test_reset_hook_cache_reloads_patched_provider_attribute() -> None:
+    target = ("wjx.provider.http_runtime", "brush_wjx_http")
+    original = load_hook(target)
+    replacement = AsyncMock(return_value=True)
+    with patch("wjx.provider.http_runtime.brush_wjx_http", replacement):
+        assert load_hook(target) is original
+        reset_hook_cache()
+        assert load_hook(target) is replacement
+    reset_hook_cache()
+    assert load_hook(target) is original
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from unittest.mock import AsyncMock
+
+import pytest
+
+from software.providers import survey_cache
+from software.providers.common import SURVEY_PROVIDER_QQ, SURVEY_PROVIDER_WJX
+from software.providers.contracts import SurveyDefinition, build_survey_definition
+from software.providers.hooks import build_parse_hook
+from software.providers.survey_cache import (
+    SurveyDefinitionCache,
+    configure_survey_definition_cache,
+    survey_payload_fingerprint,
+)
+from wjx.provider import parser as wjx_parser
+
+_URL = "https://www.wjx.cn/vm/demo.aspx"
+
+
+class _FakeClock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeHttpResponse:
+    def __init__(self, html: str) -> None:
+        self.text = html
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+def _definition(title: str = "标题") -> SurveyDefinition:
+    return build_survey_definition(
+        SURVEY_PROVIDER_WJX,
+        title,
+        [
+            {"num": 1, "title": "Q1", "type_code": "3", "options": 2, "option_texts": ["A", "B"]},
+            {"num": 2, "title": "Q2", "type_code": "1", "text_inputs": 1, "is_text_like": True},
+        ],
+    )
+
+
+@pytest.fixture
+def enabled_cache(tmp_path):
+    cache = SurveyDefinitionCache(str(tmp_path / "surveys"))
+    configure_survey_definition_cache(cache)
+    yield cache
+    configure_survey_definition_cache(None)
+
+
+class SurveyPayloadFingerprintTests:
+    def test_structured_payload_ignores_key_order(self) -> None:
+        assert survey_payload_fingerprint({"a": 1, "b": [1, 2]}) == survey_payload_fingerprint({"b": [1, 2], "a": 1})
+        assert survey_payload_fingerprint({"a": 1}) != survey_payload_fingerprint({"a": 2})
+
+    def test_text_and_bytes_payloads_match(self) -> None:
+        assert survey_payload_fingerprint("问卷") == survey_payload_fingerprint("问卷".encode("utf-8"))
+
+
+class SurveyDefinitionCacheTests:
+    def test_round_trip_restores_definition_only_for_same_fingerprint(self, tmp_path) -> None:
+        cache = SurveyDefinitionCache(str(tmp_path))
+        definition = _definition()
+
+        cache.store(SURVEY_PROVIDER_WJX, _URL, "fp-1", definition)
+
+        assert cache.lookup(SURVEY_PROVIDER_WJX, _URL, "fp-2") is None
+        restored = cache.lookup(SURVEY_PROVIDER_WJX, _URL, "fp-1")
+        assert restored == definition
+        assert cache.lookup(SURVEY_PROVIDER_QQ, _URL, "fp-1") is None
+
+    def test_entry_is_compact_gzip_with_shared_field_header(self, tmp_path) -> None:
+        cache = SurveyDefinitionCache(str(tmp_path))
+        cache.store(SURVEY_PROVIDER_WJX, _URL, "fp", _definition())
+
+        (entry_path,) = list(tmp_path.iterdir())
+        with gzip.open(entry_path, "rt", encoding="utf-8") as handle:
+            entry = json.load(handle)
+        assert entry["fields"][:2] == ["num", "title"]
+        assert [row[:2] for row in entry["rows"]] == [[1, "Q1"], [2, "Q2"]]
+
+    def test_entry_expires_after_ttl_without_revalidation(self, tmp_path) -> None:
+        clock = _FakeClock()
+        cache = SurveyDefinitionCache(str(tmp_path), ttl_seconds=60, clock=clock)
+        cache.store(SURVEY_PROVIDER_WJX, _URL, "fp", _definition())
+
+        clock.now += 50
+        assert cache.lookup(SURVEY_PROVIDER_WJX, _URL, "fp") is not None
+        # 命中会刷新校验时间，TTL 从最近一次校验重新计起
+        clock.now += 50
+        assert cache.lookup(SURVEY_PROVIDER_WJX, _URL, "fp") is not None
+        clock.now += 61
+        assert cache.lookup(SURVEY_PROVIDER_WJX, _URL, "fp") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_store_evicts_least_recently_validated_entries(self, tmp_path) -> None:
+        clock = _FakeClock()
+        cache = SurveyDefinitionCache(str(tmp_path), max_entries=2, clock=clock)
+        for index in range(2):
+            cache.store(SURVEY_PROVIDER_WJX, f"{_URL}?v={index}", "fp", _definition())
+            clock.now += 1
+        assert cache.lookup(SURVEY_PROVIDER_WJX, f"{_URL}?v=0", "fp") is not None
+        clock.now += 1
+
+        cache.store(SURVEY_PROVIDER_WJX, f"{_URL}?v=2", "fp", _definition())
+
+        assert cache.lookup(SURVEY_PROVIDER_WJX, f"{_URL}?v=0", "fp") is not None
+        assert cache.lookup(SURVEY_PROVIDER_WJX, f"{_URL}?v=1", "fp") is None
+        assert cache.lookup(SURVEY_PROVIDER_WJX, f"{_URL}?v=2", "fp") is not None
+
+    def test_entry_from_other_app_version_is_discarded(self, tmp_path) -> None:
+        SurveyDefinitionCache(str(tmp_path), app_version="1.0").store(SURVEY_PROVIDER_WJX, _URL, "fp", _definition())
+
+        assert SurveyDefinitionCache(str(tmp_path), app_version="2.0").lookup(SURVEY_PROVIDER_WJX, _URL, "fp") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_corrupt_entry_is_treated_as_miss(self, tmp_path) -> None:
+        cache = SurveyDefinitionCache(str(tmp_path))
+        cache.store(SURVEY_PROVIDER_WJX, _URL, "fp", _definition())
+        (entry_path,) = list(tmp_path.iterdir())
+        entry_path.write_bytes(b"not gzip")
+
+        assert cache.lookup(SURVEY_PROVIDER_WJX, _URL, "fp") is None
+
+
+class SurveyRevalidationHookTests:
+    async def test_parse_hook_skips_revalidation_when_cache_disabled(self) -> None:
+        configure_survey_definition_cache(None)
+        calls: list[tuple] = []
+
+        async def fake_parse(url: str):
+            calls.append((url,))
+            return ([{"num": 1, "title": "Q1", "type_code": "3"}], "标题")
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr("software.providers.hooks._load_hook", lambda _target: fake_parse)
+            definition = await build_parse_hook(SURVEY_PROVIDER_WJX, ("fake.module", "parse"))(_URL)
+
+        assert calls == [(_URL,)]
+        assert definition.title == "标题"
+
+    async def test_wjx_parse_skips_html_parse_when_page_fingerprint_unchanged(self, enabled_cache, patch_attrs) -> None:
+        aget = AsyncMock(return_value=_FakeHttpResponse("<html><body>ok</body></html>"))
+        parse_calls: list[object] = []
+
+        def fake_parse_questions(page):
+            parse_calls.append(page)
+            return [{"num": 1, "title": "Q1", "type_code": "3"}]
+
+        patch_attrs(
+            (wjx_parser.http_client, "aget", aget),
+            (wjx_parser, "parse_survey_questions_from_page", fake_parse_questions),
+            (wjx_parser, "extract_survey_title_from_page", lambda _page: "标题"),
+        )
+        hook = build_parse_hook(SURVEY_PROVIDER_WJX, ("wjx.provider.parser", "parse_wjx_survey"))
+
+        first = await hook(_URL)
+        second = await hook(_URL)
+
+        assert aget.await_count == 2
+        assert len(parse_calls) == 1
+        assert second == first
+
+        aget.return_value = _FakeHttpResponse("<html><body>changed</body></html>")
+        await hook(_URL)
+        assert len(parse_calls) == 2
+
+    async def test_wjx_fingerprint_ignores_per_request_starttime(self, enabled_cache, patch_attrs) -> None:
+        def _page(starttime: str) -> str:
+            return (
+                f'<html><body><input type="hidden" id="starttime" name="starttime" value="{starttime}" />'
+                f'<script>var nowTime = "{starttime}";</script><div>ok</div></body></html>'
+            )
+
+        aget = AsyncMock(return_value=_FakeHttpResponse(_page("2026/10/17 9:00:01")))
+        parse_calls: list[object] = []
+
+        def fake_parse_questions(page):
+            parse_calls.append(page)
+            return [{"num": 1, "title": "Q1", "type_code": "3"}]
+
+        patch_attrs(
+            (wjx_parser.http_client, "aget", aget),
+            (wjx_parser, "parse_survey_questions_from_page", fake_parse_questions),
+            (wjx_parser, "extract_survey_title_from_page", lambda _page: "标题"),
+        )
+        hook = build_parse_hook(SURVEY_PROVIDER_WJX, ("wjx.provider.parser", "parse_wjx_survey"))
+
+        first = await hook(_URL)
+        aget.return_value = _FakeHttpResponse(_page("2026/10/17 9:05:42"))
+        second = await hook(_URL)
+
+        assert len(parse_calls) == 1
+        assert second == first
+
+    async def test_revalidation_failure_falls_back_to_parse(self, enabled_cache, monkeypatch) -> None:
+        monkeypatch.setattr(
+            survey_cache,
+            "survey_payload_fingerprint",
+            lambda _payload: (_ for _ in ()).throw(TypeError("unserializable")),
+        )
+        revalidation = survey_cache.begin_survey_revalidation(SURVEY_PROVIDER_WJX, _URL)
+
+        assert revalidation is not None
+        assert revalidation.check(object()) is None
+        revalidation.store(_definition())
+        assert not os.path.exists(enabled_cache.directory) or os.listdir(enabled_cache.directory) == []
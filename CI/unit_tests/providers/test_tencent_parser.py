@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
@@ -111,6 +112,85 @@ class TencentParserTests:
         with pytest.raises(RuntimeError, match="缺少 data 对象：meta"):
             qq_parser._ensure_qq_api_ok({"code": "OK", "data": []}, "meta")
 
+    @pytest.mark.asyncio
+    async def test_http_fetch_races_locales_and_issues_meta_and_questions_together(self, patch_attrs) -> None:
+        in_flight: set[str] = set()
+        overlapped: list[str] = []
+        cancelled: list[str] = []
+
+        async def fake_request(_survey_id, endpoint, *, hash_value, headers, extra_params=None):
+            _ = hash_value, headers
+            if endpoint == "session":
+                return {"code": "OK", "data": {}}
+            locale = (extra_params or {}).get("locale")
+            key = f"{endpoint}:{locale}"
+            in_flight.add(key)
+            try:
+                await asyncio.sleep(0.01 if locale == "zhs" else 0 if locale == "zht" else 10)
+            except asyncio.CancelledError:
+                cancelled.append(key)
+                raise
+            if {f"meta:{locale}", f"questions:{locale}"} <= in_flight:
+                overlapped.append(locale)
+            if endpoint == "meta":
+                return {"code": "OK", "data": {"title": f"标题-{locale}"}}
+            return {
+                "code": "OK",
+                "data": {"questions": [{"id": "q1", "type": "radio", "title": "题目1", "options": [{"text": "A"}], "page": 1}]},
+            }
+
+        standardize = qq_parser._standardize_qq_questions
+        parsed: list[object] = []
+
+        def counting_standardize(questions):
+            parsed.append(questions)
+            return standardize(questions)
+
+        patch_attrs(
+            (qq_parser, "_request_qq_api", fake_request),
+            (qq_parser, "_standardize_qq_questions", counting_standardize),
+        )
+
+        _info, title = await qq_parser._fetch_qq_survey_via_http("123", "hash")
+
+        # zht 先返回，但优先级更高的 zhs 仍然胜出；zh / en 在胜者确定后被取消，只解析胜者一次
+        assert title == "标题-zhs"
+        assert "zhs" in overlapped
+        assert sorted(cancelled) == ["meta:en", "meta:zh", "questions:en", "questions:zh"]
+        assert len(parsed) == 1
+
+    @pytest.mark.asyncio
+    async def test_http_fetch_falls_back_to_next_locale_when_winner_parses_empty(self, patch_attrs) -> None:
+        async def fake_request(_survey_id, endpoint, *, hash_value, headers, extra_params=None):
+            _ = hash_value, headers
+            if endpoint == "session":
+                return {"code": "OK", "data": {}}
+            locale = (extra_params or {}).get("locale")
+            if endpoint == "meta":
+                return {"code": "OK", "data": {"title": f"标题-{locale}"}}
+            return {
+                "code": "OK",
+                "data": {"questions": [{"id": "q1", "type": "radio", "title": "题目1", "options": [{"text": "A"}], "page": 1}]},
+            }
+
+        standardize = qq_parser._standardize_qq_questions
+        parsed: list[object] = []
+
+        def empty_first_standardize(questions):
+            parsed.append(questions)
+            return [] if len(parsed) == 1 else standardize(questions)
+
+        patch_attrs(
+            (qq_parser, "_request_qq_api", fake_request),
+            (qq_parser, "_standardize_qq_questions", empty_first_standardize),
+        )
+
+        info, title = await qq_parser._fetch_qq_survey_via_http("123", "hash")
+
+        assert title == "标题-zht"
+        assert info[0]["provider_question_id"] == "q1"
+        assert len(parsed) == 2
+
     def test_builders_and_standardize_questions_cover_fillblank_rating_and_unsupported(self) -> None:
         question = {
             "id": "q1",
@@ -112,3 +112,20 @@ class WjxExcelExportTests:
                 load_wjx_excel_export(str(path), preferred_format=REVERSE_FILL_FORMAT_AUTO)
 
         workbook.close.assert_called_once_with()
+
+    def test_load_wjx_excel_export_keeps_only_question_columns_in_interned_column_store(self, tmp_path: Path) -> None:
+        rows: list[list[object]] = [["序号", "1、性别", "备注", "2、满意度"]]
+        rows.extend([index, "男" if index % 2 else "女", f"备注{index}", index % 5 + 1] for index in range(1, 201))
+        path = _write_workbook(tmp_path / "large.xlsx", rows)
+
+        export = load_wjx_excel_export(str(path))
+
+        store = export.column_store
+        assert store is not None
+        assert store.column_indexes == (2, 4)
+        assert store.row_count == export.total_data_rows == 200
+        # 两种性别 + 五个分数，备注列不进列存
+        assert store.distinct_value_count == 7
+        assert export.raw_rows[-1].data_row_number == 200
+        assert export.raw_rows[-1].worksheet_row_number == 201
+        assert export.raw_rows[-1].values_by_column == {2: "女", 4: 1}
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+import pytest
+
+from software.providers.common import SURVEY_PROVIDER_WJX
+from software.providers.contracts import normalize_survey_questions
+from wjx.provider import html_parser_backend
+from wjx.provider.html_parser import ParsedWjxPage, extract_survey_title_from_page, parse_survey_questions_from_page
+
+_FIXTURE_DIR = Path(__file__).resolve().parent
+_TRIPLE_QUOTED_RE = re.compile(r'"""(.*?)"""', re.S)
+
+
+def _collect_parser_fixtures() -> list[tuple[str, str]]:
+    fixtures: list[tuple[str, str]] = []
+    for path in sorted(_FIXTURE_DIR.glob("test_wjx_*.py")):
+        if path.name == Path(__file__).name:
+            continue
+        source = path.read_text(encoding="utf-8")
+        for index, match in enumerate(_TRIPLE_QUOTED_RE.finditer(source)):
+            html = match.group(1)
+            if "divQuestion" in html:
+                fixtures.append((f"{path.stem}#{index}", html))
+    return fixtures
+
+
+_PARSER_FIXTURES = _collect_parser_fixtures()
+
+
+def _parse_with_backend(html: str, backend: str):
+    page = ParsedWjxPage.from_html(html, backend=backend)
+    assert page.backend == backend
+    return (
+        normalize_survey_questions(SURVEY_PROVIDER_WJX, parse_survey_questions_from_page(page)),
+        extract_survey_title_from_page(page),
+    )
+
+
+class WjxHtmlBackendTests:
+    def test_fixture_collection_finds_parser_pages(self) -> None:
+        assert len(_PARSER_FIXTURES) >= 10
+
+    def test_resolve_backend_falls_back_to_html_parser_when_compiled_parser_missing(self, monkeypatch) -> None:
+        monkeypatch.delenv(html_parser_backend.HTML_BACKEND_ENV, raising=False)
+        monkeypatch.setattr(
+            html_parser_backend,
+            "is_html_backend_available",
+            lambda backend: backend == html_parser_backend.HTML_BACKEND_HTML_PARSER,
+        )
+
+        assert html_parser_backend.resolve_html_backend() == "html.parser"
+        assert html_parser_backend.resolve_html_backend("lxml") == "html.parser"
+        assert html_parser_backend.build_html_soup("<div id='x'>ok</div>").find(id="x").get_text() == "ok"
+
+    def test_resolve_backend_honours_env_override(self, monkeypatch) -> None:
+        monkeypatch.setenv(html_parser_backend.HTML_BACKEND_ENV, "html.parser")
+
+        assert html_parser_backend.resolve_html_backend() == "html.parser"
+        assert ParsedWjxPage.from_html("<p>x</p>").backend == "html.parser"
+
+    def test_resolve_backend_prefers_lxml_when_installed(self, monkeypatch) -> None:
+        pytest.importorskip("lxml")
+        monkeypatch.delenv(html_parser_backend.HTML_BACKEND_ENV, raising=False)
+
+        assert html_parser_backend.resolve_html_backend() == "lxml"
+        assert html_parser_backend.resolve_html_backend("unknown") == "lxml"
+
+    @pytest.mark.parametrize(
+        ("fixture_id", "html"),
+        _PARSER_FIXTURES,
+        ids=[fixture_id for fixture_id, _ in _PARSER_FIXTURES],
+    )
+    def test_compiled_backend_matches_html_parser(self, fixture_id: str, html: str) -> None:
+        pytest.importorskip("lxml")
+
+        baseline = _parse_with_backend(html, html_parser_backend.HTML_BACKEND_HTML_PARSER)
+        compiled = _parse_with_backend(html, html_parser_backend.HTML_BACKEND_LXML)
+
+        assert compiled == baseline, fixture_id
@@ -370,6 +370,28 @@ class WjxHtmlParserHelperTests:
         assert metadata[1] == 1
         assert metadata[4] == [0]
 
+    def test_limit_text_walk_skips_option_blocks_without_touching_tree(self) -> None:
+        question_div = _soup(
+            """
+            <div topic="4" type="4">
+              <div class="topichtml">请选择 <b>2-3</b> 项</div>
+              <!-- 注释 -->
+              <div class="ui-controlgroup"><div>选项1</div></div>
+              <table><tr><td>矩阵</td></tr></table>
+              <div class="slider extra">滑块</div>
+              <span class="errorMessage">错误</span>
+              <p>补充说明 &amp; 提示</p>
+            </div>
+            """
+        ).div
+        before = str(question_div)
+
+        text = html_parser_rules._collect_text_outside_option_blocks(question_div)
+
+        assert text == "请选择 2-3 项 补充说明 & 提示"
+        assert str(question_div) == before
+        assert html_parser_rules._collect_text_outside_option_blocks(_soup("<ul><li>A</li></ul>").ul) == ""
+
     def test_jump_and_display_rule_helpers_ignore_invalid_values(self) -> None:
         question_div = _soup(
             """
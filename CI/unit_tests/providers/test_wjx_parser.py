@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from wjx.provider import html_parser_page
 from wjx.provider import parser as wjx_parser
 
 
@@ -113,6 +114,52 @@ class WjxParserTests:
         """
         assert wjx_parser.build_not_open_survey_message(html) is None
 
+    def test_parse_wjx_html_builds_dom_tree_once_for_state_checks_title_and_questions(self, patch_attrs) -> None:
+        html = """
+        <html>
+          <head><title>满意度调查 - 问卷星</title></head>
+          <body>
+            <div id="divQuestion">
+              <fieldset>
+                <div id="div1" topic="1" type="3">
+                  <div class="field-label"><div class="topichtml">你的性别</div></div>
+                  <div class="ui-controlgroup">
+                    <div class="ui-radio"><input type="radio" /><div class="label">男</div></div>
+                    <div class="ui-radio"><input type="radio" /><div class="label">女</div></div>
+                  </div>
+                </div>
+              </fieldset>
+            </div>
+          </body>
+        </html>
+        """
+        built: list[str] = []
+        real_build = html_parser_page.build_html_soup
+
+        def counting_build(markup, *args, **kwargs):
+            built.append(markup)
+            return real_build(markup, *args, **kwargs)
+
+        patch_attrs((html_parser_page, "build_html_soup", counting_build))
+
+        info, title = wjx_parser._parse_wjx_html(html)
+
+        assert [item["title"] for item in info] == ["你的性别"]
+        assert title == "满意度调查"
+        assert len(built) == 1
+
+    def test_parsed_page_skips_dom_build_for_text_only_state_checks(self, patch_attrs) -> None:
+        page = wjx_parser.ParsedWjxPage.from_html("<html><body>此问卷（123）已暂停，不能填写</body></html>")
+
+        def fail_build(*_args, **_kwargs):
+            raise AssertionError("text-only checks must not build a DOM tree")
+
+        patch_attrs((html_parser_page, "build_html_soup", fail_build))
+
+        assert wjx_parser.is_paused_survey_page(page)
+        assert not wjx_parser.is_enterprise_unavailable_survey_page(page)
+        assert page._soup is html_parser_page._UNSET
+
     @pytest.mark.asyncio
     async def test_parse_wjx_survey_raises_paused_error_from_http_html(self, patch_attrs) -> None:
         patch_attrs(
@@ -163,8 +210,8 @@ class WjxParserTests:
 
         patch_attrs(
             (wjx_parser.http_client, "aget", aget),
-            (wjx_parser, "parse_survey_questions_from_html", lambda _html: [{"num": 1, "title": "Q1", "type_code": "3"}]),
-            (wjx_parser, "extract_survey_title_from_html", lambda _html: "  标题  "),
+            (wjx_parser, "parse_survey_questions_from_page", lambda _page: [{"num": 1, "title": "Q1", "type_code": "3"}]),
+            (wjx_parser, "extract_survey_title_from_page", lambda _page: "  标题  "),
         )
 
         info, title = await wjx_parser.parse_wjx_survey("https://www.wjx.cn/vm/demo.aspx")
@@ -177,8 +224,8 @@ class WjxParserTests:
     async def test_parse_wjx_survey_raises_when_http_parse_result_is_empty(self, patch_attrs) -> None:
         patch_attrs(
             (wjx_parser.http_client, "aget", AsyncMock(return_value=_FakeHttpResponse("<html><body>http-empty</body></html>"))),
-            (wjx_parser, "parse_survey_questions_from_html", lambda _html: []),
-            (wjx_parser, "extract_survey_title_from_html", lambda _html: "HTTP 标题"),
+            (wjx_parser, "parse_survey_questions_from_page", lambda _page: []),
+            (wjx_parser, "extract_survey_title_from_page", lambda _page: "HTTP 标题"),
             (wjx_parser.asyncio, "sleep", AsyncMock()),
         )
 
@@ -197,8 +244,8 @@ class WjxParserTests:
 
         patch_attrs(
             (wjx_parser.http_client, "aget", aget),
-            (wjx_parser, "parse_survey_questions_from_html", lambda html: [] if "temp-empty" in html else [{"num": 1, "title": "Q1", "type_code": "3"}]),
-            (wjx_parser, "extract_survey_title_from_html", lambda _html: "标题"),
+            (wjx_parser, "parse_survey_questions_from_page", lambda page: [] if "temp-empty" in page.html else [{"num": 1, "title": "Q1", "type_code": "3"}]),
+            (wjx_parser, "extract_survey_title_from_page", lambda _page: "标题"),
             (wjx_parser.asyncio, "sleep", sleep),
         )
 
@@ -224,8 +271,8 @@ class WjxParserTests:
 
         patch_attrs(
             (wjx_parser.http_client, "aget", AsyncMock(return_value=_FakeHttpResponse(static_html))),
-            (wjx_parser, "parse_survey_questions_from_html", lambda _html: [{"num": 23, "display_num": 22, "title": "Q23", "type_code": "2"}]),
-            (wjx_parser, "extract_survey_title_from_html", lambda _html: "标题"),
+            (wjx_parser, "parse_survey_questions_from_page", lambda _page: [{"num": 23, "display_num": 22, "title": "Q23", "type_code": "2"}]),
+            (wjx_parser, "extract_survey_title_from_page", lambda _page: "标题"),
         )
 
         info, title = await wjx_parser.parse_wjx_survey("https://www.wjx.cn/vm/demo.aspx")
@@ -124,3 +124,43 @@ class WjxReverseFillTests:
         spec = build_enabled_reverse_fill_spec(RuntimeConfig(survey_provider='wjx', reverse_fill_enabled=True, reverse_fill_source_path=workbook_path, reverse_fill_format=REVERSE_FILL_FORMAT_WJX_SEQUENCE, reverse_fill_start_row=1, target=2), questions_info=[{'num': 1, 'title': '单选题', 'type_code': '3', 'option_texts': ['选项1', '选项2']}], question_entries=[])
         assert spec is not None
         assert spec.target_num == 2
+
+    def test_reverse_fill_runtime_decodes_rows_on_demand_and_releases_committed_samples(self) -> None:
+        from software.core.task import ExecutionConfig, ExecutionState
+
+        workbook_path = self._track(_write_workbook([['序号', '1、单选题'], [1, 1], [2, 2], [3, 1]]))
+        spec = build_reverse_fill_spec(source_path=workbook_path, survey_provider='wjx', questions_info=[{'num': 1, 'title': '单选题', 'type_code': '3', 'option_texts': ['选项1', '选项2']}], question_entries=[], selected_format=REVERSE_FILL_FORMAT_WJX_SEQUENCE, start_row=2, target_num=0)
+        state = ExecutionState(config=ExecutionConfig(reverse_fill_spec=spec, target_num=2))
+        state.initialize_reverse_fill_runtime()
+        runtime = state.reverse_fill_runtime
+        assert list(runtime.queued_row_numbers) == [2, 3]
+        assert runtime.samples_by_row_number == {}
+        acquired = state.acquire_reverse_fill_sample('Worker-1')
+        assert acquired.sample.worksheet_row_number == 3
+        assert state.get_reverse_fill_answer(1, 'Worker-1').choice_index == 1
+        assert list(runtime.samples_by_row_number) == [2]
+        state.commit_reverse_fill_sample('Worker-1')
+        assert runtime.samples_by_row_number == {}
+
+    def test_reverse_fill_template_copy_shares_column_store_but_not_runtime_state(self) -> None:
+        import copy
+
+        from software.core.task import ExecutionConfig, ExecutionState
+
+        workbook_path = self._track(_write_workbook([['序号', '1、单选题'], [1, 1], [2, 2], [3, 1]]))
+        spec = build_reverse_fill_spec(source_path=workbook_path, survey_provider='wjx', questions_info=[{'num': 1, 'title': '单选题', 'type_code': '3', 'option_texts': ['选项1', '选项2']}], question_entries=[], selected_format=REVERSE_FILL_FORMAT_WJX_SEQUENCE, start_row=1, target_num=0)
+        template = ExecutionConfig(reverse_fill_spec=spec, target_num=2)
+        first_config = copy.deepcopy(template)
+        second_config = copy.deepcopy(template)
+        assert first_config.reverse_fill_spec is not spec
+        assert first_config.reverse_fill_spec.samples is spec.samples
+        assert second_config.reverse_fill_spec.samples is spec.samples
+        first = ExecutionState(config=first_config)
+        second = ExecutionState(config=second_config)
+        first.initialize_reverse_fill_runtime()
+        second.initialize_reverse_fill_runtime()
+        first.acquire_reverse_fill_sample('Worker-1')
+        first.commit_reverse_fill_sample('Worker-1')
+        assert list(first.reverse_fill_runtime.queued_row_numbers) == [2, 3]
+        assert list(second.reverse_fill_runtime.queued_row_numbers) == [1, 2, 3]
+        assert second.acquire_reverse_fill_sample('Worker-1').sample.data_row_number == 1
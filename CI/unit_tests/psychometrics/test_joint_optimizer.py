@@ -1,5 +1,8 @@
 from __future__ import annotations
+import random
 from unittest.mock import patch
+import pytest
+from software.core.psychometrics import joint_optimizer, utils
 from software.core.psychometrics.joint_optimizer import build_joint_psychometric_answer_plan, build_psychometric_blueprint
 from software.core.task import ExecutionConfig
 
@@ -64,3 +67,145 @@ class JointOptimizerTests:
         assert sample_plan is not None
         assert sample_plan.is_distribution_locked(1)
         assert sample_plan.diagnostics_by_dimension['stress'].anchor_direction == 'left'
+
+    def test_array_backend_matches_pure_python_plan_with_same_seed(self, monkeypatch) -> None:
+        pytest.importorskip('numpy')
+        question_config_index_map = {}
+        question_dimension_map = {}
+        scale_prob = []
+        for question_num in range(1, 9):
+            question_config_index_map[question_num] = ('scale', question_num - 1)
+            question_dimension_map[question_num] = 'mood' if question_num <= 5 else 'career'
+            scale_prob.append([5, 4, 3, 2, 1] if question_num in {2, 7} else [1, 2, 3, 4, 5])
+        config = ExecutionConfig(
+            target_num=120,
+            psycho_target_alpha=0.85,
+            question_config_index_map=question_config_index_map,
+            question_dimension_map=question_dimension_map,
+            question_psycho_bias_map={question_num: 'custom' for question_num in question_config_index_map},
+            questions_metadata={question_num: {'options': 5} for question_num in question_config_index_map},
+            scale_prob=scale_prob,
+        )
+
+        random.seed(20260516)
+        array_plan = build_joint_psychometric_answer_plan(config)
+        monkeypatch.setattr(joint_optimizer, 'np', None)
+        random.seed(20260516)
+        python_plan = build_joint_psychometric_answer_plan(config)
+
+        assert array_plan is not None
+        assert python_plan is not None
+        assert array_plan.answers_by_sample == python_plan.answers_by_sample
+        for dimension, diagnostic in python_plan.diagnostics_by_dimension.items():
+            assert array_plan.diagnostics_by_dimension[dimension].actual_alpha == pytest.approx(diagnostic.actual_alpha, abs=1e-9)
+
+    def test_randn_array_consumes_same_sequence_as_scalar_randn(self) -> None:
+        pytest.importorskip('numpy')
+        random.seed(11)
+        expected = [utils.randn() for _ in range(64)]
+        random.seed(11)
+        actual = utils.randn_array(64).tolist()
+
+        assert actual == pytest.approx(expected, abs=1e-12)
+
+    def test_cronbach_alpha_array_path_matches_python_path(self, monkeypatch) -> None:
+        pytest.importorskip('numpy')
+        matrix = [[1, 2, 2], [2, 3, 3], [4, 4, 5], [5, 5, 4], [3, 3, 3]]
+
+        array_alpha = utils.cronbach_alpha(matrix)
+        monkeypatch.setattr(utils, 'np', None)
+        python_alpha = utils.cronbach_alpha(matrix)
+
+        assert array_alpha == pytest.approx(python_alpha, abs=1e-12)
+        assert python_alpha == pytest.approx(0.9416058394160585)
+        assert utils.cronbach_alpha([[1, 2]]) == 0.0
+
+    def _build_multi_dimension_config(self, workers: int) -> ExecutionConfig:
+        question_config_index_map = {}
+        question_dimension_map = {}
+        scale_prob = []
+        dimension_names = ['mood', 'solo', 'career', 'family']
+        question_num = 0
+        for dimension in dimension_names:
+            for _ in range(1 if dimension == 'solo' else 4):
+                question_num += 1
+                question_config_index_map[question_num] = ('scale', question_num - 1)
+                question_dimension_map[question_num] = dimension
+                scale_prob.append([1, 2, 3, 4, 5] if question_num % 3 else [5, 4, 3, 2, 1])
+        return ExecutionConfig(
+            target_num=60,
+            psycho_target_alpha=0.85,
+            psycho_parallel_workers=workers,
+            question_config_index_map=question_config_index_map,
+            question_dimension_map=question_dimension_map,
+            question_psycho_bias_map={num: 'custom' for num in question_config_index_map},
+            questions_metadata={num: {'options': 5} for num in question_config_index_map},
+            scale_prob=scale_prob,
+        )
+
+    def test_process_pool_mode_matches_inline_seeded_mode(self) -> None:
+        random.seed(7)
+        inline_plan = build_joint_psychometric_answer_plan(self._build_multi_dimension_config(1))
+        random.seed(7)
+        pooled_plan = build_joint_psychometric_answer_plan(self._build_multi_dimension_config(2))
+
+        assert inline_plan is not None
+        assert pooled_plan is not None
+        assert pooled_plan.answers_by_sample == inline_plan.answers_by_sample
+        assert list(pooled_plan.diagnostics_by_dimension) == ['mood', 'solo', 'career', 'family']
+        assert pooled_plan.diagnostics_by_dimension['solo'].skipped is True
+        assert pooled_plan.item_dimension_map == inline_plan.item_dimension_map
+
+    def test_seeded_mode_is_independent_of_dimension_order_and_global_stream(self) -> None:
+        config = self._build_multi_dimension_config(1)
+        random.seed(99)
+        plan = build_joint_psychometric_answer_plan(config)
+        after_plan = random.random()
+
+        random.seed(99)
+        random.getrandbits(64)
+        assert random.random() == after_plan
+
+        base_seed = 12345
+        first = joint_optimizer._derive_dimension_seed(base_seed, 'mood')
+        assert first == joint_optimizer._derive_dimension_seed(base_seed, 'mood')
+        assert first != joint_optimizer._derive_dimension_seed(base_seed, 'career')
+        assert plan is not None
+
+    def test_process_pool_failure_falls_back_to_inline(self, monkeypatch) -> None:
+        class _BrokenPool:
+            def __init__(self, *args, **kwargs) -> None:
+                raise OSError('pool unavailable')
+
+        random.seed(5)
+        expected = build_joint_psychometric_answer_plan(self._build_multi_dimension_config(1))
+        monkeypatch.setattr(joint_optimizer, 'ProcessPoolExecutor', _BrokenPool)
+        random.seed(5)
+        actual = build_joint_psychometric_answer_plan(self._build_multi_dimension_config(4))
+
+        assert expected is not None
+        assert actual is not None
+        assert actual.answers_by_sample == expected.answers_by_sample
+
+    @staticmethod
+    def _legacy_z_to_category(z: float, option_count: int) -> int:
+        m = max(2, min(50, option_count))
+        for j in range(1, m):
+            if z <= utils.normal_inv(j / m):
+                return j - 1
+        return m - 1
+
+    def test_z_to_category_threshold_table_matches_legacy_scan(self) -> None:
+        rng = random.Random(17)
+        zs = [rng.gauss(0.0, 2.0) for _ in range(400)] + [float('-inf'), float('inf'), float('nan'), 0.0]
+        for option_count in (1, 2, 3, 5, 7, 11, 50, 80):
+            zs_with_edges = zs + list(utils.category_thresholds(option_count))
+            expected = [self._legacy_z_to_category(z, option_count) for z in zs_with_edges]
+            assert [utils.z_to_category(z, option_count) for z in zs_with_edges] == expected
+            assert utils.z_to_categories(zs_with_edges, option_count) == expected
+
+    def test_z_to_categories_python_path_matches_array_path(self, monkeypatch) -> None:
+        zs = [-1.2, -0.25, 0.0, 0.25, 1.2, float('nan')]
+        expected = [utils.z_to_category(z, 5) for z in zs]
+        monkeypatch.setattr(utils, 'np', None)
+        assert utils.z_to_categories(zs, 5) == expected
@@ -152,3 +152,35 @@ class AIProtocolTests:
             client_module.acall_responses_api = original_responses
         assert answer == '回退成功'
         assert calls == ['chat', 'responses']
+
+    def test_generate_answer_uses_passed_snapshot_and_live_settings_otherwise(self, monkeypatch) -> None:
+        import software.integrations.ai.client as client_module
+        import software.integrations.ai.runtime_settings as runtime_settings
+        save_ai_settings(api_protocol='responses', model='snapshot-model')
+        snapshot = runtime_settings.build_ai_runtime_settings()
+        assert snapshot.request_url == 'https://example.com/v1/responses'
+        assert snapshot.headers['Authorization'] == 'Bearer test-key'
+        calls: list[tuple[str, str, dict]] = []
+
+        async def _fake_responses(url, _api_key, model, _question, _system_prompt, **kwargs):
+            calls.append((url, model, kwargs['headers']))
+            return 'ok'
+
+        def _no_settings_reads():
+            raise AssertionError('运行中不应重新读取 AI 设置')
+
+        monkeypatch.setattr(client_module, 'acall_responses_api', _fake_responses)
+        save_ai_settings(model='changed-model')
+        monkeypatch.setattr(runtime_settings, 'get_ai_settings', _no_settings_reads)
+        assert asyncio.run(client_module.agenerate_answer('问题', runtime_settings=snapshot)) == 'ok'
+        monkeypatch.undo()
+        monkeypatch.setattr(client_module, 'acall_responses_api', _fake_responses)
+        assert asyncio.run(client_module.agenerate_answer('问题')) == 'ok'
+        assert [model for _url, model, _headers in calls] == ['snapshot-model', 'changed-model']
+        assert calls[0][2]['Authorization'] == 'Bearer test-key'
+
+        config = SimpleNamespace(ai_runtime_settings=snapshot)
+        reloaded = runtime_settings.reload_ai_runtime_settings(config)
+        assert config.ai_runtime_settings is reloaded
+        assert reloaded.model == 'changed-model'
+        assert snapshot.model == 'snapshot-model'
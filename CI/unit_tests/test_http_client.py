@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import subprocess
+import sys
+import threading
+from pathlib import Path
 
 import pytest
 
+import software.network.http as http_package
 import software.network.http.async_client as async_http_client
 import software.network.http.client as http_client
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
 
 class _FakeResponse:
     def __init__(self, *, status_code: int = 200, text: str = "ok", content: bytes = b"ok", chunks=None) -> None:
@@ -318,3 +325,60 @@ class HttpClientTests:
         async_http_client.close()
 
         assert client.close_calls == 1
+
+
+class HttpPackageLazyExportTests:
+    def test_import_does_not_load_httpx_until_first_use(self) -> None:
+        script = (
+            "import sys\n"
+            "import software.network.http as http\n"
+            "assert 'httpx' not in sys.modules\n"
+            "assert http.aget is sys.modules['software.network.http.async_client'].get\n"
+            "assert 'httpx' in sys.modules\n"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=PROJECT_ROOT,
+            text=True,
+            capture_output=True,
+            timeout=30,
+            check=False,
+        )
+
+        assert completed.returncode == 0, completed.stdout + completed.stderr
+
+    def test_unknown_attribute_raises_attribute_error(self) -> None:
+        with pytest.raises(AttributeError):
+            getattr(http_package, "missing_export")
+
+    def test_background_access_waits_for_deferred_main_thread_prewarm(self, monkeypatch) -> None:
+        events: list[str] = []
+        monkeypatch.setattr(http_package, "_prewarm_deferred", True)
+        monkeypatch.setattr(http_package, "_prewarm_done", threading.Event())
+        monkeypatch.delitem(vars(http_package), "put", raising=False)
+        monkeypatch.setattr(http_client, "prewarm", lambda: events.append("prewarm"))
+
+        def worker() -> None:
+            _ = http_package.put
+            events.append("accessed")
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        thread.join(0.2)
+        assert thread.is_alive()
+        assert events == []
+
+        http_package.prewarm()
+        thread.join(5)
+
+        assert events == ["prewarm", "accessed"]
+
+    def test_main_thread_access_prewarms_immediately_when_deferred(self, monkeypatch) -> None:
+        events: list[str] = []
+        monkeypatch.setattr(http_package, "_prewarm_deferred", True)
+        monkeypatch.setattr(http_package, "_prewarm_done", threading.Event())
+        monkeypatch.delitem(vars(http_package), "delete", raising=False)
+        monkeypatch.setattr(http_client, "prewarm", lambda: events.append("prewarm"))
+
+        assert http_package.delete is http_client.delete
+        assert events == ["prewarm"]
@@ -100,6 +100,23 @@ class LogBufferHandlerConcurrencyTests:
         finally:
             handler.remove_listener(listener_id)
 
+    def test_get_records_since_returns_only_new_entries_and_flags_wrapped_cursor(self) -> None:
+        handler = self._create_handler(capacity=3)
+        for message in ('一', '二'):
+            handler.emit(logging.LogRecord('unit.logbuffer.cursor', logging.INFO, __file__, 10, message, (), None))
+        assert self._wait_until(lambda: handler.get_last_seq() == 2)
+        first = handler.get_records_since(0)
+        assert [entry.seq for entry in first.entries] == [1, 2]
+        assert first.last_seq == 2 and not first.truncated
+        assert handler.get_records_since(2).entries == []
+        for message in ('三', '四', '五'):
+            handler.emit(logging.LogRecord('unit.logbuffer.cursor', logging.INFO, __file__, 10, message, (), None))
+        assert self._wait_until(lambda: handler.get_last_seq() == 5)
+        assert [entry.seq for entry in handler.get_records_since(4).entries] == [5]
+        wrapped = handler.get_records_since(1)
+        assert wrapped.truncated
+        assert [entry.seq for entry in wrapped.entries] == [3, 4, 5]
+
     def test_async_file_handler_writes_without_calling_file_handler_emit(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             path = os.path.join(temp_dir, 'session.log')
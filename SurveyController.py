@@ -1,3 +1,5 @@
+import multiprocessing
+
 from software.app.frozen_runtime import prepare_frozen_runtime
 
 prepare_frozen_runtime()
@@ -5,6 +7,8 @@ prepare_frozen_runtime()
 from software.app.main import main
 
 if __name__ == "__main__":
+    # 冻结包里联合信效度进程池的子进程需要先走这里
+    multiprocessing.freeze_support()
     main()
     
 
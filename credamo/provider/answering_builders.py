@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import random
 from typing import Any, Optional
 
 from software.app.config import DEFAULT_FILL_TEXT
@@ -11,6 +10,7 @@ from software.core.questions.utils import (
     normalize_droplist_probs,
     weighted_index,
 )
+from software.core.task.random_context import run_random as random
 from software.providers.answering import AnswerAction
 
 
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Mapping, Optional, Tuple
 from software.app.config import DEFAULT_USER_AGENT
 from software.providers.common import SURVEY_PROVIDER_CREDAMO
 from software.providers.contracts import LOGIC_PARSE_STATUS_NONE
+from software.providers.survey_cache import SurveyParseResult, SurveyRevalidation
 
 from .http_runtime import (
     _CredamoHttpSession,
@@ -508,12 +509,16 @@ def _survey_title(detail_data: Mapping[str, Any]) -> str:
     return "Credamo 见数问卷"
 
 
-async def parse_credamo_survey(url: str) -> Tuple[List[Dict[str, Any]], str]:
+async def parse_credamo_survey(url: str, *, revalidation: Optional[SurveyRevalidation] = None) -> SurveyParseResult:
     origin = _origin_from_url(url)
     short_url = _noauth_short_url(_short_url_from_url(url))
     headers = _request_headers(origin=origin, short_url=short_url, user_agent=DEFAULT_USER_AGENT)
     async with _CredamoHttpSession() as session:
         detail_data = await _fetch_detail(session, origin=origin, short_url=short_url, headers=headers)
+    if revalidation is not None:
+        cached = revalidation.check(detail_data)
+        if cached is not None:
+            return cached
 
     questions: List[Dict[str, Any]] = []
     for index, raw_question in enumerate(_iter_raw_questions(detail_data), start=1):
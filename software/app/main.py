@@ -10,12 +10,21 @@ from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QApplication
 
 from software.app.settings_store import configure_qt_application_metadata
+from software.app.startup_profile import (
+    finish_startup_profile,
+    mark_startup_first_paint,
+    mark_startup_phase,
+    start_startup_profile,
+    watch_first_paint,
+)
 from software.app.user_paths import (
     ensure_user_data_directories,
     get_fatal_crash_log_path,
+    get_user_cache_directory,
 )
 import software.network.http as http_client
 from software.logging.log_utils import setup_logging
+from software.providers.survey_cache import SurveyDefinitionCache, configure_survey_definition_cache
 from software.ui.helpers.qfluent_compat import install_qfluentwidgets_animation_guards
 
 _VELOPACK_MODULE_NAME = "velopack"
@@ -122,7 +131,21 @@ def _qt_message_handler(mode, context, message):
         print(f"Qt Fatal: {message}")
 
 
+def _install_survey_definition_cache() -> None:
+    """问卷结构缓存放在用户缓存目录下，重复打开同一份问卷时跳过解析。"""
+    configure_survey_definition_cache(SurveyDefinitionCache(os.path.join(get_user_cache_directory(), "surveys")))
+
+
+def _on_first_paint() -> None:
+    """首帧落屏后再预热 httpx，不占用启动到首帧的时间。"""
+    mark_startup_first_paint()
+    http_client.prewarm()
+    mark_startup_phase("http_prewarm")
+    finish_startup_profile()
+
+
 def main():
+    start_startup_profile()
     _run_velopack_startup()
     if _is_velopack_lifecycle_hook(sys.argv):
         return 0
@@ -131,8 +154,10 @@ def main():
 
     configure_qt_application_metadata()
     ensure_user_data_directories()
+    _install_survey_definition_cache()
     _enable_fault_handler()
     setup_logging()
+    mark_startup_phase("bootstrap")
 
     qInstallMessageHandler(_qt_message_handler)
     app = QApplication(sys.argv)
@@ -141,14 +166,20 @@ def main():
     # 设置默认字体
     font = QFont("Microsoft YaHei UI" if sys.platform == "win32" else "Sans Serif", 9)
     app.setFont(font)
+    mark_startup_phase("qt_application")
 
-    # 在主线程预热 httpx/httpcore/ssl，避免首次后台请求触发原生层崩溃
-    http_client.prewarm()
+    # httpx/httpcore/ssl 必须在主线程预热，否则首次后台请求可能触发原生层崩溃；
+    # 预热挪到首帧之后，在此之前后台线程的首次请求会等主线程预热完成
+    http_client.defer_prewarm()
 
     # 导入并创建主窗口（主窗口内部会显示 SplashScreen）
     from software.ui.shell.main_window import create_window
+    mark_startup_phase("import_main_window")
     window = create_window()
+    mark_startup_phase("create_window")
+    watch_first_paint(window, _on_first_paint)
     window.show()
+    mark_startup_phase("show_window")
 
     exit_code = int(app.exec())
 
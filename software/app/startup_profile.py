@@ -0,0 +1,247 @@
+"""启动耗时剖析。
+
+设置环境变量 ``SURVEYCONTROLLER_STARTUP_PROFILE`` 后，启动流程按阶段记录墙钟耗时和每个阶段新导入的模块，
+首帧绘制后把报告写成 JSON：变量值是输出路径，取 ``1`` 时写到日志目录下的 ``startup_profile.json``。
+``SURVEYCONTROLLER_STARTUP_PROFILE_EXIT=1`` 时首帧后直接退出，供启动基准反复冷启动测量。
+
+报告还会列出 ``DEFERRED_STARTUP_MODULES`` 里哪些模块在首帧前就被导入了——这些重依赖应当在首次使用时才加载。
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+
+__all__ = [
+    "DEFERRED_STARTUP_MODULES",
+    "ENV_STARTUP_PROFILE",
+    "ENV_STARTUP_PROFILE_EXIT",
+    "FirstPaintWatcher",
+    "StartupPhase",
+    "StartupProfiler",
+    "finish_startup_profile",
+    "get_startup_profiler",
+    "mark_startup_first_paint",
+    "mark_startup_phase",
+    "start_startup_profile",
+    "watch_first_paint",
+]
+
+ENV_STARTUP_PROFILE = "SURVEYCONTROLLER_STARTUP_PROFILE"
+ENV_STARTUP_PROFILE_EXIT = "SURVEYCONTROLLER_STARTUP_PROFILE_EXIT"
+STARTUP_PROFILE_FILENAME = "startup_profile.json"
+
+# 首帧前不应出现的重依赖：都改成了首次使用时导入
+DEFERRED_STARTUP_MODULES = (
+    "httpx",
+    "bs4",
+    "zxingcpp",
+    "openpyxl",
+    "software.ui.dialogs.contact",
+)
+
+# 窗口一直收不到绘制事件（如启动即最小化）时，最多等这么久就按首帧处理
+FIRST_PAINT_FALLBACK_MS = 3000
+
+
+@dataclass
+class StartupPhase:
+    name: str
+    started_ms: float
+    duration_ms: float
+    imported_modules: int
+    top_packages: List[str] = field(default_factory=list)
+
+
+def _top_packages(module_names: List[str], limit: int = 12) -> List[str]:
+    """按模块数排序的顶层包，粗看每个阶段的导入开销花在哪。"""
+    counts: Dict[str, int] = {}
+    for name in module_names:
+        top = name.split(".", 1)[0]
+        counts[top] = counts.get(top, 0) + 1
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    return [f"{name}({count})" for name, count in ranked[:limit]]
+
+
+class StartupProfiler:
+    """按调用顺序切分阶段：每次 ``mark`` 结束上一段、开始下一段。"""
+
+    def __init__(
+        self,
+        output_path: str,
+        *,
+        exit_after_first_paint: bool = False,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.output_path = str(output_path)
+        self.exit_after_first_paint = bool(exit_after_first_paint)
+        self._clock = clock
+        self._origin = float(clock())
+        self._last_mark = self._origin
+        self._known_modules = set(sys.modules)
+        self._initial_module_count = len(self._known_modules)
+        self.phases: List[StartupPhase] = []
+        self.first_paint_ms: Optional[float] = None
+        self.first_paint_epoch: Optional[float] = None
+        self.deferred_loaded_before_paint: List[str] = []
+
+    def _elapsed_ms(self, moment: float) -> float:
+        return round((moment - self._origin) * 1000.0, 3)
+
+    def mark(self, name: str) -> StartupPhase:
+        now = float(self._clock())
+        current_modules = set(sys.modules)
+        new_modules = sorted(current_modules - self._known_modules)
+        self._known_modules = current_modules
+        phase = StartupPhase(
+            name=str(name),
+            started_ms=self._elapsed_ms(self._last_mark),
+            duration_ms=round((now - self._last_mark) * 1000.0, 3),
+            imported_modules=len(new_modules),
+            top_packages=_top_packages(new_modules),
+        )
+        self._last_mark = now
+        self.phases.append(phase)
+        return phase
+
+    def mark_first_paint(self) -> None:
+        if self.first_paint_ms is not None:
+            return
+        self.mark("first_paint")
+        self.first_paint_ms = self._elapsed_ms(self._last_mark)
+        self.first_paint_epoch = time.time()
+        self.deferred_loaded_before_paint = [name for name in DEFERRED_STARTUP_MODULES if name in sys.modules]
+
+    def build_report(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            # 墙钟时间戳，外部基准用它和拉起进程的时间相减，算上解释器启动和入口模块导入
+            "first_paint_epoch": self.first_paint_epoch,
+            "python": sys.version.split()[0],
+            "first_paint_ms": self.first_paint_ms,
+            "total_ms": self._elapsed_ms(self._last_mark),
+            "modules_at_start": self._initial_module_count,
+            "modules_total": len(self._known_modules),
+            "deferred_loaded_before_paint": list(self.deferred_loaded_before_paint),
+            "phases": [asdict(phase) for phase in self.phases],
+        }
+
+    def write_report(self) -> str:
+        directory = os.path.dirname(self.output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.output_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(self.build_report(), handle, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.output_path)
+        return self.output_path
+
+
+_active_profiler: Optional[StartupProfiler] = None
+
+
+def _resolve_output_path(raw_value: str) -> str:
+    if raw_value.lower() in {"1", "true", "yes", "on"}:
+        from software.app.user_paths import get_user_logs_directory
+
+        return os.path.join(get_user_logs_directory(), STARTUP_PROFILE_FILENAME)
+    return os.path.abspath(raw_value)
+
+
+def start_startup_profile(environ: Optional[Mapping[str, str]] = None) -> Optional[StartupProfiler]:
+    """按环境变量开启剖析；未开启时返回 None，后续的 mark 调用都是空操作。"""
+    global _active_profiler
+    env = os.environ if environ is None else environ
+    raw_value = str(env.get(ENV_STARTUP_PROFILE, "") or "").strip()
+    if not raw_value or raw_value == "0":
+        _active_profiler = None
+        return None
+    _active_profiler = StartupProfiler(
+        _resolve_output_path(raw_value),
+        exit_after_first_paint=str(env.get(ENV_STARTUP_PROFILE_EXIT, "") or "").strip() == "1",
+    )
+    return _active_profiler
+
+
+def get_startup_profiler() -> Optional[StartupProfiler]:
+    return _active_profiler
+
+
+def mark_startup_phase(name: str) -> None:
+    profiler = _active_profiler
+    if profiler is not None:
+        profiler.mark(name)
+
+
+def mark_startup_first_paint() -> None:
+    profiler = _active_profiler
+    if profiler is not None:
+        profiler.mark_first_paint()
+
+
+def finish_startup_profile() -> Optional[str]:
+    """写出报告并停止剖析；要求首帧后退出时顺带结束事件循环。"""
+    global _active_profiler
+    profiler = _active_profiler
+    if profiler is None:
+        return None
+    _active_profiler = None
+    path: Optional[str] = None
+    try:
+        path = profiler.write_report()
+    except OSError as exc:
+        from software.logging.log_utils import log_suppressed_exception
+
+        log_suppressed_exception("finish_startup_profile: 启动剖析报告写入失败", exc, level=logging.WARNING)
+    if profiler.exit_after_first_paint:
+        from PySide6.QtCore import QCoreApplication
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.exit(0)
+    return path
+
+
+class FirstPaintWatcher(QObject):
+    """窗口第一次绘制完成后回调一次；绘制事件一直不来时由兜底定时器触发。"""
+
+    def __init__(
+        self,
+        window: QObject,
+        callback: Callable[[], None],
+        *,
+        fallback_ms: int = FIRST_PAINT_FALLBACK_MS,
+    ) -> None:
+        super().__init__(window)
+        self._window = window
+        self._callback: Optional[Callable[[], None]] = callback
+        window.installEventFilter(self)
+        QTimer.singleShot(max(0, int(fallback_ms)), self._fire)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is self._window and event.type() == QEvent.Type.Paint and self._callback is not None:
+            # 绘制事件还没处理完，排到事件循环下一轮再回调，让这一帧先落屏
+            QTimer.singleShot(0, self._fire)
+        return False
+
+    def _fire(self) -> None:
+        callback = self._callback
+        if callback is None:
+            return
+        self._callback = None
+        try:
+            self._window.removeEventFilter(self)
+        except RuntimeError:
+            pass
+        callback()
+
+
+def watch_first_paint(window: QObject, callback: Callable[[], None]) -> FirstPaintWatcher:
+    return FirstPaintWatcher(window, callback)
@@ -0,0 +1,217 @@
+"""AI 填空答案池 - 按题目批量预取答案，摊薄单次 LLM 往返延迟。
+
+开启后（``ExecutionConfig.ai_answer_pool_size > 0``），同一道填空题一次请求 N 个
+互不相同的回答放进有界缓冲区；slot 取走答案后水位偏低就在后台补货，同一题同时
+只会有一个补货请求在路上。池里的答案按"不同受访者"生成，不带单份问卷的画像和
+前文作答上下文，属于以一致性换吞吐的显式选择，默认关闭。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, List, Optional
+
+__all__ = [
+    "AIAnswerPool",
+    "AIAnswerPoolStats",
+    "active_ai_answer_pool",
+    "use_ai_answer_pool",
+]
+
+_ACTIVE_POOL: ContextVar[Optional["AIAnswerPool"]] = ContextVar(
+    "survey_active_ai_answer_pool",
+    default=None,
+)
+
+BatchGenerator = Callable[[str, int], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class AIAnswerPoolStats:
+    hits: int
+    misses: int
+    batches: int
+    failed_batches: int
+    answers_generated: int
+    batch_seconds_total: float
+    batch_seconds_max: float
+
+    @property
+    def batch_seconds_avg(self) -> float:
+        if self.batches <= 0:
+            return 0.0
+        return self.batch_seconds_total / self.batches
+
+
+# 自定义 API 原样返回模型文本，常见的 "1." / "（2）" / "-" 列表前缀要去掉
+_LIST_MARKER_RE = re.compile(r"^(?:\d{1,3}\s*[.．、)）:：](?!\d)|[（(]\d{1,3}[)）]|[-*•·])\s*")
+
+
+def _clean_batch_item(item: Any) -> str:
+    # 丢掉 "以下是 5 个回答：" 这类以冒号结尾的引导语行
+    lines = [line.strip() for line in str(item or "").splitlines()]
+    kept = [line for line in lines if line and not line.endswith((":", "："))]
+    return _LIST_MARKER_RE.sub("", " ".join(kept)).strip()
+
+
+def _split_batch_answers(raw: Any, limit: Optional[int] = None) -> List[str]:
+    if isinstance(raw, (list, tuple)):
+        items = [str(item or "") for item in raw]
+    else:
+        text = str(raw or "")
+        items = text.split("||") if "||" in text else text.splitlines()
+    answers: List[str] = []
+    seen: set[str] = set()
+    for item in items:
+        answer = _clean_batch_item(item)
+        if not answer or answer in seen:
+            continue
+        seen.add(answer)
+        answers.append(answer)
+        if limit is not None and len(answers) >= limit:
+            break
+    return answers
+
+
+class AIAnswerPool:
+    """按题目缓存批量生成的 AI 填空答案。"""
+
+    def __init__(
+        self,
+        *,
+        batch_size: int,
+        generate_batch: BatchGenerator,
+        buffer_limit: Optional[int] = None,
+    ) -> None:
+        self._batch_size = max(1, int(batch_size or 1))
+        self._buffer_limit = max(self._batch_size, int(buffer_limit or self._batch_size * 2))
+        # 剩余不足一半批量时后台补货
+        self._low_watermark = max(1, self._batch_size // 2)
+        self._generate_batch = generate_batch
+        # 换绑生成函数时递增，旧代次补货回来的答案直接丢弃
+        self._generation = 0
+        self._buffers: Dict[str, Deque[str]] = {}
+        self._inflight: Dict[str, asyncio.Task[None]] = {}
+        self._closed = False
+        self._hits = 0
+        self._misses = 0
+        self._batches = 0
+        self._failed_batches = 0
+        self._answers_generated = 0
+        self._batch_seconds_total = 0.0
+        self._batch_seconds_max = 0.0
+
+    async def take(self, question: str) -> Optional[str]:
+        """取一个答案；池里没有且补货失败时返回 None，由调用方走单次生成。"""
+        key = str(question or "").strip()
+        if not key or self._closed:
+            return None
+        buffer = self._buffers.setdefault(key, deque())
+        if buffer:
+            self._hits += 1
+            answer = buffer.popleft()
+            if len(buffer) < self._low_watermark:
+                self._ensure_refill(key)
+            return answer
+        self._misses += 1
+        task = self._ensure_refill(key)
+        if task is not None:
+            # shield：某个 slot 被取消时不能连带取消其它 slot 也在等的补货请求
+            await asyncio.shield(task)
+        if not buffer:
+            return None
+        answer = buffer.popleft()
+        if len(buffer) < self._low_watermark:
+            self._ensure_refill(key)
+        return answer
+
+    def snapshot_stats(self) -> AIAnswerPoolStats:
+        return AIAnswerPoolStats(
+            hits=self._hits,
+            misses=self._misses,
+            batches=self._batches,
+            failed_batches=self._failed_batches,
+            answers_generated=self._answers_generated,
+            batch_seconds_total=self._batch_seconds_total,
+            batch_seconds_max=self._batch_seconds_max,
+        )
+
+    def rebind(self, generate_batch: BatchGenerator) -> None:
+        """换用新的批量生成函数：丢弃旧配置生成的缓存答案，在途补货完成后也不再入池。
+
+        不取消在途任务，正在 ``take`` 里等待补货的 slot 拿到空结果后走单次生成。
+        """
+        self._generate_batch = generate_batch
+        self._generation += 1
+        self._buffers.clear()
+
+    async def close(self) -> None:
+        self._closed = True
+        tasks = list(self._inflight.values())
+        self._inflight.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._buffers.clear()
+
+    def _ensure_refill(self, key: str) -> Optional[asyncio.Task[None]]:
+        if self._closed:
+            return None
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.create_task(self._refill(key), name="AIAnswerPoolRefill")
+            self._inflight[key] = task
+        return task
+
+    async def _refill(self, key: str) -> None:
+        started = time.monotonic()
+        generation = self._generation
+        try:
+            raw = await self._generate_batch(key, self._batch_size)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self._failed_batches += 1
+            logging.warning("AI 答案池批量生成失败，本题回退单次生成：%s", exc)
+            return
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                self._inflight.pop(key, None)
+        if generation != self._generation:
+            return
+        elapsed = time.monotonic() - started
+        self._batches += 1
+        self._batch_seconds_total += elapsed
+        self._batch_seconds_max = max(self._batch_seconds_max, elapsed)
+        answers = _split_batch_answers(raw, self._batch_size)
+        self._answers_generated += len(answers)
+        buffer = self._buffers.setdefault(key, deque())
+        for answer in answers:
+            if len(buffer) >= self._buffer_limit:
+                break
+            buffer.append(answer)
+
+
+def active_ai_answer_pool() -> Optional[AIAnswerPool]:
+    return _ACTIVE_POOL.get()
+
+
+@contextmanager
+def use_ai_answer_pool(pool: Optional[AIAnswerPool]) -> Iterator[Optional[AIAnswerPool]]:
+    """在当前上下文内启用答案池；之后创建的 slot task 会继承它。传 None 时不改变现状。"""
+    if pool is None:
+        yield None
+        return
+    token = _ACTIVE_POOL.set(pool)
+    try:
+        yield pool
+    finally:
+        _ACTIVE_POOL.reset(token)
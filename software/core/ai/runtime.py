@@ -1,13 +1,15 @@
 """AI 运行时辅助函数 - 调用 AI 模型生成答案"""
 import re
 import asyncio
-from typing import Optional, Union, List
+from functools import partial
+from typing import Any, Optional, Union, List
 import logging
 from software.logging.log_utils import log_suppressed_exception
 
 from software.integrations.ai.client import agenerate_answer
 from software.integrations.ai.client import FreeAITimeoutError
 from software.app.config import _HTML_SPACE_RE
+from software.core.ai.answer_pool import AIAnswerPool, active_ai_answer_pool
 
 
 class AIRuntimeError(RuntimeError):
@@ -71,16 +73,58 @@ def _cleanup_question_title(raw_title: str) -> str:
     return title.strip()
 
 
+def build_ai_answer_pool(batch_size: int, runtime_settings: Optional[Any] = None) -> Optional[AIAnswerPool]:
+    """按配置的批量创建填空答案池；batch_size<=0 表示不启用。"""
+    size = int(batch_size or 0)
+    if size <= 0:
+        return None
+    return AIAnswerPool(
+        batch_size=size,
+        generate_batch=partial(_agenerate_answer_batch, runtime_settings=runtime_settings),
+    )
+
+
+def rebind_ai_answer_pool(pool: AIAnswerPool, runtime_settings: Optional[Any]) -> None:
+    """运行中换用新的 AI 配置快照：旧快照生成的缓存答案作废，之后的补货按新快照请求。"""
+    pool.rebind(partial(_agenerate_answer_batch, runtime_settings=runtime_settings))
+
+
+async def _agenerate_answer_batch(
+    cleaned_title: str,
+    count: int,
+    *,
+    runtime_settings: Optional[Any] = None,
+) -> Union[str, List[str]]:
+    prompt = (
+        f"请回答以下问卷问题：{cleaned_title}\n\n"
+        f"请分别以 {count} 位背景不同的普通受访者身份各写一个简短回答，{count} 个回答彼此不要重复。\n"
+        f"只输出这 {count} 个回答本身，用 || 分隔（示例：回答1||回答2），不要编号，不要任何说明文字。"
+    )
+    return await agenerate_answer(
+        prompt,
+        question_type="multi_fill_blank",
+        blank_count=count,
+        runtime_settings=runtime_settings,
+    )
+
+
 async def agenerate_ai_answer(
     question_title: str,
     *,
     question_type: str = "fill_blank",
     blank_count: Optional[int] = None,
+    runtime_settings: Optional[Any] = None,
 ) -> Union[str, List[str]]:
     cleaned = _cleanup_question_title(question_title)
     if not cleaned:
         raise AIRuntimeError("题干为空，无法调用 AI")
 
+    pool = active_ai_answer_pool()
+    if pool is not None and question_type == "fill_blank":
+        pooled = await pool.take(cleaned)
+        if pooled:
+            return pooled
+
     try:
         from software.core.persona.context import build_ai_context_prompt
         context_prompt = build_ai_context_prompt()
@@ -96,6 +140,7 @@ async def agenerate_ai_answer(
                 cleaned,
                 question_type=question_type,
                 blank_count=blank_count,
+                runtime_settings=runtime_settings,
             )
             if question_type == "multi_fill_blank":
                 if not isinstance(answer, list):
@@ -415,6 +415,12 @@ def normalize_runtime_config_payload(raw: Dict[str, Any]) -> RuntimeConfig:
     config.pause_on_aliyun_captcha = bool(raw.get("pause_on_aliyun_captcha", True))
     config.reliability_mode_enabled = bool(raw.get("reliability_mode_enabled", True))
     config.psycho_target_alpha = normalize_target_alpha(raw.get("psycho_target_alpha"))
+    config.psycho_parallel_workers = max(0, _as_int(raw.get("psycho_parallel_workers"), 0))
+    raw_random_seed = raw.get("random_seed")
+    try:
+        config.random_seed = None if raw_random_seed in (None, "") else int(raw_random_seed)
+    except (TypeError, ValueError):
+        config.random_seed = None
     config.reverse_fill_enabled = _as_bool(raw.get("reverse_fill_enabled", False), False)
     config.reverse_fill_source_path = str(raw.get("reverse_fill_source_path") or "")
     config.reverse_fill_format = _reverse_fill_format(raw.get("reverse_fill_format"))
@@ -450,6 +456,7 @@ def normalize_runtime_config_payload(raw: Dict[str, Any]) -> RuntimeConfig:
         config.ai_api_protocol = str(raw.get("ai_api_protocol") or "auto")
         config.ai_model = str(raw.get("ai_model") or "")
         config.ai_system_prompt = str(raw.get("ai_system_prompt") or "")
+    config.ai_answer_pool_size = max(0, _as_int(raw.get("ai_answer_pool_size"), 0))
 
     entries_data = raw.get("question_entries") or []
     config.question_entries = []
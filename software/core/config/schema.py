@@ -35,6 +35,8 @@ class RuntimeConfig:
     pause_on_aliyun_captcha: bool = True
     reliability_mode_enabled: bool = True
     psycho_target_alpha: float = 0.85
+    psycho_parallel_workers: int = 0
+    random_seed: Optional[int] = None
     ai_mode: str = "free"
     ai_provider: str = "deepseek"
     ai_api_key: str = ""
@@ -42,6 +44,7 @@ class RuntimeConfig:
     ai_api_protocol: str = "auto"
     ai_model: str = ""
     ai_system_prompt: str = ""
+    ai_answer_pool_size: int = 0
     reverse_fill_enabled: bool = False
     reverse_fill_source_path: str = ""
     reverse_fill_format: str = "auto"
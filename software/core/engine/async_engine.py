@@ -8,12 +8,16 @@ import logging
 import threading
 from typing import Any, Callable, Optional
 
+from software.core.ai.answer_pool import AIAnswerPool, use_ai_answer_pool
+from software.core.ai.runtime import build_ai_answer_pool, rebind_ai_answer_pool
 from software.core.engine.async_events import AsyncRunContext
 from software.core.engine.async_runtime_loop import AsyncSlotRunner
 from software.core.engine.async_scheduler import AsyncScheduler
 from software.core.engine.async_status_bus import AsyncStatusBus
 from software.core.engine.runtime_control_port import RuntimeControlPort, on_random_ip_loading_changed
+from software.core.engine.simulation import SimulationReport, simulate_answer_sheets
 from software.core.task import ExecutionConfig, ExecutionState
+from software.integrations.ai.runtime_settings import build_ai_runtime_settings, reload_ai_runtime_settings
 from software.network.proxy.api import fetch_proxy_batch_async
 from software.network.session_policy import (
     _acquire_proxy_fetch_lock_async,
@@ -40,6 +44,8 @@ class AsyncRuntimeEngine:
         self._pause_event: Optional[asyncio.Event] = None
         self._closed = False
         self._state: Optional[ExecutionState] = None
+        self._ai_answer_pool: Optional[AIAnswerPool] = None
+        self._simulation_stop: Optional[threading.Event] = None
 
     @property
     def thread(self) -> Optional[threading.Thread]:
@@ -90,6 +96,27 @@ class AsyncRuntimeEngine:
         self._run_future = future
         return future
 
+    def start_simulation(
+        self,
+        *,
+        config: ExecutionConfig,
+        sample_count: int,
+        output_path: str = "",
+        output_format: str = "jsonl",
+    ) -> concurrent.futures.Future[SimulationReport]:
+        """离线模拟：按正式作答链路生成答卷写入文件，不联网、不提交。"""
+        stop_signal = threading.Event()
+        self._simulation_stop = stop_signal
+        return self._submit(
+            simulate_answer_sheets(
+                config,
+                sample_count=sample_count,
+                output_path=output_path,
+                output_format=output_format,
+                stop_signal=stop_signal,
+            )
+        )
+
     async def _run(
         self,
         *,
@@ -158,20 +185,29 @@ class AsyncRuntimeEngine:
                     return
 
         prefetch_task = asyncio.create_task(_prefetch_proxy_pool(), name="AsyncProxyPrefetch")
+        if config.ai_runtime_settings is None:
+            try:
+                config.ai_runtime_settings = build_ai_runtime_settings()
+            except Exception:
+                logging.info("解析 AI 配置快照失败，AI 调用将逐次读取设置", exc_info=True)
+        ai_answer_pool = build_ai_answer_pool(config.ai_answer_pool_size, config.ai_runtime_settings)
+        self._ai_answer_pool = ai_answer_pool
         try:
-            async with asyncio.TaskGroup() as task_group:
-                for slot_index in range(worker_count):
-                    task_group.create_task(
-                        AsyncSlotRunner(
-                            slot_id=slot_index + 1,
-                            config=config,
-                            state=state,
-                            run_context=run_context,
-                            scheduler=scheduler,
-                            runtime_bridge=runtime_bridge,
-                        ).run(),
-                        name=f"AsyncSlotRunner-{slot_index + 1}",
-                    )
+            # slot task 在创建时拷贝当前 contextvars，答案池需在此之前绑定
+            with use_ai_answer_pool(ai_answer_pool):
+                async with asyncio.TaskGroup() as task_group:
+                    for slot_index in range(worker_count):
+                        task_group.create_task(
+                            AsyncSlotRunner(
+                                slot_id=slot_index + 1,
+                                config=config,
+                                state=state,
+                                run_context=run_context,
+                                scheduler=scheduler,
+                                runtime_bridge=runtime_bridge,
+                            ).run(),
+                            name=f"AsyncSlotRunner-{slot_index + 1}",
+                        )
         except* Exception as exc_group:
             errors = [exc for exc in exc_group.exceptions if not isinstance(exc, asyncio.CancelledError)]
             if not errors:
@@ -185,14 +221,38 @@ class AsyncRuntimeEngine:
             if self._stop_event is not None:
                 self._stop_event.set()
             await scheduler.close()
+            if ai_answer_pool is not None:
+                await ai_answer_pool.close()
+                logging.info("AI 答案池统计：%s", ai_answer_pool.snapshot_stats())
+            # 事件循环退出后 call_later 不会再触发，这里把各 slot 的最终状态刷给 UI
+            self._status_bus.flush()
             state.stop_event.set()
             self._stop_event = None
             self._pause_event = None
             self._state = None
+            self._ai_answer_pool = None
+
+    def reload_ai_settings(self) -> bool:
+        """运行中显式重新读取 AI 设置；没有运行中的任务时返回 False。"""
+        state = self._state
+        if state is None:
+            return False
+        try:
+            snapshot = reload_ai_runtime_settings(state.config)
+        except Exception:
+            logging.info("运行中刷新 AI 配置快照失败，继续使用原快照", exc_info=True)
+            return False
+        pool = self._ai_answer_pool
+        if pool is not None and self._loop is not None:
+            # 答案池只在引擎事件循环里读写，换绑也排到循环线程执行
+            self._loop.call_soon_threadsafe(rebind_ai_answer_pool, pool, snapshot)
+        return True
 
     def stop_run(self) -> None:
         stop_event = self._stop_event
         state = self._state
+        if self._simulation_stop is not None:
+            self._simulation_stop.set()
         if state is not None:
             try:
                 state.stop_event.set()
@@ -265,6 +325,21 @@ class AsyncEngineClient:
     ) -> concurrent.futures.Future[Any]:
         return self._engine.start_run(config=config, state=state, runtime_bridge=runtime_bridge)
 
+    def start_simulation(
+        self,
+        config: ExecutionConfig,
+        sample_count: int,
+        *,
+        output_path: str = "",
+        output_format: str = "jsonl",
+    ) -> concurrent.futures.Future[SimulationReport]:
+        return self._engine.start_simulation(
+            config=config,
+            sample_count=sample_count,
+            output_path=output_path,
+            output_format=output_format,
+        )
+
     def stop_run(self) -> None:
         self._engine.stop_run()
 
@@ -274,6 +349,9 @@ class AsyncEngineClient:
     def resume_run(self) -> None:
         self._engine.resume_run()
 
+    def reload_ai_settings(self) -> bool:
+        return self._engine.reload_ai_settings()
+
     def parse_survey(self, url: str) -> concurrent.futures.Future[Any]:
         return self._engine.parse_survey(url)
 
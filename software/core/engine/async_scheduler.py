@@ -6,9 +6,10 @@ import asyncio
 from collections import deque
 import heapq
 import itertools
+import logging
 import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Protocol
 
 
 @dataclass(order=True)
@@ -18,81 +19,208 @@ class _ScheduledToken:
     token_id: int = field(compare=False)
 
 
+@dataclass(frozen=True)
+class AsyncSchedulerMetrics:
+    """Point-in-time scheduler counters."""
+
+    ready_depth: int
+    waiting_acquirers: int
+    delayed_size: int
+    acquired_total: int
+    waited_total: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+    @property
+    def wait_seconds_avg(self) -> float:
+        if self.waited_total <= 0:
+            return 0.0
+        return self.wait_seconds_total / self.waited_total
+
+
+class ReadyTokenPolicy(Protocol):
+    """Ordering policy for tokens that are ready to be handed out."""
+
+    def push(self, token_id: int) -> None: ...
+    def pop(self) -> int: ...
+    def __len__(self) -> int: ...
+
+
+class FifoTokenPolicy:
+    """Hand tokens out in the order they became ready."""
+
+    def __init__(self) -> None:
+        self._tokens: deque[int] = deque()
+
+    def push(self, token_id: int) -> None:
+        self._tokens.append(token_id)
+
+    def pop(self) -> int:
+        return self._tokens.popleft()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+
+class LowestTokenFirstPolicy:
+    """Always hand out the smallest ready token id (keeps low slots busy)."""
+
+    def __init__(self) -> None:
+        self._tokens: list[int] = []
+
+    def push(self, token_id: int) -> None:
+        heapq.heappush(self._tokens, token_id)
+
+    def pop(self) -> int:
+        return heapq.heappop(self._tokens)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+
 class AsyncScheduler:
-    """Bounded async attempt scheduler with delayed requeue."""
+    """Bounded async attempt scheduler with delayed requeue.
+
+    Ready tokens are handed directly to the oldest waiter, so every release
+    wakes at most one acquirer. Delayed tokens are driven by a single
+    ``loop.call_at`` timer armed for the earliest entry of the delayed heap;
+    nothing polls while the scheduler is idle.
+    """
 
-    def __init__(self, *, concurrency: int) -> None:
+    def __init__(self, *, concurrency: int, policy: Optional[ReadyTokenPolicy] = None) -> None:
         self._concurrency = max(1, int(concurrency or 1))
-        self._ready: deque[int] = deque()
+        self._ready: ReadyTokenPolicy = policy if policy is not None else FifoTokenPolicy()
+        self._waiters: deque[asyncio.Future[Optional[int]]] = deque()
         self._delayed: list[_ScheduledToken] = []
         self._order = itertools.count()
-        self._condition = asyncio.Condition()
         self._closed = False
-        self._waker_task: Optional[asyncio.Task[None]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_at: Optional[float] = None
+        self._acquired_total = 0
+        self._waited_total = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
         for token_id in range(self._concurrency):
-            self._ready.append(token_id)
+            self._ready.push(token_id)
 
     async def start(self) -> None:
-        if self._waker_task is None:
-            self._waker_task = asyncio.create_task(self._wake_delayed_tokens(), name="AsyncSchedulerWake")
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
 
     async def acquire(self) -> Optional[int]:
         await self.start()
-        async with self._condition:
-            while True:
-                if self._closed:
-                    return None
-                if self._ready:
-                    return self._ready.popleft()
-                await self._condition.wait()
+        if self._closed:
+            return None
+        if len(self._ready) and not self._waiters:
+            self._acquired_total += 1
+            return self._ready.pop()
+        loop = self._loop
+        assert loop is not None
+        waiter: asyncio.Future[Optional[int]] = loop.create_future()
+        self._waiters.append(waiter)
+        started = time.monotonic()
+        try:
+            token_id = await waiter
+        except asyncio.CancelledError:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+            # 令牌已经交到这个等待者手里但协程被取消，必须归还给下一个等待者
+            if waiter.done() and not waiter.cancelled():
+                handed = waiter.result()
+                if handed is not None:
+                    self._acquired_total -= 1
+                    self._ready.push(handed)
+                    self._dispatch()
+            raise
+        if token_id is not None:
+            waited = time.monotonic() - started
+            self._waited_total += 1
+            self._wait_seconds_total += waited
+            if waited > self._wait_seconds_max:
+                self._wait_seconds_max = waited
+        return token_id
 
     async def release(self, token_id: int, *, requeue: bool, delay_seconds: float = 0.0) -> None:
         if not requeue:
             return
+        await self.start()
+        if self._closed:
+            return
         delay = max(0.0, float(delay_seconds or 0.0))
-        async with self._condition:
-            if self._closed:
-                return
-            if delay <= 0:
-                self._ready.append(int(token_id))
-                self._condition.notify_all()
+        if delay <= 0:
+            self._ready.push(int(token_id))
+            self._dispatch()
+            return
+        heapq.heappush(
+            self._delayed,
+            _ScheduledToken(time.monotonic() + delay, next(self._order), int(token_id)),
+        )
+        self._arm_timer()
+
+    def snapshot_metrics(self) -> AsyncSchedulerMetrics:
+        return AsyncSchedulerMetrics(
+            ready_depth=len(self._ready),
+            waiting_acquirers=sum(1 for waiter in self._waiters if not waiter.done()),
+            delayed_size=len(self._delayed),
+            acquired_total=self._acquired_total,
+            waited_total=self._waited_total,
+            wait_seconds_total=self._wait_seconds_total,
+            wait_seconds_max=self._wait_seconds_max,
+        )
+
+    def _dispatch(self) -> None:
+        while self._waiters and len(self._ready):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._acquired_total += 1
+            waiter.set_result(self._ready.pop())
+
+    def _arm_timer(self) -> None:
+        if self._closed or not self._delayed or self._loop is None:
+            return
+        ready_at = self._delayed[0].ready_at
+        if self._timer is not None:
+            if self._timer_at is not None and self._timer_at <= ready_at:
                 return
-            heapq.heappush(
-                self._delayed,
-                _ScheduledToken(time.monotonic() + delay, next(self._order), int(token_id)),
-            )
-            self._condition.notify_all()
-
-    async def _wake_delayed_tokens(self) -> None:
-        while True:
-            async with self._condition:
-                if self._closed:
-                    return
-                now = time.monotonic()
-                moved = False
-                while self._delayed and self._delayed[0].ready_at <= now:
-                    token = heapq.heappop(self._delayed)
-                    self._ready.append(token.token_id)
-                    moved = True
-                if moved:
-                    self._condition.notify_all()
-                    continue
-                sleep_for = 0.1
-                if self._delayed:
-                    sleep_for = min(0.1, max(0.0, self._delayed[0].ready_at - now))
-            try:
-                await asyncio.sleep(sleep_for)
-            except asyncio.CancelledError:
-                break
+            self._timer.cancel()
+        # heap 使用 time.monotonic()，换算成事件循环自己的时钟
+        when = self._loop.time() + max(0.0, ready_at - time.monotonic())
+        self._timer = self._loop.call_at(when, self._on_timer)
+        self._timer_at = ready_at
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._timer_at = None
+        if self._closed:
+            return
+        now = time.monotonic()
+        while self._delayed and self._delayed[0].ready_at <= now:
+            self._ready.push(heapq.heappop(self._delayed).token_id)
+        self._dispatch()
+        self._arm_timer()
 
     async def close(self) -> None:
-        self._closed = True
-        if self._waker_task is not None:
-            self._waker_task.cancel()
-            await asyncio.gather(self._waker_task, return_exceptions=True)
-            self._waker_task = None
-        async with self._condition:
-            self._condition.notify_all()
+        if not self._closed:
+            self._closed = True
+            logging.debug("AsyncScheduler 关闭：%s", self.snapshot_metrics())
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            self._timer_at = None
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
 
 
-__all__ = ["AsyncScheduler"]
+__all__ = [
+    "AsyncScheduler",
+    "AsyncSchedulerMetrics",
+    "FifoTokenPolicy",
+    "LowestTokenFirstPolicy",
+    "ReadyTokenPolicy",
+]
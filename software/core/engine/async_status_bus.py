@@ -2,51 +2,121 @@
 
 from __future__ import annotations
 
+import asyncio
 import threading
-import time
 from collections import defaultdict
-from typing import Any, Callable, DefaultDict, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, DefaultDict, Hashable, Optional
+
+
+_COALESCED_EVENT_TYPES = frozenset({"progress", "status"})
+
+
+@dataclass(frozen=True)
+class AsyncStatusBusStats:
+    """Bus counters since construction."""
+
+    emitted: int
+    coalesced: int
+    dispatched: int
+    batches: int
 
 
 class AsyncStatusBus:
-    """Ordered status sink with lightweight throttling support."""
+    """Coalescing status sink that flushes to the UI thread in batches.
+
+    ``progress``/``status`` events keep only the latest payload per slot and
+    event type; every other event is delivered in order. Pending events are
+    flushed through one ``dispatcher`` call per frame (``flush_interval_seconds``),
+    so the UI always ends up with each slot's final state.
+    """
 
     def __init__(
         self,
         *,
         dispatcher: Optional[Callable[[Callable[[], Any]], Any]] = None,
-        throttle_seconds: float = 0.075,
+        flush_interval_seconds: float = 0.05,
     ) -> None:
         self._dispatcher = dispatcher
-        self._throttle_seconds = max(0.0, float(throttle_seconds or 0.0))
+        self._flush_interval = max(0.0, float(flush_interval_seconds or 0.0))
         self._lock = threading.Lock()
         self._sequence_by_slot: DefaultDict[str, int] = defaultdict(int)
-        self._last_emit_by_slot: dict[str, float] = {}
+        self._pending: dict[Hashable, dict[str, Any]] = {}
+        self._flush_scheduled = False
+        self._emitted = 0
+        self._coalesced = 0
+        self._dispatched = 0
+        self._batches = 0
 
     def emit(self, event: dict[str, Any]) -> None:
-        payload = dict(event or {})
+        payload = event if isinstance(event, dict) else {}
         slot_id = str(payload.get("slot_id") or payload.get("slot_label") or "global")
-        now = time.monotonic()
+        event_type = str(payload.get("type") or "")
         with self._lock:
+            self._emitted += 1
             self._sequence_by_slot[slot_id] += 1
-            payload["sequence"] = self._sequence_by_slot[slot_id]
-            event_type = str(payload.get("type") or "")
-            high_frequency = event_type in {"progress", "status"}
-            last_emit = self._last_emit_by_slot.get(slot_id, 0.0)
-            if high_frequency and self._throttle_seconds > 0 and (now - last_emit) < self._throttle_seconds:
+            sequence = self._sequence_by_slot[slot_id]
+            payload["sequence"] = sequence
+            if event_type in _COALESCED_EVENT_TYPES:
+                key: Hashable = (slot_id, event_type)
+                # 重新插入到末尾，保证与同 slot 其它事件的先后顺序仍按最新一次 emit 计算
+                if self._pending.pop(key, None) is not None:
+                    self._coalesced += 1
+            else:
+                key = (slot_id, event_type, sequence)
+            self._pending[key] = payload
+            if self._flush_scheduled:
                 return
-            self._last_emit_by_slot[slot_id] = now
+            self._flush_scheduled = True
+        self._schedule_flush()
+
+    def flush(self) -> int:
+        """Deliver every pending event in one dispatcher call; returns the count."""
+        with self._lock:
+            self._flush_scheduled = False
+            if not self._pending:
+                return 0
+            batch = list(self._pending.values())
+            self._pending.clear()
+            self._dispatched += len(batch)
+            self._batches += 1
 
         dispatcher = self._dispatcher
         if not callable(dispatcher):
-            return
+            return len(batch)
 
         def _deliver() -> None:
-            callback = payload.get("callback")
-            if callable(callback):
-                callback()
+            for payload in batch:
+                callback = payload.get("callback")
+                if callable(callback):
+                    callback()
 
         dispatcher(_deliver)
+        return len(batch)
+
+    def snapshot_stats(self) -> AsyncStatusBusStats:
+        with self._lock:
+            return AsyncStatusBusStats(
+                emitted=self._emitted,
+                coalesced=self._coalesced,
+                dispatched=self._dispatched,
+                batches=self._batches,
+            )
+
+    def _schedule_flush(self) -> None:
+        if self._flush_interval <= 0:
+            self.flush()
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            loop.call_later(self._flush_interval, self.flush)
+            return
+        timer = threading.Timer(self._flush_interval, self.flush)
+        timer.daemon = True
+        timer.start()
 
 
-__all__ = ["AsyncStatusBus"]
+__all__ = ["AsyncStatusBus", "AsyncStatusBusStats"]
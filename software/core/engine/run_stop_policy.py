@@ -15,6 +15,7 @@ from software.core.engine.runtime_control_port import (
 )
 from software.core.engine.stop_signal import StopSignalLike
 from software.core.task import ExecutionConfig, ExecutionState
+from software.core.task.runtime_channels import RUNTIME_CHANNEL_PROXY
 
 
 class RunStopPolicy:
@@ -171,6 +172,9 @@ class RunStopPolicy:
             else:
                 should_break = True
 
+        if record_thread_success:
+            # 剩余份数变了：等代理的 slot 和后台预取都要按新的剩余份数重新判断
+            self.state.notify_runtime_change(RUNTIME_CHANNEL_PROXY)
         if record_thread_success and thread_name:
             try:
                 self.state.commit_joint_sample(thread_name)
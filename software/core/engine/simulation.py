@@ -0,0 +1,462 @@
+"""离线模拟模式 - 不联网批量生成完整答卷，用于校验配比与信效度配置。
+
+模拟与正式运行共用同一套作答链路：``provider_run_context`` 初始化画像与联合
+信效度样本计划，问卷星/腾讯问卷各自的 ``build_answer_action`` 生成答案，
+``build_http_logic_plan`` 处理跳题逻辑，成功后同样核销比例统计与样本槽位。
+区别只在于不拉取页面、不提交：答卷逐份写入 JSONL/CSV，结束时给出按题的
+实际/目标配比、各维度 Cronbach's α 与生成吞吐。
+
+AI 填空题在模拟时改用配置里的候选文本，选项附加的 AI 填空改用默认填空文本，保证全程不发起网络请求。
+"""
+
+from __future__ import annotations
+
+import csv
+import dataclasses
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, IO, List, Mapping, Optional, Sequence, Tuple
+
+from software.app.config import DEFAULT_FILL_TEXT
+from software.core.engine.provider_common import ensure_joint_psychometric_answer_plan, provider_run_context
+from software.core.persona.context import record_answer
+from software.core.psychometrics import build_psychometric_blueprint
+from software.core.psychometrics.utils import cronbach_alpha
+from software.core.questions.distribution import build_distribution_stat_key
+from software.core.questions.utils import OPTION_FILL_AI_TOKEN, normalize_droplist_probs
+from software.core.task import ExecutionConfig, ExecutionState
+from software.core.task.distribution_state import parse_distribution_stat_key
+from software.providers.answering import AnswerAction
+from software.providers.answering.recording import record_answer_action
+from software.providers.common import SURVEY_PROVIDER_QQ, SURVEY_PROVIDER_WJX, normalize_survey_provider
+from software.providers.contracts import SurveyQuestionMeta
+from software.providers.hooks import HookTarget, load_hook
+from software.providers.http_logic import HttpLogicPlan, build_http_logic_plan
+
+__all__ = [
+    "SIMULATION_OUTPUT_FORMATS",
+    "SimulationQuestionStat",
+    "SimulationReport",
+    "simulate_answer_sheets",
+]
+
+SIMULATION_OUTPUT_FORMATS = ("jsonl", "csv")
+SIMULATION_THREAD_NAME = "Simulate"
+
+_ANSWER_BUILDERS: Dict[str, HookTarget] = {
+    SURVEY_PROVIDER_WJX: ("wjx.provider.answering_builders", "build_answer_action"),
+    SURVEY_PROVIDER_QQ: ("tencent.provider.answering_builders", "build_answer_action"),
+}
+# 与正式运行中各题型读取的概率配置保持一致
+_TARGET_PROB_FIELDS = {
+    "single": "single_prob",
+    "dropdown": "droplist_prob",
+    "scale": "scale_prob",
+    "score": "scale_prob",
+}
+
+
+@dataclass(frozen=True)
+class SimulationQuestionStat:
+    """单道题（矩阵题按行）的实际配比与目标配比。"""
+
+    stat_key: str
+    question_num: int
+    row_index: Optional[int]
+    total: int
+    achieved_ratios: Tuple[float, ...]
+    target_ratios: Tuple[float, ...] = ()
+
+    @property
+    def max_abs_gap(self) -> float:
+        if not self.target_ratios or len(self.target_ratios) != len(self.achieved_ratios):
+            return 0.0
+        return max(
+            (abs(achieved - target) for achieved, target in zip(self.achieved_ratios, self.target_ratios)),
+            default=0.0,
+        )
+
+
+@dataclass(frozen=True)
+class SimulationReport:
+    """一次离线模拟的汇总结果。"""
+
+    provider: str
+    requested: int
+    generated: int
+    failed: int
+    elapsed_seconds: float
+    question_stats: Tuple[SimulationQuestionStat, ...] = ()
+    dimension_alpha: Mapping[str, float] = field(default_factory=dict)
+    output_path: str = ""
+
+    @property
+    def samples_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.generated / self.elapsed_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "requested": self.requested,
+            "generated": self.generated,
+            "failed": self.failed,
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+            "samples_per_second": round(self.samples_per_second, 3),
+            "output_path": self.output_path,
+            "dimension_alpha": {name: round(value, 4) for name, value in self.dimension_alpha.items()},
+            "questions": [
+                {
+                    "stat_key": stat.stat_key,
+                    "question_num": stat.question_num,
+                    "row_index": stat.row_index,
+                    "total": stat.total,
+                    "achieved": [round(value, 4) for value in stat.achieved_ratios],
+                    "target": [round(value, 4) for value in stat.target_ratios],
+                    "max_abs_gap": round(stat.max_abs_gap, 4),
+                }
+                for stat in self.question_stats
+            ],
+        }
+
+
+def _offline_option_fill_texts(
+    fill_texts: Sequence[Optional[Sequence[Optional[str]]]],
+) -> List[Optional[List[Optional[str]]]]:
+    """选项附加填空里的 AI 占位符换成默认填空文本，其余原样保留。"""
+    return [
+        None
+        if entries is None
+        else [
+            DEFAULT_FILL_TEXT if str(text or "").strip() == OPTION_FILL_AI_TOKEN else text
+            for text in entries
+        ]
+        for entries in fill_texts
+    ]
+
+
+def _simulation_config(config: ExecutionConfig, sample_count: int) -> ExecutionConfig:
+    """复制一份只用于模拟的配置：样本数对齐、联合计划重建、AI 填空关闭、不提交。"""
+    simulated = dataclasses.replace(
+        config,
+        target_num=sample_count,
+        joint_psychometric_answer_plan=None,
+        text_ai_flags=[False] * len(config.text_ai_flags or []),
+        single_option_fill_texts=_offline_option_fill_texts(config.single_option_fill_texts or []),
+        droplist_option_fill_texts=_offline_option_fill_texts(config.droplist_option_fill_texts or []),
+        multiple_option_fill_texts=_offline_option_fill_texts(config.multiple_option_fill_texts or []),
+        ai_answer_pool_size=0,
+    )
+    setattr(simulated, "submit_enabled", False)
+    return simulated
+
+
+def _simulation_questions(config: ExecutionConfig, provider: str) -> List[SurveyQuestionMeta]:
+    questions = sorted(
+        list((config.questions_metadata or {}).values()),
+        key=lambda item: (int(getattr(item, "page", 1) or 1), int(getattr(item, "num", 0) or 0)),
+    )
+    if provider == SURVEY_PROVIDER_QQ:
+        # 腾讯问卷只提交带平台题目 ID 的题
+        questions = [
+            question
+            for question in questions
+            if not bool(getattr(question, "is_description", False))
+            and str(getattr(question, "provider_question_id", "") or "").strip()
+        ]
+    for question in questions:
+        if bool(getattr(question, "unsupported", False)):
+            raise RuntimeError(f"第{question.num}题暂不支持：{question.unsupported_reason or question.type_code}")
+    return questions
+
+
+async def _build_sheet(
+    provider: str,
+    questions: Sequence[SurveyQuestionMeta],
+    state: ExecutionState,
+    *,
+    psycho_plan: Any,
+) -> HttpLogicPlan:
+    build_answer_action = load_hook(_ANSWER_BUILDERS[provider])
+
+    async def _build_action(question: SurveyQuestionMeta) -> Optional[AnswerAction]:
+        if provider == SURVEY_PROVIDER_WJX:
+            return await build_answer_action(
+                None,
+                question,
+                state,
+                psycho_plan=psycho_plan,
+                thread_name=SIMULATION_THREAD_NAME,
+            )
+        return await build_answer_action(None, question, state, psycho_plan=psycho_plan)
+
+    return await build_http_logic_plan(questions, build_action=_build_action)
+
+
+def _record_pending_choice(
+    ctx: ExecutionState,
+    question_index: Optional[int],
+    option_index: int,
+    option_count: int,
+    *,
+    row_index: Optional[int] = None,
+) -> None:
+    """暂存比例统计；显式挂在模拟槽位名下，与随后按槽位核销的口径保持一致。"""
+    if question_index is None or option_count <= 0 or not 0 <= option_index < option_count:
+        return
+    ctx.append_pending_distribution_choice(
+        build_distribution_stat_key(question_index, row_index),
+        option_index,
+        option_count,
+        thread_name=SIMULATION_THREAD_NAME,
+    )
+
+
+def _format_action_cell(action: AnswerAction) -> str:
+    """CSV 单元格：选项号从 1 开始，口径与问卷星 submitdata 一致。"""
+    if action.kind in {"choice", "select", "order"}:
+        return "|".join(str(int(index) + 1) for index in action.selected_indices)
+    if action.kind == "text":
+        return "^".join(str(item or "").strip() for item in action.text_values)
+    if action.kind == "matrix":
+        return ",".join(f"{row_index + 1}!{int(item) + 1}" for row_index, item in enumerate(action.matrix_indices))
+    if action.kind == "slider":
+        return "" if action.slider_value is None else str(action.slider_value)
+    return ""
+
+
+def _action_payload(action: AnswerAction) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"kind": action.kind}
+    if action.selected_indices:
+        payload["selected"] = [int(index) for index in action.selected_indices]
+    if action.text_values:
+        payload["texts"] = [str(item or "") for item in action.text_values]
+    if action.matrix_indices:
+        payload["matrix"] = [int(index) for index in action.matrix_indices]
+    if action.slider_value is not None:
+        payload["slider"] = action.slider_value
+    if action.option_fill_texts:
+        payload["fills"] = {str(int(index)): str(text or "") for index, text in action.option_fill_texts}
+    return payload
+
+
+class _SheetWriter:
+    """逐份写出答卷，每份写完立即 flush，长时间模拟也能边跑边看。"""
+
+    def __init__(self, stream: Optional[IO[str]], output_format: str, questions: Sequence[SurveyQuestionMeta]) -> None:
+        self._stream = stream
+        self._format = output_format
+        self._question_nums = [int(question.num or 0) for question in questions if int(question.num or 0) > 0]
+        self._csv_writer: Any = None
+        if stream is not None and output_format == "csv":
+            self._csv_writer = csv.writer(stream)
+            self._csv_writer.writerow(["sample", "joint_sample", *[f"Q{num}" for num in self._question_nums]])
+
+    def write(self, sample_number: int, joint_sample: Optional[int], plan: HttpLogicPlan) -> None:
+        if self._stream is None:
+            return
+        action_by_num = {int(action.question_num or 0): action for action in plan.actions}
+        if self._csv_writer is not None:
+            cells = [
+                _format_action_cell(action_by_num[num]) if num in action_by_num else ""
+                for num in self._question_nums
+            ]
+            self._csv_writer.writerow([sample_number, "" if joint_sample is None else joint_sample + 1, *cells])
+        else:
+            record = {
+                "sample": sample_number,
+                "joint_sample": None if joint_sample is None else joint_sample + 1,
+                "answers": {str(num): _action_payload(action) for num, action in sorted(action_by_num.items())},
+                "skipped": [int(num) for num in plan.skipped_question_nums],
+            }
+            self._stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._stream.flush()
+
+
+def _resolve_target_ratios(
+    config: ExecutionConfig,
+    question_num: int,
+    row_index: Optional[int],
+    option_count: int,
+) -> Tuple[float, ...]:
+    config_entry = config.question_config_index_map.get(question_num)
+    if not config_entry or option_count <= 0:
+        return ()
+    question_type, start_index = config_entry
+    if question_type == "matrix":
+        probabilities = list(config.matrix_prob or [])
+        index = int(start_index) + int(row_index or 0)
+    else:
+        field_name = _TARGET_PROB_FIELDS.get(str(question_type))
+        if field_name is None:
+            return ()
+        probabilities = list(getattr(config, field_name, []) or [])
+        index = int(start_index)
+    raw = probabilities[index] if 0 <= index < len(probabilities) else -1
+    return tuple(float(value) for value in normalize_droplist_probs(raw, option_count))
+
+
+def _collect_question_stats(state: ExecutionState) -> Tuple[SimulationQuestionStat, ...]:
+    buckets = state.distribution_runtime_stats
+    stats: List[SimulationQuestionStat] = []
+    for stat_key, bucket in buckets.items():
+        question_num, row_index = parse_distribution_stat_key(stat_key) or (0, None)
+        counts = [max(0, int(value or 0)) for value in list(bucket.get("counts") or [])]
+        total = max(0, int(bucket.get("total") or 0))
+        achieved = tuple(count / total if total > 0 else 0.0 for count in counts)
+        stats.append(
+            SimulationQuestionStat(
+                stat_key=stat_key,
+                question_num=question_num,
+                row_index=row_index,
+                total=total,
+                achieved_ratios=achieved,
+                target_ratios=_resolve_target_ratios(state.config, question_num, row_index, len(counts)),
+            )
+        )
+    stats.sort(key=lambda item: (item.question_num, -1 if item.row_index is None else item.row_index))
+    return tuple(stats)
+
+
+def _item_score(item: Any, action: Optional[AnswerAction]) -> Optional[float]:
+    if action is None:
+        return None
+    if item.row_index is not None:
+        indices = list(action.matrix_indices or ())
+        if int(item.row_index) >= len(indices):
+            return None
+        choice_index = int(indices[int(item.row_index)])
+    elif action.selected_indices:
+        choice_index = int(action.selected_indices[0])
+    else:
+        return None
+    score_map = item.score_by_choice_index
+    if isinstance(score_map, list) and 0 <= choice_index < len(score_map):
+        return float(score_map[choice_index])
+    return float(choice_index)
+
+
+def _collect_dimension_scores(
+    blueprint: Mapping[str, Sequence[Any]],
+    plan: HttpLogicPlan,
+    rows_by_dimension: Dict[str, List[List[float]]],
+) -> None:
+    action_by_num = {int(action.question_num or 0): action for action in plan.actions}
+    for dimension, items in blueprint.items():
+        row: List[float] = []
+        for item in items:
+            score = _item_score(item, action_by_num.get(int(item.question_index)))
+            if score is None:
+                # 跳题导致维度不完整的答卷不参与 α 计算
+                break
+            row.append(score)
+        else:
+            if len(row) >= 2:
+                rows_by_dimension.setdefault(dimension, []).append(row)
+
+
+async def simulate_answer_sheets(
+    config: ExecutionConfig,
+    *,
+    sample_count: int,
+    output: Optional[IO[str]] = None,
+    output_format: str = "jsonl",
+    output_path: str = "",
+    stop_signal: Any = None,
+) -> SimulationReport:
+    """在进程内生成 ``sample_count`` 份完整答卷，不访问网络。
+
+    ``output`` 为已打开的文本流；只传 ``output_path`` 时由本函数负责打开和关闭文件。
+    """
+    total = max(0, int(sample_count or 0))
+    normalized_format = str(output_format or "jsonl").strip().lower()
+    if normalized_format not in SIMULATION_OUTPUT_FORMATS:
+        raise ValueError(f"不支持的模拟输出格式：{output_format}")
+    provider = normalize_survey_provider(getattr(config, "survey_provider", None), default=SURVEY_PROVIDER_WJX)
+    if provider not in _ANSWER_BUILDERS:
+        raise RuntimeError(f"离线模拟暂不支持该问卷平台：{provider}")
+
+    simulated_config = _simulation_config(config, total)
+    state = ExecutionState(config=simulated_config)
+    state.compile_distribution_counters()
+    questions = _simulation_questions(simulated_config, provider)
+    joint_plan = ensure_joint_psychometric_answer_plan(simulated_config)
+    joint_sample_count = int(getattr(joint_plan, "sample_count", total) or total) if joint_plan is not None else 0
+    blueprint = build_psychometric_blueprint(simulated_config)
+    rows_by_dimension: Dict[str, List[List[float]]] = {}
+
+    owned_stream: Optional[IO[str]] = None
+    stream = output
+    if stream is None and output_path:
+        owned_stream = open(output_path, "w", encoding="utf-8", newline="")
+        stream = owned_stream
+
+    generated = 0
+    failed = 0
+    started = time.perf_counter()
+    try:
+        writer = _SheetWriter(stream, normalized_format, questions)
+        for _ in range(total):
+            if stop_signal is not None and stop_signal.is_set():
+                break
+            state.reset_pending_distribution(SIMULATION_THREAD_NAME)
+            reserved: Optional[int] = None
+            if joint_sample_count > 0:
+                reserved = state.reserve_joint_sample(joint_sample_count, thread_name=SIMULATION_THREAD_NAME)
+            try:
+                with provider_run_context(
+                    simulated_config,
+                    state=state,
+                    thread_name=SIMULATION_THREAD_NAME,
+                ) as psycho_plan:
+                    plan = await _build_sheet(provider, questions, state, psycho_plan=psycho_plan)
+                    for action in plan.actions:
+                        record_answer_action(
+                            state,
+                            action,
+                            record_answer_fn=record_answer,
+                            record_pending_distribution_choice_fn=_record_pending_choice,
+                            default_fill_text="",
+                        )
+            except Exception:
+                failed += 1
+                state.release_joint_sample(SIMULATION_THREAD_NAME)
+                logging.warning("离线模拟第%s份答卷生成失败", generated + failed, exc_info=True)
+                continue
+            state.commit_joint_sample(SIMULATION_THREAD_NAME)
+            state.commit_pending_distribution(SIMULATION_THREAD_NAME)
+            generated += 1
+            state.cur_num = generated
+            writer.write(generated, reserved, plan)
+            _collect_dimension_scores(blueprint, plan, rows_by_dimension)
+    finally:
+        if owned_stream is not None:
+            owned_stream.close()
+    elapsed = time.perf_counter() - started
+
+    report = SimulationReport(
+        provider=provider,
+        requested=total,
+        generated=generated,
+        failed=failed,
+        elapsed_seconds=elapsed,
+        question_stats=_collect_question_stats(state),
+        dimension_alpha={
+            dimension: cronbach_alpha(rows)
+            for dimension, rows in sorted(rows_by_dimension.items())
+            if len(rows) >= 2
+        },
+        output_path=str(output_path or ""),
+    )
+    logging.info(
+        "离线模拟完成：生成%s/%s份，失败%s份，耗时%.2fs，吞吐%.1f份/s",
+        generated,
+        total,
+        failed,
+        elapsed,
+        report.samples_per_second,
+    )
+    return report
@@ -6,11 +6,13 @@
 3. 为 AI 填空题提供完整的上下文信息
 """
 import logging
-import threading
+import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
 
-from software.core.persona.generator import get_current_persona
+from software.core.persona.generator import Persona, get_current_persona
+from software.core.task.answer_context import current_answer_context
 
 
 # ── 已答题目记录 ────────────────────────────────────────────
@@ -26,17 +28,15 @@ class AnsweredQuestion:
     row_answers: Dict[int, List[int]] = field(default_factory=dict)  # 矩阵题行级答案：行索引(0-based) -> 选项索引列表
 
 
-# ── 线程局部上下文 ──────────────────────────────────────────
-
-_thread_local = threading.local()
+# ── 作答上下文 ──────────────────────────────────────────────
 
 # 权重加成倍数：匹配画像的选项权重乘以此值
 PERSONA_BOOST_FACTOR = 3.0
 
 
 def reset_context() -> None:
-    """清空当前线程的作答上下文（每份问卷开始时调用）。"""
-    _thread_local.answered = {}
+    """清空当前作答上下文的已答记录（每份问卷开始时调用）。"""
+    current_answer_context().answered = {}
 
 
 def record_answer(
@@ -48,10 +48,7 @@ def record_answer(
     row_index: Optional[int] = None,
 ) -> None:
     """记录一道题的作答结果。row_index 非 None 时表示矩阵题的行级记录。"""
-    ctx = getattr(_thread_local, "answered", None)
-    if ctx is None:
-        _thread_local.answered = {}
-        ctx = _thread_local.answered
+    ctx = current_answer_context().answered
     if row_index is not None:
         # 矩阵题行级记录：更新或新建该题的记录
         if question_num not in ctx:
@@ -71,12 +68,67 @@ def record_answer(
 
 
 def get_answered() -> Dict[int, AnsweredQuestion]:
-    """获取当前线程的全部已答题目。"""
-    return getattr(_thread_local, "answered", {})
+    """获取当前作答上下文的全部已答题目。"""
+    return current_answer_context().answered
 
 
 # ── 画像约束：给选项加权 ───────────────────────────────────
 
+class PersonaKeywordMatcher:
+    """把一份画像的全部关键词编译成一条正则，并按选项文本缓存加成掩码。
+
+    同一份问卷里每道题的选项文本固定，掩码缓存命中后既不用再扫描，也不再重复打日志。
+    """
+
+    _MASK_CACHE_LIMIT = 4096
+
+    def __init__(self, keywords: Tuple[str, ...]) -> None:
+        self.keywords = keywords
+        # 长关键词优先，保证日志里报告的是最具体的那个命中词
+        ordered = sorted(set(keywords), key=len, reverse=True)
+        self._pattern: Optional[Pattern[str]] = (
+            re.compile("|".join(re.escape(keyword) for keyword in ordered)) if ordered else None
+        )
+        self._mask_cache: Dict[Tuple[str, ...], Tuple[Optional[str], ...]] = {}
+
+    def match_mask(self, option_texts: Sequence[str]) -> Tuple[Tuple[Optional[str], ...], bool]:
+        """返回 (每个选项命中的关键词或 None, 是否命中缓存)。"""
+        key = tuple(str(text or "") for text in option_texts)
+        cached = self._mask_cache.get(key)
+        if cached is not None:
+            return cached, True
+        pattern = self._pattern
+        mask: List[Optional[str]] = []
+        for text in key:
+            stripped = text.strip()
+            found = pattern.search(stripped) if (pattern is not None and stripped) else None
+            mask.append(found.group(0) if found is not None else None)
+        result = tuple(mask)
+        if len(self._mask_cache) >= self._MASK_CACHE_LIMIT:
+            self._mask_cache.clear()
+        self._mask_cache[key] = result
+        return result, False
+
+
+@lru_cache(maxsize=64)
+def _compile_persona_matcher(keywords: Tuple[str, ...]) -> PersonaKeywordMatcher:
+    # 画像属性组合有限，相同关键词集合的画像共用同一个匹配器和掩码缓存
+    return PersonaKeywordMatcher(keywords)
+
+
+def _resolve_persona_matcher(persona: Persona) -> Optional[PersonaKeywordMatcher]:
+    answer_context = current_answer_context()
+    cached = answer_context.persona_matcher
+    if cached is not None and cached[0] is persona:
+        return cached[1]
+    keywords: List[str] = []
+    for values in (persona.to_keyword_map() or {}).values():
+        keywords.extend(str(value) for value in values if value)
+    matcher = _compile_persona_matcher(tuple(keywords)) if keywords else None
+    answer_context.persona_matcher = (persona, matcher)
+    return matcher
+
+
 def apply_persona_boost(
     option_texts: List[str],
     base_weights: List[float],
@@ -86,32 +138,27 @@ def apply_persona_boost(
     if persona is None:
         return list(base_weights)
 
-    keyword_map = persona.to_keyword_map()
-    if not keyword_map:
-        return list(base_weights)
-
-    # 把所有关键词扁平化
-    all_keywords: List[str] = []
-    for keywords in keyword_map.values():
-        all_keywords.extend(keywords)
-
-    if not all_keywords:
+    matcher = _resolve_persona_matcher(persona)
+    if matcher is None:
         return list(base_weights)
 
+    mask, cache_hit = matcher.match_mask(option_texts)
     boosted = list(base_weights)
-    for i, text in enumerate(option_texts):
-        if not text or i >= len(boosted):
+    matched: List[str] = []
+    for i, keyword in enumerate(mask):
+        if keyword is None or i >= len(boosted):
             continue
-        text_lower = text.strip()
-        for keyword in all_keywords:
-            if keyword in text_lower:
-                boosted[i] *= PERSONA_BOOST_FACTOR
-                logging.info(
-                    "画像约束：选项[%d]「%s」匹配关键词「%s」，权重 x%.1f",
-                    i, text[:20], keyword, PERSONA_BOOST_FACTOR,
-                )
-                break  # 一个选项只加成一次
+        boosted[i] *= PERSONA_BOOST_FACTOR  # 一个选项只加成一次
+        if not cache_hit:
+            matched.append(f"[{i}]「{option_texts[i][:20]}」←{keyword}")
+    if matched:
+        logging.info(
+            "画像约束：%d 个选项匹配关键词，权重 x%.1f：%s",
+            len(matched), PERSONA_BOOST_FACTOR, "；".join(matched),
+        )
     return boosted
+
+
 # ── AI 上下文构建 ───────────────────────────────────────────
 
 def build_ai_context_prompt() -> str:
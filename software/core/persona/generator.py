@@ -3,11 +3,12 @@
 画像在每份问卷开始时随机生成，各属性之间有逻辑约束，
 确保不会出现"18岁已退休"或"未婚有三个孩子"这类矛盾。
 """
-import random
-import threading
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+from software.core.task.answer_context import current_answer_context
+from software.core.task.random_context import run_random as random
+
 
 @dataclass
 class Persona:
@@ -218,21 +219,19 @@ def generate_persona() -> Persona:
     return p
 
 
-# ── 线程局部画像管理 ────────────────────────────────────────
-
-_thread_local = threading.local()
+# ── 作答上下文内的画像管理 ──────────────────────────────────
 
 
 def set_current_persona(persona: Persona) -> None:
-    """为当前线程设置画像（每份问卷开始时调用）。"""
-    _thread_local.persona = persona
+    """为当前作答上下文设置画像（每份问卷开始时调用）。"""
+    current_answer_context().persona = persona
 
 
 def get_current_persona() -> Optional[Persona]:
-    """获取当前线程的画像。"""
-    return getattr(_thread_local, "persona", None)
+    """获取当前作答上下文的画像。"""
+    return current_answer_context().persona
 
 
 def reset_persona() -> None:
-    """清除当前线程的画像（问卷结束后调用）。"""
-    _thread_local.persona = None
+    """清除当前作答上下文的画像（问卷结束后调用）。"""
+    current_answer_context().persona = None
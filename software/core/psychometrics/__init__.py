@@ -26,11 +26,16 @@ from software.core.psychometrics.orientation import (
 )
 from software.core.psychometrics.utils import (
     randn,
+    randn_array,
+    randn_batch,
     normal_inv,
+    category_thresholds,
     z_to_category,
+    z_to_categories,
     variance,
     correlation,
     cronbach_alpha,
+    cronbach_alpha_items,
     infer_reversed_keys,
 )
 
@@ -54,11 +59,16 @@ __all__ = [
     "infer_dimension_orientation",
     "infer_item_orientation",
     "randn",
+    "randn_array",
+    "randn_batch",
     "normal_inv",
+    "category_thresholds",
     "z_to_category",
+    "z_to_categories",
     "variance",
     "correlation",
     "cronbach_alpha",
+    "cronbach_alpha_items",
     "infer_reversed_keys",
 ]
 
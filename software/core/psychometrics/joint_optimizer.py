@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import math
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 from software.core.psychometrics.orientation import (
     build_bias_target_probabilities,
@@ -17,8 +19,9 @@ from software.core.psychometrics.psychometric import (
     compute_sigma_e_from_alpha,
     normalize_target_alpha,
 )
-from software.core.psychometrics.utils import cronbach_alpha, randn
+from software.core.psychometrics.utils import cronbach_alpha, cronbach_alpha_items, np, randn, randn_array
 from software.core.questions.utils import normalize_droplist_probs
+from software.core.task.random_context import run_random as random
 from software.providers.contracts import ensure_survey_question_meta
 
 if TYPE_CHECKING:
@@ -406,6 +409,10 @@ def _build_noise_matrix(item_count: int, sample_count: int) -> List[List[float]]
     return [[randn() for _ in range(sample_count)] for _ in range(item_count)]
 
 
+def _array_backend_enabled() -> bool:
+    return np is not None
+
+
 def _alpha_fit_key(alpha: float, target_alpha: float) -> tuple[float, int]:
     if alpha != alpha:
         return (float("inf"), 1)
@@ -475,6 +482,165 @@ def _evaluate_dimension_plan(
     return cronbach_alpha(response_rows), choices_by_item
 
 
+class _DimensionArrayPlanner:
+    """NumPy 版维度求解：与 _evaluate_dimension_plan 同口径，只是按“题目 × 样本”矩阵整批计算。
+
+    与 sigma 无关的部分（基准分、微扰、配额展开、分值→选项映射）在构造时算好，
+    每个 sigma 候选只做一次矩阵加法、一次按行稳定排序和一次向量化 alpha。
+    """
+
+    def __init__(
+        self,
+        items: List[PsychometricBlueprintItem],
+        sample_count: int,
+        reversed_keys: set[str],
+    ) -> None:
+        item_count = len(items)
+        self.items = items
+        # 与逐个 randn() 的消耗顺序一致：theta → 标准噪声（逐题）→ 微扰噪声（逐题）
+        theta = randn_array(sample_count)
+        self.standard_noise = randn_array(item_count * sample_count).reshape(item_count, sample_count)
+        micro_jitter_noise = randn_array(item_count * sample_count).reshape(item_count, sample_count)
+
+        reversed_mask = np.array([item.choice_key in reversed_keys for item in items], dtype=bool)
+        signs = np.where(reversed_mask, -1.0, 1.0)[:, None]
+        self.base_scores = signs * theta[None, :]
+        self.jitter = _MICRO_JITTER_SIGMA * micro_jitter_noise
+
+        max_option_count = max(int(item.option_count) for item in items)
+        self.ordered_scores = np.empty((item_count, sample_count), dtype=np.int64)
+        self.choice_table = np.zeros((item_count, max_option_count), dtype=np.int64)
+        for item_index, item in enumerate(items):
+            quotas = np.clip(np.asarray(_build_integer_quotas(item.target_probabilities, sample_count)), 0, None)
+            ordered = np.repeat(np.arange(len(quotas), dtype=np.int64), quotas)
+            if ordered.size < sample_count:
+                ordered = np.concatenate([
+                    ordered,
+                    np.full(sample_count - ordered.size, max(0, len(quotas) - 1), dtype=np.int64),
+                ])
+            self.ordered_scores[item_index] = ordered[:sample_count]
+            for score_index in range(int(item.option_count)):
+                self.choice_table[item_index, score_index] = item.choice_index_for_score(score_index)
+
+        self.reversed_mask = reversed_mask[:, None]
+        self.option_counts = np.array([float(item.option_count) for item in items])[:, None]
+        self.row_indexes = np.arange(item_count)[:, None]
+
+    def evaluate(self, sigma_e: float) -> tuple[float, Any]:
+        scores = self.base_scores + (sigma_e * self.standard_noise) + self.jitter
+        ranked_samples = np.argsort(scores, axis=1, kind="stable")
+        assigned_scores = np.empty_like(self.ordered_scores)
+        np.put_along_axis(assigned_scores, ranked_samples, self.ordered_scores, axis=1)
+        responses = np.where(
+            self.reversed_mask,
+            self.option_counts - assigned_scores,
+            assigned_scores + 1.0,
+        )
+        return cronbach_alpha_items(responses), assigned_scores
+
+    def choices_by_item(self, plan: Any) -> Dict[str, List[int]]:
+        """``plan`` 是 evaluate 返回的分数矩阵，与纯 Python 路径的 finalize 同签名。"""
+        choices = self.choice_table[self.row_indexes, plan]
+        return {item.choice_key: choices[item_index].tolist() for item_index, item in enumerate(self.items)}
+
+
+def _search_dimension_choices(
+    items: List[PsychometricBlueprintItem],
+    sample_count: int,
+    target_alpha: float,
+    reversed_keys: set[str],
+) -> tuple[float, Dict[str, List[int]]]:
+    """对单个维度搜索 sigma，返回最贴近目标 α 的 (α, 每题作答序列)。"""
+    item_count = len(items)
+    if _array_backend_enabled():
+        planner = _DimensionArrayPlanner(items, sample_count, reversed_keys)
+        evaluate = planner.evaluate
+        finalize = planner.choices_by_item
+    else:
+        theta = [randn() for _ in range(sample_count)]
+        standard_noise = _build_noise_matrix(item_count, sample_count)
+        micro_jitter_noise = _build_noise_matrix(item_count, sample_count)
+
+        def evaluate(sigma_e: float) -> tuple[float, Any]:
+            return _evaluate_dimension_plan(
+                items,
+                sample_count,
+                sigma_e,
+                theta,
+                reversed_keys,
+                standard_noise,
+                micro_jitter_noise,
+            )
+
+        def finalize(plan: Any) -> Dict[str, List[int]]:
+            return plan
+
+    evaluated_candidates: List[tuple[float, float, Any]] = []
+    for sigma_e in _build_sigma_candidates(target_alpha, item_count):
+        current_alpha, current_choices = evaluate(sigma_e)
+        evaluated_candidates.append((sigma_e, float(current_alpha), current_choices))
+
+    for sigma_e in _build_refined_sigma_candidates(
+        [(sigma_value, alpha_value) for sigma_value, alpha_value, _ in evaluated_candidates],
+        target_alpha,
+    ):
+        current_alpha, current_choices = evaluate(sigma_e)
+        evaluated_candidates.append((sigma_e, float(current_alpha), current_choices))
+
+    _best_sigma, best_alpha, best_choices = min(
+        evaluated_candidates,
+        key=lambda item: _alpha_fit_key(item[1], target_alpha),
+    )
+    return best_alpha, finalize(best_choices)
+
+
+def _resolve_parallel_workers(config: "ExecutionConfig") -> int:
+    try:
+        return max(0, int(getattr(config, "psycho_parallel_workers", 0) or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _derive_dimension_seed(base_seed: int, dimension: str) -> int:
+    """由本轮基准种子和维度名派生稳定种子；不用 hash()，避免受进程级哈希随机化影响。"""
+    digest = hashlib.blake2b(f"{int(base_seed)}:{dimension}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _search_dimension_choices_seeded(
+    seed: int,
+    items: List[PsychometricBlueprintItem],
+    sample_count: int,
+    target_alpha: float,
+    reversed_keys: set[str],
+) -> tuple[float, Dict[str, List[int]]]:
+    """用独立种子求解单个维度；进程池 worker 与进程内串行共用，保证两种模式结果一致。"""
+    saved_state = random.getstate()
+    random.seed(seed)
+    try:
+        return _search_dimension_choices(items, sample_count, target_alpha, reversed_keys)
+    finally:
+        random.setstate(saved_state)
+
+
+_DimensionTask = Tuple[int, List[PsychometricBlueprintItem], int, float, set]
+
+
+def _run_dimension_tasks(
+    tasks: Sequence[_DimensionTask],
+    workers: int,
+) -> List[tuple[float, Dict[str, List[int]]]]:
+    """按提交顺序返回各维度结果；进程池不可用时退回进程内逐个求解。"""
+    if workers > 1 and len(tasks) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+                futures = [executor.submit(_search_dimension_choices_seeded, *task) for task in tasks]
+                return [future.result() for future in futures]
+        except Exception as exc:
+            logger.warning("联合信效度并行求解失败，改为串行：%s", exc)
+    return [_search_dimension_choices_seeded(*task) for task in tasks]
+
+
 def build_joint_psychometric_answer_plan(config: "ExecutionConfig") -> Optional[JointPsychometricAnswerPlan]:
     sample_count = max(0, int(getattr(config, "target_num", 0) or 0))
     if sample_count <= 0:
@@ -495,63 +661,15 @@ def build_joint_psychometric_answer_plan(config: "ExecutionConfig") -> Optional[
     runtime_items: List[PsychometricItem] = []
     has_locked_items = False
 
-    for dimension, items in grouped_items.items():
-        normalized_dimension = str(dimension or "").strip()
-        if not normalized_dimension:
-            continue
-        item_count = len(items or [])
-        if item_count < 2:
-            diagnostics_by_dimension[normalized_dimension] = JointPsychometricDimensionDiagnostic(
-                dimension=normalized_dimension,
-                item_count=item_count,
-                sample_count=sample_count,
-                target_alpha=target_alpha,
-                actual_alpha=0.0,
-                degraded_for_ratio=False,
-                skipped=True,
-                reason="维度题数不足 2，已回退常规信效度逻辑",
-            )
-            logger.info("维度[%s]题数不足 2，联合优化已跳过", normalized_dimension)
-            continue
-
-        theta = [randn() for _ in range(sample_count)]
-        standard_noise = _build_noise_matrix(item_count, sample_count)
-        micro_jitter_noise = _build_noise_matrix(item_count, sample_count)
-        dimension_orientation = infer_dimension_orientation(items)
-        reversed_keys = set(dimension_orientation.reversed_keys)
-        evaluated_candidates: List[tuple[float, float, Dict[str, List[int]]]] = []
-        for sigma_e in _build_sigma_candidates(target_alpha, item_count):
-            current_alpha, current_choices = _evaluate_dimension_plan(
-                items,
-                sample_count,
-                sigma_e,
-                theta,
-                reversed_keys,
-                standard_noise,
-                micro_jitter_noise,
-            )
-            evaluated_candidates.append((sigma_e, current_alpha, current_choices))
-
-        for sigma_e in _build_refined_sigma_candidates(
-            [(sigma_value, alpha_value) for sigma_value, alpha_value, _ in evaluated_candidates],
-            target_alpha,
-        ):
-            current_alpha, current_choices = _evaluate_dimension_plan(
-                items,
-                sample_count,
-                sigma_e,
-                theta,
-                reversed_keys,
-                standard_noise,
-                micro_jitter_noise,
-            )
-            evaluated_candidates.append((sigma_e, current_alpha, current_choices))
-
-        _best_sigma, best_alpha, best_choices_by_item = min(
-            evaluated_candidates,
-            key=lambda item: _alpha_fit_key(item[1], target_alpha),
-        )
-
+    def _merge_dimension_result(
+        normalized_dimension: str,
+        items: List[PsychometricBlueprintItem],
+        dimension_orientation: Any,
+        reversed_keys: set[str],
+        best_alpha: float,
+        best_choices_by_item: Dict[str, List[int]],
+    ) -> None:
+        nonlocal has_locked_items
         actual_alpha = max(0.0, float(best_alpha))
         degraded_for_ratio = actual_alpha + 1e-6 < target_alpha
         reason = ""
@@ -559,7 +677,7 @@ def build_joint_psychometric_answer_plan(config: "ExecutionConfig") -> Optional[
             reason = "维度主方向不明确，未自动判反向题"
         diagnostics_by_dimension[normalized_dimension] = JointPsychometricDimensionDiagnostic(
             dimension=normalized_dimension,
-            item_count=item_count,
+            item_count=len(items),
             sample_count=sample_count,
             target_alpha=target_alpha,
             actual_alpha=actual_alpha,
@@ -601,6 +719,74 @@ def build_joint_psychometric_answer_plan(config: "ExecutionConfig") -> Optional[
             for sample_index, choice in enumerate(assigned):
                 answers_by_sample.setdefault(sample_index, {})[item.choice_key] = int(choice)
 
+    parallel_workers = _resolve_parallel_workers(config)
+    base_seed = random.getrandbits(64) if parallel_workers > 0 else 0
+    pending_dimensions: List[tuple[str, List[PsychometricBlueprintItem], Any, set[str]]] = []
+    dimension_order: List[str] = []
+    for dimension, items in grouped_items.items():
+        normalized_dimension = str(dimension or "").strip()
+        if not normalized_dimension:
+            continue
+        dimension_order.append(normalized_dimension)
+        item_count = len(items or [])
+        if item_count < 2:
+            diagnostics_by_dimension[normalized_dimension] = JointPsychometricDimensionDiagnostic(
+                dimension=normalized_dimension,
+                item_count=item_count,
+                sample_count=sample_count,
+                target_alpha=target_alpha,
+                actual_alpha=0.0,
+                degraded_for_ratio=False,
+                skipped=True,
+                reason="维度题数不足 2，已回退常规信效度逻辑",
+            )
+            logger.info("维度[%s]题数不足 2，联合优化已跳过", normalized_dimension)
+            continue
+
+        dimension_orientation = infer_dimension_orientation(items)
+        reversed_keys = set(dimension_orientation.reversed_keys)
+        if parallel_workers <= 0:
+            # 默认模式：沿用全局随机序列逐维求解，结果与旧版本一致
+            best_alpha, best_choices_by_item = _search_dimension_choices(
+                items,
+                sample_count,
+                target_alpha,
+                reversed_keys,
+            )
+            _merge_dimension_result(
+                normalized_dimension,
+                items,
+                dimension_orientation,
+                reversed_keys,
+                best_alpha,
+                best_choices_by_item,
+            )
+            continue
+        pending_dimensions.append((normalized_dimension, items, dimension_orientation, reversed_keys))
+
+    if pending_dimensions:
+        tasks: List[_DimensionTask] = [
+            (
+                _derive_dimension_seed(base_seed, normalized_dimension),
+                items,
+                sample_count,
+                target_alpha,
+                reversed_keys,
+            )
+            for normalized_dimension, items, _orientation, reversed_keys in pending_dimensions
+        ]
+        results = _run_dimension_tasks(tasks, parallel_workers)
+        for pending, (best_alpha, best_choices_by_item) in zip(pending_dimensions, results):
+            _merge_dimension_result(*pending, best_alpha, best_choices_by_item)
+        # 跳过的维度先写入了诊断，这里按问卷原始维度顺序重排
+        ordered_diagnostics = {
+            name: diagnostics_by_dimension[name]
+            for name in dimension_order
+            if name in diagnostics_by_dimension
+        }
+        diagnostics_by_dimension.clear()
+        diagnostics_by_dimension.update(ordered_diagnostics)
+
     if not has_locked_items:
         return None
 
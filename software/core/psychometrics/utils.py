@@ -2,10 +2,17 @@
 数学工具函数
 """
 import math
-import random
-from typing import Any, List
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from software.core.psychometrics.orientation import infer_dimension_orientation
+from software.core.task.random_context import run_random as random
 
 # 逆正态分布函数的系数
 _NORMAL_INV_COEFFS = {
@@ -52,6 +59,27 @@ def randn() -> float:
     return math.sqrt(-2.0 * math.log(u)) * math.cos(2.0 * math.pi * v)
 
 
+def randn_batch(count: int) -> List[float]:
+    """批量生成标准正态随机数，与逐个调用 randn() 消耗同一段随机序列。"""
+    return [randn() for _ in range(max(0, int(count or 0)))]
+
+
+def randn_array(count: int) -> Any:
+    """NumPy 版 randn_batch，随机序列与逐个调用 randn() 一致；未安装 NumPy 时抛 RuntimeError。"""
+    if np is None:
+        raise RuntimeError("NumPy is required for randn_array")
+    total = max(0, int(count or 0))
+    state = random.getstate()
+    uniforms = np.fromiter((random.random() for _ in range(total * 2)), dtype=np.float64, count=total * 2)
+    if total and not uniforms.all():
+        # 命中 0.0 时 randn() 会重抽，批量版无法对齐，回退逐个生成保证序列一致
+        random.setstate(state)
+        return np.asarray(randn_batch(total), dtype=np.float64)
+    u = uniforms[0::2]
+    v = uniforms[1::2]
+    return np.sqrt(-2.0 * np.log(u)) * np.cos(2.0 * math.pi * v)
+
+
 def normal_inv(p: float) -> float:
     """逆正态分布函数（分位数函数）"""
     if p <= 0:
@@ -87,16 +115,35 @@ def normal_inv(p: float) -> float:
     )
 
 
+@lru_cache(maxsize=None)
+def category_thresholds(option_count: int) -> Tuple[float, ...]:
+    """按选项数缓存的分类阈值表，依次为 normal_inv(1/m) … normal_inv((m-1)/m)。"""
+    m = max(2, min(50, option_count))
+    return tuple(normal_inv(j / m) for j in range(1, m))
+
+
 def z_to_category(z: float, option_count: int) -> int:
     """将连续的 Z 分数转换为离散的选项索引"""
-    m = max(2, min(50, option_count))
-    
-    for j in range(1, m):
-        threshold = normal_inv(j / m)
-        if z <= threshold:
-            return j - 1
-    
-    return m - 1
+    thresholds = category_thresholds(option_count)
+    if z != z:
+        # NaN 与任何阈值比较都不成立，旧逐个比较的写法会落到最后一档
+        return len(thresholds)
+    # 第一个满足 z <= 阈值 的位置即选项索引，与逐个比较结果一致
+    return bisect_left(thresholds, z)
+
+
+def z_to_categories(zs: Any, option_count: int) -> List[int]:
+    """批量版 z_to_category，逐元素结果与单个调用完全一致。"""
+    thresholds = category_thresholds(option_count)
+    if np is not None:
+        values = np.asarray(zs, dtype=np.float64).ravel()
+        # searchsorted 把 NaN 排在末尾，和单个调用落到最后一档的口径相同
+        return np.searchsorted(np.asarray(thresholds), values, side="left").tolist()
+    last_category = len(thresholds)
+    return [
+        last_category if z != z else bisect_left(thresholds, z)
+        for z in zs
+    ]
 
 
 def variance(values: List[float]) -> float:
@@ -146,6 +193,9 @@ def cronbach_alpha(matrix: List[List[float]]) -> float:
     k = len(matrix[0])  # 题目数
     if k < 2:
         return 0.0
+
+    if np is not None:
+        return cronbach_alpha_items(np.asarray(matrix, dtype=np.float64).T)
     
     # 计算总分的方差
     totals = [sum(row) for row in matrix]
@@ -154,10 +204,24 @@ def cronbach_alpha(matrix: List[List[float]]) -> float:
     if var_total == 0:
         return 0.0
     
-    # 计算各题目方差之和
-    sum_item_var = 0.0
-    for j in range(k):
-        item_values = [row[j] for row in matrix]
-        sum_item_var += variance(item_values)
+    # 计算各题目方差之和（按列转置一次，避免逐列重建列表）
+    sum_item_var = sum(variance(list(column)) for column in zip(*matrix))
     
     return (k / (k - 1)) * (1 - (sum_item_var / var_total))
+
+
+def cronbach_alpha_items(item_matrix: Any) -> float:
+    """按“题目 × 样本”的 NumPy 矩阵计算 Cronbach's Alpha，口径与 cronbach_alpha 相同。"""
+    if np is None:
+        raise RuntimeError("NumPy is required for cronbach_alpha_items")
+    values = np.asarray(item_matrix, dtype=np.float64)
+    if values.ndim != 2:
+        return 0.0
+    k, n = values.shape
+    if k < 2 or n < 2:
+        return 0.0
+    var_total = float(values.sum(axis=0).var(ddof=1))
+    if var_total == 0:
+        return 0.0
+    sum_item_var = float(values.var(axis=1, ddof=1).sum())
+    return (k / (k - 1)) * (1 - (sum_item_var / var_total))
@@ -2,14 +2,13 @@
 from __future__ import annotations
 
 import logging
-import threading
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from software.core.persona.context import get_answered
+from software.core.task.answer_context import current_answer_context
 from software.providers.contracts import SurveyQuestionMeta, ensure_survey_question_meta
 
-_thread_local = threading.local()
 _CONDITION_MODES = {"selected", "not_selected"}
 _ACTION_MODES = {"must_select", "must_not_select"}
 _SUPPORTED_RULE_TYPE_CODES = {"3", "4", "5", "6"}
@@ -182,11 +181,11 @@ def reset_consistency_context(
         normalized = _normalize_rule(item)
         if normalized:
             parsed_rules.append(normalized)
-    _thread_local.answer_rules = parsed_rules
+    current_answer_context().answer_rules = parsed_rules
 
 
 def _get_answer_rules() -> List[AnswerRule]:
-    rules = getattr(_thread_local, "answer_rules", None)
+    rules = current_answer_context().answer_rules
     if not rules:
         return []
     return list(rules)
@@ -1,18 +1,13 @@
 import math
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
 from software.core.questions.reliability_mode import get_reliability_profile
 from software.core.questions.utils import normalize_droplist_probs
+from software.core.task.distribution_state import build_distribution_stat_key
 
 _STANDARD_CORRECTION_PARAMS = (12, 4.2, 0.45, 2.2, 0.42)
 
 
-def build_distribution_stat_key(question_index: int, row_index: Optional[int] = None) -> str:
-    if row_index is None:
-        return f"q:{int(question_index)}"
-    return f"matrix:{int(question_index)}:{int(row_index)}"
-
-
 def _normalize_distribution_target(
     probabilities: Union[List[float], int, float, None],
     option_count: int,
@@ -24,13 +19,22 @@ def _normalize_distribution_target(
 
 def _resolve_runtime_counts(
     ctx: Optional[Any],
-    stat_key: str,
+    question_index: int,
+    row_index: Optional[int],
     option_count: int,
-) -> Tuple[int, List[int]]:
+) -> Tuple[int, Sequence[int]]:
+    reader = getattr(ctx, "read_distribution_counts", None)
+    if reader is not None:
+        # 运行态直接给出计数数组引用，不加锁、不复制
+        try:
+            total, counts = reader(question_index, row_index)
+        except Exception:
+            return (0, ())
+        return (max(0, int(total or 0)), counts)
     if ctx is None or not hasattr(ctx, "snapshot_distribution_stats"):
         return (0, [0] * max(0, int(option_count or 0)))
     try:
-        total, counts = ctx.snapshot_distribution_stats(stat_key, option_count)
+        total, counts = ctx.snapshot_distribution_stats(build_distribution_stat_key(question_index, row_index), option_count)
     except Exception:
         return (0, [0] * max(0, int(option_count or 0)))
     return (max(0, int(total or 0)), list(counts or []))
@@ -90,8 +94,7 @@ def resolve_distribution_probabilities(
     if option_count <= 0 or not target or question_index is None or ctx is None:
         return target
 
-    stat_key = build_distribution_stat_key(question_index, row_index)
-    total, counts = _resolve_runtime_counts(ctx, stat_key, option_count)
+    total, counts = _resolve_runtime_counts(ctx, question_index, row_index, option_count)
     if total <= 0:
         return target
 
@@ -135,6 +138,13 @@ def record_pending_distribution_choice(
         return
     if option_index < 0 or option_index >= option_count:
         return
+    recorder = getattr(ctx, "record_distribution_choice", None)
+    if recorder is not None:
+        try:
+            recorder(question_index, option_index, option_count, row_index=row_index)
+        except Exception:
+            pass
+        return
     if not hasattr(ctx, "append_pending_distribution_choice"):
         return
     try:
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import math
-import random
 from typing import Any, Dict, List, Optional, Sequence
 
+from software.core.task.random_context import run_random as random
+
 
 def has_positive_weight_values(raw: Any) -> bool:
     """判断权重配置里是否存在正值，支持嵌套列表。"""
@@ -1,8 +1,6 @@
 """
 答题倾向模块 - 保证同一份问卷内量表类题目的前后一致性
 """
-import random
-import threading
 import math
 from typing import Any, Dict, List, Optional, Union
 import logging
@@ -11,9 +9,8 @@ from software.logging.log_utils import log_suppressed_exception
 from software.core.questions.reliability_mode import get_reliability_profile
 from software.core.questions.utils import weighted_index
 from software.app.config import DIMENSION_UNGROUPED
-
-# 线程局部存储：每个浏览器线程有自己独立的答题倾向
-_thread_local = threading.local()
+from software.core.task.answer_context import current_answer_context
+from software.core.task.random_context import run_random as random
 
 _SMALL_SCALE_STATIC_MAX_OPTIONS = 3
 
@@ -23,7 +20,7 @@ def reset_tendency() -> None:
 
     这样每份问卷会重新生成倾向，不同问卷之间仍然是随机的。
     """
-    _thread_local.dimension_bases = {}
+    current_answer_context().dimension_bases = {}
 
 
 def _generate_base_ratio(
@@ -217,10 +214,12 @@ def get_tendency_index(
 
     # 获取该维度的基准偏好
     assert dimension is not None  # 已通过 _is_ungrouped 过滤，此处 dimension 必为 str
-    bases: Dict[str, float] = getattr(_thread_local, 'dimension_bases', {})
+    # 每份问卷的维度倾向挂在作答上下文上，并发 slot 协程之间互不影响
+    answer_context = current_answer_context()
+    bases: Dict[str, float] = answer_context.dimension_bases
     if not isinstance(bases, dict):
         bases = {}
-        _thread_local.dimension_bases = bases
+        answer_context.dimension_bases = bases
 
     base_ratio = bases.get(dimension)
 
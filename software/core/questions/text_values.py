@@ -34,6 +34,7 @@ async def resolve_option_fill_text_from_config(
     question_number: int = 0,
     option_text: Optional[str] = None,
     driver: Any = None,
+    runtime_settings: Any = None,
 ) -> Optional[str]:
     del driver
     raw_value = get_fill_text_from_config(fill_entries, option_index)
@@ -53,7 +54,7 @@ async def resolve_option_fill_text_from_config(
     ai_prompt += "\n请只输出最终要填写的内容，不要解释。"
 
     try:
-        answer = await agenerate_ai_answer(ai_prompt, question_type="fill_blank")
+        answer = await agenerate_ai_answer(ai_prompt, question_type="fill_blank", runtime_settings=runtime_settings)
     except AIRuntimeError as exc:
         raise AIRuntimeError(f"第{question_number}题附加填空 AI 生成失败：{exc}") from exc
     return str(answer).strip() or DEFAULT_FILL_TEXT
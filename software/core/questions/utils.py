@@ -2,11 +2,11 @@
 import json
 import math
 import os
-import random
 from datetime import date, timedelta
 from functools import lru_cache
 from typing import Any, List, Optional, Sequence, Tuple, Union
 import logging
+from software.core.task.random_context import run_random as random
 from software.logging.log_utils import log_suppressed_exception
 
 from software.app.config import DEFAULT_FILL_TEXT
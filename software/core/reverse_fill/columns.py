@@ -0,0 +1,152 @@
+"""反填数据的紧凑列存。
+
+Excel 导出按行读取，但每行一个 ``values_by_column`` 字典在几万行 × 上百列时会膨胀成数百万个字典项。
+这里只保留题目列，按列存成 ``array`` 编码，单元格值统一驻留到一张值表里：
+重复的选项文本、分数只存一份，每个单元格只占一个整数槽位。
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, overload
+
+from software.core.reverse_fill.schema import ReverseFillRawRow
+
+__all__ = [
+    "ReverseFillColumnStore",
+    "ReverseFillRawRowView",
+]
+
+# 值编码 0 固定表示空单元格
+_EMPTY_CODE = 0
+
+
+class ReverseFillColumnStore:
+    """按列存储题目单元格，行号从 0 开始计数。"""
+
+    __slots__ = ("column_indexes", "_columns", "_values", "_codes", "_row_count")
+
+    def __init__(self, column_indexes: Iterable[int]):
+        ordered: List[int] = []
+        for raw_index in column_indexes:
+            index = int(raw_index)
+            if index not in ordered:
+                ordered.append(index)
+        self.column_indexes: Tuple[int, ...] = tuple(ordered)
+        self._columns: Dict[int, array] = {index: array("I") for index in self.column_indexes}
+        self._values: List[Any] = [None]
+        self._codes: Dict[Tuple[type, Any], int] = {}
+        self._row_count = 0
+
+    def __copy__(self) -> "ReverseFillColumnStore":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ReverseFillColumnStore":
+        # 载入完成后列存只读，每次启动复制执行配置模板时按引用共享，不复制编码数组和值表
+        return self
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    @property
+    def distinct_value_count(self) -> int:
+        return len(self._values) - 1
+
+    def _intern(self, value: Any) -> int:
+        if value is None:
+            return _EMPTY_CODE
+        if isinstance(value, str):
+            value = sys.intern(value)
+        # 带上类型，避免 1 / 1.0 / True 被合并成同一个值
+        key = (type(value), value)
+        try:
+            code = self._codes.get(key)
+        except TypeError:
+            code = len(self._values)
+            self._values.append(value)
+            return code
+        if code is None:
+            code = len(self._values)
+            self._values.append(value)
+            self._codes[key] = code
+        return code
+
+    def append_row(self, values: Sequence[Any]) -> None:
+        """写入一行，``values`` 与 ``column_indexes`` 一一对应，缺失的按空值处理。"""
+        width = len(values)
+        for offset, index in enumerate(self.column_indexes):
+            self._columns[index].append(self._intern(values[offset] if offset < width else None))
+        self._row_count += 1
+
+    def value(self, position: int, column_index: int) -> Any:
+        column = self._columns.get(int(column_index))
+        if column is None:
+            return None
+        return self._values[column[position]]
+
+    def iter_column(self, column_index: int, start: int = 0, stop: Optional[int] = None) -> Iterator[Any]:
+        column = self._columns.get(int(column_index))
+        end = self._row_count if stop is None else min(int(stop), self._row_count)
+        begin = max(0, int(start))
+        if column is None:
+            for _ in range(begin, end):
+                yield None
+            return
+        values = self._values
+        for position in range(begin, end):
+            yield values[column[position]]
+
+    def iter_rows(
+        self,
+        column_indexes: Sequence[int],
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """按行遍历指定列的值元组，不构造中间字典。"""
+        return zip(*(self.iter_column(index, start, stop) for index in column_indexes))
+
+    def row_values(self, position: int, column_indexes: Optional[Iterable[int]] = None) -> List[Any]:
+        indexes = self.column_indexes if column_indexes is None else column_indexes
+        return [self.value(position, index) for index in indexes]
+
+    def values_by_column(self, position: int) -> Dict[int, Any]:
+        return {index: self._values[self._columns[index][position]] for index in self.column_indexes}
+
+
+class ReverseFillRawRowView(Sequence[ReverseFillRawRow]):
+    """按需把列存还原成 ``ReverseFillRawRow``，兼容逐行读取的旧调用方。"""
+
+    __slots__ = ("_store", "_header_row_number")
+
+    def __init__(self, store: ReverseFillColumnStore, *, header_row_number: int = 1):
+        self._store = store
+        self._header_row_number = int(header_row_number)
+
+    def __len__(self) -> int:
+        return self._store.row_count
+
+    def _build_row(self, position: int) -> ReverseFillRawRow:
+        return ReverseFillRawRow(
+            data_row_number=position + 1,
+            worksheet_row_number=position + 1 + self._header_row_number,
+            values_by_column=self._store.values_by_column(position),
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> ReverseFillRawRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[ReverseFillRawRow]: ...
+
+    def __getitem__(self, index: int | slice) -> ReverseFillRawRow | List[ReverseFillRawRow]:
+        if isinstance(index, slice):
+            return [self._build_row(position) for position in range(*index.indices(len(self)))]
+        position = int(index)
+        if position < 0:
+            position += len(self)
+        if position < 0 or position >= len(self):
+            raise IndexError("reverse fill row index out of range")
+        return self._build_row(position)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from software.core.questions.schema import QuestionEntry
 from software.core.questions.meta_helpers import infer_question_entry_type
@@ -246,20 +246,26 @@ def parse_multi_text_answer(
     ordered_columns: List[ReverseFillColumn],
     raw_row: ReverseFillRawRow,
 ) -> Optional[ReverseFillAnswer]:
-    values: List[str] = []
+    return parse_multi_text_values(
+        question_num=question_num,
+        values=[(raw_row.values_by_column or {}).get(int(column.column_index)) for column in list(ordered_columns or [])],
+    )
+
+
+def parse_multi_text_values(*, question_num: int, values: Iterable[Any]) -> Optional[ReverseFillAnswer]:
+    texts: List[str] = []
     has_value = False
-    for column in list(ordered_columns or []):
-        raw_value = (raw_row.values_by_column or {}).get(int(column.column_index))
+    for raw_value in values:
         text = normalize_reverse_fill_text(raw_value)
         if text:
             has_value = True
-        values.append(text)
+        texts.append(text)
     if not has_value:
         return None
     return ReverseFillAnswer(
         question_num=question_num,
         kind=REVERSE_FILL_KIND_MULTI_TEXT,
-        text_values=values,
+        text_values=texts,
     )
 
 
@@ -271,22 +277,40 @@ def parse_matrix_answer(
     export_format: str,
     option_texts: List[Any],
 ) -> Optional[ReverseFillAnswer]:
-    values: List[Any] = []
-    for column in list(ordered_columns or []):
-        values.append((raw_row.values_by_column or {}).get(int(column.column_index)))
+    return parse_matrix_values(
+        question_num=question_num,
+        values=[(raw_row.values_by_column or {}).get(int(column.column_index)) for column in list(ordered_columns or [])],
+        export_format=export_format,
+        option_texts=option_texts,
+    )
+
+
+def parse_matrix_values(
+    *,
+    question_num: int,
+    values: Iterable[Any],
+    export_format: str,
+    option_texts: List[Any],
+    choice_parser: Optional[Callable[[Any], Optional[ReverseFillAnswer]]] = None,
+) -> Optional[ReverseFillAnswer]:
+    """``choice_parser`` 用于复用调用方按单元格值缓存的选项解析结果。"""
+    values = list(values)
     if all(is_reverse_fill_blank(value) for value in values):
         return None
     if any(is_reverse_fill_blank(value) for value in values):
         raise ValueError("矩阵题存在部分行为空，V1 不能可靠回放")
     row_indexes: List[int] = []
     for raw_value in values:
-        parsed = parse_choice_answer(
-            question_num=question_num,
-            question_type="matrix",
-            raw_value=raw_value,
-            export_format=export_format,
-            option_texts=option_texts,
-        )
+        if choice_parser is not None:
+            parsed = choice_parser(raw_value)
+        else:
+            parsed = parse_choice_answer(
+                question_num=question_num,
+                question_type="matrix",
+                raw_value=raw_value,
+                export_format=export_format,
+                option_texts=option_texts,
+            )
         if parsed is None or parsed.choice_index is None:
             raise ValueError("矩阵题行值解析失败")
         row_indexes.append(int(parsed.choice_index))
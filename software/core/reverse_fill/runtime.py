@@ -5,13 +5,24 @@ from __future__ import annotations
 from collections import deque
 from typing import Any, Optional
 
-from software.core.reverse_fill.schema import ReverseFillAnswer, ReverseFillRuntimeState, ReverseFillSpec
+from software.core.reverse_fill.schema import (
+    ReverseFillAnswer,
+    ReverseFillLazySamples,
+    ReverseFillRuntimeState,
+    ReverseFillSpec,
+)
 
 
 def create_reverse_fill_runtime_state(spec: Optional[ReverseFillSpec]) -> Optional[ReverseFillRuntimeState]:
     if spec is None:
         return None
     runtime = ReverseFillRuntimeState(spec=spec)
+    samples = spec.samples
+    if isinstance(samples, ReverseFillLazySamples):
+        # 惰性样本源：只排队行号，样本在领取时才解码
+        runtime.sample_loader = samples.sample_for_row
+        runtime.queued_row_numbers.extend(samples.row_numbers())
+        return runtime
     for sample in list(spec.samples or []):
         runtime.samples_by_row_number[int(sample.data_row_number)] = sample
         runtime.queued_row_numbers.append(int(sample.data_row_number))
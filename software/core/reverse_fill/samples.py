@@ -0,0 +1,159 @@
+"""按需解码反填样本。
+
+校验阶段逐题扫一遍列存确认每个值都能回放，但不保留解析结果；
+运行时领取到某一行时才解码该行的答案，提交或作废后即释放。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, overload
+
+from software.core.reverse_fill.columns import ReverseFillColumnStore
+from software.core.reverse_fill.parser import (
+    parse_choice_answer,
+    parse_matrix_values,
+    parse_multi_text_values,
+    parse_text_answer,
+)
+from software.core.reverse_fill.schema import ReverseFillAnswer, ReverseFillSampleRow
+
+__all__ = [
+    "ReverseFillQuestionDecoder",
+    "ReverseFillSampleSource",
+]
+
+_CHOICE_TYPES = frozenset({"single", "dropdown", "scale", "score"})
+
+# 缓存解析结果或解析时抛出的异常，同一个坏值不必反复解析
+_ChoiceParseResult = Union[Optional[ReverseFillAnswer], Exception]
+
+
+class ReverseFillQuestionDecoder:
+    """一道题的解码规则；选项类单元格按原值缓存解析结果。"""
+
+    __slots__ = ("question_num", "question_type", "column_indexes", "export_format", "option_texts", "_choice_cache")
+
+    def __init__(
+        self,
+        *,
+        question_num: int,
+        question_type: str,
+        column_indexes: Iterable[int],
+        export_format: str,
+        option_texts: Iterable[Any] = (),
+    ):
+        self.question_num = int(question_num)
+        self.question_type = str(question_type or "")
+        self.column_indexes: Tuple[int, ...] = tuple(int(index) for index in column_indexes)
+        self.export_format = str(export_format or "")
+        self.option_texts: List[Any] = list(option_texts or [])
+        self._choice_cache: Dict[Tuple[type, Any], _ChoiceParseResult] = {}
+
+    def _parse_choice_uncached(self, raw_value: Any) -> _ChoiceParseResult:
+        try:
+            return parse_choice_answer(
+                question_num=self.question_num,
+                question_type=self.question_type,
+                raw_value=raw_value,
+                export_format=self.export_format,
+                option_texts=self.option_texts,
+            )
+        except Exception as exc:
+            return exc
+
+    def _parse_choice(self, raw_value: Any) -> Optional[ReverseFillAnswer]:
+        key = (type(raw_value), raw_value)
+        try:
+            cached = self._choice_cache[key]
+        except KeyError:
+            cached = self._choice_cache[key] = self._parse_choice_uncached(raw_value)
+        except TypeError:
+            # 不可哈希的单元格值不进缓存
+            cached = self._parse_choice_uncached(raw_value)
+        if isinstance(cached, Exception):
+            raise ValueError(str(cached))
+        return cached
+
+    def decode(self, values: Tuple[Any, ...]) -> Optional[ReverseFillAnswer]:
+        if self.question_type in _CHOICE_TYPES:
+            return self._parse_choice(values[0])
+        if self.question_type == "text":
+            return parse_text_answer(question_num=self.question_num, raw_value=values[0])
+        if self.question_type == "multi_text":
+            return parse_multi_text_values(question_num=self.question_num, values=values)
+        if self.question_type == "matrix":
+            return parse_matrix_values(
+                question_num=self.question_num,
+                values=values,
+                export_format=self.export_format,
+                option_texts=self.option_texts,
+                choice_parser=self._parse_choice,
+            )
+        return None
+
+
+class ReverseFillSampleSource(Sequence[ReverseFillSampleRow]):
+    """从 ``start_position`` 开始的样本序列，下标访问时才解码。"""
+
+    __slots__ = ("_store", "_decoders", "_start_position", "_header_row_number")
+
+    def __init__(
+        self,
+        store: ReverseFillColumnStore,
+        decoders: Iterable[ReverseFillQuestionDecoder],
+        *,
+        start_position: int = 0,
+        header_row_number: int = 1,
+    ):
+        self._store = store
+        self._decoders = tuple(decoders)
+        self._start_position = max(0, int(start_position))
+        self._header_row_number = int(header_row_number)
+
+    def __copy__(self) -> "ReverseFillSampleSource":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ReverseFillSampleSource":
+        # 样本源只读，解码缓存只是记忆化结果，多次运行共用同一份；逐轮状态在 ReverseFillRuntimeState 里
+        return self
+
+    def __len__(self) -> int:
+        return max(0, self._store.row_count - self._start_position)
+
+    @overload
+    def __getitem__(self, index: int) -> ReverseFillSampleRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[ReverseFillSampleRow]: ...
+
+    def __getitem__(self, index: int | slice) -> ReverseFillSampleRow | List[ReverseFillSampleRow]:
+        if isinstance(index, slice):
+            return [self._decode_position(self._start_position + offset) for offset in range(*index.indices(len(self)))]
+        offset = int(index)
+        if offset < 0:
+            offset += len(self)
+        if offset < 0 or offset >= len(self):
+            raise IndexError("reverse fill sample index out of range")
+        return self._decode_position(self._start_position + offset)
+
+    def row_numbers(self) -> range:
+        return range(self._start_position + 1, self._store.row_count + 1)
+
+    def sample_for_row(self, data_row_number: int) -> Optional[ReverseFillSampleRow]:
+        position = int(data_row_number) - 1
+        if position < self._start_position or position >= self._store.row_count:
+            return None
+        return self._decode_position(position)
+
+    def _decode_position(self, position: int) -> ReverseFillSampleRow:
+        answers: Dict[int, ReverseFillAnswer] = {}
+        for decoder in self._decoders:
+            answer = decoder.decode(tuple(self._store.row_values(position, decoder.column_indexes)))
+            if answer is not None:
+                answers[decoder.question_num] = answer
+        return ReverseFillSampleRow(
+            data_row_number=position + 1,
+            worksheet_row_number=position + 1 + self._header_row_number,
+            answers=answers,
+        )
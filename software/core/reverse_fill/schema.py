@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Deque, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, List, Optional, Protocol, Sequence, runtime_checkable
+
+if TYPE_CHECKING:
+    from software.core.reverse_fill.columns import ReverseFillColumnStore
 
 REVERSE_FILL_FORMAT_AUTO = "auto"
 REVERSE_FILL_FORMAT_WJX_SEQUENCE = "wjx_sequence"
@@ -70,7 +73,9 @@ class WjxExcelExport:
     header_row_number: int
     total_data_rows: int
     question_columns: Dict[int, List[ReverseFillColumn]] = field(default_factory=dict)
-    raw_rows: List[ReverseFillRawRow] = field(default_factory=list)
+    # 由 column_store 按需还原的行视图；大文件请直接读列存
+    raw_rows: Sequence[ReverseFillRawRow] = field(default_factory=list)
+    column_store: Optional["ReverseFillColumnStore"] = None
 
 
 @dataclass(frozen=True)
@@ -113,6 +118,15 @@ class ReverseFillQuestionPlan:
     fallback_resolved: bool = False
 
 
+@runtime_checkable
+class ReverseFillLazySamples(Protocol):
+    """按行号惰性解码的样本源，如 ``ReverseFillSampleSource``。"""
+
+    def row_numbers(self) -> Iterable[int]: ...
+
+    def sample_for_row(self, data_row_number: int) -> Optional[ReverseFillSampleRow]: ...
+
+
 @dataclass(frozen=True)
 class ReverseFillSpec:
     source_path: str
@@ -124,7 +138,8 @@ class ReverseFillSpec:
     target_num: int
     question_plans: List[ReverseFillQuestionPlan] = field(default_factory=list)
     issues: List[ReverseFillIssue] = field(default_factory=list)
-    samples: List[ReverseFillSampleRow] = field(default_factory=list)
+    # 可以是现成列表，也可以是按行号惰性解码的 ReverseFillSampleSource
+    samples: Sequence[ReverseFillSampleRow] = field(default_factory=list)
 
     @property
     def blocking_issues(self) -> List[ReverseFillIssue]:
@@ -144,6 +159,21 @@ class ReverseFillRuntimeState:
     failure_count_by_row: Dict[int, int] = field(default_factory=dict)
     committed_row_numbers: set[int] = field(default_factory=set)
     discarded_row_numbers: set[int] = field(default_factory=set)
+    # 惰性样本：samples_by_row_number 只缓存已领取的行，结束后释放
+    sample_loader: Optional[Callable[[int], Optional[ReverseFillSampleRow]]] = None
+
+    def get_sample(self, row_number: int) -> Optional[ReverseFillSampleRow]:
+        normalized_row = int(row_number)
+        sample = self.samples_by_row_number.get(normalized_row)
+        if sample is None and self.sample_loader is not None:
+            sample = self.sample_loader(normalized_row)
+            if sample is not None:
+                self.samples_by_row_number[normalized_row] = sample
+        return sample
+
+    def release_sample(self, row_number: int) -> None:
+        if self.sample_loader is not None:
+            self.samples_by_row_number.pop(int(row_number), None)
 
 
 @dataclass(frozen=True)
@@ -12,14 +12,11 @@ from software.core.questions.schema import QuestionEntry, _infer_option_count
 from software.core.questions.validation import validate_question_config
 from software.core.reverse_fill.parser import (
     infer_reverse_fill_question_type,
-    parse_choice_answer,
-    parse_matrix_answer,
-    parse_multi_text_answer,
-    parse_text_answer,
     resolve_ordered_columns,
     resolve_question_entry,
     supports_reverse_fill_runtime,
 )
+from software.core.reverse_fill.samples import ReverseFillQuestionDecoder, ReverseFillSampleSource
 from software.core.reverse_fill.schema import (
     REVERSE_FILL_FORMAT_AUTO,
     REVERSE_FILL_FORMAT_WJX_SEQUENCE,
@@ -28,7 +25,6 @@ from software.core.reverse_fill.schema import (
     REVERSE_FILL_STATUS_REVERSE,
     ReverseFillIssue,
     ReverseFillQuestionPlan,
-    ReverseFillSampleRow,
     ReverseFillSpec,
     reverse_fill_format_label,
 )
@@ -198,13 +194,14 @@ def build_reverse_fill_spec(
     effective_target_num = max(0, int(target_num or 0))
     if effective_target_num <= 0:
         effective_target_num = available_rows
-    selected_rows = list(export.raw_rows or [])[normalized_start_row - 1 :]
+    store = export.column_store
+    if store is None:
+        raise ValueError("Excel 导出缺少列存数据，无法校验反填")
+    start_position = normalized_start_row - 1
 
     issues: List[ReverseFillIssue] = []
     question_plans: List[ReverseFillQuestionPlan] = []
-    answers_by_row: Dict[int, Dict[int, Any]] = {
-        int(row.data_row_number): {} for row in selected_rows
-    }
+    decoders: List[ReverseFillQuestionDecoder] = []
 
     if available_rows <= 0:
         issues.append(_build_no_sample_issue(start_row=normalized_start_row, total_samples=total_samples))
@@ -409,42 +406,21 @@ def build_reverse_fill_spec(
                 continue
             ordered_columns = resolve_ordered_columns(columns, blank_labels)
 
+        decoder = ReverseFillQuestionDecoder(
+            question_num=question_num,
+            question_type=question_type,
+            column_indexes=[int(column.column_index) for column in ordered_columns],
+            export_format=export.selected_format,
+            option_texts=list(info.option_texts or []),
+        )
+        # 只校验每行都能解码，结果不保留；运行时领取样本时再按行解码
         parse_errors: List[int] = []
-        for raw_row in selected_rows:
+        rows = store.iter_rows(decoder.column_indexes, start_position)
+        for data_row_number, values in enumerate(rows, start=normalized_start_row):
             try:
-                if question_type in {"single", "dropdown", "scale", "score"}:
-                    answer = parse_choice_answer(
-                        question_num=question_num,
-                        question_type=question_type,
-                        raw_value=(raw_row.values_by_column or {}).get(int(ordered_columns[0].column_index)),
-                        export_format=export.selected_format,
-                        option_texts=list(info.option_texts or []),
-                    )
-                elif question_type == "text":
-                    answer = parse_text_answer(
-                        question_num=question_num,
-                        raw_value=(raw_row.values_by_column or {}).get(int(ordered_columns[0].column_index)),
-                    )
-                elif question_type == "multi_text":
-                    answer = parse_multi_text_answer(
-                        question_num=question_num,
-                        ordered_columns=ordered_columns,
-                        raw_row=raw_row,
-                    )
-                elif question_type == "matrix":
-                    answer = parse_matrix_answer(
-                        question_num=question_num,
-                        ordered_columns=ordered_columns,
-                        raw_row=raw_row,
-                        export_format=export.selected_format,
-                        option_texts=list(info.option_texts or []),
-                    )
-                else:
-                    answer = None
-                if answer is not None:
-                    answers_by_row[int(raw_row.data_row_number)][question_num] = answer
+                decoder.decode(values)
             except Exception:
-                parse_errors.append(int(raw_row.data_row_number))
+                parse_errors.append(data_row_number)
                 break
 
         if parse_errors:
@@ -477,10 +453,9 @@ def build_reverse_fill_spec(
                     fallback_resolved=fallback_resolved,
                 )
             )
-            for row_answers in answers_by_row.values():
-                row_answers.pop(question_num, None)
             continue
 
+        decoders.append(decoder)
         question_plans.append(
             _build_question_plan(
                 question_num=question_num,
@@ -493,17 +468,6 @@ def build_reverse_fill_spec(
             )
         )
 
-    samples: List[ReverseFillSampleRow] = []
-    for raw_row in selected_rows:
-        answers = dict(answers_by_row.get(int(raw_row.data_row_number)) or {})
-        samples.append(
-            ReverseFillSampleRow(
-                data_row_number=int(raw_row.data_row_number),
-                worksheet_row_number=int(raw_row.worksheet_row_number),
-                answers=answers,
-            )
-        )
-
     return ReverseFillSpec(
         source_path=os.path.abspath(str(source_path or "").strip()),
         selected_format=str(export.selected_format or REVERSE_FILL_FORMAT_AUTO),
@@ -514,7 +478,7 @@ def build_reverse_fill_spec(
         target_num=effective_target_num,
         question_plans=question_plans,
         issues=issues,
-        samples=samples,
+        samples=ReverseFillSampleSource(store, decoders, start_position=start_position, header_row_number=export.header_row_number),
     )
 
 
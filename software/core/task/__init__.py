@@ -1,15 +1,19 @@
 """任务模型。"""
 
-from software.core.task.task_context import (
-    ExecutionConfig,
-    ExecutionState,
-    ProxyLease,
-    ThreadProgressState,
-)
+from software.core.task.answer_context import AnswerContext, current_answer_context, use_answer_context
+from software.core.task.progress_state import ThreadProgressState
+from software.core.task.random_context import RunRandomContext, create_run_random_context, use_random_stream
+from software.core.task.task_context import ExecutionConfig, ExecutionState, ProxyLease
 
 __all__ = [
+    "AnswerContext",
     "ExecutionConfig",
     "ExecutionState",
     "ProxyLease",
+    "RunRandomContext",
     "ThreadProgressState",
+    "create_run_random_context",
+    "current_answer_context",
+    "use_answer_context",
+    "use_random_stream",
 ]
@@ -0,0 +1,57 @@
+"""任务模型 - 单次作答上下文。
+
+画像、已答题记录、条件规则和量表倾向都属于"这一份问卷"的状态。异步引擎把所有
+slot 协程跑在同一个事件循环线程上，``threading.local`` 会让并发 slot 互相覆盖，
+因此这些状态统一挂在 ``AnswerContext`` 上，并通过 ``ContextVar`` 绑定：
+每个 asyncio task 拥有独立的上下文副本，线程之间也天然隔离。
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+__all__ = [
+    "AnswerContext",
+    "current_answer_context",
+    "use_answer_context",
+]
+
+_ACTIVE_ANSWER_CONTEXT: ContextVar[Optional["AnswerContext"]] = ContextVar(
+    "survey_active_answer_context",
+    default=None,
+)
+
+
+@dataclass
+class AnswerContext:
+    """一次作答尝试的可变状态。"""
+
+    persona: Optional[Any] = None
+    answered: Dict[int, Any] = field(default_factory=dict)
+    answer_rules: List[Any] = field(default_factory=list)
+    dimension_bases: Dict[str, float] = field(default_factory=dict)
+    # (画像对象, 编译好的关键词匹配器)；画像换了就整体失效
+    persona_matcher: Optional[Tuple[Any, Any]] = None
+
+
+def current_answer_context() -> AnswerContext:
+    """返回当前线程/协程绑定的作答上下文；未绑定时就地创建一个。"""
+    context = _ACTIVE_ANSWER_CONTEXT.get()
+    if context is None:
+        context = AnswerContext()
+        _ACTIVE_ANSWER_CONTEXT.set(context)
+    return context
+
+
+@contextmanager
+def use_answer_context(context: Optional[AnswerContext] = None) -> Iterator[AnswerContext]:
+    """在当前线程/协程上下文内绑定一份作答上下文；不传时新建一份空上下文。"""
+    bound = context if context is not None else AnswerContext()
+    token = _ACTIVE_ANSWER_CONTEXT.set(bound)
+    try:
+        yield bound
+    finally:
+        _ACTIVE_ANSWER_CONTEXT.reset(token)
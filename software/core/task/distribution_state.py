@@ -2,69 +2,259 @@
 
 from __future__ import annotations
 
+import heapq
 import threading
 import time
-from typing import TYPE_CHECKING, Any, List, Optional, Protocol, Tuple
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple
+
+from software.core.task.runtime_channels import RUNTIME_CHANNEL_DISTRIBUTION
+
+_RATIO_QUESTION_TYPES = frozenset({"single", "dropdown", "scale", "score"})
+_EMPTY_COUNTS: Tuple[int, ...] = ()
+
+
+def build_distribution_stat_key(question_index: int, row_index: Optional[int] = None) -> str:
+    if row_index is None:
+        return f"q:{int(question_index)}"
+    return f"matrix:{int(question_index)}:{int(row_index)}"
+
+
+def parse_distribution_stat_key(stat_key: str) -> Optional[Tuple[int, Optional[int]]]:
+    parts = str(stat_key or "").split(":")
+    try:
+        if parts[0] == "matrix" and len(parts) == 3:
+            return int(parts[1]), int(parts[2])
+        if parts[0] == "q" and len(parts) == 2:
+            return int(parts[1]), None
+    except ValueError:
+        pass
+    return None
+
+
+def _zero_counts(option_count: int) -> array:
+    return array("q", bytes(8 * max(0, int(option_count or 0))))
+
+
+class DistributionCounterTable:
+    """一次运行的比例计数表。
+
+    每道题（矩阵按行）编译成一个整数 id，计数放在预分配的 ``array`` 里。
+    读取方直接拿到数组引用，不加锁也不复制；提交只在本表自己的短锁里累加，
+    不再占用 ``ExecutionState.lock``。id 注册后不会变，数组只在选项数变化时整体替换。
+    """
+
+    __slots__ = ("_ids", "_ids_by_key", "keys", "totals", "counts", "_lock")
+
+    def __init__(self) -> None:
+        self._ids: Dict[Tuple[int, Optional[int]], int] = {}
+        self._ids_by_key: Dict[str, int] = {}
+        self.keys: List[str] = []
+        self.totals = array("q")
+        self.counts: List[array] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def lookup(self, question_index: int, row_index: Optional[int] = None) -> Optional[int]:
+        return self._ids.get((question_index, row_index))
+
+    def compile(self, question_index: int, row_index: Optional[int], option_count: int) -> int:
+        ident = (int(question_index), None if row_index is None else int(row_index))
+        stat_id = self._ids.get(ident)
+        if stat_id is not None:
+            return stat_id
+        with self._lock:
+            stat_id = self._ids.get(ident)
+            if stat_id is None:
+                stat_id = len(self.keys)
+                key = build_distribution_stat_key(*ident)
+                self.counts.append(_zero_counts(option_count))
+                self.totals.append(0)
+                self.keys.append(key)
+                self._ids_by_key[key] = stat_id
+                # 数组就位后再登记 id，无锁读取方查到 id 时一定能读到数组
+                self._ids[ident] = stat_id
+        return stat_id
+
+    def id_for_key(self, stat_key: str, option_count: int, *, create: bool = True) -> Optional[int]:
+        stat_id = self._ids_by_key.get(stat_key)
+        if stat_id is not None or not create:
+            return stat_id
+        ident = parse_distribution_stat_key(stat_key)
+        if ident is None:
+            return None
+        return self.compile(ident[0], ident[1], option_count)
+
+    def read(self, stat_id: int) -> Tuple[int, Sequence[int]]:
+        """零拷贝读取；返回的数组可能被并发提交更新，只适合做比例纠偏这类近似计算。"""
+        return self.totals[stat_id], self.counts[stat_id]
+
+    def snapshot(self, stat_id: int, option_count: int) -> Tuple[int, List[int]]:
+        total, counts = self.read(stat_id)
+        count = max(0, int(option_count or 0))
+        normalized = list(counts[:count])
+        normalized.extend([0] * (count - len(normalized)))
+        return total, normalized
+
+    def commit(self, items: Iterable[Tuple[int, int, int]]) -> int:
+        committed = 0
+        with self._lock:
+            for stat_id, option_index, option_count in items:
+                counts = self.counts[stat_id]
+                if len(counts) != option_count:
+                    # 选项数变了：按新选项数截断/补零，旧数组留给还在读的一方
+                    resized = _zero_counts(option_count)
+                    keep = min(len(counts), option_count)
+                    resized[:keep] = counts[:keep]
+                    self.counts[stat_id] = counts = resized
+                counts[option_index] += 1
+                self.totals[stat_id] += 1
+                committed += 1
+        return committed
+
+    def export(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                key: {"total": int(self.totals[stat_id]), "counts": list(self.counts[stat_id])}
+                for stat_id, key in enumerate(self.keys)
+            }
 
 
 if TYPE_CHECKING:
     class _DistributionRuntimeHost(Protocol):
-        lock: threading.Lock
-        distribution_runtime_stats: dict[str, dict[str, Any]]
-        distribution_pending_by_thread: dict[str, list[tuple[str, int, int]]]
+        distribution_lock: threading.Lock
+        config: Any
+        distribution_counters: DistributionCounterTable
+        distribution_pending_by_thread: dict[str, list[tuple[Any, int, int]]]
         joint_reserved_sample_by_thread: dict[str, int]
         joint_reserved_sample_started_at_by_thread: dict[str, float]
         joint_committed_sample_indexes: set[int]
         joint_answering_threads: set[str]
+        joint_free_sample_heap: list[int]
+        joint_free_sample_watermark: int
 
-        @staticmethod
-        def _normalize_distribution_counts(raw_counts: Any, option_count: int) -> List[int]: ...
+        def _append_pending_distribution(self, thread_name: Optional[str], item: Tuple[int, int, int]) -> None: ...
+        def _extend_joint_free_samples(self, sample_count: int) -> None: ...
+        def _return_joint_free_sample(self, sample_index: Optional[int]) -> None: ...
         def reserve_joint_sample(self, sample_count: int, thread_name: Optional[str] = None) -> Optional[int]: ...
         def is_joint_sample_quota_exhausted(self, sample_count: int) -> bool: ...
         def expire_stale_joint_sample_reservations(self, max_age_seconds: float) -> int: ...
         def release_reverse_fill_sample(self, thread_name: Optional[str] = None, *, requeue: bool = True) -> Optional[int]: ...
 
-        def notify_runtime_change(self) -> None: ...
+        def notify_runtime_change(self, channel: Optional[str] = None) -> None: ...
         def wait_for_runtime_change(
             self,
             *,
+            channel: Optional[str] = None,
             stop_signal: Optional[threading.Event] = None,
             timeout: Optional[float] = None,
         ) -> bool: ...
 
 
 class DistributionRuntimeMixin:
-    @staticmethod
-    def _normalize_distribution_counts(raw_counts: Any, option_count: int) -> List[int]:
-        count = max(0, int(option_count or 0))
-        normalized = [0] * count
-        if not isinstance(raw_counts, list):
-            return normalized
-        for idx in range(min(len(raw_counts), count)):
+    def _extend_joint_free_samples(self: "_DistributionRuntimeHost", sample_count: int) -> None:
+        """把 [watermark, sample_count) 补进空闲堆；调用方需持有 lock。"""
+        start = self.joint_free_sample_watermark
+        if sample_count <= start:
+            return
+        heap = self.joint_free_sample_heap
+        if heap:
+            for sample_index in range(start, sample_count):
+                heapq.heappush(heap, sample_index)
+        else:
+            # 升序列表本身就是合法的最小堆
+            heap.extend(range(start, sample_count))
+        self.joint_free_sample_watermark = sample_count
+
+    def _return_joint_free_sample(self: "_DistributionRuntimeHost", sample_index: Optional[int]) -> None:
+        """把释放/过期的样本号放回空闲堆；调用方需持有 lock。"""
+        if sample_index is None:
+            return
+        normalized = int(sample_index)
+        if normalized < 0 or normalized >= self.joint_free_sample_watermark:
+            return
+        if normalized in self.joint_committed_sample_indexes:
+            return
+        heapq.heappush(self.joint_free_sample_heap, normalized)
+
+    @property
+    def distribution_runtime_stats(self: "_DistributionRuntimeHost") -> Dict[str, Dict[str, Any]]:
+        """按统计键导出的计数副本，供报告与调试使用。"""
+        return self.distribution_counters.export()
+
+    def compile_distribution_counters(self: "_DistributionRuntimeHost") -> int:
+        """按题目配置预先编译计数 id，运行中的热路径只剩一次字典查找。"""
+        config = getattr(self, "config", None)
+        index_map = getattr(config, "question_config_index_map", None) or {}
+        metadata = getattr(config, "questions_metadata", None) or {}
+        table = self.distribution_counters
+        for question_num, entry in index_map.items():
             try:
-                normalized[idx] = max(0, int(raw_counts[idx] or 0))
+                question_type = str(entry[0] or "")
             except Exception:
-                normalized[idx] = 0
-        return normalized
+                continue
+            meta = metadata.get(question_num)
+            option_count = max(0, int(getattr(meta, "options", 0) or 0))
+            if question_type == "matrix":
+                for row_index in range(max(0, int(getattr(meta, "rows", 0) or 0))):
+                    table.compile(question_num, row_index, option_count)
+            elif question_type in _RATIO_QUESTION_TYPES:
+                table.compile(question_num, None, option_count)
+        return len(table)
+
+    def read_distribution_counts(
+        self: "_DistributionRuntimeHost",
+        question_index: int,
+        row_index: Optional[int] = None,
+    ) -> Tuple[int, Sequence[int]]:
+        """零拷贝读取某题的已提交计数；返回的序列只读，长度可能与当前选项数不同。"""
+        stat_id = self.distribution_counters.lookup(question_index, row_index)
+        if stat_id is None:
+            return 0, _EMPTY_COUNTS
+        return self.distribution_counters.read(stat_id)
 
     def snapshot_distribution_stats(
         self: "_DistributionRuntimeHost",
         stat_key: str,
         option_count: int,
     ) -> Tuple[int, List[int]]:
-        with self.lock:
-            bucket = self.distribution_runtime_stats.get(str(stat_key or "")) or {}
-            total = max(0, int(bucket.get("total") or 0)) if isinstance(bucket, dict) else 0
-            counts = self._normalize_distribution_counts(
-                bucket.get("counts") if isinstance(bucket, dict) else None,
-                option_count,
-            )
-        return total, counts
+        table = self.distribution_counters
+        stat_id = table.id_for_key(str(stat_key or ""), option_count, create=False)
+        if stat_id is None:
+            return 0, [0] * max(0, int(option_count or 0))
+        return table.snapshot(stat_id, option_count)
 
     def reset_pending_distribution(self: "_DistributionRuntimeHost", thread_name: Optional[str] = None) -> None:
         key = str(thread_name or threading.current_thread().name or "Worker-?").strip() or "Worker-?"
-        with self.lock:
-            self.distribution_pending_by_thread[key] = []
+        # 每个槽位只读写自己的缓冲，整表替换在 GIL 下是原子的，不需要加锁
+        self.distribution_pending_by_thread[key] = []
+
+    def _append_pending_distribution(
+        self: "_DistributionRuntimeHost",
+        thread_name: Optional[str],
+        item: Tuple[int, int, int],
+    ) -> None:
+        key = str(thread_name or threading.current_thread().name or "Worker-?").strip() or "Worker-?"
+        pending = self.distribution_pending_by_thread.get(key)
+        if pending is None:
+            pending = self.distribution_pending_by_thread.setdefault(key, [])
+        pending.append(item)
+
+    def record_distribution_choice(
+        self: "_DistributionRuntimeHost",
+        question_index: int,
+        option_index: int,
+        option_count: int,
+        *,
+        row_index: Optional[int] = None,
+        thread_name: Optional[str] = None,
+    ) -> None:
+        if option_count <= 0 or option_index < 0 or option_index >= option_count:
+            return
+        stat_id = self.distribution_counters.compile(question_index, row_index, option_count)
+        self._append_pending_distribution(thread_name, (stat_id, int(option_index), int(option_count)))
 
     def append_pending_distribution_choice(
         self: "_DistributionRuntimeHost",
@@ -73,47 +263,39 @@ class DistributionRuntimeMixin:
         option_count: int,
         thread_name: Optional[str] = None,
     ) -> None:
-        key = str(thread_name or threading.current_thread().name or "Worker-?").strip() or "Worker-?"
         normalized_option_count = max(0, int(option_count or 0))
         normalized_option_index = int(option_index or 0)
         if normalized_option_count <= 0:
             return
         if normalized_option_index < 0 or normalized_option_index >= normalized_option_count:
             return
-        item = (str(stat_key or ""), normalized_option_index, normalized_option_count)
-        with self.lock:
-            pending = self.distribution_pending_by_thread.setdefault(key, [])
-            pending.append(item)
+        stat_id = self.distribution_counters.id_for_key(str(stat_key or ""), normalized_option_count)
+        if stat_id is None:
+            return
+        self._append_pending_distribution(thread_name, (stat_id, normalized_option_index, normalized_option_count))
 
     def commit_pending_distribution(self: "_DistributionRuntimeHost", thread_name: Optional[str] = None) -> int:
         key = str(thread_name or threading.current_thread().name or "Worker-?").strip() or "Worker-?"
-        committed = 0
-        with self.lock:
-            pending = list(self.distribution_pending_by_thread.get(key) or [])
-            self.distribution_pending_by_thread[key] = []
-            for stat_key, option_index, option_count in pending:
-                if option_count <= 0 or option_index < 0 or option_index >= option_count:
-                    continue
-                bucket = self.distribution_runtime_stats.get(stat_key) or {}
-                total = max(0, int(bucket.get("total") or 0)) if isinstance(bucket, dict) else 0
-                counts = self._normalize_distribution_counts(
-                    bucket.get("counts") if isinstance(bucket, dict) else None,
-                    option_count,
-                )
-                counts[option_index] += 1
-                self.distribution_runtime_stats[stat_key] = {
-                    "total": total + 1,
-                    "counts": counts,
-                }
-                committed += 1
-        return committed
+        pending = self.distribution_pending_by_thread.get(key) or []
+        self.distribution_pending_by_thread[key] = []
+        table = self.distribution_counters
+        items: List[Tuple[int, int, int]] = []
+        for stat_ref, option_index, option_count in pending:
+            if option_count <= 0 or option_index < 0 or option_index >= option_count:
+                continue
+            stat_id = table.id_for_key(stat_ref, option_count) if isinstance(stat_ref, str) else stat_ref
+            if stat_id is not None:
+                items.append((int(stat_id), int(option_index), int(option_count)))
+        if not items:
+            return 0
+        return table.commit(items)
 
     def peek_reserved_joint_sample(
         self: "_DistributionRuntimeHost",
         thread_name: Optional[str] = None,
     ) -> Optional[int]:
         key = str(thread_name or threading.current_thread().name or "Worker-?").strip() or "Worker-?"
-        with self.lock:
+        with self.distribution_lock:
             reserved = self.joint_reserved_sample_by_thread.get(key)
             return int(reserved) if reserved is not None else None
 
@@ -126,13 +308,16 @@ class DistributionRuntimeMixin:
         total = max(0, int(sample_count or 0))
         if total <= 0:
             return None
-        with self.lock:
+        with self.distribution_lock:
             existing = self.joint_reserved_sample_by_thread.get(key)
             if existing is not None:
                 return int(existing)
-            reserved_values = set(self.joint_reserved_sample_by_thread.values())
-            for sample_index in range(total):
-                if sample_index in reserved_values or sample_index in self.joint_committed_sample_indexes:
+            self._extend_joint_free_samples(total)
+            heap = self.joint_free_sample_heap
+            while heap and heap[0] < total:
+                sample_index = heapq.heappop(heap)
+                # 堆里可能残留已提交的样本号（外部直接写入预留表后提交），惰性丢弃
+                if sample_index in self.joint_committed_sample_indexes:
                     continue
                 self.joint_reserved_sample_by_thread[key] = sample_index
                 self.joint_reserved_sample_started_at_by_thread[key] = time.monotonic()
@@ -144,7 +329,7 @@ class DistributionRuntimeMixin:
         thread_name: Optional[str] = None,
     ) -> bool:
         key = str(thread_name or threading.current_thread().name or "Worker-?").strip() or "Worker-?"
-        with self.lock:
+        with self.distribution_lock:
             if key not in self.joint_reserved_sample_by_thread:
                 return False
             self.joint_answering_threads.add(key)
@@ -159,7 +344,7 @@ class DistributionRuntimeMixin:
             return 0
         now = time.monotonic()
         expired_keys: list[str] = []
-        with self.lock:
+        with self.distribution_lock:
             for key, reserved_at in list(self.joint_reserved_sample_started_at_by_thread.items()):
                 if key in self.joint_answering_threads:
                     continue
@@ -169,7 +354,7 @@ class DistributionRuntimeMixin:
                 if now - float(reserved_at or now) >= max_age:
                     expired_keys.append(key)
             for key in expired_keys:
-                self.joint_reserved_sample_by_thread.pop(key, None)
+                self._return_joint_free_sample(self.joint_reserved_sample_by_thread.pop(key, None))
                 self.joint_reserved_sample_started_at_by_thread.pop(key, None)
                 self.joint_answering_threads.discard(key)
         for key in expired_keys:
@@ -178,7 +363,7 @@ class DistributionRuntimeMixin:
             except Exception:
                 pass
         if expired_keys:
-            self.notify_runtime_change()
+            self.notify_runtime_change(RUNTIME_CHANNEL_DISTRIBUTION)
         return len(expired_keys)
 
     def is_joint_sample_quota_exhausted(
@@ -188,7 +373,7 @@ class DistributionRuntimeMixin:
         total = max(0, int(sample_count or 0))
         if total <= 0:
             return False
-        with self.lock:
+        with self.distribution_lock:
             return len(self.joint_committed_sample_indexes) >= total
 
     def release_joint_sample(
@@ -196,12 +381,13 @@ class DistributionRuntimeMixin:
         thread_name: Optional[str] = None,
     ) -> Optional[int]:
         key = str(thread_name or threading.current_thread().name or "Worker-?").strip() or "Worker-?"
-        with self.lock:
+        with self.distribution_lock:
             reserved = self.joint_reserved_sample_by_thread.pop(key, None)
             self.joint_reserved_sample_started_at_by_thread.pop(key, None)
             self.joint_answering_threads.discard(key)
+            self._return_joint_free_sample(reserved)
         if reserved is not None:
-            self.notify_runtime_change()
+            self.notify_runtime_change(RUNTIME_CHANNEL_DISTRIBUTION)
             return int(reserved)
         return None
 
@@ -210,14 +396,14 @@ class DistributionRuntimeMixin:
         thread_name: Optional[str] = None,
     ) -> Optional[int]:
         key = str(thread_name or threading.current_thread().name or "Worker-?").strip() or "Worker-?"
-        with self.lock:
+        with self.distribution_lock:
             reserved = self.joint_reserved_sample_by_thread.pop(key, None)
             self.joint_reserved_sample_started_at_by_thread.pop(key, None)
             self.joint_answering_threads.discard(key)
             if reserved is None:
                 return None
             self.joint_committed_sample_indexes.add(int(reserved))
-        self.notify_runtime_change()
+        self.notify_runtime_change(RUNTIME_CHANNEL_DISTRIBUTION)
         return int(reserved)
 
     def wait_for_joint_sample(
@@ -234,5 +420,9 @@ class DistributionRuntimeMixin:
                 return reserved
             if stop_signal is not None and stop_signal.is_set():
                 return None
-            if self.wait_for_runtime_change(stop_signal=stop_signal, timeout=timeout_seconds):
+            if self.wait_for_runtime_change(
+                channel=RUNTIME_CHANNEL_DISTRIBUTION,
+                stop_signal=stop_signal,
+                timeout=timeout_seconds,
+            ):
                 return None
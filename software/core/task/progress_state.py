@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 import threading
-from typing import TYPE_CHECKING, Any, Dict, List, Protocol
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol, Tuple
+
+from software.core.task.runtime_channels import RUNTIME_CHANNEL_PROGRESS
 
 
 @dataclass
@@ -24,10 +27,216 @@ class ThreadProgressState:
     last_update_ts: float = 0.0
 
 
+@dataclass
+class ThreadProgressDelta:
+    """增量进度快照：``rows`` 只含 ``since_seq`` 之后变化过的槽位。"""
+
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    order: Tuple[str, ...] = ()
+    last_seq: int = 0
+    full: bool = False
+
+
+def _thread_sort_key(thread_name: str, thread_index: int) -> Tuple[bool, int, str]:
+    # 没有编号的线程排在最后
+    return (thread_index <= 0, thread_index if thread_index > 0 else 10**9, thread_name)
+
+
+class ThreadProgressTable:
+    """按槽位列存的线程进度。
+
+    每个字段一列 ``array``，槽位号即下标；每次修改把全局序号写进该槽位的 ``changed_seq``，
+    增量快照只需比较序号就能挑出变化的槽位，不必逐个构造字典。
+    """
+
+    __slots__ = (
+        "_slot_by_name",
+        "names",
+        "display_names",
+        "indexes",
+        "owner_ids",
+        "success_counts",
+        "fail_counts",
+        "step_currents",
+        "step_totals",
+        "status_texts",
+        "running",
+        "last_update_ts",
+        "changed_seq",
+        "_seq",
+        "_order",
+    )
+
+    def __init__(self) -> None:
+        self._slot_by_name: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.display_names: List[str] = []
+        self.indexes = array("q")
+        self.owner_ids = array("q")
+        self.success_counts = array("q")
+        self.fail_counts = array("q")
+        self.step_currents = array("q")
+        self.step_totals = array("q")
+        self.status_texts: List[str] = []
+        self.running = bytearray()
+        self.last_update_ts = array("d")
+        self.changed_seq = array("Q")
+        self._seq = 0
+        self._order: Optional[Tuple[int, ...]] = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, thread_name: object) -> bool:
+        return thread_name in self._slot_by_name
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def slot_of(self, thread_name: str) -> Optional[int]:
+        return self._slot_by_name.get(thread_name)
+
+    def add_slot(self, thread_name: str, thread_index: int, now: float) -> int:
+        slot = len(self.names)
+        self._slot_by_name[thread_name] = slot
+        self.names.append(thread_name)
+        self.display_names.append(ThreadProgressMixin._format_thread_display_name(thread_name, thread_index))
+        self.indexes.append(int(thread_index))
+        self.owner_ids.append(0)
+        self.success_counts.append(0)
+        self.fail_counts.append(0)
+        self.step_currents.append(0)
+        self.step_totals.append(0)
+        self.status_texts.append("等待中")
+        self.running.append(0)
+        self.last_update_ts.append(float(now))
+        self.changed_seq.append(0)
+        self._order = None
+        self.touch(slot, now)
+        return slot
+
+    def set_thread_index(self, slot: int, thread_index: int) -> None:
+        if self.indexes[slot] == thread_index:
+            return
+        self.indexes[slot] = int(thread_index)
+        self.display_names[slot] = ThreadProgressMixin._format_thread_display_name(self.names[slot], thread_index)
+        self._order = None
+
+    def touch(self, slot: int, now: float) -> None:
+        self._seq += 1
+        self.last_update_ts[slot] = float(now)
+        self.changed_seq[slot] = self._seq
+
+    def ordered_slots(self) -> Tuple[int, ...]:
+        order = self._order
+        if order is None:
+            order = tuple(
+                sorted(range(len(self.names)), key=lambda slot: _thread_sort_key(self.names[slot], self.indexes[slot]))
+            )
+            self._order = order
+        return order
+
+    def ordered_names(self) -> Tuple[str, ...]:
+        return tuple(self.names[slot] for slot in self.ordered_slots())
+
+    def raw_row(self, slot: int) -> Tuple[Any, ...]:
+        return (
+            self.names[slot],
+            self.display_names[slot],
+            self.indexes[slot],
+            self.success_counts[slot],
+            self.fail_counts[slot],
+            self.step_currents[slot],
+            self.step_totals[slot],
+            self.status_texts[slot],
+            self.running[slot],
+            self.last_update_ts[slot],
+        )
+
+    def get(self, thread_name: str) -> Optional[ThreadProgressState]:
+        slot = self._slot_by_name.get(thread_name)
+        if slot is None:
+            return None
+        return ThreadProgressState(
+            thread_name=self.names[slot],
+            thread_index=self.indexes[slot],
+            owner_id=self.owner_ids[slot],
+            success_count=self.success_counts[slot],
+            fail_count=self.fail_counts[slot],
+            step_current=self.step_currents[slot],
+            step_total=self.step_totals[slot],
+            status_text=self.status_texts[slot],
+            running=bool(self.running[slot]),
+            last_update_ts=self.last_update_ts[slot],
+        )
+
+
+def _build_thread_row(raw: Tuple[Any, ...]) -> Dict[str, Any]:
+    (
+        thread_name,
+        display_name,
+        thread_index,
+        success_count,
+        fail_count,
+        current,
+        total,
+        status_text,
+        running,
+        last_update_ts,
+    ) = raw
+    if total > 0:
+        current = min(current, total)
+        step_percent = int(min(100, (current / float(total)) * 100))
+    else:
+        step_percent = 0
+    return {
+        "thread_name": thread_name,
+        "slot_label": thread_name,
+        "thread_display_name": display_name,
+        "thread_index": thread_index,
+        "slot_id": thread_index,
+        "success_count": success_count,
+        "fail_count": fail_count,
+        "step_current": current,
+        "step_total": total,
+        "step_percent": step_percent,
+        "status_text": status_text,
+        "running": bool(running),
+        "last_update_ts": last_update_ts,
+    }
+
+
+class ThreadProgressRowCache:
+    """UI 侧的行缓存：按增量快照只替换变化的行，未变化的行保持原对象。"""
+
+    def __init__(self) -> None:
+        self._owner: Any = None
+        self._seq = 0
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._order: Tuple[str, ...] = ()
+        self._ordered_rows: List[Dict[str, Any]] = []
+
+    def refresh(self, state: Any) -> List[Dict[str, Any]]:
+        if state is not self._owner:
+            self._owner = state
+            self._seq = 0
+        delta = state.snapshot_thread_progress_delta(self._seq)
+        if delta.full:
+            self._rows = {}
+        for row in delta.rows:
+            self._rows[row["thread_name"]] = row
+        if delta.full or delta.rows or delta.order != self._order:
+            self._order = delta.order
+            self._ordered_rows = [self._rows[name] for name in delta.order if name in self._rows]
+        self._seq = delta.last_seq
+        return list(self._ordered_rows)
+
+
 if TYPE_CHECKING:
     class _ThreadProgressHost(Protocol):
-        lock: threading.Lock
-        thread_progress: dict[str, ThreadProgressState]
+        progress_lock: threading.Lock
+        thread_progress: ThreadProgressTable
 
         @staticmethod
         def _resolve_thread_index(thread_name: str) -> int: ...
@@ -35,8 +244,8 @@ if TYPE_CHECKING:
         @staticmethod
         def _format_thread_display_name(thread_name: str, thread_index: int) -> str: ...
 
-        def _get_or_create_thread_state_locked(self, thread_name: str) -> ThreadProgressState: ...
-        def notify_runtime_change(self) -> None: ...
+        def _get_or_create_thread_slot_locked(self, thread_name: str, now: float) -> int: ...
+        def notify_runtime_change(self, channel: Optional[str] = None) -> None: ...
 
 
 class ThreadProgressMixin:
@@ -81,44 +290,33 @@ class ThreadProgressMixin:
             return "会话 ?"
         return text or "线程 ?"
 
-    def _get_or_create_thread_state_locked(
+    def _get_or_create_thread_slot_locked(
         self: "_ThreadProgressHost",
         thread_name: str,
-    ) -> ThreadProgressState:
+        now: float,
+    ) -> int:
         key = str(thread_name or "").strip() or "Worker-?"
-        state = self.thread_progress.get(key)
-        if state is not None:
-            return state
-        state = ThreadProgressState(
-            thread_name=key,
-            thread_index=self._resolve_thread_index(key),
-            last_update_ts=time.time(),
-        )
-        self.thread_progress[key] = state
-        return state
+        table = self.thread_progress
+        slot = table.slot_of(key)
+        if slot is not None:
+            return slot
+        return table.add_slot(key, self._resolve_thread_index(key), now)
 
     def ensure_worker_threads(self: "_ThreadProgressHost", expected_count: int, *, prefix: str = "Worker") -> None:
         count = max(1, int(expected_count or 1))
         now = time.time()
         normalized_prefix = str(prefix or "Worker").strip() or "Worker"
-        changed = False
-        with self.lock:
+        with self.progress_lock:
+            table = self.thread_progress
             for idx in range(1, count + 1):
                 name = f"{normalized_prefix}-{idx}"
-                state = self.thread_progress.get(name)
-                if state is None:
-                    self.thread_progress[name] = ThreadProgressState(
-                        thread_name=name,
-                        thread_index=idx,
-                        last_update_ts=now,
-                    )
-                    changed = True
+                slot = table.slot_of(name)
+                if slot is None:
+                    table.add_slot(name, idx, now)
                 else:
-                    state.thread_index = idx
-                    state.last_update_ts = now
-                    changed = True
-        if changed:
-            self.notify_runtime_change()
+                    table.set_thread_index(slot, idx)
+                    table.touch(slot, now)
+        self.notify_runtime_change(RUNTIME_CHANNEL_PROGRESS)
 
     def update_thread_status(
         self: "_ThreadProgressHost",
@@ -128,13 +326,14 @@ class ThreadProgressMixin:
         running: bool | None = None,
     ) -> None:
         now = time.time()
-        with self.lock:
-            state = self._get_or_create_thread_state_locked(thread_name)
-            state.status_text = str(status_text or "")
+        with self.progress_lock:
+            table = self.thread_progress
+            slot = self._get_or_create_thread_slot_locked(thread_name, now)
+            table.status_texts[slot] = str(status_text or "")
             if running is not None:
-                state.running = bool(running)
-            state.last_update_ts = now
-        self.notify_runtime_change()
+                table.running[slot] = bool(running)
+            table.touch(slot, now)
+        self.notify_runtime_change(RUNTIME_CHANNEL_PROGRESS)
 
     def update_thread_step(
         self: "_ThreadProgressHost",
@@ -150,16 +349,17 @@ class ThreadProgressMixin:
         total = max(0, int(step_total or 0))
         if total > 0:
             current = min(current, total)
-        with self.lock:
-            thread_state = self._get_or_create_thread_state_locked(thread_name)
-            thread_state.step_current = current
-            thread_state.step_total = total
+        with self.progress_lock:
+            table = self.thread_progress
+            slot = self._get_or_create_thread_slot_locked(thread_name, now)
+            table.step_currents[slot] = current
+            table.step_totals[slot] = total
             if status_text is not None:
-                thread_state.status_text = str(status_text or "")
+                table.status_texts[slot] = str(status_text or "")
             if running is not None:
-                thread_state.running = bool(running)
-            thread_state.last_update_ts = now
-        self.notify_runtime_change()
+                table.running[slot] = bool(running)
+            table.touch(slot, now)
+        self.notify_runtime_change(RUNTIME_CHANNEL_PROGRESS)
 
     def increment_thread_success(
         self: "_ThreadProgressHost",
@@ -168,15 +368,16 @@ class ThreadProgressMixin:
         status_text: str = "提交成功",
     ) -> None:
         now = time.time()
-        with self.lock:
-            state = self._get_or_create_thread_state_locked(thread_name)
-            state.success_count += 1
-            if state.step_total > 0:
-                state.step_current = state.step_total
-            state.status_text = str(status_text or "提交成功")
-            state.running = True
-            state.last_update_ts = now
-        self.notify_runtime_change()
+        with self.progress_lock:
+            table = self.thread_progress
+            slot = self._get_or_create_thread_slot_locked(thread_name, now)
+            table.success_counts[slot] += 1
+            if table.step_totals[slot] > 0:
+                table.step_currents[slot] = table.step_totals[slot]
+            table.status_texts[slot] = str(status_text or "提交成功")
+            table.running[slot] = True
+            table.touch(slot, now)
+        self.notify_runtime_change(RUNTIME_CHANNEL_PROGRESS)
 
     def increment_thread_fail(
         self: "_ThreadProgressHost",
@@ -185,13 +386,14 @@ class ThreadProgressMixin:
         status_text: str = "失败重试",
     ) -> None:
         now = time.time()
-        with self.lock:
-            state = self._get_or_create_thread_state_locked(thread_name)
-            state.fail_count += 1
-            state.status_text = str(status_text or "失败重试")
-            state.running = True
-            state.last_update_ts = now
-        self.notify_runtime_change()
+        with self.progress_lock:
+            table = self.thread_progress
+            slot = self._get_or_create_thread_slot_locked(thread_name, now)
+            table.fail_counts[slot] += 1
+            table.status_texts[slot] = str(status_text or "失败重试")
+            table.running[slot] = True
+            table.touch(slot, now)
+        self.notify_runtime_change(RUNTIME_CHANNEL_PROGRESS)
 
     def mark_thread_finished(
         self: "_ThreadProgressHost",
@@ -200,49 +402,39 @@ class ThreadProgressMixin:
         status_text: str = "已停止",
     ) -> None:
         now = time.time()
-        with self.lock:
-            state = self._get_or_create_thread_state_locked(thread_name)
-            state.running = False
-            state.status_text = str(status_text or "已停止")
-            state.last_update_ts = now
-        self.notify_runtime_change()
+        with self.progress_lock:
+            table = self.thread_progress
+            slot = self._get_or_create_thread_slot_locked(thread_name, now)
+            table.running[slot] = False
+            table.status_texts[slot] = str(status_text or "已停止")
+            table.touch(slot, now)
+        self.notify_runtime_change(RUNTIME_CHANNEL_PROGRESS)
+
+    def get_thread_progress(self: "_ThreadProgressHost", thread_name: str) -> Optional[ThreadProgressState]:
+        with self.progress_lock:
+            return self.thread_progress.get(str(thread_name or "").strip() or "Worker-?")
 
     def snapshot_thread_progress(self: "_ThreadProgressHost") -> List[Dict[str, Any]]:
-        with self.lock:
-            rows = []
-            for state in self.thread_progress.values():
-                total = max(0, int(state.step_total or 0))
-                current = max(0, int(state.step_current or 0))
-                if total > 0:
-                    current = min(current, total)
-                    step_percent = int(min(100, (current / float(total)) * 100))
-                else:
-                    step_percent = 0
-                rows.append(
-                    {
-                        "thread_name": state.thread_name,
-                        "slot_label": state.thread_name,
-                        "thread_display_name": self._format_thread_display_name(
-                            state.thread_name,
-                            int(state.thread_index or 0),
-                        ),
-                        "thread_index": int(state.thread_index or 0),
-                        "slot_id": int(state.thread_index or 0),
-                        "success_count": int(state.success_count or 0),
-                        "fail_count": int(state.fail_count or 0),
-                        "step_current": current,
-                        "step_total": total,
-                        "step_percent": step_percent,
-                        "status_text": str(state.status_text or ""),
-                        "running": bool(state.running),
-                        "last_update_ts": float(state.last_update_ts or 0.0),
-                    }
-                )
-        rows.sort(
-            key=lambda item: (
-                item["thread_index"] <= 0,
-                item["thread_index"] if item["thread_index"] > 0 else 10**9,
-                item["thread_name"],
-            )
+        # 锁内只拷贝原始元组，字典在锁外构造，减少与提交线程的争用
+        with self.progress_lock:
+            table = self.thread_progress
+            raw_rows = [table.raw_row(slot) for slot in table.ordered_slots()]
+        return [_build_thread_row(raw) for raw in raw_rows]
+
+    def snapshot_thread_progress_delta(self: "_ThreadProgressHost", since_seq: int = 0) -> ThreadProgressDelta:
+        """返回 ``since_seq`` 之后变化过的槽位；序号不连续（如换了一次运行）时退回全量。"""
+        since = int(since_seq or 0)
+        with self.progress_lock:
+            table = self.thread_progress
+            last_seq = table.last_seq
+            full = since <= 0 or since > last_seq
+            changed_seq = table.changed_seq
+            slots = table.ordered_slots()
+            raw_rows = [table.raw_row(slot) for slot in slots if full or changed_seq[slot] > since]
+            order = tuple(table.names[slot] for slot in slots)
+        return ThreadProgressDelta(
+            rows=[_build_thread_row(raw) for raw in raw_rows],
+            order=order,
+            last_seq=last_seq,
+            full=full,
         )
-        return rows
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import asyncio
 import threading
 import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional, Protocol
 
-from software.core.engine.stop_signal import StopSignalLike
+from software.core.task.runtime_channels import RUNTIME_CHANNEL_PROXY
 
 
 @dataclass
@@ -24,39 +23,33 @@ class ProxyLease:
 
 if TYPE_CHECKING:
     class _ProxyRuntimeHost(Protocol):
-        lock: threading.Lock
+        proxy_lock: threading.Lock
         proxy_waiting_threads: int
         proxy_in_use_by_thread: dict[str, ProxyLease]
         successful_proxy_addresses: set[str]
         proxy_cooldown_until_by_address: dict[str, float]
-        _runtime_condition: threading.Condition
-        _runtime_async_event: Optional[asyncio.Event]
-        _runtime_async_event_loop: Optional[asyncio.AbstractEventLoop]
-        _runtime_change_seq: int
 
         def _purge_expired_proxy_cooldowns_locked(self, *, now_ts: Optional[float] = None) -> None: ...
         def _is_proxy_in_cooldown_locked(self, proxy_address: str, *, now_ts: Optional[float] = None) -> bool: ...
         def active_proxy_addresses_locked(self, *, exclude_thread_name: str = "") -> set[str]: ...
         def successful_proxy_addresses_locked(self) -> set[str]: ...
-        def notify_runtime_change(self) -> None: ...
-        def _runtime_change_sequence(self) -> int: ...
-        def _ensure_runtime_async_event(self) -> asyncio.Event: ...
+        def notify_runtime_change(self, channel: Optional[str] = None) -> None: ...
 
 
 class ProxyRuntimeMixin:
     def register_proxy_waiter(self: "_ProxyRuntimeHost") -> None:
-        with self.lock:
+        with self.proxy_lock:
             self.proxy_waiting_threads = max(0, int(self.proxy_waiting_threads or 0)) + 1
 
     def unregister_proxy_waiter(self: "_ProxyRuntimeHost") -> None:
-        with self.lock:
+        with self.proxy_lock:
             self.proxy_waiting_threads = max(0, int(self.proxy_waiting_threads or 0) - 1)
 
     def mark_proxy_in_use(self: "_ProxyRuntimeHost", thread_name: str, lease: ProxyLease) -> None:
         key = str(thread_name or "").strip()
         if not key or not isinstance(lease, ProxyLease):
             return
-        with self.lock:
+        with self.proxy_lock:
             self.proxy_in_use_by_thread[key] = lease
 
     def _purge_expired_proxy_cooldowns_locked(
@@ -74,7 +67,7 @@ class ProxyRuntimeMixin:
             self.proxy_cooldown_until_by_address.pop(address, None)
 
     def purge_expired_proxy_cooldowns(self: "_ProxyRuntimeHost", *, now_ts: Optional[float] = None) -> None:
-        with self.lock:
+        with self.proxy_lock:
             self._purge_expired_proxy_cooldowns_locked(now_ts=now_ts)
 
     def _is_proxy_in_cooldown_locked(
@@ -99,7 +92,7 @@ class ProxyRuntimeMixin:
         normalized = str(proxy_address or "").strip()
         if not normalized:
             return False
-        with self.lock:
+        with self.proxy_lock:
             return self._is_proxy_in_cooldown_locked(normalized, now_ts=now_ts)
 
     def mark_proxy_in_cooldown(
@@ -117,10 +110,10 @@ class ProxyRuntimeMixin:
         if seconds <= 0:
             return
         cooldown_until = time.time() + seconds
-        with self.lock:
+        with self.proxy_lock:
             previous_until = float(self.proxy_cooldown_until_by_address.get(normalized, 0.0) or 0.0)
             self.proxy_cooldown_until_by_address[normalized] = max(previous_until, cooldown_until)
-        self.notify_runtime_change()
+        self.notify_runtime_change(RUNTIME_CHANNEL_PROXY)
 
     def active_proxy_addresses_locked(
         self: "_ProxyRuntimeHost",
@@ -149,11 +142,11 @@ class ProxyRuntimeMixin:
         *,
         exclude_thread_name: str = "",
     ) -> set[str]:
-        with self.lock:
+        with self.proxy_lock:
             return self.active_proxy_addresses_locked(exclude_thread_name=exclude_thread_name)
 
     def snapshot_successful_proxy_addresses(self: "_ProxyRuntimeHost") -> set[str]:
-        with self.lock:
+        with self.proxy_lock:
             return self.successful_proxy_addresses_locked()
 
     def snapshot_blocked_proxy_addresses(
@@ -161,7 +154,7 @@ class ProxyRuntimeMixin:
         *,
         exclude_thread_name: str = "",
     ) -> set[str]:
-        with self.lock:
+        with self.proxy_lock:
             blocked = self.active_proxy_addresses_locked(exclude_thread_name=exclude_thread_name)
             blocked.update(self.successful_proxy_addresses_locked())
             return blocked
@@ -175,99 +168,34 @@ class ProxyRuntimeMixin:
         normalized = str(proxy_address or "").strip()
         if not normalized:
             return False
-        with self.lock:
+        with self.proxy_lock:
             return normalized in self.active_proxy_addresses_locked(exclude_thread_name=exclude_thread_name)
 
     def mark_successful_proxy_address(self: "_ProxyRuntimeHost", proxy_address: str) -> bool:
         normalized = str(proxy_address or "").strip()
         if not normalized:
             return False
-        with self.lock:
+        with self.proxy_lock:
             previous_size = len(self.successful_proxy_addresses)
             self.successful_proxy_addresses.add(normalized)
             changed = len(self.successful_proxy_addresses) != previous_size
         if changed:
-            self.notify_runtime_change()
+            self.notify_runtime_change(RUNTIME_CHANNEL_PROXY)
         return changed
 
     def is_successful_proxy_address(self: "_ProxyRuntimeHost", proxy_address: str) -> bool:
         normalized = str(proxy_address or "").strip()
         if not normalized:
             return False
-        with self.lock:
+        with self.proxy_lock:
             return normalized in self.successful_proxy_addresses_locked()
 
-    def notify_runtime_change(self: "_ProxyRuntimeHost") -> None:
-        with self._runtime_condition:
-            self._runtime_change_seq += 1
-            self._runtime_condition.notify_all()
-        event = self._runtime_async_event
-        loop = self._runtime_async_event_loop
-        if event is not None and loop is not None and not loop.is_closed():
-            try:
-                loop.call_soon_threadsafe(event.set)
-            except RuntimeError:
-                pass
-
-    def wait_for_runtime_change(
-        self: "_ProxyRuntimeHost",
-        *,
-        stop_signal: Optional[StopSignalLike] = None,
-        timeout: Optional[float] = None,
-    ) -> bool:
-        if stop_signal is not None and stop_signal.is_set():
-            return True
-        wait_timeout = None if timeout is None else max(0.0, float(timeout))
-        with self._runtime_condition:
-            self._runtime_condition.wait(timeout=wait_timeout)
-        return bool(stop_signal is not None and stop_signal.is_set())
-
-    def _runtime_change_sequence(self: "_ProxyRuntimeHost") -> int:
-        with self._runtime_condition:
-            return int(self._runtime_change_seq)
-
-    def _ensure_runtime_async_event(self: "_ProxyRuntimeHost") -> asyncio.Event:
-        loop = asyncio.get_running_loop()
-        event = self._runtime_async_event
-        if event is None or self._runtime_async_event_loop is not loop:
-            event = asyncio.Event()
-            self._runtime_async_event = event
-            self._runtime_async_event_loop = loop
-        return event
-
-    async def wait_for_runtime_change_async(
-        self: "_ProxyRuntimeHost",
-        *,
-        stop_signal: Optional[StopSignalLike] = None,
-        timeout: Optional[float] = None,
-    ) -> bool:
-        if stop_signal is not None and stop_signal.is_set():
-            return True
-        wait_timeout = None if timeout is None else max(0.0, float(timeout))
-        observed_seq = self._runtime_change_sequence()
-        event = self._ensure_runtime_async_event()
-        while True:
-            if stop_signal is not None and stop_signal.is_set():
-                return True
-            if self._runtime_change_sequence() != observed_seq:
-                return False
-            event.clear()
-            if self._runtime_change_sequence() != observed_seq:
-                return False
-            try:
-                if wait_timeout is None:
-                    await event.wait()
-                else:
-                    await asyncio.wait_for(event.wait(), timeout=wait_timeout)
-            except asyncio.TimeoutError:
-                return bool(stop_signal is not None and stop_signal.is_set())
-
     def release_proxy_in_use(self: "_ProxyRuntimeHost", thread_name: str) -> Optional[ProxyLease]:
         key = str(thread_name or "").strip()
         if not key:
             return None
-        with self.lock:
+        with self.proxy_lock:
             released = self.proxy_in_use_by_thread.pop(key, None)
         if released is not None:
-            self.notify_runtime_change()
+            self.notify_runtime_change(RUNTIME_CHANNEL_PROXY)
         return released
@@ -0,0 +1,141 @@
+"""任务模型 - 运行级随机数上下文。
+
+默认情况下答题逻辑直接用全局 ``random``；配置了 ``ExecutionConfig.random_seed``
+后，同一份配置和种子会按 计划 / 槽位 / 样本 派生出互相独立的子随机流，
+从而让答案计划可以逐字节复现，也能安全地交给并行 worker 生成。
+
+答题相关模块通过 ``from software.core.task.random_context import run_random as random``
+接入：调用写法不变，当前上下文绑定了子随机流时走子流，否则回落到全局 ``random``。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random as _global_random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+__all__ = [
+    "RunRandomContext",
+    "active_random_stream",
+    "create_run_random_context",
+    "run_random",
+    "use_random_stream",
+]
+
+_ACTIVE_STREAM: ContextVar[Optional[_global_random.Random]] = ContextVar(
+    "survey_active_random_stream",
+    default=None,
+)
+
+
+@dataclass(frozen=True)
+class RunRandomContext:
+    """一次运行的随机种子；子随机流只由种子和键决定，与线程调度无关。"""
+
+    seed: int
+
+    def derive_seed(self, *keys: Any) -> int:
+        # 不用 hash()：字符串哈希受 PYTHONHASHSEED 影响，跨进程不稳定
+        material = ":".join([str(int(self.seed)), *(repr(key) for key in keys)])
+        digest = hashlib.blake2b(material.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    def stream(self, *keys: Any) -> _global_random.Random:
+        return _global_random.Random(self.derive_seed(*keys))
+
+    def plan_stream(self, name: str = "joint_plan") -> _global_random.Random:
+        return self.stream("plan", str(name or ""))
+
+    def slot_stream(self, slot_name: str, attempt: int = 0) -> _global_random.Random:
+        return self.stream("slot", str(slot_name or ""), int(attempt))
+
+    def sample_stream(self, sample_index: int, attempt: int = 0) -> _global_random.Random:
+        return self.stream("sample", int(sample_index), int(attempt))
+
+
+def create_run_random_context(seed: Any) -> Optional[RunRandomContext]:
+    """种子为空时返回 None，表示沿用全局随机数。"""
+    if seed is None or isinstance(seed, bool):
+        return None
+    try:
+        normalized_seed = int(str(seed).strip())
+    except (TypeError, ValueError):
+        return None
+    return RunRandomContext(seed=normalized_seed)
+
+
+def active_random_stream() -> Optional[_global_random.Random]:
+    return _ACTIVE_STREAM.get()
+
+
+@contextmanager
+def use_random_stream(stream: Optional[_global_random.Random]) -> Iterator[Optional[_global_random.Random]]:
+    """在当前线程/协程上下文内绑定子随机流；传 None 时不改变现状。"""
+    if stream is None:
+        yield None
+        return
+    token = _ACTIVE_STREAM.set(stream)
+    try:
+        yield stream
+    finally:
+        _ACTIVE_STREAM.reset(token)
+
+
+def _source() -> Any:
+    stream = _ACTIVE_STREAM.get()
+    return _global_random if stream is None else stream
+
+
+class _RunRandomProxy:
+    """与 ``random`` 模块同名接口的分发器，按当前上下文选择子流或全局随机数。"""
+
+    def random(self) -> float:
+        return _source().random()
+
+    def uniform(self, a: float, b: float) -> float:
+        return _source().uniform(a, b)
+
+    def randint(self, a: int, b: int) -> int:
+        return _source().randint(a, b)
+
+    def randrange(self, *args: Any, **kwargs: Any) -> int:
+        return _source().randrange(*args, **kwargs)
+
+    def choice(self, seq: Any) -> Any:
+        return _source().choice(seq)
+
+    def choices(self, population: Any, weights: Any = None, *, cum_weights: Any = None, k: int = 1) -> list:
+        return _source().choices(population, weights, cum_weights=cum_weights, k=k)
+
+    def sample(self, population: Any, k: int, **kwargs: Any) -> list:
+        return _source().sample(population, k, **kwargs)
+
+    def shuffle(self, values: Any) -> None:
+        _source().shuffle(values)
+
+    def gauss(self, mu: float = 0.0, sigma: float = 1.0) -> float:
+        return _source().gauss(mu, sigma)
+
+    def normalvariate(self, mu: float = 0.0, sigma: float = 1.0) -> float:
+        return _source().normalvariate(mu, sigma)
+
+    def getrandbits(self, k: int) -> int:
+        return _source().getrandbits(k)
+
+    def getstate(self) -> Any:
+        return _source().getstate()
+
+    def setstate(self, state: Any) -> None:
+        _source().setstate(state)
+
+    def seed(self, *args: Any, **kwargs: Any) -> None:
+        _source().seed(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_source(), name)
+
+
+run_random = _RunRandomProxy()
@@ -11,11 +11,12 @@ from software.core.reverse_fill import (
     ReverseFillRuntimeState,
     create_reverse_fill_runtime_state,
 )
+from software.core.task.runtime_channels import RUNTIME_CHANNEL_REVERSE_FILL
 
 
 if TYPE_CHECKING:
     class _ReverseFillRuntimeHost(Protocol):
-        lock: threading.Lock
+        reverse_fill_lock: threading.Lock
         config: Any
         cur_num: int
         reverse_fill_runtime: Optional[ReverseFillRuntimeState]
@@ -24,10 +25,11 @@ if TYPE_CHECKING:
         def _reverse_fill_possible_total_locked(self) -> int: ...
         def acquire_reverse_fill_sample(self, thread_name: Optional[str] = None) -> ReverseFillAcquireResult: ...
 
-        def notify_runtime_change(self) -> None: ...
+        def notify_runtime_change(self, channel: Optional[str] = None) -> None: ...
         def wait_for_runtime_change(
             self,
             *,
+            channel: Optional[str] = None,
             stop_signal: Optional[threading.Event] = None,
             timeout: Optional[float] = None,
         ) -> bool: ...
@@ -35,9 +37,9 @@ if TYPE_CHECKING:
 
 class ReverseFillRuntimeMixin:
     def initialize_reverse_fill_runtime(self: "_ReverseFillRuntimeHost") -> None:
-        with self.lock:
+        with self.reverse_fill_lock:
             self.reverse_fill_runtime = create_reverse_fill_runtime_state(getattr(self.config, "reverse_fill_spec", None))
-        self.notify_runtime_change()
+        self.notify_runtime_change(RUNTIME_CHANNEL_REVERSE_FILL)
 
     def _reverse_fill_thread_key(self, thread_name: Optional[str] = None) -> str:
         key = str(thread_name or threading.current_thread().name or "Worker-?").strip()
@@ -58,19 +60,19 @@ class ReverseFillRuntimeMixin:
         thread_name: Optional[str] = None,
     ) -> ReverseFillAcquireResult:
         key = self._reverse_fill_thread_key(thread_name)
-        with self.lock:
+        with self.reverse_fill_lock:
             runtime = self.reverse_fill_runtime
             if runtime is None:
                 return ReverseFillAcquireResult(status="disabled", message="reverse_fill_disabled")
             existing_row = runtime.reserved_row_by_thread.get(key)
             if existing_row is not None:
-                sample = runtime.samples_by_row_number.get(int(existing_row))
+                sample = runtime.get_sample(int(existing_row))
                 if sample is not None:
                     return ReverseFillAcquireResult(status="acquired", sample=sample, message="already_reserved")
                 runtime.reserved_row_by_thread.pop(key, None)
             while runtime.queued_row_numbers:
                 row_number = int(runtime.queued_row_numbers.popleft())
-                sample = runtime.samples_by_row_number.get(row_number)
+                sample = runtime.get_sample(row_number)
                 if sample is None:
                     continue
                 runtime.reserved_row_by_thread[key] = row_number
@@ -87,7 +89,7 @@ class ReverseFillRuntimeMixin:
         requeue: bool = True,
     ) -> Optional[int]:
         key = self._reverse_fill_thread_key(thread_name)
-        with self.lock:
+        with self.reverse_fill_lock:
             runtime = self.reverse_fill_runtime
             if runtime is None:
                 return None
@@ -97,7 +99,7 @@ class ReverseFillRuntimeMixin:
             normalized_row = int(row_number)
             if requeue and normalized_row not in runtime.committed_row_numbers and normalized_row not in runtime.discarded_row_numbers:
                 runtime.queued_row_numbers.appendleft(normalized_row)
-        self.notify_runtime_change()
+        self.notify_runtime_change(RUNTIME_CHANNEL_REVERSE_FILL)
         return normalized_row
 
     def commit_reverse_fill_sample(
@@ -105,7 +107,7 @@ class ReverseFillRuntimeMixin:
         thread_name: Optional[str] = None,
     ) -> Optional[int]:
         key = self._reverse_fill_thread_key(thread_name)
-        with self.lock:
+        with self.reverse_fill_lock:
             runtime = self.reverse_fill_runtime
             if runtime is None:
                 return None
@@ -115,7 +117,8 @@ class ReverseFillRuntimeMixin:
             normalized_row = int(row_number)
             runtime.committed_row_numbers.add(normalized_row)
             runtime.failure_count_by_row.pop(normalized_row, None)
-        self.notify_runtime_change()
+            runtime.release_sample(normalized_row)
+        self.notify_runtime_change(RUNTIME_CHANNEL_REVERSE_FILL)
         return normalized_row
 
     def mark_reverse_fill_submission_failed(
@@ -125,7 +128,7 @@ class ReverseFillRuntimeMixin:
         max_retries: int = 1,
     ) -> Tuple[Optional[int], bool]:
         key = self._reverse_fill_thread_key(thread_name)
-        with self.lock:
+        with self.reverse_fill_lock:
             runtime = self.reverse_fill_runtime
             if runtime is None:
                 return None, False
@@ -137,10 +140,11 @@ class ReverseFillRuntimeMixin:
             runtime.failure_count_by_row[normalized_row] = next_count
             if next_count <= max(0, int(max_retries or 0)):
                 runtime.queued_row_numbers.appendleft(normalized_row)
-                self.notify_runtime_change()
+                self.notify_runtime_change(RUNTIME_CHANNEL_REVERSE_FILL)
                 return normalized_row, False
             runtime.discarded_row_numbers.add(normalized_row)
-        self.notify_runtime_change()
+            runtime.release_sample(normalized_row)
+        self.notify_runtime_change(RUNTIME_CHANNEL_REVERSE_FILL)
         return normalized_row, True
 
     def wait_for_reverse_fill_sample(
@@ -156,7 +160,11 @@ class ReverseFillRuntimeMixin:
                 return result
             if stop_signal is not None and stop_signal.is_set():
                 return ReverseFillAcquireResult(status="waiting", message="stopped")
-            if self.wait_for_runtime_change(stop_signal=stop_signal, timeout=timeout_seconds):
+            if self.wait_for_runtime_change(
+                channel=RUNTIME_CHANNEL_REVERSE_FILL,
+                stop_signal=stop_signal,
+                timeout=timeout_seconds,
+            ):
                 return ReverseFillAcquireResult(status="waiting", message="stopped")
 
     def get_reverse_fill_answer(
@@ -169,20 +177,20 @@ class ReverseFillRuntimeMixin:
             normalized_question_num = int(question_num)
         except Exception:
             return None
-        with self.lock:
+        with self.reverse_fill_lock:
             runtime = self.reverse_fill_runtime
             if runtime is None:
                 return None
             row_number = runtime.reserved_row_by_thread.get(key)
             if row_number is None:
                 return None
-            sample = runtime.samples_by_row_number.get(int(row_number))
+            sample = runtime.get_sample(int(row_number))
             if sample is None:
                 return None
             return (sample.answers or {}).get(normalized_question_num)
 
     def is_reverse_fill_target_unreachable(self: "_ReverseFillRuntimeHost") -> bool:
-        with self.lock:
+        with self.reverse_fill_lock:
             runtime = self.reverse_fill_runtime
             if runtime is None:
                 return False
@@ -0,0 +1,152 @@
+"""ExecutionState 的分通道运行态通知。
+
+每个子系统（线程进度、比例统计与联合样本、代理、反填）各有一把锁和一个变更通道：
+等待方只订阅自己关心的通道，不会被无关子系统的变更唤醒；``RUNTIME_CHANNEL_ALL``
+汇总所有通道，供状态监控这类需要全量刷新的订阅方使用。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Dict, Optional, Protocol
+
+from software.core.engine.stop_signal import StopSignalLike
+
+RUNTIME_CHANNEL_ALL = "all"
+RUNTIME_CHANNEL_PROGRESS = "progress"
+RUNTIME_CHANNEL_DISTRIBUTION = "distribution"
+RUNTIME_CHANNEL_PROXY = "proxy"
+RUNTIME_CHANNEL_REVERSE_FILL = "reverse_fill"
+
+RUNTIME_CHANNELS = (
+    RUNTIME_CHANNEL_PROGRESS,
+    RUNTIME_CHANNEL_DISTRIBUTION,
+    RUNTIME_CHANNEL_PROXY,
+    RUNTIME_CHANNEL_REVERSE_FILL,
+)
+
+
+class RuntimeChangeChannel:
+    """一个变更通道：递增序号 + 条件变量 + 绑定到事件循环的 ``asyncio.Event``。"""
+
+    __slots__ = ("name", "_condition", "_seq", "_async_event", "_async_event_loop")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._condition = threading.Condition()
+        self._seq = 0
+        self._async_event: Optional[asyncio.Event] = None
+        self._async_event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def notify(self) -> None:
+        with self._condition:
+            self._seq += 1
+            self._condition.notify_all()
+        event = self._async_event
+        loop = self._async_event_loop
+        if event is not None and loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass
+
+    def sequence(self) -> int:
+        with self._condition:
+            return int(self._seq)
+
+    def wait(
+        self,
+        *,
+        stop_signal: Optional[StopSignalLike] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        if stop_signal is not None and stop_signal.is_set():
+            return True
+        wait_timeout = None if timeout is None else max(0.0, float(timeout))
+        with self._condition:
+            self._condition.wait(timeout=wait_timeout)
+        return bool(stop_signal is not None and stop_signal.is_set())
+
+    def _ensure_async_event(self) -> asyncio.Event:
+        loop = asyncio.get_running_loop()
+        event = self._async_event
+        if event is None or self._async_event_loop is not loop:
+            event = asyncio.Event()
+            self._async_event = event
+            self._async_event_loop = loop
+        return event
+
+    async def wait_async(
+        self,
+        *,
+        stop_signal: Optional[StopSignalLike] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        if stop_signal is not None and stop_signal.is_set():
+            return True
+        wait_timeout = None if timeout is None else max(0.0, float(timeout))
+        observed_seq = self.sequence()
+        event = self._ensure_async_event()
+        while True:
+            if stop_signal is not None and stop_signal.is_set():
+                return True
+            if self.sequence() != observed_seq:
+                return False
+            event.clear()
+            if self.sequence() != observed_seq:
+                return False
+            try:
+                if wait_timeout is None:
+                    await event.wait()
+                else:
+                    await asyncio.wait_for(event.wait(), timeout=wait_timeout)
+            except asyncio.TimeoutError:
+                return bool(stop_signal is not None and stop_signal.is_set())
+
+
+def create_runtime_channels() -> Dict[str, RuntimeChangeChannel]:
+    return {name: RuntimeChangeChannel(name) for name in (RUNTIME_CHANNEL_ALL, *RUNTIME_CHANNELS)}
+
+
+if TYPE_CHECKING:
+    class _RuntimeChangeHost(Protocol):
+        _runtime_channels: Dict[str, RuntimeChangeChannel]
+
+        def _runtime_channel(self, channel: Optional[str]) -> RuntimeChangeChannel: ...
+
+
+class RuntimeChangeMixin:
+    def _runtime_channel(self: "_RuntimeChangeHost", channel: Optional[str]) -> RuntimeChangeChannel:
+        return self._runtime_channels[channel or RUNTIME_CHANNEL_ALL]
+
+    def notify_runtime_change(self: "_RuntimeChangeHost", channel: Optional[str] = None) -> None:
+        """通知某个子系统有变更；不指定通道时（如终止、暂停）广播给所有通道。"""
+        channels = self._runtime_channels
+        if channel is None or channel == RUNTIME_CHANNEL_ALL:
+            for name in RUNTIME_CHANNELS:
+                channels[name].notify()
+        else:
+            channels[channel].notify()
+        channels[RUNTIME_CHANNEL_ALL].notify()
+
+    def wait_for_runtime_change(
+        self: "_RuntimeChangeHost",
+        *,
+        channel: Optional[str] = None,
+        stop_signal: Optional[StopSignalLike] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        return self._runtime_channel(channel).wait(stop_signal=stop_signal, timeout=timeout)
+
+    async def wait_for_runtime_change_async(
+        self: "_RuntimeChangeHost",
+        *,
+        channel: Optional[str] = None,
+        stop_signal: Optional[StopSignalLike] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        return await self._runtime_channel(channel).wait_async(stop_signal=stop_signal, timeout=timeout)
+
+    def _runtime_change_sequence(self: "_RuntimeChangeHost", channel: Optional[str] = None) -> int:
+        return self._runtime_channel(channel).sequence()
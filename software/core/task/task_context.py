@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import random
 import threading
 from collections import deque
 from dataclasses import dataclass, field
 from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 
 from software.core.reverse_fill import ReverseFillRuntimeState, ReverseFillSpec
-from software.core.task.distribution_state import DistributionRuntimeMixin
-from software.core.task.progress_state import ThreadProgressMixin, ThreadProgressState
+from software.core.task.distribution_state import DistributionCounterTable, DistributionRuntimeMixin
+from software.core.task.progress_state import ThreadProgressMixin, ThreadProgressTable
 from software.core.task.proxy_state import ProxyLease, ProxyRuntimeMixin
+from software.core.task.random_context import RunRandomContext, create_run_random_context
 from software.core.task.reverse_fill_state import ReverseFillRuntimeMixin
+from software.core.task.runtime_channels import RuntimeChangeChannel, RuntimeChangeMixin, create_runtime_channels
 from software.providers.contracts import SurveyQuestionMeta
 
 
@@ -56,6 +59,14 @@ class ExecutionConfig:
     joint_psychometric_answer_plan: Optional[Any] = None
 
     psycho_target_alpha: float = 0.85
+    # >0 时联合信效度按维度独立播种；>1 时各维度分发到进程池并行求解
+    psycho_parallel_workers: int = 0
+    # 运行级随机种子；为 None 时沿用全局随机数，设置后同配置同种子可复现答案计划
+    random_seed: Optional[int] = None
+    # >0 时 AI 填空题按题批量预取这么多个答案（不带单份画像上下文）；0 表示逐份实时生成
+    ai_answer_pool_size: int = 0
+    # 任务启动时解析好的 AI 配置快照（AIRuntimeSettings），AI 调用随配置读取；运行中只通过显式 reload 替换
+    ai_runtime_settings: Optional[Any] = None
 
     num_threads: int = 1
     target_num: int = 1
@@ -78,12 +89,21 @@ class ExecutionConfig:
 
 @dataclass
 class ExecutionState(
+    RuntimeChangeMixin,
     ThreadProgressMixin,
     ProxyRuntimeMixin,
     DistributionRuntimeMixin,
     ReverseFillRuntimeMixin,
 ):
-    """一次任务运行中的动态状态。"""
+    """一次任务运行中的动态状态。
+
+    锁按子系统拆分：``lock`` 只保护提交计数、失败计数与随机流序号，
+    线程进度、比例统计/联合样本、代理、反填各用自己的锁，并在各自的通道上发变更通知。
+    需要同时持有多把锁时必须按以下顺序获取，避免死锁：
+    ``lock`` → ``reverse_fill_lock`` → ``distribution_lock`` → ``proxy_lock`` → ``progress_lock``。
+    通道内部的条件变量是叶子锁，持有任意子系统锁时都可以发通知。
+    跨子系统只读单个整数（如代理预取读 ``cur_num``）时不加对方的锁。
+    """
 
     config: ExecutionConfig = field(default_factory=ExecutionConfig)
 
@@ -94,22 +114,30 @@ class ExecutionState(
     terminal_stop_category: str = ""
     terminal_failure_reason: str = ""
     terminal_stop_message: str = ""
-    thread_progress: Dict[str, ThreadProgressState] = field(default_factory=dict)
-    distribution_runtime_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
-    distribution_pending_by_thread: Dict[str, List[Tuple[str, int, int]]] = field(default_factory=dict)
+    thread_progress: ThreadProgressTable = field(default_factory=ThreadProgressTable)
+    distribution_counters: DistributionCounterTable = field(default_factory=DistributionCounterTable)
+    distribution_pending_by_thread: Dict[str, List[Tuple[int, int, int]]] = field(default_factory=dict)
     joint_reserved_sample_by_thread: Dict[str, int] = field(default_factory=dict)
     joint_reserved_sample_started_at_by_thread: Dict[str, float] = field(default_factory=dict)
     joint_committed_sample_indexes: set[int] = field(default_factory=set)
     joint_answering_threads: set[str] = field(default_factory=set)
+    joint_free_sample_heap: List[int] = field(default_factory=list)
+    joint_free_sample_watermark: int = 0
 
     proxy_waiting_threads: int = 0
     proxy_in_use_by_thread: Dict[str, ProxyLease] = field(default_factory=dict)
     successful_proxy_addresses: set[str] = field(default_factory=set)
     proxy_cooldown_until_by_address: Dict[str, float] = field(default_factory=dict)
     reverse_fill_runtime: Optional[ReverseFillRuntimeState] = None
+    random_context: Optional[RunRandomContext] = None
+    random_stream_draws: Dict[Tuple[str, Any], int] = field(default_factory=dict)
 
     stop_event: threading.Event = field(default_factory=threading.Event)
     lock: threading.Lock = field(default_factory=threading.Lock)
+    progress_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    distribution_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    proxy_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    reverse_fill_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
     _aliyun_captcha_stop_triggered: bool = False
     _aliyun_captcha_stop_lock: threading.Lock = field(default_factory=threading.Lock)
@@ -117,10 +145,11 @@ class ExecutionState(
     _target_reached_stop_triggered: bool = False
     _target_reached_stop_lock: threading.Lock = field(default_factory=threading.Lock)
     _terminal_stop_lock: threading.Lock = field(default_factory=threading.Lock)
-    _runtime_condition: threading.Condition = field(default_factory=threading.Condition, repr=False)
-    _runtime_async_event: Any = field(default=None, init=False, repr=False)
-    _runtime_async_event_loop: Any = field(default=None, init=False, repr=False)
-    _runtime_change_seq: int = field(default=0, init=False, repr=False)
+    _runtime_channels: Dict[str, RuntimeChangeChannel] = field(
+        default_factory=create_runtime_channels,
+        init=False,
+        repr=False,
+    )
 
     def __setattr__(self, name: str, value: Any) -> None:
         """阻止把静态配置字段误写到运行态对象本身。"""
@@ -152,6 +181,35 @@ class ExecutionState(
             self.terminal_stop_message = normalized_message
         self.notify_runtime_change()
 
+    def ensure_random_context(self) -> Optional[RunRandomContext]:
+        """按 config.random_seed 懒建运行级随机上下文；未配置种子时返回 None。"""
+        if self.random_context is None:
+            self.random_context = create_run_random_context(self.config.random_seed)
+        return self.random_context
+
+    def next_attempt_random_stream(
+        self,
+        thread_name: str,
+        sample_index: Optional[int] = None,
+    ) -> Optional[random.Random]:
+        """为一次作答分配子随机流：有联合样本槽位时按样本派生，否则按槽位派生。
+
+        同一个样本/槽位每取一次序号加一，失败重试不会复用上一轮的随机序列。
+        """
+        context = self.ensure_random_context()
+        if context is None:
+            return None
+        if sample_index is not None:
+            key: Tuple[str, Any] = ("sample", int(sample_index))
+        else:
+            key = ("slot", str(thread_name or ""))
+        with self.lock:
+            attempt = self.random_stream_draws.get(key, 0)
+            self.random_stream_draws[key] = attempt + 1
+        if sample_index is not None:
+            return context.sample_stream(int(sample_index), attempt)
+        return context.slot_stream(str(thread_name or ""), attempt)
+
     def get_terminal_stop_snapshot(self) -> Tuple[str, str, str]:
         with self._terminal_stop_lock:
             return (
@@ -8,13 +8,13 @@ from typing import List, Optional, Union
 
 from software.integrations.ai.free_api import FreeAITimeoutError, call_free_ai_api_async
 from software.integrations.ai.protocols import (
-    _CHAT_COMPLETIONS_SUFFIX,
-    _RESPONSES_SUFFIX,
     acall_chat_completions,
     acall_responses_api,
     _is_endpoint_mismatch_error,
-    _normalize_endpoint_url,
-    _resolve_custom_endpoint,
+)
+from software.integrations.ai.runtime_settings import (
+    AIRuntimeSettings,
+    build_ai_runtime_settings,
 )
 from software.integrations.ai.settings import (
     AI_MODE_FREE,
@@ -26,7 +26,6 @@ from software.integrations.ai.settings import (
     FREE_QUESTION_TYPE_FILL,
     FREE_QUESTION_TYPE_MULTI,
     _normalize_ai_mode,
-    _normalize_custom_api_protocol,
     _normalize_free_question_type,
     get_ai_readiness_error,
     get_ai_settings,
@@ -45,8 +44,10 @@ __all__ = [
     "DEFAULT_SYSTEM_PROMPT_PROVIDER",
     "FREE_QUESTION_TYPE_FILL",
     "FREE_QUESTION_TYPE_MULTI",
+    "AIRuntimeSettings",
     "FreeAITimeoutError",
     "agenerate_answer",
+    "build_ai_runtime_settings",
     "get_ai_readiness_error",
     "get_ai_settings",
     "get_default_system_prompt",
@@ -60,19 +61,21 @@ async def agenerate_answer(
     *,
     question_type: str = FREE_QUESTION_TYPE_FILL,
     blank_count: Optional[int] = None,
+    runtime_settings: Optional[AIRuntimeSettings] = None,
 ) -> Union[str, List[str]]:
-    """根据问题标题异步生成答案。"""
-    config = get_ai_settings()
-    readiness_error = get_ai_readiness_error(config)
-    if readiness_error:
-        raise RuntimeError(f"AI 配置不完整：{readiness_error}")
+    """根据问题标题异步生成答案。
+
+    运行中传入 ``ExecutionConfig.ai_runtime_settings`` 快照；不传时（如设置页测试连接）按当前设置现场解析。
+    """
+    snapshot = runtime_settings or build_ai_runtime_settings()
+    if snapshot.readiness_error:
+        raise RuntimeError(f"AI 配置不完整：{snapshot.readiness_error}")
 
     resolved_question_type = _normalize_free_question_type(question_type)
     resolved_blank_count = int(blank_count or 0) if blank_count is not None else None
-    ai_mode = _normalize_ai_mode(config.get("ai_mode"))
-    system_prompt = str(config.get("system_prompt") or "").strip() or get_default_system_prompt(ai_mode)
+    system_prompt = snapshot.system_prompt
 
-    if ai_mode == AI_MODE_FREE:
+    if snapshot.is_free:
         answers = await call_free_ai_api_async(
             question=question_title,
             question_type=resolved_question_type,
@@ -83,38 +86,26 @@ async def agenerate_answer(
             return answers[0]
         return answers
 
-    api_key = str(config.get("api_key") or "")
-    if not api_key:
+    if not snapshot.api_key:
         raise RuntimeError("请先配置 API Key")
+    if snapshot.endpoint_error:
+        raise RuntimeError(snapshot.endpoint_error)
 
-    provider = str(config.get("provider") or "deepseek")
-    if provider == "custom":
-        base_url = str(config.get("base_url") or "")
-        api_protocol = _normalize_custom_api_protocol(config.get("api_protocol"))
-        model = str(config.get("model") or "")
-        if not base_url:
-            raise RuntimeError("自定义模式需要配置 Base URL")
-        if not model:
-            raise RuntimeError("自定义模式需要配置模型名称")
-        resolved_protocol, request_url, has_explicit_endpoint = _resolve_custom_endpoint(base_url, api_protocol)
-        if resolved_protocol == "responses":
-            return await acall_responses_api(request_url, api_key, model, question_title, system_prompt)
-        try:
-            return await acall_chat_completions(request_url, api_key, model, question_title, system_prompt)
-        except Exception as exc:
-            if has_explicit_endpoint or api_protocol != "auto" or not _is_endpoint_mismatch_error(exc):
-                raise
-            fallback_url = f"{_normalize_endpoint_url(base_url)}{_RESPONSES_SUFFIX}"
-            return await acall_responses_api(fallback_url, api_key, model, question_title, system_prompt)
-
-    provider_config = AI_PROVIDERS.get(provider)
-    if not provider_config:
-        raise RuntimeError(f"不支持的 AI 服务提供商: {provider}")
-    base_url = provider_config["base_url"]
-    model = str(config.get("model") or provider_config["default_model"])
-
-    request_url = f"{_normalize_endpoint_url(base_url)}{_CHAT_COMPLETIONS_SUFFIX}"
-    return await acall_chat_completions(request_url, api_key, model, question_title, system_prompt)
+    headers = dict(snapshot.headers)
+    if snapshot.protocol == "responses":
+        return await acall_responses_api(
+            snapshot.request_url, snapshot.api_key, snapshot.model, question_title, system_prompt, headers=headers
+        )
+    try:
+        return await acall_chat_completions(
+            snapshot.request_url, snapshot.api_key, snapshot.model, question_title, system_prompt, headers=headers
+        )
+    except Exception as exc:
+        if not snapshot.fallback_url or not _is_endpoint_mismatch_error(exc):
+            raise
+        return await acall_responses_api(
+            snapshot.fallback_url, snapshot.api_key, snapshot.model, question_title, system_prompt, headers=headers
+        )
 
 
 async def atest_connection() -> str:
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import logging
 import asyncio
-from typing import Any, Awaitable, Callable, Dict, Iterable, TypeVar
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, TypeVar
 from urllib.parse import urlsplit, urlunsplit
 
 import software.network.http as http_client
@@ -200,11 +200,13 @@ async def acall_chat_completions(
     question: str,
     system_prompt: str,
     timeout: int = _AI_REQUEST_TIMEOUT_SECONDS,
+    headers: Optional[Dict[str, str]] = None,
 ) -> str:
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}",
-    }
+    if headers is None:
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}",
+        }
     payload = {
         "model": model,
         "messages": [
@@ -232,11 +234,13 @@ async def acall_responses_api(
     question: str,
     system_prompt: str,
     timeout: int = _AI_REQUEST_TIMEOUT_SECONDS,
+    headers: Optional[Dict[str, str]] = None,
 ) -> str:
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}",
-    }
+    if headers is None:
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}",
+        }
     payload = {
         "model": model,
         "instructions": system_prompt,
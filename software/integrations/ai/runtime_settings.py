@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""运行级 AI 配置快照。
+
+``get_ai_settings()`` 每次都会拷贝并重新归一化配置字典，readiness 也要重新校验；
+任务启动时把这些一次性解析成不可变快照（含请求地址与请求头），挂在 ``ExecutionConfig.ai_runtime_settings``
+上随配置传给各 slot；运行中修改设置不会隐式生效，需要显式调用 ``reload_ai_runtime_settings()``。
+HTTP 连接由 ``software.network.http`` 按事件循环复用同一个 AsyncClient。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from software.integrations.ai.protocols import (
+    _CHAT_COMPLETIONS_SUFFIX,
+    _RESPONSES_SUFFIX,
+    _normalize_endpoint_url,
+    _resolve_custom_endpoint,
+)
+from software.integrations.ai.settings import (
+    AI_MODE_FREE,
+    AI_PROVIDERS,
+    _normalize_ai_mode,
+    _normalize_custom_api_protocol,
+    get_ai_readiness_error,
+    get_ai_settings,
+    get_default_system_prompt,
+)
+
+__all__ = [
+    "AIRuntimeSettings",
+    "build_ai_runtime_settings",
+    "reload_ai_runtime_settings",
+]
+
+
+@dataclass(frozen=True)
+class AIRuntimeSettings:
+    """一次运行内固定的 AI 调用参数。"""
+
+    ai_mode: str
+    provider: str
+    model: str
+    system_prompt: str
+    readiness_error: str = ""
+    # "chat_completions" / "responses"；免费模式或配置不完整时为空
+    protocol: str = ""
+    request_url: str = ""
+    # 自定义 auto 协议下 chat 端点不匹配时回退的 responses 地址
+    fallback_url: str = ""
+    api_key: str = field(default="", repr=False)
+    headers: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}), repr=False)
+    endpoint_error: str = ""
+
+    @property
+    def is_free(self) -> bool:
+        return self.ai_mode == AI_MODE_FREE
+
+
+def build_ai_runtime_settings(config: Optional[Dict[str, Any]] = None) -> AIRuntimeSettings:
+    """把当前 AI 设置解析成快照；不传 config 时读取设置存储。"""
+    settings = get_ai_settings() if config is None else dict(config)
+    ai_mode = _normalize_ai_mode(settings.get("ai_mode"))
+    system_prompt = str(settings.get("system_prompt") or "").strip() or get_default_system_prompt(ai_mode)
+    provider = str(settings.get("provider") or "deepseek")
+    readiness_error = get_ai_readiness_error(settings)
+    if ai_mode == AI_MODE_FREE or readiness_error:
+        return AIRuntimeSettings(
+            ai_mode=ai_mode,
+            provider=provider,
+            model=str(settings.get("model") or ""),
+            system_prompt=system_prompt,
+            readiness_error=readiness_error,
+        )
+
+    api_key = str(settings.get("api_key") or "")
+    headers = MappingProxyType({
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}",
+    })
+    if provider == "custom":
+        base_url = str(settings.get("base_url") or "")
+        api_protocol = _normalize_custom_api_protocol(settings.get("api_protocol"))
+        model = str(settings.get("model") or "")
+        try:
+            protocol, request_url, has_explicit_endpoint = _resolve_custom_endpoint(base_url, api_protocol)
+        except RuntimeError as exc:
+            # 与逐次解析时一致：端点错误在真正调用时再抛出
+            return AIRuntimeSettings(
+                ai_mode=ai_mode,
+                provider=provider,
+                model=model,
+                system_prompt=system_prompt,
+                api_key=api_key,
+                headers=headers,
+                endpoint_error=str(exc),
+            )
+        fallback_url = ""
+        if protocol == "chat_completions" and not has_explicit_endpoint and api_protocol == "auto":
+            fallback_url = f"{_normalize_endpoint_url(base_url)}{_RESPONSES_SUFFIX}"
+        return AIRuntimeSettings(
+            ai_mode=ai_mode,
+            provider=provider,
+            model=model,
+            system_prompt=system_prompt,
+            protocol=protocol,
+            request_url=request_url,
+            fallback_url=fallback_url,
+            api_key=api_key,
+            headers=headers,
+        )
+
+    provider_config = AI_PROVIDERS[provider]
+    return AIRuntimeSettings(
+        ai_mode=ai_mode,
+        provider=provider,
+        model=str(settings.get("model") or provider_config["default_model"]),
+        system_prompt=system_prompt,
+        protocol="chat_completions",
+        request_url=f"{_normalize_endpoint_url(provider_config['base_url'])}{_CHAT_COMPLETIONS_SUFFIX}",
+        api_key=api_key,
+        headers=headers,
+    )
+
+
+def reload_ai_runtime_settings(config: Any) -> AIRuntimeSettings:
+    """运行中显式刷新：按当前设置重建快照并替换 ``config.ai_runtime_settings``，返回新快照。"""
+    snapshot = build_ai_runtime_settings()
+    config.ai_runtime_settings = snapshot
+    return snapshot
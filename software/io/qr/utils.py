@@ -5,8 +5,6 @@ from typing import Optional
 
 from PySide6.QtGui import QImage
 
-import zxingcpp
-
 
 def _load_qimage(image_path: str) -> QImage:
     """从文件路径读取 QImage。"""
@@ -35,6 +33,9 @@ def decode_qrcode(image_source: object) -> Optional[str]:
         >>> url = decode_qrcode("qrcode.png")
     """
     try:
+        # zxing-cpp 原生库加载较慢，只在真正解码时才导入
+        import zxingcpp
+
         if isinstance(image_source, str):
             image = _load_qimage(image_source)
         elif isinstance(image_source, QImage):
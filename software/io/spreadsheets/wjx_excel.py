@@ -6,18 +6,20 @@ import os
 import re
 from typing import Any, Dict, Iterable, List
 
+from software.core.reverse_fill.columns import ReverseFillColumnStore, ReverseFillRawRowView
 from software.core.reverse_fill.schema import (
     REVERSE_FILL_FORMAT_AUTO,
     REVERSE_FILL_FORMAT_WJX_SCORE,
     REVERSE_FILL_FORMAT_WJX_SEQUENCE,
     REVERSE_FILL_FORMAT_WJX_TEXT,
     ReverseFillColumn,
-    ReverseFillRawRow,
     WjxExcelExport,
 )
 
 _QUESTION_HEADER_RE = re.compile(r"^\s*(\d+)\s*[、,.，．]\s*(.*?)\s*$")
 _SEQUENCE_SUFFIX_RE = re.compile(r"^\(\s*选项\s*\d+\s*\)$")
+# 格式识别只看前几行样本，不需要等整张表读完
+_FORMAT_DETECTION_SAMPLE_ROWS = 5
 
 
 def _cell_text(value: Any) -> str:
@@ -27,23 +29,14 @@ def _cell_text(value: Any) -> str:
     return text
 
 
-def _iter_question_values(raw_rows: Iterable[ReverseFillRawRow], question_columns: Dict[int, List[ReverseFillColumn]]) -> Iterable[Any]:
-    column_indexes: List[int] = []
-    for columns in question_columns.values():
-        for column in columns:
-            column_indexes.append(int(column.column_index))
-    seen = set(column_indexes)
-    if not seen:
-        return []
-    collected: List[Any] = []
-    for row in raw_rows:
-        values_by_column = row.values_by_column if isinstance(row.values_by_column, dict) else {}
-        for column_index in column_indexes:
-            collected.append(values_by_column.get(column_index))
-    return collected
-
-
-def _detect_wjx_export_format(question_columns: Dict[int, List[ReverseFillColumn]], raw_rows: List[ReverseFillRawRow]) -> str:
+def _iter_question_values(store: ReverseFillColumnStore, *, limit: int) -> Iterable[Any]:
+    if not store.column_indexes:
+        return
+    for values in store.iter_rows(store.column_indexes, 0, limit):
+        yield from values
+
+
+def _detect_wjx_export_format(question_columns: Dict[int, List[ReverseFillColumn]], store: ReverseFillColumnStore) -> str:
     for columns in question_columns.values():
         if len(columns) <= 1:
             continue
@@ -53,7 +46,7 @@ def _detect_wjx_export_format(question_columns: Dict[int, List[ReverseFillColumn
     has_numeric_type = False
     has_numeric_string = False
     has_string_marker = False
-    for value in _iter_question_values(raw_rows[:5], question_columns):
+    for value in _iter_question_values(store, limit=_FORMAT_DETECTION_SAMPLE_ROWS):
         if value is None:
             continue
         if isinstance(value, bool):
@@ -92,23 +85,19 @@ def load_wjx_excel_export(source_path: str, *, preferred_format: str = REVERSE_F
         if not workbook.sheetnames:
             raise ValueError("Excel 中没有可读取的工作表")
         worksheet = workbook[workbook.sheetnames[0]]
-        rows_iter = worksheet.iter_rows(values_only=False)
-        header_cells = next(rows_iter, None)
-        if not header_cells:
+        rows_iter = worksheet.iter_rows(values_only=True)
+        header_values = next(rows_iter, None)
+        if not header_values:
             raise ValueError("Excel 缺少表头，无法识别问卷列")
 
         question_columns: Dict[int, List[ReverseFillColumn]] = {}
-        for cell in list(header_cells):
-            header = _cell_text(cell.value)
+        for column_index, raw_header in enumerate(header_values, start=1):
+            header = _cell_text(raw_header)
             match = _QUESTION_HEADER_RE.match(header)
             if not match:
                 continue
             question_num = int(match.group(1))
             suffix = str(match.group(2) or "").strip()
-            raw_column = cell.column
-            if raw_column is None:
-                continue
-            column_index = int(raw_column)
             question_columns.setdefault(question_num, []).append(
                 ReverseFillColumn(
                     column_index=column_index,
@@ -118,23 +107,16 @@ def load_wjx_excel_export(source_path: str, *, preferred_format: str = REVERSE_F
                 )
             )
 
-        raw_rows: List[ReverseFillRawRow] = []
-        for data_row_number, row_cells in enumerate(rows_iter, start=1):
-            values_by_column: Dict[int, Any] = {}
-            for column_list in question_columns.values():
-                for column in column_list:
-                    position = int(column.column_index) - 1
-                    raw_value = row_cells[position].value if position < len(row_cells) else None
-                    values_by_column[int(column.column_index)] = raw_value
-            raw_rows.append(
-                ReverseFillRawRow(
-                    data_row_number=data_row_number,
-                    worksheet_row_number=data_row_number + 1,
-                    values_by_column=values_by_column,
-                )
-            )
+        # 只保留题目列：按列位置从每行元组里取值，直接写入列存
+        store = ReverseFillColumnStore(
+            column.column_index for columns in question_columns.values() for column in columns
+        )
+        positions = [column_index - 1 for column_index in store.column_indexes]
+        for row_values in rows_iter:
+            width = len(row_values)
+            store.append_row([row_values[position] if position < width else None for position in positions])
 
-        detected_format = _detect_wjx_export_format(question_columns, raw_rows)
+        detected_format = _detect_wjx_export_format(question_columns, store)
         selected_format = str(preferred_format or REVERSE_FILL_FORMAT_AUTO).strip().lower()
         if selected_format == REVERSE_FILL_FORMAT_AUTO:
             selected_format = detected_format
@@ -143,9 +125,10 @@ def load_wjx_excel_export(source_path: str, *, preferred_format: str = REVERSE_F
             detected_format=detected_format,
             selected_format=selected_format,
             header_row_number=1,
-            total_data_rows=len(raw_rows),
+            total_data_rows=store.row_count,
             question_columns=question_columns,
-            raw_rows=raw_rows,
+            raw_rows=ReverseFillRawRowView(store, header_row_number=1),
+            column_store=store,
         )
     finally:
         workbook.close()
@@ -9,8 +9,9 @@ import sys
 import threading
 import traceback
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from typing import Any, Callable, Deque, List, Optional
 
 from software.app.config import LOG_BUFFER_CAPACITY, LOG_FORMAT
@@ -181,6 +182,20 @@ class StreamToLogger:
 class LogBufferEntry:
     text: str
     category: str
+    # 缓冲区内单调递增的序号，从 1 开始；0 表示不是来自缓冲区的条目
+    seq: int = 0
+
+
+@dataclass
+class LogBufferSlice:
+    """``get_records_since`` 的结果。
+
+    ``truncated`` 为 True 表示游标之后有日志已被环形缓冲挤掉，调用方应整体重建。
+    """
+
+    entries: List[LogBufferEntry] = field(default_factory=list)
+    last_seq: int = 0
+    truncated: bool = False
 
 
 class LogBufferHandler(logging.Handler):
@@ -206,6 +221,8 @@ class LogBufferHandler(logging.Handler):
         # 处理后的日志记录（只在后台线程中修改）
         self._records: Deque[LogBufferEntry] = deque(maxlen=capacity if capacity else None)
         self._records_lock = threading.RLock()
+        # 最近一条入缓冲日志的序号，读取方据此增量拉取
+        self._last_seq = 0
 
         # 版本号：每次 _records 变化时递增，用于检测变化
         self._version = 0
@@ -293,9 +310,9 @@ class LogBufferHandler(logging.Handler):
             display_text = self._apply_category_label(message, original_level, category)
 
             # 构造日志条目并添加到缓冲区
-            entry = LogBufferEntry(text=display_text, category=category)
             with self._records_lock:
-                self._records.append(entry)
+                self._last_seq += 1
+                self._records.append(LogBufferEntry(text=display_text, category=category, seq=self._last_seq))
 
         except Exception as exc:
             # 处理失败不应影响其他日志
@@ -317,6 +334,25 @@ class LogBufferHandler(logging.Handler):
         with self._records_lock:
             return list(self._records)
 
+    def get_last_seq(self) -> int:
+        with self._records_lock:
+            return self._last_seq
+
+    def get_records_since(self, seq: int) -> LogBufferSlice:
+        """返回序号大于 ``seq`` 的日志，只拷贝新增部分。"""
+        cursor = max(0, int(seq or 0))
+        with self._records_lock:
+            last_seq = self._last_seq
+            if cursor >= last_seq:
+                # 游标超前说明缓冲区被重建过，让调用方从头取
+                return LogBufferSlice(last_seq=last_seq, truncated=cursor > last_seq)
+            missing = last_seq - cursor
+            available = len(self._records)
+            truncated = missing > available
+            newest_first = list(islice(reversed(self._records), min(missing, available)))
+        newest_first.reverse()
+        return LogBufferSlice(entries=newest_first, last_seq=last_seq, truncated=truncated)
+
     def get_version(self) -> int:
         """获取当前版本号（用于检测变化）"""
         with self._version_lock:
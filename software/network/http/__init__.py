@@ -1,30 +1,44 @@
-"""HTTP 客户端导出。"""
-
-from software.network.http.client import (
-    ConnectionError,
-    ConnectTimeout,
-    HTTPError,
-    ProxyError,
-    ReadTimeout,
-    RemoteProtocolError,
-    RequestException,
-    Timeout,
-    TransportError,
-    close,
-    delete,
-    get,
-    post,
-    prewarm,
-    put,
-    request,
-)
-from software.network.http.async_client import (
-    delete as adelete,
-    get as aget,
-    post as apost,
-    put as aput,
-    request as arequest,
-)
+"""HTTP 客户端导出。
+
+httpx 导入链（httpcore / ssl / certifi）较重，这里按需加载：导入本包不会带起 httpx，
+首次访问某个导出名时才导入 ``client`` / ``async_client``。
+
+GUI 启动时 httpx 需要在主线程完成预热，否则首次后台初始化可能触发原生层崩溃。
+启动流程调用 ``defer_prewarm()`` 把预热推迟到首帧之后；预热完成之前首次访问导出名时，
+主线程当场预热，后台线程则等待主线程预热，而不是自己在后台初始化 httpx。
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+if TYPE_CHECKING:
+    from software.network.http.async_client import (
+        delete as adelete,
+        get as aget,
+        post as apost,
+        put as aput,
+        request as arequest,
+    )
+    from software.network.http.client import (
+        ConnectionError,
+        ConnectTimeout,
+        HTTPError,
+        ProxyError,
+        ReadTimeout,
+        RemoteProtocolError,
+        RequestException,
+        Timeout,
+        TransportError,
+        close,
+        delete,
+        get,
+        post,
+        put,
+        request,
+    )
 
 __all__ = [
     "RequestException",
@@ -37,6 +51,7 @@ __all__ = [
     "RemoteProtocolError",
     "HTTPError",
     "close",
+    "defer_prewarm",
     "prewarm",
     "request",
     "arequest",
@@ -50,3 +65,76 @@ __all__ = [
     "adelete",
 ]
 
+_SYNC_MODULE = "software.network.http.client"
+_ASYNC_MODULE = "software.network.http.async_client"
+_LAZY_EXPORTS: Dict[str, Tuple[str, str]] = {
+    **{
+        name: (_SYNC_MODULE, name)
+        for name in (
+            "RequestException",
+            "TransportError",
+            "Timeout",
+            "ConnectTimeout",
+            "ReadTimeout",
+            "ConnectionError",
+            "ProxyError",
+            "RemoteProtocolError",
+            "HTTPError",
+            "close",
+            "request",
+            "get",
+            "post",
+            "put",
+            "delete",
+        )
+    },
+    "arequest": (_ASYNC_MODULE, "request"),
+    "aget": (_ASYNC_MODULE, "get"),
+    "apost": (_ASYNC_MODULE, "post"),
+    "aput": (_ASYNC_MODULE, "put"),
+    "adelete": (_ASYNC_MODULE, "delete"),
+}
+
+# 后台线程等待主线程预热的上限；超时后照常加载，避免预热异常时请求永久卡住
+_PREWARM_WAIT_SECONDS = 15.0
+_prewarm_deferred = False
+_prewarm_done = threading.Event()
+
+
+def defer_prewarm() -> None:
+    """声明主线程稍后会调用 ``prewarm()``；在此之前后台线程的首次访问会等待预热完成。"""
+    global _prewarm_deferred
+    _prewarm_deferred = True
+
+
+def prewarm() -> None:
+    """在主线程预热 httpx/httpcore/ssl 导入链，规避首次后台初始化的原生崩溃。"""
+    try:
+        client = importlib.import_module(_SYNC_MODULE)
+        client.prewarm()
+    finally:
+        _prewarm_done.set()
+
+
+def _await_deferred_prewarm() -> None:
+    if not _prewarm_deferred or _prewarm_done.is_set():
+        return
+    if threading.current_thread() is threading.main_thread():
+        prewarm()
+    else:
+        _prewarm_done.wait(_PREWARM_WAIT_SECONDS)
+
+
+def __getattr__(name: str) -> Any:
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _await_deferred_prewarm()
+    module_name, attr_name = target
+    value = getattr(importlib.import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -7,6 +7,7 @@ import logging
 from software.core.engine.stop_signal import StopSignalLike
 from software.core.engine.runtime_ui_bridge import RuntimeUiBridge
 from software.core.task import ExecutionState, ProxyLease
+from software.core.task.runtime_channels import RUNTIME_CHANNEL_PROXY
 from software.app.config import PROXY_MAX_PROXIES
 from software.network.proxy.pool import coerce_proxy_lease, mask_proxy_for_log
 from software.network.proxy.api import fetch_proxy_batch_async
@@ -153,7 +154,7 @@ def _purge_unusable_proxy_pool_locked(
         logging.info("代理池已清理无效/重复代理 %s 个", removed)
     ctx.config.proxy_ip_pool = kept
     if removed:
-        ctx.notify_runtime_change()
+        ctx.notify_runtime_change(RUNTIME_CHANNEL_PROXY)
     return seen
 
 
@@ -225,7 +226,7 @@ def _merge_fetched_proxy_leases_locked(
         changed = True
 
     if changed or selected is not None:
-        ctx.notify_runtime_change()
+        ctx.notify_runtime_change(RUNTIME_CHANNEL_PROXY)
     return selected
 
 
@@ -233,12 +234,12 @@ def merge_prefetched_proxy_leases(ctx: ExecutionState, fetched: Iterable[object]
     """把后台预热到的代理并入运行池，返回实际入池数量。"""
     if not fetched:
         return 0
-    with ctx.lock:
+    with ctx.proxy_lock:
         before = len(_ensure_proxy_pool_deque_locked(ctx))
         _merge_fetched_proxy_leases_locked(ctx, fetched, select_first=False)
         merged_count = max(0, len(_ensure_proxy_pool_deque_locked(ctx)) - before)
     if merged_count:
-        ctx.notify_runtime_change()
+        ctx.notify_runtime_change(RUNTIME_CHANNEL_PROXY)
     return merged_count
 
 
@@ -272,7 +273,7 @@ def resolve_proxy_prefetch_request_count(ctx: ExecutionState) -> int:
     """计算后台预取还需要补多少代理。"""
     if not bool(getattr(ctx.config, "random_proxy_ip_enabled", False)):
         return 0
-    with ctx.lock:
+    with ctx.proxy_lock:
         active_count = len(ctx.proxy_in_use_by_thread)
         remaining_to_start = max(0, int(ctx.config.target_num or 0) - int(ctx.cur_num or 0) - active_count)
         if remaining_to_start <= 0:
@@ -293,7 +294,7 @@ def should_continue_proxy_prefetch(ctx: ExecutionState) -> bool:
         return False
     if _should_stop_proxy_wait(ctx, getattr(ctx, "stop_event", None)):
         return False
-    with ctx.lock:
+    with ctx.proxy_lock:
         active_count = len(ctx.proxy_in_use_by_thread)
         remaining_to_start = max(0, int(ctx.config.target_num or 0) - int(ctx.cur_num or 0) - active_count)
     return remaining_to_start > 0
@@ -314,7 +315,7 @@ def _wait_for_next_proxy_cycle(
     *,
     timeout: float = _PROXY_WAIT_POLL_SECONDS,
 ) -> bool:
-    return ctx.wait_for_runtime_change(stop_signal=stop_signal, timeout=timeout)
+    return ctx.wait_for_runtime_change(channel=RUNTIME_CHANNEL_PROXY, stop_signal=stop_signal, timeout=timeout)
 
 
 async def _wait_for_next_proxy_cycle_async(
@@ -324,6 +325,7 @@ async def _wait_for_next_proxy_cycle_async(
     timeout: float = _PROXY_WAIT_POLL_SECONDS,
 ) -> bool:
     return await ctx.wait_for_runtime_change_async(
+        channel=RUNTIME_CHANNEL_PROXY,
         stop_signal=stop_signal,
         timeout=timeout,
     )
@@ -362,7 +364,7 @@ async def _select_proxy_for_session_async(
     if not ctx.config.random_proxy_ip_enabled:
         return None
     selected: Optional[ProxyLease] = None
-    with ctx.lock:
+    with ctx.proxy_lock:
         selected = _pop_available_proxy_lease_locked(ctx)
     if selected is not None:
         return _mark_proxy_in_use(ctx, thread_name, selected)
@@ -372,7 +374,7 @@ async def _select_proxy_for_session_async(
         while True:
             if _should_stop_proxy_wait(ctx, stop_signal):
                 return None
-            with ctx.lock:
+            with ctx.proxy_lock:
                 selected = _pop_available_proxy_lease_locked(ctx)
             if selected is not None:
                 return _mark_proxy_in_use(ctx, thread_name, selected)
@@ -386,7 +388,7 @@ async def _select_proxy_for_session_async(
             if not fetch_lock_acquired:
                 return None
             try:
-                with ctx.lock:
+                with ctx.proxy_lock:
                     selected = _pop_available_proxy_lease_locked(ctx)
                     if selected is None:
                         request_num = _resolve_proxy_request_num_locked(ctx)
@@ -405,7 +407,7 @@ async def _select_proxy_for_session_async(
                         logging.warning(f"获取随机代理失败：{exc}")
                         fetched = None
                     if fetched:
-                        with ctx.lock:
+                        with ctx.proxy_lock:
                             selected = _merge_fetched_proxy_leases_locked(ctx, fetched, select_first=True)
                         if selected is not None:
                             return _mark_proxy_in_use(ctx, thread_name, selected)
@@ -429,7 +431,7 @@ def _select_user_agent_for_session(ctx: ExecutionState) -> Tuple[Optional[str],
 def _discard_unresponsive_proxy(ctx: ExecutionState, proxy_address: str) -> None:
     if not proxy_address:
         return
-    with ctx.lock:
+    with ctx.proxy_lock:
         removed = False
         normalized = str(proxy_address or "").strip()
         retained = deque()
@@ -446,6 +448,6 @@ def _discard_unresponsive_proxy(ctx: ExecutionState, proxy_address: str) -> None
         ctx.config.proxy_ip_pool = retained
         if removed:
             logging.info(f"已移除无响应代理：{mask_proxy_for_log(proxy_address)}")
-            ctx.notify_runtime_change()
+            ctx.notify_runtime_change(RUNTIME_CHANNEL_PROXY)
 
 
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import math
-import random
 from typing import Any, Optional
 
+from software.core.task.random_context import run_random as random
+
 
 def coerce_positive_int(value: Any, default: int) -> int:
     try:
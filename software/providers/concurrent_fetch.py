@@ -0,0 +1,82 @@
+"""解析阶段的并发请求工具。
+
+provider 解析问卷时常要发几个互不依赖的请求（元信息 + 题目），或者按优先级尝试多个候选
+（语言版本、备用入口）。串行等待时总耗时是各次往返之和；这里把它们同时发出去：
+
+- ``fetch_all``：并发执行一组请求，全部成功才返回；任何一个失败就取消其余请求并抛出该异常。
+- ``race_by_priority``：并发执行候选，按优先级取第一个成功的结果。
+  靠前的候选全部失败、或者已确定胜者时，立即取消剩下的候选。
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+__all__ = [
+    "fetch_all",
+    "race_by_priority",
+]
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+
+async def _cancel_tasks(tasks: Sequence["asyncio.Task[Any]"]) -> None:
+    pending = [task for task in tasks if not task.done()]
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def fetch_all(*requests: Awaitable[Any]) -> Tuple[Any, ...]:
+    """并发执行互不依赖的请求，按传入顺序返回结果。"""
+    tasks = [asyncio.ensure_future(request) for request in requests]
+    try:
+        done, _pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in tasks:
+            if task in done and not task.cancelled():
+                error = task.exception()
+                if error is not None:
+                    raise error
+        return tuple(task.result() for task in tasks)
+    finally:
+        await _cancel_tasks(tasks)
+
+
+async def race_by_priority(
+    candidates: Sequence[Tuple[K, Callable[[], Awaitable[T]]]],
+    *,
+    abort_on: Optional[Callable[[BaseException], bool]] = None,
+) -> Tuple[K, T]:
+    """并发执行候选，返回优先级最高的成功结果 ``(key, result)``。
+
+    ``abort_on`` 判定为真的异常（如需要登录）对所有候选都成立，直接取消其余候选并抛出。
+    全部失败时抛出优先级最低的候选的异常，与逐个尝试时“最后一个错误”一致。
+    """
+    if not candidates:
+        raise ValueError("race_by_priority 至少需要一个候选")
+    keys = [key for key, _factory in candidates]
+    tasks: List["asyncio.Task[T]"] = [asyncio.ensure_future(factory()) for _key, factory in candidates]
+    index_by_task = {task: index for index, task in enumerate(tasks)}
+    try:
+        pending = set(tasks)
+        while True:
+            # 已完成的最高优先级候选：成功即胜出；失败则看下一位是否也已完成
+            for index, task in enumerate(tasks):
+                if not task.done():
+                    break
+                error = task.exception()
+                if error is None:
+                    return keys[index], task.result()
+                if index == len(tasks) - 1:
+                    raise error
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if abort_on is not None:
+                for task in sorted(done, key=index_by_task.__getitem__):
+                    error = task.exception()
+                    if error is not None and abort_on(error):
+                        raise error
+    finally:
+        await _cancel_tasks(tasks)
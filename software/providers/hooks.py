@@ -8,6 +8,7 @@ from importlib import import_module
 from typing import Any, TypeAlias
 
 from software.providers.contracts import SurveyDefinition, build_survey_definition
+from software.providers.survey_cache import begin_survey_revalidation
 
 HookTarget: TypeAlias = tuple[str, str]
 
@@ -19,6 +20,16 @@ def _load_hook(target: HookTarget) -> Any:
     return getattr(module, attr_name)
 
 
+def load_hook(target: HookTarget) -> Any:
+    """按 (模块路径, 属性名) 取出 provider hook，首次调用时才导入对应模块。"""
+    return _load_hook(target)
+
+
+def reset_hook_cache() -> None:
+    """清空已加载的 hook 缓存，下次调用时重新按属性名取，替换过 provider 模块属性后使用。"""
+    _load_hook.cache_clear()
+
+
 async def _invoke(target: HookTarget, *args: Any, **kwargs: Any) -> Any:
     value = _load_hook(target)(*args, **kwargs)
     if not inspect.isawaitable(value):
@@ -28,11 +39,19 @@ async def _invoke(target: HookTarget, *args: Any, **kwargs: Any) -> Any:
 
 def build_parse_hook(provider: str, target: HookTarget):
     async def _parse(url: str) -> SurveyDefinition:
-        value = _load_hook(target)(url)
+        revalidation = begin_survey_revalidation(provider, url)
+        parser = _load_hook(target)
+        value = parser(url) if revalidation is None else parser(url, revalidation=revalidation)
         if not inspect.isawaitable(value):
             raise TypeError(f"解析 hook 必须返回 awaitable: {target[0]}.{target[1]}")
-        info, title = await value
-        return build_survey_definition(provider, title, info)
+        result = await value
+        if isinstance(result, SurveyDefinition):
+            return result
+        info, title = result
+        definition = build_survey_definition(provider, title, info)
+        if revalidation is not None:
+            revalidation.store(definition)
+        return definition
 
     return _parse
 
@@ -0,0 +1,269 @@
+"""问卷结构的本地持久缓存。
+
+同一份问卷一天里会被反复打开，页面或接口载荷没变时解析结果也不会变。
+缓存按 provider + 规范化 URL 建条目，条目里记下原始载荷的指纹：解析入口照常拉取载荷，
+指纹一致就直接还原 ``SurveyDefinition``，跳过整段解析。
+
+条目是 gzip 压缩的紧凑 JSON（题目按字段表存成行数组，不重复写键名）；
+最近一次校验时间记在文件 mtime 上，超过 TTL 未校验的条目作废，条目数超限时按 LRU 淘汰。
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeAlias, Union
+
+from software.app.version import __VERSION__
+from software.providers.contracts import (
+    SurveyDefinition,
+    ensure_survey_question_metas,
+    serialize_survey_question_metas,
+)
+
+__all__ = [
+    "DEFAULT_SURVEY_CACHE_MAX_ENTRIES",
+    "DEFAULT_SURVEY_CACHE_TTL_SECONDS",
+    "SurveyDefinitionCache",
+    "SurveyParseResult",
+    "SurveyRevalidation",
+    "begin_survey_revalidation",
+    "configure_survey_definition_cache",
+    "get_survey_definition_cache",
+    "survey_payload_fingerprint",
+]
+
+DEFAULT_SURVEY_CACHE_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_SURVEY_CACHE_MAX_ENTRIES = 128
+
+_FORMAT_VERSION = 1
+_ENTRY_SUFFIX = ".json.gz"
+
+# 解析 hook 的返回值：常规为 (题目列表, 标题)；缓存命中时直接是还原好的 SurveyDefinition
+SurveyParseResult: TypeAlias = Union[Tuple[List[Dict[str, Any]], str], SurveyDefinition]
+
+
+def survey_payload_fingerprint(payload: Any) -> str:
+    """原始页面文本或接口载荷的内容指纹；结构化载荷按键排序后序列化，与字典顺序无关。"""
+    if isinstance(payload, bytes):
+        data = payload
+    elif isinstance(payload, str):
+        data = payload.encode("utf-8", "surrogatepass")
+    else:
+        data = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode(
+            "utf-8", "surrogatepass"
+        )
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _encode_questions(questions: List[Dict[str, Any]]) -> Tuple[List[str], List[List[Any]]]:
+    fields: List[str] = []
+    for question in questions:
+        for key in question:
+            if key not in fields:
+                fields.append(key)
+    return fields, [[question.get(key) for key in fields] for question in questions]
+
+
+def _decode_questions(fields: List[str], rows: List[List[Any]]) -> List[Dict[str, Any]]:
+    return [dict(zip(fields, row)) for row in rows]
+
+
+class SurveyDefinitionCache:
+    """目录里每份问卷一个条目文件；读写都在一把锁里完成，解析线程之间可以共用。"""
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        ttl_seconds: float = DEFAULT_SURVEY_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_SURVEY_CACHE_MAX_ENTRIES,
+        app_version: str = __VERSION__,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.directory = str(directory)
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        # 解析规则随版本变化，同一份载荷在新版本里可能解析出不同结果，版本号不一致的条目一律作废
+        self.app_version = str(app_version or "")
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def _entry_path(self, provider: str, url: str) -> str:
+        digest = hashlib.blake2b(f"{provider}\n{url}".encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.directory, digest + _ENTRY_SUFFIX)
+
+    @staticmethod
+    def _discard(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def lookup(self, provider: str, url: str, fingerprint: str) -> Optional[SurveyDefinition]:
+        """指纹一致且未过期时还原问卷结构，并刷新条目的校验时间。"""
+        if not fingerprint:
+            return None
+        path = self._entry_path(provider, url)
+        now = float(self._clock())
+        with self._lock:
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                return None
+            if now - mtime > self.ttl_seconds:
+                self._discard(path)
+                return None
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as handle:
+                    entry = json.load(handle)
+            except Exception as exc:
+                logging.debug("问卷缓存条目损坏，已丢弃: %s (%s)", path, exc)
+                self._discard(path)
+                return None
+            if (
+                not isinstance(entry, dict)
+                or entry.get("v") != _FORMAT_VERSION
+                or entry.get("app") != self.app_version
+                or entry.get("provider") != provider
+                or entry.get("url") != url
+            ):
+                self._discard(path)
+                return None
+            if entry.get("fp") != fingerprint:
+                return None
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+        try:
+            questions = _decode_questions(list(entry.get("fields") or []), list(entry.get("rows") or []))
+            return SurveyDefinition(
+                provider=provider,
+                title=str(entry.get("title") or ""),
+                questions=ensure_survey_question_metas(questions, default_provider=provider),
+            )
+        except Exception as exc:
+            logging.debug("问卷缓存条目无法还原: %s (%s)", path, exc)
+            return None
+
+    def store(self, provider: str, url: str, fingerprint: str, definition: SurveyDefinition) -> None:
+        if not fingerprint:
+            return
+        fields, rows = _encode_questions(serialize_survey_question_metas(definition.questions))
+        entry = {
+            "v": _FORMAT_VERSION,
+            "app": self.app_version,
+            "provider": provider,
+            "url": url,
+            "fp": fingerprint,
+            "title": definition.title,
+            "fields": fields,
+            "rows": rows,
+        }
+        try:
+            data = json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError) as exc:
+            logging.debug("问卷结构包含无法序列化的字段，跳过缓存: %s (%s)", url, exc)
+            return
+        path = self._entry_path(provider, url)
+        now = float(self._clock())
+        with self._lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temp_path, "wb") as handle:
+                    handle.write(gzip.compress(data, compresslevel=6, mtime=0))
+                os.replace(temp_path, path)
+                os.utime(path, (now, now))
+            except OSError as exc:
+                logging.debug("写入问卷缓存失败: %s (%s)", path, exc)
+                return
+            self._evict_locked(now)
+
+    def _evict_locked(self, now: float) -> None:
+        entries: List[Tuple[float, str]] = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if not name.endswith(_ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+            if now - mtime > self.ttl_seconds:
+                self._discard(path)
+            else:
+                entries.append((mtime, path))
+        overflow = len(entries) - self.max_entries
+        if overflow > 0:
+            entries.sort()
+            for _mtime, path in entries[:overflow]:
+                self._discard(path)
+
+    def clear(self) -> None:
+        with self._lock:
+            try:
+                names = os.listdir(self.directory)
+            except OSError:
+                return
+            for name in names:
+                if name.endswith(_ENTRY_SUFFIX):
+                    self._discard(os.path.join(self.directory, name))
+
+
+class SurveyRevalidation:
+    """单次解析调用的缓存校验：parser 拿到原始载荷后先比对指纹，命中就跳过解析。"""
+
+    __slots__ = ("cache", "provider", "url", "fingerprint")
+
+    def __init__(self, cache: SurveyDefinitionCache, provider: str, url: str) -> None:
+        self.cache = cache
+        self.provider = provider
+        self.url = url
+        self.fingerprint = ""
+
+    def check(self, payload: Any) -> Optional[SurveyDefinition]:
+        """记录本次载荷的指纹并查缓存；缓存只是加速手段，任何异常都按未命中处理。"""
+        try:
+            self.fingerprint = survey_payload_fingerprint(payload)
+            return self.cache.lookup(self.provider, self.url, self.fingerprint)
+        except Exception as exc:
+            logging.debug("问卷缓存校验失败，按未命中处理: %s (%s)", self.url, exc)
+            self.fingerprint = ""
+            return None
+
+    def store(self, definition: SurveyDefinition) -> None:
+        try:
+            self.cache.store(self.provider, self.url, self.fingerprint, definition)
+        except Exception as exc:
+            logging.debug("写入问卷缓存失败: %s (%s)", self.url, exc)
+
+
+_active_cache: Optional[SurveyDefinitionCache] = None
+
+
+def configure_survey_definition_cache(cache: Optional[SurveyDefinitionCache]) -> None:
+    """由应用启动流程挂上缓存；传 None 关闭缓存（默认即关闭）。"""
+    global _active_cache
+    _active_cache = cache
+
+
+def get_survey_definition_cache() -> Optional[SurveyDefinitionCache]:
+    return _active_cache
+
+
+def begin_survey_revalidation(provider: str, url: str) -> Optional[SurveyRevalidation]:
+    cache = _active_cache
+    if cache is None:
+        return None
+    return SurveyRevalidation(cache, provider, url)
@@ -17,6 +17,7 @@ from software.core.engine.async_engine import AsyncEngineClient
 from software.core.engine.cleanup import CleanupRunner
 from software.core.engine.failure_reason import FailureReason
 from software.core.task import ExecutionState, ProxyLease
+from software.core.task.progress_state import ThreadProgressRowCache
 from software.io.config.store import load_config, save_config
 from software.system.power_management import SystemSleepBlocker
 from software.ui.controller.controller_events import event_payload
@@ -123,6 +124,7 @@ class RunCommandService(RandomIpRuntimeService, RunControllerInitializationMixin
         self._init_gate_thread: Optional[threading.Thread] = None
         self._status_snapshot_monitor_thread: Optional[threading.Thread] = None
         self._execution_state: Optional[ExecutionState] = None
+        self._thread_progress_rows = ThreadProgressRowCache()
         self._close_shutdown_lock = threading.Lock()
         self._close_shutdown_thread: Optional[threading.Thread] = None
         self._random_ip_toggle_lock = threading.Lock()
@@ -587,6 +589,16 @@ class RunCommandService(RandomIpRuntimeService, RunControllerInitializationMixin
             self._paused_state = False
         self.emit_status_snapshot()
 
+    def reload_ai_settings(self) -> bool:
+        """运行中显式让已保存的 AI 设置生效；没有运行中的任务时返回 False。"""
+        if not self.running:
+            return False
+        try:
+            return bool(self._async_engine_client.reload_ai_settings())
+        except Exception:
+            logging.debug("刷新运行中的 AI 设置失败", exc_info=True)
+            return False
+
     def _wait_for_async_run(self, run_future: Any) -> None:
         try:
             try:
@@ -690,7 +702,8 @@ class RunCommandService(RandomIpRuntimeService, RunControllerInitializationMixin
         per_thread_target = 0
         if ctx is not None:
             try:
-                thread_rows = ctx.snapshot_thread_progress()
+                # 只取上次之后变化的会话，未变化的行沿用缓存里的同一对象
+                thread_rows = self._thread_progress_rows.refresh(ctx)
             except Exception:
                 logging.debug("获取线程进度快照失败", exc_info=True)
             try:
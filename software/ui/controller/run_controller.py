@@ -2,25 +2,26 @@
 
 from __future__ import annotations
 
+import copy
 from typing import Any, Callable, Optional
 
 from PySide6.QtCore import QObject, Signal, Slot
 
-from software.core.config.codec import build_runtime_config_snapshot
 from software.core.config.schema import RuntimeConfig
 from software.core.engine.async_engine import AsyncEngineClient
 from software.core.engine.cleanup import CleanupRunner
 from software.io.config.store import save_config
 from software.system.power_management import SystemSleepBlocker
 from software.ui.controller.run_command_service import RunCommandService
-from software.ui.controller.run_state_store import RunStateStore
+from software.ui.controller.run_state_store import ChangedPaths, RunStateStore, snapshot_paths_changed
 from software.ui.controller.survey_parse_service import SurveyParseService
 from software.ui.controller.ui_dispatcher import UiCallbackDispatcher
 
 
 class RunController(QObject):
-    runtimeSnapshotChanged = Signal(dict)
-    surveySnapshotChanged = Signal(dict)
+    # 第二个参数是变化路径集合（frozenset of tuple），None 表示全量刷新
+    runtimeSnapshotChanged = Signal(dict, object)
+    surveySnapshotChanged = Signal(dict, object)
     controllerEvent = Signal(dict)
     _uiCallbackQueued = Signal()
 
@@ -61,8 +62,10 @@ class RunController(QObject):
     def _dispatch_to_ui_async(self, callback: Callable[[], Any]) -> None:
         self._ui_dispatcher.dispatch_async(callback)
 
-    def _emit_runtime_snapshot(self, snapshot: dict[str, Any]) -> None:
-        self.runtimeSnapshotChanged.emit(dict(snapshot))
+    def _emit_runtime_snapshot(self, snapshot: dict[str, Any], changed_paths: Optional[ChangedPaths] = None) -> None:
+        self.runtimeSnapshotChanged.emit(dict(snapshot), changed_paths)
+        if not snapshot_paths_changed(changed_paths, "random_ip"):
+            return
         random_ip = snapshot.get("random_ip") or {}
         if callable(self.on_ip_counter):
             try:
@@ -74,8 +77,8 @@ class RunController(QObject):
             except Exception:
                 pass
 
-    def _emit_survey_snapshot(self, snapshot: dict[str, Any]) -> None:
-        self.surveySnapshotChanged.emit(dict(snapshot))
+    def _emit_survey_snapshot(self, snapshot: dict[str, Any], changed_paths: Optional[ChangedPaths] = None) -> None:
+        self.surveySnapshotChanged.emit(dict(snapshot), changed_paths)
 
     def _emit_controller_event(self, event: dict[str, Any]) -> None:
         self.controllerEvent.emit(dict(event))
@@ -146,6 +149,9 @@ class RunController(QObject):
     def resume_run(self) -> None:
         self._command_service.resume_run()
 
+    def reload_ai_settings(self) -> bool:
+        return self._command_service.reload_ai_settings()
+
     def request_shutdown_for_close(self, timeout_seconds: float = 5.0) -> None:
         self._command_service.request_shutdown_for_close(timeout_seconds=timeout_seconds)
 
@@ -195,18 +201,15 @@ class RunController(QObject):
         *,
         config: Optional[RuntimeConfig] = None,
     ) -> str:
-        cfg = config or build_runtime_config_snapshot(
-            RuntimeConfig(),
-            question_entries=self.get_survey_snapshot().get("question_entries") or [],
-            questions_info=self.get_survey_snapshot().get("questions_info") or [],
-        )
+        cfg = config or RuntimeConfig()
         self.write_runtime_settings_to_config(cfg)
         snapshot = self.get_survey_snapshot()
         cfg.url = str(snapshot.get("url") or "")
         cfg.survey_title = str(snapshot.get("survey_title") or "")
         cfg.survey_provider = str(snapshot.get("survey_provider") or "wjx")
-        cfg.questions_info = list(snapshot.get("questions_info") or [])
-        cfg.question_entries = list(snapshot.get("question_entries") or [])
+        # 快照里的题目对象与页面共享，写进配置前各复制一份
+        cfg.questions_info = copy.deepcopy(list(snapshot.get("questions_info") or []))
+        cfg.question_entries = copy.deepcopy(list(snapshot.get("question_entries") or []))
         self.config = cfg
         return save_config(cfg, path)
 
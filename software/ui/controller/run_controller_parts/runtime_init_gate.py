@@ -90,6 +90,7 @@ class RunControllerInitializationMixin:
             list(proxy_pool) if execution_config.random_proxy_ip_enabled else []
         )
         execution_state = ExecutionState(config=execution_config, stop_event=self.stop_event)
+        execution_state.compile_distribution_counters()
         return execution_config, execution_state
 
     def _build_initialization_logs(self) -> List[str]:
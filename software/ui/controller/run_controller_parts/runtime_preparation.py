@@ -38,12 +38,6 @@ from software.providers.errors import (
     SurveyEnterpriseUnavailableError,
     SurveyStoppedError,
 )
-from wjx.provider.parser import (
-    ENTERPRISE_UNAVAILABLE_SURVEY_ERROR_MESSAGE,
-    STOPPED_SURVEY_ERROR_MESSAGE,
-    is_enterprise_unavailable_survey_page,
-    is_stopped_survey_page,
-)
 
 
 @dataclass(frozen=True)
@@ -134,6 +128,14 @@ def _verify_wjx_survey_is_answerable(config: RuntimeConfig, survey_provider: str
     except Exception:
         logging.info("启动前问卷星状态复查失败，已放行到运行时处理", exc_info=True)
         return
+    # 问卷星解析器会带起 HTML 解析后端，只在真正复查时导入
+    from wjx.provider.parser import (
+        ENTERPRISE_UNAVAILABLE_SURVEY_ERROR_MESSAGE,
+        STOPPED_SURVEY_ERROR_MESSAGE,
+        is_enterprise_unavailable_survey_page,
+        is_stopped_survey_page,
+    )
+
     html = str(getattr(response, "text", "") or "")
     if is_stopped_survey_page(html):
         raise SurveyStoppedError(STOPPED_SURVEY_ERROR_MESSAGE)
@@ -238,6 +240,9 @@ def _build_execution_config_template(
         answer_rules=copy.deepcopy(list(getattr(config, "answer_rules", []) or [])),
         reverse_fill_spec=copy.deepcopy(reverse_fill_spec),
         psycho_target_alpha=psycho_target_alpha,
+        psycho_parallel_workers=max(0, int(getattr(config, "psycho_parallel_workers", 0) or 0)),
+        ai_answer_pool_size=max(0, int(getattr(config, "ai_answer_pool_size", 0) or 0)),
+        random_seed=getattr(config, "random_seed", None),
     )
     execution_config.questions_metadata = _build_questions_metadata(questions_info)
     execution_config.provider_question_metadata_map = _build_provider_question_metadata(questions_info)
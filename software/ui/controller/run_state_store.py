@@ -1,37 +1,132 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Any, Callable, Dict, Optional
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
 
 from software.core.config.codec import clone_question_entries, clone_questions_info
 from software.core.config.schema import RuntimeConfig
 from software.providers.common import detect_survey_provider, normalize_survey_provider
 from software.ui.controller.runtime_settings_state import RuntimeSettingsState
 
+# 变化路径：每项是从快照根到发生变化的键的元组，如 ("progress", "current")
+SnapshotPath = Tuple[str, ...]
+ChangedPaths = FrozenSet[SnapshotPath]
 
-def _deep_merge(base: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
-    merged = dict(base)
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Any:
+    """把补丁值转成只读结构：字典转只读视图，列表转元组；其余对象原样保留。"""
+    if isinstance(value, MappingProxyType):
+        return value
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _freeze_reusing(value: Any, current: Any) -> Any:
+    """冻结补丁值，与旧快照相等的子结构直接复用旧对象，让订阅方可以按身份跳过未变化的行。"""
+    if value is current:
+        return current
+    if isinstance(value, Mapping) and isinstance(current, Mapping):
+        frozen_items = {key: _freeze_reusing(item, current.get(key, _MISSING)) for key, item in value.items()}
+        if len(frozen_items) == len(current) and all(
+            item is current.get(key, _MISSING) for key, item in frozen_items.items()
+        ):
+            return current
+        return MappingProxyType(frozen_items)
+    if isinstance(value, (list, tuple)) and isinstance(current, tuple):
+        frozen_tuple = tuple(
+            _freeze_reusing(item, current[index] if index < len(current) else _MISSING)
+            for index, item in enumerate(value)
+        )
+        if len(frozen_tuple) == len(current) and all(item is old for item, old in zip(frozen_tuple, current)):
+            return current
+        return frozen_tuple
+    frozen = _freeze(value)
+    if current is not _MISSING and frozen == current:
+        return current
+    return frozen
+
+
+def _merge_frozen(
+    base: Mapping[str, Any],
+    patch: Mapping[str, Any],
+    prefix: SnapshotPath,
+    changes: List[SnapshotPath],
+) -> Mapping[str, Any]:
+    """合并补丁并记录变化路径；没有变化的子树保持原对象不变（结构共享）。"""
+    updates: Dict[str, Any] = {}
     for key, value in patch.items():
-        current = merged.get(key)
-        if isinstance(current, dict) and isinstance(value, dict):
-            merged[key] = _deep_merge(current, value)
+        current = base.get(key, _MISSING)
+        path = prefix + (key,)
+        if isinstance(current, Mapping) and isinstance(value, Mapping):
+            merged = _merge_frozen(current, value, path, changes)
+            if merged is not current:
+                updates[key] = merged
+            continue
+        frozen = _freeze_reusing(value, current)
+        if frozen is current:
+            continue
+        changes.append(path)
+        updates[key] = frozen
+    if not updates:
+        return base
+    return MappingProxyType({**base, **updates})
+
+
+def _share_unchanged_items(items: Sequence[Any], current: Sequence[Any], clone: Callable[[List[Any]], List[Any]]) -> Tuple[Any, ...]:
+    """逐项复用快照里相等的旧对象，只复制真正变化的题目。"""
+    shared: List[Any] = []
+    for index, item in enumerate(items):
+        previous = current[index] if index < len(current) else _MISSING
+        if previous is not _MISSING and (item is previous or item == previous):
+            shared.append(previous)
+            continue
+        cloned = clone([item])
+        if not cloned:
+            continue
+        if previous is not _MISSING and cloned[0] == previous:
+            shared.append(previous)
         else:
-            merged[key] = value
-    return merged
+            shared.append(cloned[0])
+    return tuple(shared)
+
+
+def snapshot_paths_changed(changed_paths: Optional[ChangedPaths], *prefixes: Union[str, SnapshotPath]) -> bool:
+    """判断变化路径是否涉及任一前缀；``changed_paths`` 为 None 表示全量刷新。"""
+    if changed_paths is None:
+        return True
+    for raw_prefix in prefixes:
+        prefix = (raw_prefix,) if isinstance(raw_prefix, str) else tuple(raw_prefix)
+        size = len(prefix)
+        for path in changed_paths:
+            common = min(size, len(path))
+            if path[:common] == prefix[:common]:
+                return True
+    return False
 
 
 class RunStateStore:
-    """统一维护运行态/解析态快照，并在变化时通知外层。"""
+    """统一维护运行态/解析态快照，并在变化时通知外层。
+
+    快照整体只读：嵌套字典是 ``MappingProxyType``，列表是元组，补丁只替换变化的子树。
+    通知回调收到 ``(snapshot, changed_paths)``，页面可以只刷新变化的部分。
+    快照里的题目对象与其他订阅方共享，需要原地修改或写回配置时请先复制。
+    """
 
     def __init__(
         self,
         *,
-        on_runtime_snapshot_changed: Optional[Callable[[dict[str, Any]], Any]] = None,
-        on_survey_snapshot_changed: Optional[Callable[[dict[str, Any]], Any]] = None,
+        on_runtime_snapshot_changed: Optional[Callable[[dict[str, Any], Optional[ChangedPaths]], Any]] = None,
+        on_survey_snapshot_changed: Optional[Callable[[dict[str, Any], Optional[ChangedPaths]], Any]] = None,
     ) -> None:
         self._runtime_settings_state = RuntimeSettingsState()
-        self._runtime_snapshot = self._build_runtime_snapshot()
-        self._survey_snapshot = self._build_survey_snapshot()
+        self._runtime_snapshot: Mapping[str, Any] = _freeze(self._build_runtime_snapshot())
+        self._survey_snapshot: Mapping[str, Any] = _freeze(self._build_survey_snapshot())
         self._on_runtime_snapshot_changed = on_runtime_snapshot_changed
         self._on_survey_snapshot_changed = on_survey_snapshot_changed
 
@@ -90,10 +185,11 @@ class RunStateStore:
         }
 
     def get_runtime_snapshot(self) -> Dict[str, Any]:
-        return deepcopy(self._runtime_snapshot)
+        # 只复制顶层，嵌套部分只读共享
+        return dict(self._runtime_snapshot)
 
     def get_survey_snapshot(self) -> Dict[str, Any]:
-        return deepcopy(self._survey_snapshot)
+        return dict(self._survey_snapshot)
 
     def runtime_settings(self) -> Dict[str, Any]:
         return dict(self._runtime_snapshot.get("settings") or {})
@@ -115,7 +211,7 @@ class RunStateStore:
                 "enabled": bool(state.get("random_ip_enabled", False)),
             },
         }
-        self._set_runtime_snapshot(_deep_merge(self._runtime_snapshot, patch), emit=emit and changed)
+        self._apply_runtime(patch, emit=emit and changed)
         return dict(state)
 
     def sync_runtime_settings_from_config(
@@ -135,37 +231,41 @@ class RunStateStore:
                 "enabled": bool(state.get("random_ip_enabled", False)),
             },
         }
-        self._set_runtime_snapshot(_deep_merge(self._runtime_snapshot, patch), emit=emit and changed)
+        self._apply_runtime(patch, emit=emit and changed)
         return dict(state)
 
     def write_runtime_settings_to_config(self, config: RuntimeConfig) -> RuntimeConfig:
         return self._runtime_settings_state.write_to_config(config)
 
     def apply_runtime_patch(self, patch: Dict[str, Any], *, emit: bool = True) -> Dict[str, Any]:
-        snapshot = _deep_merge(self._runtime_snapshot, patch)
-        self._set_runtime_snapshot(snapshot, emit=emit)
+        self._apply_runtime(patch, emit=emit)
         return self.get_runtime_snapshot()
 
     def apply_survey_patch(self, patch: Dict[str, Any], *, emit: bool = True) -> Dict[str, Any]:
         normalized_patch = dict(patch or {})
         if "questions_info" in normalized_patch:
-            normalized_patch["questions_info"] = clone_questions_info(
-                normalized_patch.get("questions_info"),
-                default_provider=normalize_survey_provider(
-                    normalized_patch.get(
-                        "survey_provider",
-                        self._survey_snapshot.get("survey_provider"),
-                    ),
-                    default="wjx",
+            default_provider = normalize_survey_provider(
+                normalized_patch.get(
+                    "survey_provider",
+                    self._survey_snapshot.get("survey_provider"),
                 ),
+                default="wjx",
+            )
+            normalized_patch["questions_info"] = _share_unchanged_items(
+                list(normalized_patch.get("questions_info") or []),
+                self._survey_snapshot.get("questions_info") or (),
+                lambda items: clone_questions_info(items, default_provider=default_provider),
             )
         if "question_entries" in normalized_patch:
-            normalized_patch["question_entries"] = clone_question_entries(
-                normalized_patch.get("question_entries")
+            normalized_patch["question_entries"] = _share_unchanged_items(
+                list(normalized_patch.get("question_entries") or []),
+                self._survey_snapshot.get("question_entries") or (),
+                clone_question_entries,
             )
-        snapshot = _deep_merge(self._survey_snapshot, normalized_patch)
-        snapshot["has_question_entries"] = bool(snapshot.get("question_entries"))
-        self._set_survey_snapshot(snapshot, emit=emit)
+            normalized_patch["has_question_entries"] = bool(normalized_patch["question_entries"])
+        changes: List[SnapshotPath] = []
+        snapshot = _merge_frozen(self._survey_snapshot, normalized_patch, (), changes)
+        self._set_survey_snapshot(snapshot, frozenset(changes), emit=emit)
         return self.get_survey_snapshot()
 
     def hydrate_from_config(self, config: RuntimeConfig, *, emit: bool = True) -> None:
@@ -210,29 +310,34 @@ class RunStateStore:
             patch["questions_info"] = list(questions_info or [])
         return self.apply_survey_patch(patch, emit=emit)
 
-    def _set_runtime_snapshot(self, snapshot: Dict[str, Any], *, emit: bool) -> None:
-        if snapshot == self._runtime_snapshot:
+    def _apply_runtime(self, patch: Dict[str, Any], *, emit: bool) -> None:
+        changes: List[SnapshotPath] = []
+        snapshot = _merge_frozen(self._runtime_snapshot, patch, (), changes)
+        self._set_runtime_snapshot(snapshot, frozenset(changes), emit=emit)
+
+    def _set_runtime_snapshot(self, snapshot: Mapping[str, Any], changed_paths: ChangedPaths, *, emit: bool) -> None:
+        if snapshot is self._runtime_snapshot:
             return
         self._runtime_snapshot = snapshot
         if emit:
-            self._emit_runtime_snapshot()
+            self._emit_runtime_snapshot(changed_paths)
 
-    def _set_survey_snapshot(self, snapshot: Dict[str, Any], *, emit: bool) -> None:
-        if snapshot == self._survey_snapshot:
+    def _set_survey_snapshot(self, snapshot: Mapping[str, Any], changed_paths: ChangedPaths, *, emit: bool) -> None:
+        if snapshot is self._survey_snapshot:
             return
         self._survey_snapshot = snapshot
         if emit:
-            self._emit_survey_snapshot()
+            self._emit_survey_snapshot(changed_paths)
 
-    def _emit_runtime_snapshot(self) -> None:
+    def _emit_runtime_snapshot(self, changed_paths: Optional[ChangedPaths] = None) -> None:
         callback = self._on_runtime_snapshot_changed
         if callable(callback):
-            callback(self.get_runtime_snapshot())
+            callback(self.get_runtime_snapshot(), changed_paths)
 
-    def _emit_survey_snapshot(self) -> None:
+    def _emit_survey_snapshot(self, changed_paths: Optional[ChangedPaths] = None) -> None:
         callback = self._on_survey_snapshot_changed
         if callable(callback):
-            callback(self.get_survey_snapshot())
+            callback(self.get_survey_snapshot(), changed_paths)
 
 
-__all__ = ["RunStateStore"]
+__all__ = ["ChangedPaths", "RunStateStore", "SnapshotPath", "snapshot_paths_changed"]
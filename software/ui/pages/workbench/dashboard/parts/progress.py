@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, Dict, Optional, cast
 
 from PySide6.QtCore import QAbstractAnimation, QByteArray, QEasingCurve, QObject, QPropertyAnimation, Qt, QTimer
@@ -664,7 +665,7 @@ class DashboardProgressMixin:
             0, int(payload.get("device_quota_fail_count") or 0)
         )
         thread_rows = payload.get("threads")
-        if not isinstance(thread_rows, list):
+        if not isinstance(thread_rows, Sequence) or isinstance(thread_rows, str):
             return
 
         running_now = bool(getattr(self.controller, "running", False))
@@ -687,7 +688,7 @@ class DashboardProgressMixin:
 
         seen_names = set()
         for item in thread_rows:
-            if not isinstance(item, dict):
+            if not isinstance(item, Mapping):
                 continue
             thread_name = str(item.get("thread_name") or "").strip()
             if not thread_name:
@@ -12,18 +12,18 @@ from PySide6.QtWidgets import (
     QFileDialog,
     QSizePolicy,
 )
-from PySide6.QtGui import QFont, QTextCursor
+from PySide6.QtGui import QFont
 from qfluentwidgets import (
     SubtitleLabel,
     PrimaryPushButton,
     PushButton,
+    ComboBox,
     InfoBar,
     InfoBarIcon,
     InfoBarPosition,
     FluentIcon as FIF,
     isDarkTheme,
     qconfig,
-    PlainTextEdit,
 )
 from software.logging.log_utils import (
     LOG_BUFFER_HANDLER,
@@ -37,7 +37,7 @@ from software.app.user_paths import (
     get_user_local_data_root,
     get_user_logs_directory,
 )
-from software.ui.widgets.log_highlighter import LogHighlighter
+from software.ui.widgets.log_list_view import LogListModel, LogListView
 
 
 # 日志级别颜色配置（深色/浅色主题）
@@ -59,6 +59,15 @@ LOG_COLORS_LIGHT = {
     "DEFAULT": "#4b5563",  # 默认深灰
 }
 
+# 类别过滤选项：(显示文本, 允许的类别；None 表示全部)
+LOG_CATEGORY_FILTERS = (
+    ("全部日志", None),
+    ("仅错误", ("ERROR",)),
+    ("警告及错误", ("WARNING", "ERROR")),
+    ("成功", ("OK",)),
+    ("普通信息", ("INFO",)),
+)
+
 
 class _LogRefreshBridge(QObject):
     changed = Signal(int)
@@ -70,9 +79,9 @@ class LogPage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._force_full_refresh = True
-        self._last_seen_record = None
         self._stick_to_bottom = True  # 用户是否希望自动跟随最新日志
         self._last_version = -1  # 上次读取的日志版本号
+        self._last_seq = 0  # 已渲染到的日志序号（增量拉取游标）
         self._refresh_pending = False
         self._refresh_bridge = _LogRefreshBridge(self)
         self._refresh_bridge.changed.connect(self._schedule_refresh)
@@ -114,41 +123,29 @@ class LogPage(QWidget):
         toolbar.setSpacing(8)
 
         self.save_btn = PushButton("导出到文件", self, FIF.SAVE)
+        self.category_combo = ComboBox(self)
+        for label, _categories in LOG_CATEGORY_FILTERS:
+            self.category_combo.addItem(label)
+        self.category_combo.setCurrentIndex(0)
         self.feedback_btn = PrimaryPushButton("报错反馈", self, FIF.HELP)
         self.feedback_btn.setToolTip("打开联系开发者，并直接选择“报错反馈”")
 
         toolbar.addWidget(self.save_btn)
+        toolbar.addWidget(self.category_combo)
         toolbar.addStretch(1)
         toolbar.addWidget(self.feedback_btn)
         layout.addLayout(toolbar)
 
-        # 日志显示区域
-        self.log_view = PlainTextEdit(self)
-        self.log_view.setReadOnly(True)
-        self.log_view.setTextInteractionFlags(
-            Qt.TextInteractionFlag.TextSelectableByMouse
-            | Qt.TextInteractionFlag.TextSelectableByKeyboard
-        )
-        self.log_view.setPlaceholderText("日志输出会显示在这里...")
+        # 日志显示区域：模型/视图只绘制可见行，选中行后 Ctrl+C 复制
+        self.log_model = LogListModel(self, capacity=int(LOG_BUFFER_CAPACITY or 0))
+        self.log_view = LogListView(self)
+        self.log_view.setModel(self.log_model)
 
         # 设置等宽字体
         font = QFont("Consolas", 10)
         font.setStyleHint(QFont.StyleHint.Monospace)
         self.log_view.setFont(font)
         self.log_view.verticalScrollBar().valueChanged.connect(self._on_scrollbar_value_changed)
-        try:
-            if LOG_BUFFER_CAPACITY and int(LOG_BUFFER_CAPACITY) > 0:
-                self.log_view.document().setMaximumBlockCount(int(LOG_BUFFER_CAPACITY))
-        except Exception as exc:
-            log_suppressed_exception(
-                "_build_ui: setMaximumBlockCount",
-                exc,
-                level=logging.WARNING,
-            )
-        self._highlighter = LogHighlighter(
-            self.log_view.document(),
-            colors=self._resolve_log_colors(),
-        )
 
         # 应用主题样式
         self._apply_theme()
@@ -159,6 +156,7 @@ class LogPage(QWidget):
     def _bind_events(self):
         self.save_btn.clicked.connect(self.save_logs)
         self.feedback_btn.clicked.connect(self._open_bug_report_dialog)
+        self.category_combo.currentIndexChanged.connect(self._on_category_filter_changed)
 
     def showEvent(self, event):
         super().showEvent(event)
@@ -212,86 +210,50 @@ class LogPage(QWidget):
         )
 
     def refresh_logs(self):
-        """完全异步的日志刷新：版本号检测 + 无锁读取
+        """增量刷新日志：版本号检测 + 按序号游标拉取
 
-        优化策略：
-        1. 先检查版本号，没有变化则跳过（避免无效拷贝）
-        2. 使用无锁队列，读取时完全不阻塞
-        3. 增量更新时批量渲染，减少 GUI 开销
+        1. 版本号没变就直接返回，不做任何拷贝
+        2. 只拉取游标之后的新日志追加到模型，视图只重绘可见行
+        3. 游标之后的日志已被环形缓冲挤掉时，才整体重建模型
         """
         # 不在当前可见页面时，跳过自动刷新，避免后台重绘拖慢主窗口
         if not self.isVisible():
             return
-        # 如果用户正在选择文本，跳过自动刷新
-        cursor = self.log_view.textCursor()
-        if cursor.hasSelection():
-            return
 
-        # 【优化 1】先检查版本号，没有变化则跳过
         current_version = LOG_BUFFER_HANDLER.get_version()
         if current_version == self._last_version and not self._force_full_refresh:
             return  # 没有新日志，直接返回
 
         scrollbar = self.log_view.verticalScrollBar()
         old_value = scrollbar.value()
-        old_max = scrollbar.maximum()
         stick_to_bottom = self._stick_to_bottom
 
-        # 【优化 2】无锁读取日志（异步模式下无需 try_lock）
-        records = LOG_BUFFER_HANDLER.get_records()
-        if not records:
-            if self._force_full_refresh:
-                self.log_view.clear()
-                self._force_full_refresh = False
-            self._last_seen_record = None
-            self._last_version = current_version
-            return
-
-        # 增量更新：只追加新日志
-        if not self._force_full_refresh and self._last_seen_record is not None:
-            last_index = -1
-            for idx, entry in enumerate(records):
-                if entry is self._last_seen_record:
-                    last_index = idx
-                    break
-            if last_index != -1 and last_index < len(records) - 1:
-                new_entries = records[last_index + 1 :]
-
-                # 【优化 3】批量渲染：先拼接字符串，再一次性追加
-                new_lines = []
-                for entry in new_entries:
-                    text = entry.text if hasattr(entry, "text") else str(entry)
-                    new_lines.append(text)
-
-                if new_lines:
-                    # 一次性追加所有新日志（比循环 appendPlainText 快得多）
-                    self.log_view.appendPlainText("\n".join(new_lines))
-
-                self._last_seen_record = records[-1]
-                self._last_version = current_version
-
-                if stick_to_bottom:
-                    self.log_view.moveCursor(QTextCursor.MoveOperation.End)
-                else:
-                    self._restore_scroll_position(scrollbar, old_value, old_max)
-                return
-
-        # 全量刷新：重新渲染所有日志
-        lines = []
-        for entry in records:
-            text = entry.text if hasattr(entry, "text") else str(entry)
-            lines.append(text)
-
-        self.log_view.setPlainText("\n".join(lines))
-        self._last_seen_record = records[-1] if records else None
+        cursor = 0 if self._force_full_refresh else self._last_seq
+        batch = LOG_BUFFER_HANDLER.get_records_since(cursor)
+        if self._force_full_refresh or batch.truncated:
+            if batch.entries or self._force_full_refresh:
+                self.log_model.reset_entries(batch.entries)
+            removed = 0
+            old_value = 0
+        else:
+            removed = self.log_model.append_entries(batch.entries)
+        self._last_seq = batch.last_seq
         self._last_version = current_version
         self._force_full_refresh = False
 
-        # 恢复滚动位置
         if stick_to_bottom:
-            self.log_view.moveCursor(QTextCursor.MoveOperation.End)
+            self.log_view.scrollToBottom()
         else:
-            self._restore_scroll_position(scrollbar, old_value, old_max)
+            # 顶部被裁掉的行数要从滚动位置里扣掉，保持当前阅读位置
+            scrollbar.setValue(min(max(old_value - removed, 0), scrollbar.maximum()))
+
+    def _on_category_filter_changed(self, index: int) -> None:
+        if index < 0 or index >= len(LOG_CATEGORY_FILTERS):
+            return
+        _label, categories = LOG_CATEGORY_FILTERS[index]
+        self.log_model.set_category_filter(categories)
+        if self._stick_to_bottom:
+            self.log_view.scrollToBottom()
 
     def save_logs(self):
         try:
@@ -336,7 +298,7 @@ class LogPage(QWidget):
         """根据主题应用样式"""
         if isDarkTheme():
             self.log_view.setStyleSheet("""
-                PlainTextEdit {
+                QListView {
                     background-color: #1a1a1a;
                     color: #d1d5db;
                     border: 1px solid #333;
@@ -347,7 +309,7 @@ class LogPage(QWidget):
             """)
         else:
             self.log_view.setStyleSheet("""
-                PlainTextEdit {
+                QListView {
                     background-color: #f8f9fa;
                     color: #1f2937;
                     border: 1px solid #e0e0e0;
@@ -356,8 +318,8 @@ class LogPage(QWidget):
                     selection-background-color: #3b82f6;
                 }
             """)
-        if hasattr(self, "_highlighter"):
-            self._highlighter.set_colors(self._resolve_log_colors())
+        if hasattr(self, "log_model"):
+            self.log_model.set_colors(self._resolve_log_colors())
 
     @staticmethod
     def _resolve_log_colors():
@@ -368,18 +330,6 @@ class LogPage(QWidget):
         scrollbar = self.log_view.verticalScrollBar()
         self._stick_to_bottom = value >= scrollbar.maximum() - 2
 
-    @staticmethod
-    def _restore_scroll_position(scrollbar, old_value, old_max):
-        """在非自动跟随时，尽量保持当前阅读位置"""
-        new_max = scrollbar.maximum()
-        if new_max < old_max:
-            # 有截断（比如达到最大行数），等比例向上补偿
-            target = max(0, old_value - (old_max - new_max))
-        else:
-            # 只追加了新日志，保持当前位置不要被拖到底
-            target = old_value
-        scrollbar.setValue(min(max(target, 0), new_max))
-
     def _load_last_session_logs(self):
         """加载上次会话的日志"""
         try:
@@ -388,6 +338,6 @@ class LogPage(QWidget):
                 with open(log_path, "r", encoding="utf-8") as f:
                     content = f.read()
                 if content.strip():
-                    self.log_view.setPlainText(content)
+                    self.log_model.load_plain_text(content)
         except Exception as exc:
             log_suppressed_exception("_load_last_session_logs", exc, level=logging.WARNING)
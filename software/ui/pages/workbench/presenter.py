@@ -16,6 +16,7 @@ from software.providers.contracts import (
     SurveyQuestionMeta,
     ensure_survey_question_metas,
 )
+from software.ui.controller.run_state_store import ChangedPaths, snapshot_paths_changed
 from software.ui.pages.workbench.dashboard.page import DashboardPage
 from software.ui.pages.workbench.reverse_fill.page import ReverseFillPage
 from software.ui.pages.workbench.runtime_panel.main import RuntimePage
@@ -34,6 +35,8 @@ class WorkbenchPresenter:
         self.host = host
         self._last_running_state: bool | None = None
         self._last_pause_state: tuple[bool, str] | None = None
+        # 快照键 -> (上次快照里的题目对象, 交给页面的副本)，按对象身份复用未变化题目的副本
+        self._snapshot_item_copies: dict[str, tuple[tuple[Any, ...], list[Any]]] = {}
         self.state = WorkbenchState(host)
         self.runtime_page = RuntimePage(controller, host)
         self.strategy_page = QuestionStrategyPage(host)
@@ -122,29 +125,37 @@ class WorkbenchPresenter:
             self.controller.config = cfg
         return cfg
 
-    @Slot(dict)
-    def on_survey_snapshot_changed(self, snapshot: dict[str, Any]) -> None:
+    @Slot(dict, object)
+    def on_survey_snapshot_changed(
+        self,
+        snapshot: dict[str, Any],
+        changed_paths: ChangedPaths | None = None,
+    ) -> None:
         phase = str((snapshot or {}).get("phase") or "")
-        parsed_url = str((snapshot or {}).get("url") or "")
-        self.sync_dashboard_url_from_reverse_fill(parsed_url)
-        self.sync_reverse_fill_url_from_dashboard(parsed_url)
+        if snapshot_paths_changed(changed_paths, "url"):
+            parsed_url = str((snapshot or {}).get("url") or "")
+            self.sync_dashboard_url_from_reverse_fill(parsed_url)
+            self.sync_reverse_fill_url_from_dashboard(parsed_url)
         if phase == "error":
-            self.on_survey_parse_failed(str((snapshot or {}).get("parse_error") or ""))
+            if snapshot_paths_changed(changed_paths, "phase", "parse_error"):
+                self.on_survey_parse_failed(str((snapshot or {}).get("parse_error") or ""))
             return
         if phase != "ready":
             return
+        if not snapshot_paths_changed(changed_paths, "phase", "survey_title", "questions_info", "question_entries"):
+            return
 
-        questions = ensure_survey_question_metas((snapshot or {}).get("questions_info") or [])
+        questions = ensure_survey_question_metas(self._page_copies(snapshot, "questions_info"))
         parsed_title = str((snapshot or {}).get("survey_title") or "") or "问卷"
-        entries = list((snapshot or {}).get("question_entries") or [])
+        entries = self._page_copies(snapshot, "question_entries")
         self._notify_dashboard_parse_succeeded(questions, parsed_title)
         self.strategy_page.set_questions_info(questions)
         if getattr(self.dashboard, "_open_wizard_after_parse", False):
             self.dashboard._open_wizard_after_parse = False
-            info_snapshot = copy.deepcopy(questions)
+            # 向导打开时会自行复制题目与配置
             QTimer.singleShot(
                 0,
-                lambda: self.open_parse_wizard_after_parse(info_snapshot, parsed_title),
+                lambda: self.open_parse_wizard_after_parse(questions, parsed_title),
             )
             return
         self.state.set_questions(questions, entries)
@@ -156,6 +167,19 @@ class WorkbenchPresenter:
         self.dashboard.update_question_meta(parsed_title, len(entries))
         self.sync_reverse_fill_context()
 
+    def _page_copies(self, snapshot: Mapping[str, Any] | None, key: str) -> list[Any]:
+        """快照里的题目对象与 store 共享只读，页面会原地修改；只复制与上次快照相比换了对象的项。"""
+        items = tuple((snapshot or {}).get(key) or ())
+        previous_items, previous_copies = self._snapshot_item_copies.get(key, ((), []))
+        copies = [
+            previous_copies[index]
+            if index < len(previous_items) and item is previous_items[index]
+            else copy.deepcopy(item)
+            for index, item in enumerate(items)
+        ]
+        self._snapshot_item_copies[key] = (items, copies)
+        return copies
+
     def on_survey_parsed(self, info: list[Any], title: str) -> None:
         self.on_survey_snapshot_changed(
             {
@@ -195,8 +219,12 @@ class WorkbenchPresenter:
         if callable(handler):
             handler(str(message or ""))
 
-    @Slot(dict)
-    def on_runtime_snapshot_changed(self, snapshot: dict[str, Any]) -> None:
+    @Slot(dict, object)
+    def on_runtime_snapshot_changed(
+        self,
+        snapshot: dict[str, Any],
+        changed_paths: ChangedPaths | None = None,
+    ) -> None:
         running = bool((snapshot or {}).get("running"))
         paused = bool((snapshot or {}).get("paused"))
         pause_reason = str((snapshot or {}).get("status_text") or "")
@@ -207,35 +235,38 @@ class WorkbenchPresenter:
             self._last_running_state = running
             self.dashboard.on_run_state_changed(running)
             self.reverse_fill_page.on_run_state_changed(running)
-        self.dashboard.set_random_ip_loading(
-            bool(random_ip.get("loading")),
-            str(random_ip.get("loading_message") or ""),
-        )
-        self.reverse_fill_page.set_random_ip_loading(
-            bool(random_ip.get("loading")),
-            str(random_ip.get("loading_message") or ""),
-        )
-        self.dashboard.update_status(
-            str((snapshot or {}).get("status_text") or ""),
-            int(progress.get("current") or 0),
-            int(progress.get("target") or 0),
-        )
-        self.reverse_fill_page.update_status(
-            str((snapshot or {}).get("status_text") or ""),
-            int(progress.get("current") or 0),
-            int(progress.get("target") or 0),
-        )
-        thread_payload = {
-            "threads": list(threads.get("rows") or []),
-            "target": int(progress.get("target") or 0),
-            "num_threads": int(threads.get("num_threads") or 0),
-            "per_thread_target": int(threads.get("per_thread_target") or 0),
-            "device_quota_fail_count": int(progress.get("device_quota_fail_count") or 0),
-            "initializing": bool((snapshot or {}).get("initialization", {}).get("active")),
-            "initializing_text": str((snapshot or {}).get("initialization", {}).get("text") or ""),
-            "initialization_logs": list((snapshot or {}).get("initialization", {}).get("logs") or []),
-        }
-        self.dashboard.update_thread_progress(thread_payload)
+        if snapshot_paths_changed(changed_paths, ("random_ip", "loading"), ("random_ip", "loading_message")):
+            self.dashboard.set_random_ip_loading(
+                bool(random_ip.get("loading")),
+                str(random_ip.get("loading_message") or ""),
+            )
+            self.reverse_fill_page.set_random_ip_loading(
+                bool(random_ip.get("loading")),
+                str(random_ip.get("loading_message") or ""),
+            )
+        if snapshot_paths_changed(changed_paths, "status_text", "progress"):
+            self.dashboard.update_status(
+                str((snapshot or {}).get("status_text") or ""),
+                int(progress.get("current") or 0),
+                int(progress.get("target") or 0),
+            )
+            self.reverse_fill_page.update_status(
+                str((snapshot or {}).get("status_text") or ""),
+                int(progress.get("current") or 0),
+                int(progress.get("target") or 0),
+            )
+        if snapshot_paths_changed(changed_paths, "threads", "progress", "initialization"):
+            thread_payload = {
+                "threads": list(threads.get("rows") or []),
+                "target": int(progress.get("target") or 0),
+                "num_threads": int(threads.get("num_threads") or 0),
+                "per_thread_target": int(threads.get("per_thread_target") or 0),
+                "device_quota_fail_count": int(progress.get("device_quota_fail_count") or 0),
+                "initializing": bool((snapshot or {}).get("initialization", {}).get("active")),
+                "initializing_text": str((snapshot or {}).get("initialization", {}).get("text") or ""),
+                "initialization_logs": list((snapshot or {}).get("initialization", {}).get("logs") or []),
+            }
+            self.dashboard.update_thread_progress(thread_payload)
         pause_state = (paused, pause_reason if paused else "")
         if getattr(self, "_last_pause_state", None) != pause_state:
             self._last_pause_state = pause_state
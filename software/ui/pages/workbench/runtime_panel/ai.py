@@ -5,7 +5,7 @@ import logging
 from software.logging.log_utils import log_suppressed_exception
 
 
-from PySide6.QtCore import QObject, Qt, QThread
+from PySide6.QtCore import QObject, Qt, QThread, QTimer
 from PySide6.QtWidgets import QSizePolicy, QVBoxLayout, QWidget
 from qfluentwidgets import (
     ComboBox,
@@ -89,6 +89,8 @@ class RuntimeAISection(QObject):
         "custom": "https://platform.openai.com/docs/api-reference/introduction",
     }
 
+    _AI_RELOAD_DEBOUNCE_MS = 500
+
     def __init__(self, parent_view: QWidget, owner: QWidget):
         super().__init__(parent_view)
         self._owner = owner
@@ -97,6 +99,11 @@ class RuntimeAISection(QObject):
         self._ai_test_thread: Optional[QThread] = None
         self._ai_test_worker: Optional[AITestWorker] = None
         self._current_infobar: Optional[InfoBar] = None  # 存储当前显示的InfoBar引用
+        # 提示词逐字保存，运行中的快照刷新合并到停止输入之后
+        self._ai_reload_timer = QTimer(self)
+        self._ai_reload_timer.setSingleShot(True)
+        self._ai_reload_timer.setInterval(self._AI_RELOAD_DEBOUNCE_MS)
+        self._ai_reload_timer.timeout.connect(self._reload_running_ai_settings)
         ai_config = get_ai_settings()
         initial_mode = str(ai_config.get("ai_mode") or "free").strip().lower()
         if initial_mode not in self._AI_MODES:
@@ -386,7 +393,7 @@ class RuntimeAISection(QObject):
             # 自定义模式：切换时清空（除非是初始化加载）
             if not self._ai_loading:
                 self.ai_model_edit.setText("")
-                save_ai_settings(model="")
+                self._save_ai_settings(model="")
         else:
             # 非自定义模式：清空并填充推荐模型
             self.ai_model_combo.clear()
@@ -399,7 +406,7 @@ class RuntimeAISection(QObject):
             # 切换服务商时使用新的默认模型（除非是初始化加载）
             if not self._ai_loading:
                 self.ai_model_combo.setText(default_model)
-                save_ai_settings(model=default_model)
+                self._save_ai_settings(model=default_model)
 
         self._update_ai_doc_link(provider_key)
 
@@ -466,7 +473,7 @@ class RuntimeAISection(QObject):
         else:
             self.ai_prompt_card.set_default_prompt(next_default)
         self._last_ai_mode = ai_mode
-        save_ai_settings(ai_mode=ai_mode)
+        self._save_ai_settings(ai_mode=ai_mode)
         self._update_ai_visibility()
 
     def _on_ai_provider_changed(self):
@@ -475,9 +482,20 @@ class RuntimeAISection(QObject):
             return
         idx = self.ai_provider_combo.currentIndex()
         provider_key = str(self.ai_provider_combo.itemData(idx)) if idx >= 0 else "deepseek"
-        save_ai_settings(provider=provider_key)
+        self._save_ai_settings(provider=provider_key)
         self._update_ai_visibility()
 
+    def _save_ai_settings(self, **updates) -> None:
+        """保存 AI 设置；有任务在运行时稍后显式刷新它的 AI 配置快照。"""
+        save_ai_settings(**updates)
+        self._ai_reload_timer.start()
+
+    def _reload_running_ai_settings(self) -> None:
+        controller = getattr(self._owner, "controller", None)
+        reloader = getattr(controller, "reload_ai_settings", None)
+        if callable(reloader):
+            reloader()
+
     def _update_ai_doc_link(self, provider_key: str):
         url = self._PROVIDER_DOCS.get(provider_key, "")
         self.ai_provider_link.setVisible(provider_key != "custom")
@@ -494,25 +512,25 @@ class RuntimeAISection(QObject):
         """API Key 变化"""
         if self._ai_loading:
             return
-        save_ai_settings(api_key=self.ai_apikey_edit.text())
+        self._save_ai_settings(api_key=self.ai_apikey_edit.text())
 
     def _on_ai_baseurl_changed(self):
         """Base URL 变化"""
         if self._ai_loading:
             return
-        save_ai_settings(base_url=self.ai_baseurl_edit.text())
+        self._save_ai_settings(base_url=self.ai_baseurl_edit.text())
 
     def _on_ai_model_changed(self, text: str):
         """模型变化（EditableComboBox）"""
         if self._ai_loading:
             return
-        save_ai_settings(model=text.strip())
+        self._save_ai_settings(model=text.strip())
 
     def _on_ai_model_edit_changed(self):
         """模型变化（LineEdit - 自定义模式）"""
         if self._ai_loading:
             return
-        save_ai_settings(model=self.ai_model_edit.text().strip())
+        self._save_ai_settings(model=self.ai_model_edit.text().strip())
 
     def _get_current_model_value(self) -> str:
         """获取当前模型值"""
@@ -526,7 +544,7 @@ class RuntimeAISection(QObject):
             return
         self._ai_system_prompt = self.ai_prompt_card.prompt_text()
         if self._get_current_ai_mode() != "free":
-            save_ai_settings(system_prompt=self._ai_system_prompt)
+            self._save_ai_settings(system_prompt=self._ai_system_prompt)
 
     def _on_ai_test_clicked(self):
         """测试 AI 连接"""
@@ -534,7 +552,7 @@ class RuntimeAISection(QObject):
             return
         if self._ai_test_thread is not None and self._ai_test_thread.isRunning():
             return
-        save_ai_settings(
+        self._save_ai_settings(
             ai_mode=self._get_current_ai_mode(),
             api_key=self.ai_apikey_edit.text(),
             base_url=self.ai_baseurl_edit.text(),
@@ -9,6 +9,7 @@ from qfluentwidgets import ScrollArea
 
 from software.app.config import HTTP_MAX_THREADS
 from software.ui.controller.run_controller import RunController
+from software.ui.controller.run_state_store import ChangedPaths, snapshot_paths_changed
 from software.ui.pages.workbench.runtime_panel.config_sync import RuntimeConfigSyncMixin
 from software.ui.pages.workbench.runtime_panel.control_sync import RuntimeControlSyncMixin
 from software.ui.pages.workbench.runtime_panel.events import bind_runtime_page_events
@@ -97,12 +98,16 @@ class RuntimePage(
         elif hasattr(self.controller, "get_runtime_ui_state"):
             self._apply_runtime_ui_state(self.controller.get_runtime_ui_state())
 
-    def _on_runtime_snapshot_changed(self, snapshot: dict) -> None:
+    def _on_runtime_snapshot_changed(self, snapshot: dict, changed_paths: ChangedPaths | None = None) -> None:
         runtime_snapshot = dict(snapshot or {})
-        self._apply_runtime_ui_state(runtime_snapshot.get("settings") or {})
-        random_ip = runtime_snapshot.get("random_ip") or {}
-        self._apply_random_ip_loading(
-            bool(random_ip.get("loading")),
-            str(random_ip.get("loading_message") or ""),
-        )
-        self.on_run_state_changed(bool(runtime_snapshot.get("running")))
+        # 运行中进度每秒刷新多次，只在设置、代理加载或运行状态变化时才回写控件
+        if snapshot_paths_changed(changed_paths, "settings"):
+            self._apply_runtime_ui_state(runtime_snapshot.get("settings") or {})
+        if snapshot_paths_changed(changed_paths, "random_ip"):
+            random_ip = runtime_snapshot.get("random_ip") or {}
+            self._apply_random_ip_loading(
+                bool(random_ip.get("loading")),
+                str(random_ip.get("loading_message") or ""),
+            )
+        if snapshot_paths_changed(changed_paths, "running"):
+            self.on_run_state_changed(bool(runtime_snapshot.get("running")))
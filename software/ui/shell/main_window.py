@@ -27,9 +27,6 @@ from qfluentwidgets import (
 )
 from shiboken6 import isValid
 
-from software.ui.dialogs.contact import ContactDialog
-from software.ui.dialogs.quota_redeem import QuotaRedeemDialog
-
 from software.ui.controller.run_controller import RunController
 from software.ui.pages.workbench.presenter import WorkbenchPresenter
 from software.ui.shell.main_window_parts.dialogs import MainWindowDialogsMixin
@@ -55,9 +52,6 @@ from software.ui.shell.startup_tutorial import (
 from software.logging.action_logger import log_action
 from software.logging.log_utils import register_popup_handler
 from software.app.version import __VERSION__
-from software.network.proxy import (
-    format_status_payload,
-)
 from software.app.runtime_paths import get_resource_path
 
 from software.ui.shell.boot import create_boot_splash, finish_boot_splash
@@ -438,6 +432,10 @@ class MainWindow(
             result="shown",
             payload={"locked_type": bool(lock_message_type)},
         )
+        # 联系表单会带起配置、代理状态接口等整串依赖，首次打开时再导入，不占启动时间
+        from software.network.proxy import format_status_payload
+        from software.ui.dialogs.contact import ContactDialog
+
         dlg = ContactDialog(
             self,
             default_type=default_type,
@@ -770,6 +768,8 @@ class MainWindow(
                 logging.info("额度兑换窗口前置失败", exc_info=True)
             return False
 
+        from software.ui.dialogs.quota_redeem import QuotaRedeemDialog
+
         dlg = QuotaRedeemDialog(self)
         self._quota_redeem_dialog = dlg
         self._quota_redeem_dialog_active = True
@@ -0,0 +1,204 @@
+"""虚拟化日志列表 - 按行渲染可见区域，支持按类别过滤"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, NamedTuple, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtGui import QColor, QGuiApplication, QKeySequence
+from PySide6.QtWidgets import QAbstractItemView, QListView
+
+from software.logging.log_utils import LogBufferEntry
+
+LOG_CATEGORY_DEFAULT = "DEFAULT"
+
+
+class _LogRow(NamedTuple):
+    seq: int
+    text: str
+    category: str
+
+
+def extract_log_level(text: str) -> Optional[str]:
+    """从行文本里识别日志级别，供没有类别信息的历史日志着色。"""
+    upper = text.upper()
+    if "[ERROR]" in upper or "[CRITICAL]" in upper:
+        return "ERROR"
+    if "[WARNING]" in upper or "[WARN]" in upper:
+        return "WARNING"
+    if "[OK]" in upper or "[SUCCESS]" in upper:
+        return "OK"
+    if "[INFO]" in upper:
+        return "INFO"
+    if "TRACEBACK (MOST RECENT CALL LAST)" in upper:
+        return "ERROR"
+    return None
+
+
+def _rows_from_entry(entry: LogBufferEntry) -> List[_LogRow]:
+    text = entry.text if hasattr(entry, "text") else str(entry)
+    category = str(getattr(entry, "category", "") or LOG_CATEGORY_DEFAULT).upper()
+    seq = int(getattr(entry, "seq", 0) or 0)
+    # 多行日志（traceback）拆成多行，保证每行等高，视图才能按行号直接定位
+    return [_LogRow(seq, line, category) for line in text.split("\n")]
+
+
+class LogListModel(QAbstractListModel):
+    """日志行模型：全部行放在环形队列里，过滤后的可见行单独成表。"""
+
+    def __init__(self, parent=None, *, capacity: int = 0):
+        super().__init__(parent)
+        self._capacity = max(0, int(capacity or 0))
+        self._rows: Deque[_LogRow] = deque()
+        self._visible: List[_LogRow] = []
+        self._category_filter: Optional[frozenset[str]] = None
+        self._colors: Dict[str, QColor] = {}
+        self._last_seq = 0
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._visible)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        if row < 0 or row >= len(self._visible):
+            return None
+        item = self._visible[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return item.text
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._colors.get(item.category) or self._colors.get(LOG_CATEGORY_DEFAULT)
+        return None
+
+    def set_colors(self, colors: Dict[str, str]) -> None:
+        self._colors = {str(key).upper(): QColor(value) for key, value in (colors or {}).items()}
+        if self._visible:
+            self.dataChanged.emit(
+                self.index(0),
+                self.index(len(self._visible) - 1),
+                [Qt.ItemDataRole.ForegroundRole],
+            )
+
+    def set_category_filter(self, categories: Optional[Iterable[str]]) -> None:
+        normalized = None if categories is None else frozenset(str(item).upper() for item in categories)
+        if normalized == self._category_filter:
+            return
+        self.beginResetModel()
+        self._category_filter = normalized
+        self._visible = [row for row in self._rows if self._accepts(row)]
+        self.endResetModel()
+
+    def _accepts(self, row: _LogRow) -> bool:
+        return self._category_filter is None or row.category in self._category_filter
+
+    def clear(self) -> None:
+        self.reset_entries([])
+
+    def reset_entries(self, entries: Iterable[LogBufferEntry]) -> None:
+        self.beginResetModel()
+        self._rows.clear()
+        last_seq = 0
+        for entry in entries:
+            rows = _rows_from_entry(entry)
+            self._rows.extend(rows)
+            last_seq = max(last_seq, rows[0].seq)
+        self._last_seq = last_seq
+        self._trim_rows()
+        self._visible = [row for row in self._rows if self._accepts(row)]
+        self.endResetModel()
+
+    def load_plain_text(self, content: str) -> None:
+        """载入上次会话的纯文本日志，按行识别级别；traceback 续行沿用错误色。"""
+        self.beginResetModel()
+        self._rows.clear()
+        previous = LOG_CATEGORY_DEFAULT
+        for line in str(content or "").splitlines():
+            level = extract_log_level(line)
+            if level is None:
+                level = previous if previous == "ERROR" and line.startswith((" ", "\t")) else LOG_CATEGORY_DEFAULT
+            self._rows.append(_LogRow(0, line, level))
+            previous = level
+        self._last_seq = 0
+        self._visible = [row for row in self._rows if self._accepts(row)]
+        self.endResetModel()
+
+    def append_entries(self, entries: Iterable[LogBufferEntry]) -> int:
+        """追加新日志并按容量裁掉最旧的行，返回从可见区顶部移除的行数。"""
+        new_rows: List[_LogRow] = []
+        for entry in entries:
+            new_rows.extend(_rows_from_entry(entry))
+        if not new_rows:
+            return 0
+        self._last_seq = max(self._last_seq, max(row.seq for row in new_rows))
+        self._rows.extend(new_rows)
+        visible_rows = [row for row in new_rows if self._accepts(row)]
+        if visible_rows:
+            start = len(self._visible)
+            self.beginInsertRows(QModelIndex(), start, start + len(visible_rows) - 1)
+            self._visible.extend(visible_rows)
+            self.endInsertRows()
+        cutoff = self._trim_rows()
+        if cutoff <= 0:
+            return 0
+        removed = 0
+        for row in self._visible:
+            if row.seq >= cutoff:
+                break
+            removed += 1
+        if removed:
+            self.beginRemoveRows(QModelIndex(), 0, removed - 1)
+            del self._visible[:removed]
+            self.endRemoveRows()
+        return removed
+
+    def _trim_rows(self) -> int:
+        """按条目数保留最近 ``capacity`` 条日志，返回保留的最小序号（0 表示未裁剪）。"""
+        if not self._capacity or self._last_seq <= self._capacity:
+            return 0
+        cutoff = self._last_seq - self._capacity + 1
+        if not self._rows or self._rows[0].seq >= cutoff:
+            return 0
+        while self._rows and self._rows[0].seq < cutoff:
+            self._rows.popleft()
+        return cutoff
+
+    def text_for_rows(self, rows: Iterable[int]) -> str:
+        lines = [self._visible[row].text for row in sorted(set(rows)) if 0 <= row < len(self._visible)]
+        return "\n".join(lines)
+
+
+class LogListView(QListView):
+    """只绘制可见行的日志视图；Ctrl+C 复制选中的行。"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUniformItemSizes(True)
+        self.setWordWrap(False)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerItem)
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.StandardKey.Copy):
+            self.copy_selection()
+            event.accept()
+            return
+        super().keyPressEvent(event)
+
+    def copy_selection(self) -> None:
+        model = self.model()
+        if not isinstance(model, LogListModel):
+            return
+        rows = [index.row() for index in self.selectionModel().selectedIndexes()]
+        text = model.text_for_rows(rows)
+        if text:
+            QGuiApplication.clipboard().setText(text)
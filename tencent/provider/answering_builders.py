@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import random
 from typing import Any, List, Optional, Sequence
 
 from software.app.config import DEFAULT_FILL_TEXT
@@ -32,6 +31,7 @@ from software.core.questions.utils import (
     weighted_index,
 )
 from software.core.task import ExecutionState
+from software.core.task.random_context import run_random as random
 from software.providers.answering import AnswerAction
 from software.providers.contracts import SurveyQuestionMeta
 
@@ -90,6 +90,7 @@ async def _build_qq_single_action(
         fill_entries,
         selected_index,
         driver=driver,
+        runtime_settings=config.ai_runtime_settings,
         question_title=str(question.title or ""),
         question_number=current,
         option_text=selected_text,
@@ -135,7 +136,12 @@ async def _build_qq_text_action(
         if description and description not in ai_prompt:
             ai_prompt = f"{ai_prompt}\n补充说明：{description}"
         try:
-            generated = await agenerate_ai_answer(ai_prompt, question_type="fill_blank", blank_count=1)
+            generated = await agenerate_ai_answer(
+                ai_prompt,
+                question_type="fill_blank",
+                blank_count=1,
+                runtime_settings=config.ai_runtime_settings,
+            )
         except AIRuntimeError as exc:
             raise AIRuntimeError(f"腾讯问卷第{current}题 AI 生成失败：{exc}") from exc
         text_values = (
@@ -205,6 +211,7 @@ async def _build_qq_dropdown_action(
         fill_entries,
         selected_index,
         driver=driver,
+        runtime_settings=config.ai_runtime_settings,
         question_title=str(question.title or ""),
         question_number=current,
         option_text=selected_text,
@@ -300,6 +307,7 @@ async def _build_qq_multiple_action(
                 fill_entries,
                 option_idx,
                 driver=driver,
+                runtime_settings=config.ai_runtime_settings,
                 question_title=str(question.title or ""),
                 question_number=current,
                 option_text=selected_text,
@@ -11,7 +11,9 @@ from urllib.parse import urlparse
 import software.network.http as http_client
 from software.app.config import DEFAULT_HTTP_HEADERS, _HTML_SPACE_RE
 from software.providers.common import SURVEY_PROVIDER_QQ
+from software.providers.concurrent_fetch import fetch_all, race_by_priority
 from software.providers.contracts import LOGIC_PARSE_STATUS_UNKNOWN
+from software.providers.survey_cache import SurveyParseResult, SurveyRevalidation
 
 QQ_SUPPORTED_PROVIDER_TYPES = {
     "radio",
@@ -333,22 +335,23 @@ async def _fetch_qq_locale_payload(
     headers: Dict[str, str],
     locale: str,
 ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
-    meta_payload = await _request_qq_api(
-        survey_id,
-        "meta",
-        hash_value=hash_value,
-        headers=headers,
-        extra_params={"locale": locale},
+    meta_payload, questions_payload = await fetch_all(
+        _request_qq_api(
+            survey_id,
+            "meta",
+            hash_value=hash_value,
+            headers=headers,
+            extra_params={"locale": locale},
+        ),
+        _request_qq_api(
+            survey_id,
+            "questions",
+            hash_value=hash_value,
+            headers=headers,
+            extra_params={"locale": locale},
+        ),
     )
     meta_data = _ensure_qq_api_ok(meta_payload, f"meta?locale={locale}")
-
-    questions_payload = await _request_qq_api(
-        survey_id,
-        "questions",
-        hash_value=hash_value,
-        headers=headers,
-        extra_params={"locale": locale},
-    )
     questions_data = _ensure_qq_api_ok(questions_payload, f"questions?locale={locale}")
     questions = questions_data.get("questions")
     if not isinstance(questions, list) or not questions:
@@ -356,7 +359,30 @@ async def _fetch_qq_locale_payload(
     return meta_data, questions
 
 
-async def _fetch_qq_survey_via_http(survey_id: str, hash_value: str) -> Tuple[List[Dict[str, Any]], str]:
+def _parse_qq_locale_payload(
+    locale: str,
+    meta_data: Dict[str, Any],
+    questions: List[Dict[str, Any]],
+    revalidation: Optional[SurveyRevalidation],
+) -> SurveyParseResult:
+    """解析竞速胜出的语言版本；载荷指纹命中缓存时跳过解析。"""
+    if revalidation is not None:
+        cached = revalidation.check({"locale": locale, "meta": meta_data, "questions": questions})
+        if cached is not None:
+            return cached
+    return _build_qq_parse_result(
+        questions,
+        raw_title=meta_data.get("title") or "",
+        empty_error_message=f"腾讯问卷解析结果为空（locale={locale}）",
+    )
+
+
+async def _fetch_qq_survey_via_http(
+    survey_id: str,
+    hash_value: str,
+    *,
+    revalidation: Optional[SurveyRevalidation] = None,
+) -> SurveyParseResult:
     page_url = _build_qq_survey_page_url(survey_id, hash_value)
     headers = _build_qq_api_headers(page_url)
 
@@ -368,22 +394,31 @@ async def _fetch_qq_survey_via_http(survey_id: str, hash_value: str) -> Tuple[Li
     )
     _ensure_qq_api_ok(session_payload, "session")
 
+    # 各语言版本同时拉取载荷，按 _QQ_HTTP_LOCALES 的优先级取第一个可用的，其余请求随即取消；
+    # 只解析胜出的那一份，解析为空时再在更低优先级的版本里竞速
+    remaining = list(_QQ_HTTP_LOCALES)
     last_error: Optional[Exception] = None
-    for locale in _QQ_HTTP_LOCALES:
+    while remaining:
         try:
-            meta_data, questions = await _fetch_qq_locale_payload(survey_id, hash_value, headers, locale)
-            return _build_qq_parse_result(
-                questions,
-                raw_title=meta_data.get("title") or "",
-                empty_error_message=f"腾讯问卷解析结果为空（locale={locale}）",
+            locale, (meta_data, questions) = await race_by_priority(
+                [
+                    (
+                        locale,
+                        lambda locale=locale: _fetch_qq_locale_payload(survey_id, hash_value, headers, locale),
+                    )
+                    for locale in remaining
+                ],
+                abort_on=_is_qq_login_required_error,
             )
         except Exception as exc:
             _raise_if_qq_login_required(exc)
+            raise RuntimeError(f"腾讯问卷 HTTP 解析失败：{exc}") from exc
+        try:
+            return _parse_qq_locale_payload(locale, meta_data, questions, revalidation)
+        except Exception as exc:
             last_error = exc
-
-    if last_error is not None:
-        raise RuntimeError(f"腾讯问卷 HTTP 解析失败：{last_error}") from last_error
-    raise RuntimeError("腾讯问卷 HTTP 解析失败：未获得可用 locale")
+            remaining = remaining[remaining.index(locale) + 1:]
+    raise RuntimeError(f"腾讯问卷 HTTP 解析失败：{last_error}") from last_error
 
 
 def _build_option_texts(question: Dict[str, Any], provider_type: str) -> List[str]:
@@ -947,13 +982,13 @@ def _standardize_qq_questions(questions: List[Dict[str, Any]]) -> List[Dict[str,
     return _assign_visible_display_numbers(_merge_same_page_descriptions_into_questions(normalized))
 
 
-async def parse_qq_survey(url: str) -> Tuple[List[Dict[str, Any]], str]:
+async def parse_qq_survey(url: str, *, revalidation: Optional[SurveyRevalidation] = None) -> SurveyParseResult:
     if _is_qq_login_required_url(url):
         _raise_qq_login_required()
     survey_id, hash_value = _extract_qq_identifiers(url)
 
     try:
-        return await _fetch_qq_survey_via_http(survey_id, hash_value)
+        return await _fetch_qq_survey_via_http(survey_id, hash_value, revalidation=revalidation)
     except Exception as exc:
         _raise_if_qq_login_required(exc)
         logging.exception("腾讯问卷 HTTP 解析失败，url=%r", url)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import math
-import random
 from typing import Any, List, Optional, Sequence
 
 from software.app.config import DEFAULT_FILL_TEXT
@@ -40,6 +39,7 @@ from software.core.reverse_fill.schema import (
     REVERSE_FILL_KIND_TEXT,
 )
 from software.core.task import ExecutionState
+from software.core.task.random_context import run_random as random
 from software.providers.answering import AnswerAction
 from software.providers.answering.selection import (
     coerce_positive_int as _coerce_positive_int,
@@ -120,6 +120,7 @@ async def _build_wjx_single_action(
         fill_entries,
         selected_index,
         driver=driver,
+        runtime_settings=config.ai_runtime_settings,
         question_title=str(question.title or ""),
         question_number=current,
         option_text=selected_text,
@@ -201,6 +202,7 @@ async def _build_wjx_dropdown_action(
         fill_entries,
         selected_index,
         driver=driver,
+        runtime_settings=config.ai_runtime_settings,
         question_title=str(question.title or ""),
         question_number=current,
         option_text=selected_text,
@@ -247,7 +249,12 @@ async def _build_wjx_text_action(
             if description and description not in ai_prompt:
                 ai_prompt = f"{ai_prompt}\n补充说明：{description}"
             try:
-                generated = await agenerate_ai_answer(ai_prompt, question_type="fill_blank", blank_count=blank_count)
+                generated = await agenerate_ai_answer(
+                    ai_prompt,
+                    question_type="fill_blank",
+                    blank_count=blank_count,
+                    runtime_settings=config.ai_runtime_settings,
+                )
             except AIRuntimeError as exc:
                 raise AIRuntimeError(f"问卷星第{current}题 AI 生成失败：{exc}") from exc
             text_values = (
@@ -370,6 +377,7 @@ async def _build_wjx_multiple_action(
                 fill_entries,
                 option_idx,
                 driver=driver,
+                runtime_settings=config.ai_runtime_settings,
                 question_title=str(question.title or ""),
                 question_number=current,
                 option_text=selected_text,
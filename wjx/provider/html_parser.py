@@ -8,11 +8,6 @@ from software.providers.contracts import (
 
 from software.core.questions.utils import _should_treat_question_as_text_like
 
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    BeautifulSoup = None
-
 from .html_parser_choice import (
     _extract_choice_attached_selects,
     _extract_force_select_option,
@@ -33,8 +28,11 @@ from .html_parser_common import (
     _soup_question_looks_like_description,
     _soup_question_looks_like_rating,
     _soup_question_looks_like_reorder,
+    _extract_survey_title_from_soup,
     extract_survey_title_from_html,
 )
+from .html_parser_backend import HTML_BACKEND_HTML_PARSER, is_html_backend_available
+from .html_parser_page import ParsedWjxPage, ensure_parsed_wjx_page
 from .html_parser_matrix import _extract_slider_range, _question_div_looks_like_slider_matrix
 from .html_parser_rules import (
     _attach_display_condition_metadata,
@@ -44,7 +42,14 @@ from .html_parser_rules import (
     _extract_question_title,
 )
 
-__all__ = ["_normalize_html_text", "extract_survey_title_from_html", "parse_survey_questions_from_html"]
+__all__ = [
+    "ParsedWjxPage",
+    "_normalize_html_text",
+    "extract_survey_title_from_html",
+    "extract_survey_title_from_page",
+    "parse_survey_questions_from_html",
+    "parse_survey_questions_from_page",
+]
 
 
 def _normalize_media_source_url(raw: Any) -> str:
@@ -196,12 +201,26 @@ def _question_div_has_question_ancestor(question_div, fieldset) -> bool:
     return False
 
 
+def extract_survey_title_from_page(page: ParsedWjxPage) -> Optional[str]:
+    """从共享页面对象提取问卷标题，复用已建好的 DOM 树。"""
+    try:
+        soup = page.soup
+    except Exception:
+        return None
+    return _extract_survey_title_from_soup(soup)
+
+
 def parse_survey_questions_from_html(html: str) -> List[Dict[str, Any]]:
     """从 HTML 解析问卷题目列表"""
-    if not BeautifulSoup:
+    return parse_survey_questions_from_page(ensure_parsed_wjx_page(html))
+
+
+def parse_survey_questions_from_page(page: ParsedWjxPage) -> List[Dict[str, Any]]:
+    """从共享页面对象解析问卷题目列表"""
+    if not is_html_backend_available(HTML_BACKEND_HTML_PARSER):
         raise RuntimeError("BeautifulSoup is required for HTML parsing")
-    soup = BeautifulSoup(html, "html.parser")
-    container = soup.find("div", id="divQuestion")
+    soup = page.soup
+    container = page.question_container
     if not container:
         return []
     fieldsets = container.find_all("fieldset")
@@ -0,0 +1,76 @@
+"""问卷星 HTML 解析：建树后端选择。
+
+解析逻辑统一基于 bs4 的节点 API，这里只决定 bs4 底层用哪个 tree builder：
+装了 lxml 时走编译版解析器，否则回退到纯 Python 的 ``html.parser``。
+lxml 是可选依赖（``uv sync --extra fast-html``），没装时行为与之前完全一致；
+设置 ``SURVEYCONTROLLER_WJX_HTML_BACKEND=html.parser`` 可以在装了 lxml 时仍固定用纯 Python 后端。
+"""
+from __future__ import annotations
+
+import importlib.util
+import logging
+import os
+from functools import lru_cache
+from typing import Any, Optional
+
+try:
+    from bs4 import BeautifulSoup
+    from bs4 import FeatureNotFound as _FeatureNotFound
+except ImportError:
+    BeautifulSoup = None
+    # 没装 bs4 时 build_html_soup 会提前报错，这里只需让 except 子句保持合法
+    _FeatureNotFound = ValueError
+
+from software.logging.log_utils import log_suppressed_exception
+
+__all__ = [
+    "HTML_BACKEND_AUTO",
+    "HTML_BACKEND_ENV",
+    "HTML_BACKEND_HTML_PARSER",
+    "HTML_BACKEND_LXML",
+    "build_html_soup",
+    "is_html_backend_available",
+    "resolve_html_backend",
+]
+
+HTML_BACKEND_ENV = "SURVEYCONTROLLER_WJX_HTML_BACKEND"
+HTML_BACKEND_AUTO = "auto"
+HTML_BACKEND_LXML = "lxml"
+HTML_BACKEND_HTML_PARSER = "html.parser"
+_KNOWN_BACKENDS = (HTML_BACKEND_LXML, HTML_BACKEND_HTML_PARSER)
+
+
+@lru_cache(maxsize=None)
+def is_html_backend_available(backend: str) -> bool:
+    if BeautifulSoup is None:
+        return False
+    if backend == HTML_BACKEND_HTML_PARSER:
+        return True
+    if backend == HTML_BACKEND_LXML:
+        return importlib.util.find_spec("lxml") is not None
+    return False
+
+
+def resolve_html_backend(preferred: Optional[str] = None) -> str:
+    """按 显式参数 > 环境变量 > 自动探测 的顺序决定建树后端。"""
+    requested = str(preferred or os.environ.get(HTML_BACKEND_ENV, "") or "").strip().lower()
+    if requested in _KNOWN_BACKENDS and is_html_backend_available(requested):
+        return requested
+    if requested not in ("", HTML_BACKEND_AUTO) and requested not in _KNOWN_BACKENDS:
+        logging.debug("未知的问卷星 HTML 解析后端：%s，改为自动选择", requested)
+    if is_html_backend_available(HTML_BACKEND_LXML):
+        return HTML_BACKEND_LXML
+    return HTML_BACKEND_HTML_PARSER
+
+
+def build_html_soup(html: str, backend: Optional[str] = None) -> Any:
+    """构建 DOM 树；编译版后端不可用时回退到 html.parser。"""
+    if BeautifulSoup is None:
+        raise RuntimeError("BeautifulSoup is required for HTML parsing")
+    resolved = resolve_html_backend(backend)
+    if resolved != HTML_BACKEND_HTML_PARSER:
+        try:
+            return BeautifulSoup(html, resolved)
+        except _FeatureNotFound as exc:
+            log_suppressed_exception("wjx.html_parser_backend.build_html_soup", exc)
+    return BeautifulSoup(html, HTML_BACKEND_HTML_PARSER)
@@ -3,15 +3,12 @@ import logging
 import re
 from typing import Any, List, Optional
 
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    BeautifulSoup = None
-
 from software.app.config import _HTML_SPACE_RE
 from software.core.questions.utils import _normalize_question_type_code
 from software.logging.log_utils import log_suppressed_exception
 
+from .html_parser_backend import HTML_BACKEND_HTML_PARSER, build_html_soup, is_html_backend_available
+
 _TEXT_INPUT_ALLOWED_TYPES = {"text", "tel", "email", "number", "search", "url", "password"}
 _KNOWN_NON_TEXT_QUESTION_TYPES = {"3", "4", "5", "6", "7", "8", "11", "12", "13", "15", "16", "17"}
 _SELECT_PLACEHOLDER_PREFIXES = ("请选择", "请先选择")
@@ -112,15 +109,18 @@ def _soup_question_is_required(question_div) -> bool:
 
 def extract_survey_title_from_html(html: str) -> Optional[str]:
     """尝试从问卷 HTML 文本中提取标题。"""
-
-
-    if not BeautifulSoup:
+    if not is_html_backend_available(HTML_BACKEND_HTML_PARSER):
         return None
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = build_html_soup(html)
     except Exception:
         return None
+    return _extract_survey_title_from_soup(soup)
+
 
+def _extract_survey_title_from_soup(soup) -> Optional[str]:
+    if soup is None:
+        return None
     selectors = [
         "#divTitle h1",
         "#divTitle",
@@ -0,0 +1,88 @@
+"""问卷星 HTML 解析：单次建树的页面对象。"""
+from __future__ import annotations
+
+from typing import Any, Optional, Union
+
+from .html_parser_backend import build_html_soup, is_html_backend_available, resolve_html_backend
+from .html_parser_common import _normalize_html_text
+
+__all__ = ["ParsedWjxPage", "ensure_parsed_wjx_page"]
+
+_QUESTION_CONTAINER_ID = "divQuestion"
+_UNSET: Any = object()
+
+
+class ParsedWjxPage:
+    """同一份问卷 HTML 的共享解析结果。
+
+    状态页检测、标题提取和题目解析都从这里取 DOM 树，整页只建一次树；
+    纯文本检测用不到 DOM 时也不会触发建树。
+    """
+
+    __slots__ = ("html", "backend", "_soup", "_text", "_compact_text", "_question_container")
+
+    def __init__(self, html: Optional[str], *, backend: Optional[str] = None) -> None:
+        self.html = str(html or "")
+        self.backend = resolve_html_backend(backend)
+        self._soup: Any = _UNSET
+        self._text: Optional[str] = None
+        self._compact_text: Optional[str] = None
+        self._question_container: Any = _UNSET
+
+    @classmethod
+    def from_html(cls, html: Optional[str], *, backend: Optional[str] = None) -> "ParsedWjxPage":
+        return cls(html, backend=backend)
+
+    @property
+    def soup(self) -> Any:
+        """整页 DOM 树；bs4 不可用时为 None，建树异常原样抛出。"""
+        if self._soup is _UNSET:
+            if not is_html_backend_available(self.backend):
+                self._soup = None
+            else:
+                self._soup = build_html_soup(self.html, self.backend)
+        return self._soup
+
+    @property
+    def text(self) -> str:
+        """按旧逻辑归一化空白后的原始 HTML 文本。"""
+        if self._text is None:
+            self._text = _normalize_html_text(self.html)
+        return self._text
+
+    @property
+    def compact_text(self) -> str:
+        if self._compact_text is None:
+            self._compact_text = "".join(self.text.split())
+        return self._compact_text
+
+    @property
+    def question_container(self) -> Any:
+        if self._question_container is _UNSET:
+            soup = self.soup
+            self._question_container = soup.find("div", id=_QUESTION_CONTAINER_ID) if soup is not None else None
+        return self._question_container
+
+    def find_div_by_id(self, element_id: str) -> Any:
+        soup = self.soup
+        if soup is None:
+            return None
+        return soup.find("div", id=element_id)
+
+    def has_question_content(self) -> bool:
+        try:
+            container = self.question_container
+        except Exception:
+            return False
+        if not container:
+            return False
+        return bool(
+            container.find("fieldset")
+            or container.find("div", attrs={"topic": True})
+        )
+
+
+def ensure_parsed_wjx_page(html_or_page: Union[str, ParsedWjxPage, None]) -> ParsedWjxPage:
+    if isinstance(html_or_page, ParsedWjxPage):
+        return html_or_page
+    return ParsedWjxPage.from_html(html_or_page)
@@ -3,9 +3,9 @@ import re
 from typing import Any, Dict, List, Optional, Tuple
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4.element import CData, NavigableString
 except ImportError:
-    BeautifulSoup = None
+    CData = NavigableString = None
 
 from .html_parser_choice import (
     _collect_choice_option_texts,
@@ -16,6 +16,49 @@ from .html_parser_common import _cleanup_question_title, _is_select_placeholder_
 from .html_parser_matrix import _collect_matrix_option_texts, _collect_slider_matrix_metadata, _question_div_looks_like_slider_matrix
 
 
+# 多选限制文本里需要跳过的选项/控件子树，等价于旧的 select + decompose 选择器
+_LIMIT_TEXT_EXCLUDED_TAGS = frozenset({"ul", "ol", "table", "textarea", "select"})
+_LIMIT_TEXT_EXCLUDED_CLASSES = frozenset({
+    "ui-controlgroup",
+    "slider",
+    "rangeslider",
+    "range-slider",
+    "errorMessage",
+})
+
+
+def _element_excluded_from_limit_text(element) -> bool:
+    if element.name in _LIMIT_TEXT_EXCLUDED_TAGS:
+        return True
+    class_attr = element.get("class") or []
+    if isinstance(class_attr, str):
+        class_attr = class_attr.split()
+    return any(class_name in _LIMIT_TEXT_EXCLUDED_CLASSES for class_name in class_attr)
+
+
+def _collect_text_outside_option_blocks(question_div) -> str:
+    """单次遍历原 DOM 收集题干文本，跳过选项/控件子树，不修改也不复制原树。"""
+    if NavigableString is None or _element_excluded_from_limit_text(question_div):
+        return ""
+    text_types = (NavigableString, CData)
+    parts: List[str] = []
+    stack = [iter(question_div.contents)]
+    while stack:
+        node = next(stack[-1], None)
+        if node is None:
+            stack.pop()
+            continue
+        if node.__class__ in text_types:
+            text = node.strip()
+            if text:
+                parts.append(text)
+            continue
+        if getattr(node, "name", None) is None or _element_excluded_from_limit_text(node):
+            continue
+        stack.append(iter(node.contents))
+    return " ".join(parts)
+
+
 def _extract_question_title(question_div, fallback_number: int) -> str:
     title_element = question_div.find(class_="topichtml")
     if title_element:
@@ -59,28 +102,12 @@ def _collect_multi_limit_text_fragments(question_div) -> List[str]:
             if text:
                 fragments.append(text)
 
-    if BeautifulSoup is not None:
-        try:
-            cloned_soup = BeautifulSoup(str(question_div), "html.parser")
-            for selector in (
-                ".ui-controlgroup",
-                "ul",
-                "ol",
-                "table",
-                "textarea",
-                "select",
-                ".slider",
-                ".rangeslider",
-                ".range-slider",
-                ".errorMessage",
-            ):
-                for element in cloned_soup.select(selector):
-                    element.decompose()
-            cleaned_text = _normalize_html_text(cloned_soup.get_text(" ", strip=True))
-            if cleaned_text:
-                fragments.append(cleaned_text)
-        except Exception:
-            pass
+    try:
+        cleaned_text = _normalize_html_text(_collect_text_outside_option_blocks(question_div))
+    except Exception:
+        cleaned_text = ""
+    if cleaned_text:
+        fragments.append(cleaned_text)
 
     deduped: List[str] = []
     seen = set()
@@ -33,7 +33,12 @@ from software.providers.errors import (
     SurveyStoppedError,
 )
 from wjx.provider.answering_builders import build_answer_action
-from wjx.provider.parser import _parse_wjx_html, _raise_wjx_page_state_errors
+from wjx.provider.html_parser import ParsedWjxPage, parse_survey_questions_from_page
+from wjx.provider.parser import (
+    _WJX_NOW_TIME_PATTERNS,
+    _WJX_STARTTIME_INPUT_PATTERNS,
+    _raise_wjx_page_state_errors,
+)
 
 
 WJX_SUBMISSION_VERIFICATION_MESSAGE = "问卷星触发智能验证，当前链路已停止。请启用随机 IP 后再提交。"
@@ -51,20 +56,6 @@ class WjxSubmitResult:
     REJECTED = "rejected"
 
 
-_WJX_STARTTIME_INPUT_PATTERNS = (
-    re.compile(
-        r'<input\b[^>]*\b(?:id|name)=["\']starttime["\'][^>]*\bvalue=["\']([^"\']+)["\']',
-        re.IGNORECASE | re.DOTALL,
-    ),
-    re.compile(
-        r'<input\b[^>]*\bvalue=["\']([^"\']+)["\'][^>]*\b(?:id|name)=["\']starttime["\']',
-        re.IGNORECASE | re.DOTALL,
-    ),
-)
-_WJX_NOW_TIME_PATTERNS = (
-    re.compile(r'var\s+nowTime\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE),
-    re.compile(r'var\s+interviewStartTime\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE),
-)
 _WJX_SCENE_ID_PATTERNS = (
     re.compile(r'\bsceneId\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE),
     re.compile(r'\bscene_id\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE),
@@ -331,8 +322,9 @@ def _raise_submit_rejected(
 async def _load_wjx_page(url: str, *, headers: dict[str, str], proxies: Any) -> str:
     response = await http_client.aget(url, timeout=15, headers=headers, proxies=proxies)
     response.raise_for_status()
+    page = ParsedWjxPage.from_html(response.text)
     try:
-        _raise_wjx_page_state_errors(response.text)
+        _raise_wjx_page_state_errors(page)
     except (
         SurveyPausedError,
         SurveyStoppedError,
@@ -340,8 +332,8 @@ async def _load_wjx_page(url: str, *, headers: dict[str, str], proxies: Any) ->
         SurveyNotOpenError,
     ) as exc:
         raise SurveyProviderUnavailableAtRuntimeError(str(exc)) from exc
-    _parse_wjx_html(response.text)
-    return str(response.text or "")
+    parse_survey_questions_from_page(page)
+    return page.html
 
 
 async def _build_actions(
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import software.network.http as http_client
 from software.app.config import DEFAULT_HTTP_HEADERS
@@ -15,11 +15,16 @@ from software.providers.errors import (
     SurveyPausedError,
     SurveyStoppedError,
 )
+from software.providers.survey_cache import SurveyParseResult, SurveyRevalidation
 from wjx.provider.html_parser import (
+    ParsedWjxPage,
     _normalize_html_text,
-    extract_survey_title_from_html,
-    parse_survey_questions_from_html,
+    extract_survey_title_from_page,
+    parse_survey_questions_from_page,
 )
+from wjx.provider.html_parser_page import ensure_parsed_wjx_page
+
+PageInput = Union[str, ParsedWjxPage]
 
 PAUSED_SURVEY_ERROR_MESSAGE = "问卷已暂停，需要前往问卷星后台重新发布"
 STOPPED_SURVEY_ERROR_MESSAGE = "问卷已停止，无法作答"
@@ -29,6 +34,21 @@ _PAUSED_SURVEY_ID_RE = re.compile(r"此问卷[（(]\d+[）)]已暂停")
 _NOT_OPEN_TIME_RE = re.compile(
     r"此问卷将于\s*(\d{4}[-/]\d{1,2}[-/]\d{1,2}\s+\d{1,2}:\d{2})\s*开放"
 )
+# 每次请求都会变的作答起始时间；提交时据此推算作答时长，算缓存指纹时要抹掉
+_WJX_STARTTIME_INPUT_PATTERNS = (
+    re.compile(
+        r'<input\b[^>]*\b(?:id|name)=["\']starttime["\'][^>]*\bvalue=["\']([^"\']+)["\']',
+        re.IGNORECASE | re.DOTALL,
+    ),
+    re.compile(
+        r'<input\b[^>]*\bvalue=["\']([^"\']+)["\'][^>]*\b(?:id|name)=["\']starttime["\']',
+        re.IGNORECASE | re.DOTALL,
+    ),
+)
+_WJX_NOW_TIME_PATTERNS = (
+    re.compile(r'var\s+nowTime\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE),
+    re.compile(r'var\s+interviewStartTime\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE),
+)
 _PAGE_SUMMARY_MAX_LENGTH = 120
 _PARSE_RETRY_ATTEMPTS = 3
 _PARSE_RETRY_DELAY_SECONDS = 0.35
@@ -42,9 +62,9 @@ def _build_unparseable_page_summary(html: str) -> str:
         text = f"{text[:_PAGE_SUMMARY_MAX_LENGTH]}..."
     return text
 
-def is_paused_survey_page(html: str) -> bool:
+def is_paused_survey_page(html: PageInput) -> bool:
     """检测页面是否为“问卷已暂停，不能填写”提示页。"""
-    text = _normalize_html_text(html)
+    text = ensure_parsed_wjx_page(html).text
     if not text or "已暂停" not in text:
         return False
     if "不能填写" in text or "问卷已暂停" in text:
@@ -52,34 +72,20 @@ def is_paused_survey_page(html: str) -> bool:
     return bool(_PAUSED_SURVEY_ID_RE.search(text))
 
 
-def _html_has_question_content(html: str) -> bool:
-    try:
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(html, "html.parser")
-        question_container = soup.find("div", id="divQuestion")
-        if not question_container:
-            return False
-        return bool(
-            question_container.find_all("fieldset")
-            or question_container.find_all("div", attrs={"topic": True})
-        )
-    except Exception:
-        return False
+def _html_has_question_content(html: PageInput) -> bool:
+    return ensure_parsed_wjx_page(html).has_question_content()
 
 
-def is_stopped_survey_page(html: str) -> bool:
+def is_stopped_survey_page(html: PageInput) -> bool:
     """检测页面是否为“问卷停止作答”提示页。"""
-    text = _normalize_html_text(html)
+    page = ensure_parsed_wjx_page(html)
+    text = page.text
     if not text or "停止状态" not in text or "无法作答" not in text:
         return False
 
     try:
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(html, "html.parser")
         for selector_id in ("divWorkError", "divTip"):
-            error_container = soup.find("div", id=selector_id)
+            error_container = page.find_div_by_id(selector_id)
             if error_container is not None:
                 error_text = _normalize_html_text(error_container.get_text(" ", strip=True))
                 if "停止状态" in error_text and "无法作答" in error_text:
@@ -87,19 +93,18 @@ def is_stopped_survey_page(html: str) -> bool:
     except Exception:
         pass
 
-    if _html_has_question_content(html):
+    if page.has_question_content():
         return False
 
-    normalized = "".join(text.split())
-    return "此问卷处于停止状态，无法作答" in normalized
+    return "此问卷处于停止状态，无法作答" in page.compact_text
 
 
-def is_enterprise_unavailable_survey_page(html: str) -> bool:
+def is_enterprise_unavailable_survey_page(html: PageInput) -> bool:
     """检测企业标准版未购买或到期导致的不可填写提示。"""
-    text = _normalize_html_text(html)
-    if not text:
+    page = ensure_parsed_wjx_page(html)
+    if not page.text:
         return False
-    normalized = "".join(text.split())
+    normalized = page.compact_text
     if "企业标准版" not in normalized:
         return False
     if "问卷发布者" not in normalized:
@@ -109,16 +114,17 @@ def is_enterprise_unavailable_survey_page(html: str) -> bool:
     return "暂时不能被填写" in normalized or "暂时不能填写" in normalized
 
 
-def build_not_open_survey_message(html: str) -> Optional[str]:
+def build_not_open_survey_message(html: PageInput) -> Optional[str]:
     """构造"问卷暂未开放"提示文案。"""
-    text = _normalize_html_text(html)
+    page = ensure_parsed_wjx_page(html)
+    text = page.text
     if not text:
         return None
 
-    if _html_has_question_content(html):
+    if page.has_question_content():
         return None
 
-    normalized = "".join(text.split())
+    normalized = page.compact_text
     
     # 保留所有关键词，但通过DOM检查优先避免误判
     keywords = (
@@ -141,24 +147,41 @@ def build_not_open_survey_message(html: str) -> Optional[str]:
     return NOT_OPEN_SURVEY_ERROR_MESSAGE
 
 
-def _raise_wjx_page_state_errors(html: str) -> None:
-    if is_paused_survey_page(html):
+def _raise_wjx_page_state_errors(html: PageInput) -> None:
+    page = ensure_parsed_wjx_page(html)
+    if is_paused_survey_page(page):
         raise SurveyPausedError(PAUSED_SURVEY_ERROR_MESSAGE)
-    if is_stopped_survey_page(html):
+    if is_stopped_survey_page(page):
         raise SurveyStoppedError(STOPPED_SURVEY_ERROR_MESSAGE)
-    if is_enterprise_unavailable_survey_page(html):
+    if is_enterprise_unavailable_survey_page(page):
         raise SurveyEnterpriseUnavailableError(ENTERPRISE_UNAVAILABLE_SURVEY_ERROR_MESSAGE)
-    not_open_message = build_not_open_survey_message(html)
+    not_open_message = build_not_open_survey_message(page)
     if not_open_message:
         raise SurveyNotOpenError(not_open_message)
 
 
-def _parse_wjx_html(html: str) -> Tuple[List[Dict[str, Any]], str]:
-    _raise_wjx_page_state_errors(html)
-    return parse_survey_questions_from_html(html), extract_survey_title_from_html(html) or ""
+def _parse_wjx_html(html: PageInput) -> Tuple[List[Dict[str, Any]], str]:
+    """状态页检测、题目解析、标题提取共用同一棵 DOM 树。"""
+    page = ensure_parsed_wjx_page(html)
+    _raise_wjx_page_state_errors(page)
+    return parse_survey_questions_from_page(page), extract_survey_title_from_page(page) or ""
+
+
+def _strip_volatile_timestamps(match: re.Match[str]) -> str:
+    text = match.group(0)
+    start, end = match.start(1) - match.start(0), match.end(1) - match.start(0)
+    return text[:start] + text[end:]
+
+
+def _wjx_fingerprint_payload(html: str) -> str:
+    """去掉 starttime / nowTime 等每次请求都不同的时间戳，问卷结构不变时指纹保持一致。"""
+    text = str(html or "")
+    for pattern in _WJX_STARTTIME_INPUT_PATTERNS + _WJX_NOW_TIME_PATTERNS:
+        text = pattern.sub(_strip_volatile_timestamps, text)
+    return text
 
 
-async def parse_wjx_survey(url: str) -> Tuple[List[Dict[str, Any]], str]:
+async def parse_wjx_survey(url: str, *, revalidation: Optional[SurveyRevalidation] = None) -> SurveyParseResult:
     resp = None
     try:
         info: List[Dict[str, Any]] = []
@@ -166,6 +189,10 @@ async def parse_wjx_survey(url: str) -> Tuple[List[Dict[str, Any]], str]:
         for attempt in range(1, _PARSE_RETRY_ATTEMPTS + 1):
             resp = await http_client.aget(url, timeout=12, headers=DEFAULT_HTTP_HEADERS, proxies={})
             resp.raise_for_status()
+            if revalidation is not None:
+                cached = revalidation.check(_wjx_fingerprint_payload(resp.text))
+                if cached is not None:
+                    return cached
             info, title = _parse_wjx_html(resp.text)
             if info:
                 break
@@ -203,6 +230,7 @@ __all__ = [
     "STOPPED_SURVEY_ERROR_MESSAGE",
     "ENTERPRISE_UNAVAILABLE_SURVEY_ERROR_MESSAGE",
     "NOT_OPEN_SURVEY_ERROR_MESSAGE",
+    "ParsedWjxPage",
     "SurveyPausedError",
     "SurveyStoppedError",
     "SurveyEnterpriseUnavailableError",
@@ -1,8 +1,9 @@
 """问卷星多选题规则与约束。"""
 import logging
-import random
 from typing import List, Optional, Set, Tuple
 
+from software.core.task.random_context import run_random as random
+
 _WARNED_PROB_MISMATCH: Set[int] = set()
 
 def _normalize_selected_indices(indices: List[int], option_count: int) -> List[int]: